@@ -17,34 +17,44 @@
         mysql_rep_admin.py
             {-B -c mysql_cfg -d path [-z] [-e] [-o /path/file [-a]]
                  [-t ToEmail [ToEmail2 ...] [-u SubjectLine] [-w]
-                 [-r -f FileName [-n] [-g] [-m]]] |
+                 [-r -f FileName [-n] [-g] [-m] [-Z]]] |
              -C -c mysql_cfg -s [/path/]slave.txt -d path [-z] [-e]
                  [-o /path/file [-a]]
                  [-t ToEmail [ToEmail2 ...] [-u SubjectLine] [-w]
-                 [-r -f FileName [-n] [-g] [-m]]] |
+                 [-r -f FileName [-n] [-g] [-m] [-Z]]] |
              -D -c mysql_cfg -s [/path/]slave.txt -d path [-z] [-e]
                  [-o /path/file [-a]]
                  [-t ToEmail [ToEmail2 ...] [-u SubjectLine] [-w]
-                 [-r -f FileName [-n] [-g] [-m]]] |
+                 [-r -f FileName [-n] [-g] [-m] [-Z]]] |
              -E -s [path/]slave.txt -d path [-z] [-e] [-o /path/file [-a]]
                  [-t ToEmail [ToEmail2 ...] [-u SubjectLine] [-w]
-                 [-r -f FileName [-n] [-g] [-m]]] |
+                 [-r -f FileName [-n] [-g] [-m] [-Z]]] |
              -O -s [/path/]slave.txt -d path [-z] [-e] [-o /path/file [-a]]
                  [-t ToEmail [ToEmail2 ...] [-u SubjectLine] [-w]
-                 [-r -f FileName [-n] [-g] [-m]]] |
+                 [-r -f FileName [-n] [-g] [-m] [-Z]]] |
              -S -s [/path/]slave.txt -d path [-z] [-e] [-o /path/file [-a]]
                  [-t ToEmail [ToEmail2 ...] [-u SubjectLine] [-w]
-                 [-r -f FileName [-n] [-g] [-m]]] |
-             -T -c mysql_cfg -s [/path]/slave.txt -d path [-z] [-e] [-x]
+                 [-r -f FileName [-n] [-g] [-m] [-Z]]] |
+             -T -c mysql_cfg -s [/path]/slave.txt -d path [-z] [-e]
                  [-o /path/file [-a]]
                  [-t ToEmail [ToEmail2 ...] [-u SubjectLine] [-w]
-                 [-r -f FileName [-n] [-g] [-m]]] |
+                 [-r -f FileName [-n] [-g] [-m] [-Z]]] |
              -A -c mysql_cfg -s [/path/]slave.txt -d path [-z] [-e]
                  [-o /path/file [-a]]
                  [-t ToEmail [ToEmail2 ...] [-u SubjectLine] [-w]
-                 [-r -f FileName [-n] [-g] [-m]]]}
+                 [-r -f FileName [-n] [-g] [-m] [-Z]]]}
             [-y flavor_id]
             [-p path]
+            [-k rep_admin_cfg]
+            [-j]
+            [-b]
+            [-Q]
+            [-x]
+            [-F]
+            [-P /path/file.prom]
+            [-q]
+            [-l seconds]
+            [-i slave_template]
             [-v | -h]
 
     Arguments:
@@ -65,9 +75,12 @@
                     -n => Add hostname to file attachment name.
                     -g => Add datetime to file attachment name.
                     -m => Add microseconds to file attachment name.
+                    -Z => Gzip the file attachment.
 
         -C => Compare master binlog position to the slaves' and return any
-                differences detected if not the same positions.
+                differences detected if not the same positions.  The master
+                and slave positions are captured at the same time and the
+                allowed difference is set in the -k settings file.
             -c mysql_cfg => Master config file.
             -s [path/]slave.txt => Slave config file.
             -d path => Directory path to the config files.
@@ -84,6 +97,7 @@
                     -n => Add hostname to file attachment name.
                     -g => Add datetime to file attachment name.
                     -m => Add microseconds to file attachment name.
+                    -Z => Gzip the file attachment.
 
         -D => Display the slave(s) binlog filename and position.
             -c mysql_cfg => Master config file.
@@ -102,6 +116,7 @@
                     -n => Add hostname to file attachment name.
                     -g => Add datetime to file attachment name.
                     -m => Add microseconds to file attachment name.
+                    -Z => Gzip the file attachment.
 
         -E => Check for any replication errors on the slave(s).
             -s [path/]slave.txt => Slave config file.
@@ -119,6 +134,7 @@
                     -n => Add hostname to file attachment name.
                     -g => Add datetime to file attachment name.
                     -m => Add microseconds to file attachment name.
+                    -Z => Gzip the file attachment.
 
         -O => Other slave replication checks and return any errors detected.
             -s [path/]slave.txt => Slave config file.
@@ -136,6 +152,7 @@
                     -n => Add hostname to file attachment name.
                     -g => Add datetime to file attachment name.
                     -m => Add microseconds to file attachment name.
+                    -Z => Gzip the file attachment.
 
         -S => Check the slave(s) IO and SQL threads and return any errors or
                 warnings detected.
@@ -154,16 +171,13 @@
                     -n => Add hostname to file attachment name.
                     -g => Add datetime to file attachment name.
                     -m => Add microseconds to file attachment name.
+                    -Z => Gzip the file attachment.
 
         -T => Check time lag for the slave(s) and return any differences
                 detected.
             -c mysql_cfg => Master config file.
             -s [path/]slave.txt => Slave config file.
             -d path => Directory path to the config files.
-            -x => Returns none if no time lag is detected.  If this option is
-                used, then none of the other options are allowed.
-                Note:  Usually used for email purposes to only email out if a
-                    time lag is detected.
             -z => Suppress standard out.
             -e => Expand the JSON data structure.
             -o /path/file => Directory path and file name for output.
@@ -177,6 +191,7 @@
                     -n => Add hostname to file attachment name.
                     -g => Add datetime to file attachment name.
                     -m => Add microseconds to file attachment name.
+                    -Z => Gzip the file attachment.
 
         -A => Runs multiple checks which include the options:  -C, -S, -T, -E
             -c mysql_cfg => Master config file.
@@ -195,16 +210,124 @@
                     -n => Add hostname to file attachment name.
                     -g => Add datetime to file attachment name.
                     -m => Add microseconds to file attachment name.
+                    -Z => Gzip the file attachment.
 
         General options:
         -p dir_path => Directory path to the mysql binary programs, if needed.
         -y value => A flavor id for the program lock.  To create unique lock.
+        -k rep_admin_cfg => Program settings file.  Located in the -d
+            directory.  Default settings are used if not provided.
+        -j => Run the -A options (-C, -S, -E, -T, -O) for all slaves
+            concurrently using the asyncio check engine.
+        -b => JSON Lines output.  Each option's results are written to the
+            -o file and standard out as a single compact JSON line as soon as
+            the option finishes, instead of one JSON document at the end of
+            the run.
+        -Q => Delta mode.  Only the slaves whose status changed since the
+            last run are output.  Nothing is output if no status changed.
+            Requires the state_dir setting, see NOTE 8.
+        -x => Problem-only mode.  Nothing is output or emailed if none of the
+            selected checks detect a problem.  Cannot be used with the -B or
+            -D options.
+            Note:  Usually used for email purposes to only email out if a
+                problem is detected.
+        -F => Flush the mail spool.  Sends the emails in the mail_spool
+            setting directory.  Only the spool is flushed if no other option
+            is selected.
+        -P /path/file.prom => Prometheus textfile exporter.  Writes the
+            results as Prometheus metrics to the file for the node_exporter
+            textfile collector.  The file is replaced at the end of each run.
+        -q => Add a Timings block to the output with the number of seconds
+            spent connecting, checking and waiting on the slaves' time lag
+            and the latency histogram of the queries to each server.
+        -l seconds => Daemon mode.  Connects once and re-runs the selected
+            options every number of seconds until stopped.  Only a master or
+            slave which has dropped its connection is reconnected.
+        -i slave_template => Discover the slaves from the master's replica
+            list instead of the -s slave file.  The slave template holds the
+            shared credentials for all slaves and is located in the -d
+            directory.  Requires the -c option and cannot be used with -s.
         -v => Display version of this program.
         -h => Help and usage message.
 
         NOTE 1: -v or -h overrides the other options.
-        NOTE 2: -r option: SMTP has a 998 character per line limit.
+        NOTE 2: -r option: SMTP has a 998 character per line limit.  With
+            the -Z option the attachment is gzipped and named .json.gz.
         NOTE 3: -g option: Uses the DateTime format of %Y%m%d_%H%M%S.
+        NOTE 4: The master and slaves are only connected to if a selected
+            option uses them.  The -B option only uses the master and the -D,
+            -E, -O and -S options only use the slaves.
+        NOTE 5: -i option:  The -i option can be used in place of the -s
+            option.  The replica list is cached in the
+            mysql_rep_admin_topology[_flavor_id].json file in the state_dir
+            setting directory.  The cache is updated when the topology
+            changes and is checked against the master at least every
+            discovery_ttl seconds.  The cache is only used if state_dir is
+            set to a directory owned by the user which no one else can
+            access, otherwise the replica list is read from the master on
+            every run.  Each replica must have the "report-host"
+            and "report-port" set in its mysqld.cnf file.
+        NOTE 6: The parsed -c and -s configuration files are cached in the
+            mysql_rep_admin_config[_flavor_id].json file in the state_dir
+            setting directory and are only parsed again when a file's
+            modification time or size changes.  The cache holds the
+            passwords, so it is only used if state_dir is set to a directory
+            owned by the user which no one else can access and the file is
+            only readable by the user.
+        NOTE 7: -T option:  The slaves are matched to the master's slave list
+            by UUID or, for a down slave, by server id.  Slaves in the
+            master's slave list which are not checked are added with an UNK
+            time lag.  Slaves not in the master's slave list are listed under
+            Unexpected and slaves whose name is not the master's host name
+            for the slave are listed under Mismatched.
+        NOTE 8: -Q option:  The status of each option and slave is kept in
+            the mysql_rep_admin_delta[_flavor_id].json file in the state_dir
+            setting directory.  The state_dir must be a directory owned by
+            the user which no one else can access, otherwise all results are
+            output.  The first run outputs all results.  A slave's
+            status is its thread, error or lag state, such as Up to Down, OK
+            to Warning or a time lag of 0 to over 0 and back.  The -B and -D
+            options and an option which timed out are output when any of
+            their values change.
+        NOTE 9: -t option:  The mail_rate and mail_digest settings cut down
+            the emails during an outage.  With mail_rate the same status of a
+            slave or option is only emailed once every mail_rate seconds.
+            With mail_digest the first results are emailed right away and the
+            results during the next mail_digest seconds are sent together in
+            one digest email.  The mail state is kept in the
+            mysql_rep_admin_mail[_flavor_id].json file in the state_dir
+            setting directory, which must be a directory owned by the user
+            which no one else can access.
+        NOTE 10: -F option:  With the mail_spool setting the emails are
+            written to the spool directory and the run does not wait on the
+            mail server.  Run the -F option with its own -y flavor id, such
+            as from cron, to send the spooled emails.  The daemon mode sends
+            the spooled emails after each cycle.  A failed email is tried
+            again by the next flush, up to mail_retries times.  An email
+            held by a flush which was stopped part way is sent by the next
+            flush.
+        NOTE 11: -P option:  The metrics are written for every selected
+            option and slave, even with the -Q or -x options.  The slave
+            metrics are labeled with the slave's name and UUID.  A slave
+            which is down has no position or counter metrics.
+        NOTE 12: -q option:  The Timings block has the Connect, Sample and
+            LagWait times of the run, the time of each option under Checks
+            and the connect time of each slave under Slaves.  The time of
+            each -A option for each slave is also under Slaves.  With the -j
+            option the concurrent check time is under Checks as -j.  The
+            output and email times cannot be in their own output, so the
+            times of the previous run are under LastRun.  They are kept in
+            the mysql_rep_admin_timings[_flavor_id].json file in the
+            state_dir setting directory.  With the -b option the Timings are
+            written as the last JSON line.
+        NOTE 13: -q and -P options:  Every query to the master and slaves,
+            such as the status, variable and GTID reads, is timed and added
+            to the server's latency histogram.  The queries made while a
+            slave is first connected are not timed.  The histograms are
+            under Queries in the Timings block and are the
+            query_latency_seconds histogram in the -P file.  The bucket
+            counts are cumulative and each run or daemon cycle has its own
+            histograms.
 
     Notes:
         Master configuration file format (config/mysql_cfg.py.TEMPLATE):
@@ -297,50 +420,783 @@
         NOTE 1:  Ignore the Replication user information entries.  They are
             not required for this program.
 
-    Known Bugs:
-        Bug: The -T option may produce extra entries in the slaves list if the
-            master's show slave hosts names do not match up with the host names
-            in the slave.txt file.
-        Workaround: Ensure the slave.txt's host name entries in the file are
-            set to match the host names from the master.
+
+        Slave template file format (config/slave_template.py.TEMPLATE)
+        Shared by all slaves discovered with the -i option.
+            # Slave template configuration:
+            user = "USER"
+            japd = "PSWORD"
+            serv_os = "Linux"
+            cfg_file = None
+            extra_def_file = "PYTHON_PROJECT/config/mysql.cfg"
+
+            # If SSL connections are being used, configure one or more of these
+                entries:
+            ssl_client_ca = None
+            ssl_client_key = None
+            ssl_client_cert = None
+
+            # Only changes these if necessary and have knowledge in MySQL
+                SSL configuration setup:
+            ssl_client_flag = None
+            ssl_disabled = False
+            ssl_verify_id = False
+            ssl_verify_cert = False
+
+
+        Program settings file format (config/rep_admin_cfg.py.TEMPLATE):
+            # Maximum number of slaves connected to at the same time.
+            conn_workers = 10
+            # Number of seconds to wait on each slave connection, from when
+                it is started, before the slave is reported as down.  None
+                will wait indefinitely.
+            conn_timeout = 10
+            # Directory for the program state files.  None uses the
+                temporary directory.
+            state_dir = None
+            # Number of seconds a slave which failed to connect is skipped
+                for, doubled for each failure in a row.  0 turns the circuit
+                breaker off.  Requires a private state_dir.
+            backoff_base = 60
+            # Maximum number of seconds a slave is skipped for.
+            backoff_max = 3600
+            # Number of seconds between checks of the cached topology
+                against the master (-i option).  Requires a private
+                state_dir directory, see NOTE 5.
+            discovery_ttl = 3600
+            # Cache the parsed master and slave configuration files until
+                the files change.  False parses the files on every run.
+                Requires a private state_dir directory, see NOTE 6.
+            cfg_cache = True
+            # JSON backend used to serialize the output: orjson, simplejson
+                or json.  None uses the first one installed in that order.
+                The indented -e output is always serialized with 4 spaces, by
+                json if orjson is used.
+            json_backend = None
+            # Number of seconds in a mail digest window (-t option).  The
+                first email is sent right away, later results are held and
+                sent in one email when the window is over.  None sends an
+                email for every run.  Requires a private state_dir.
+            mail_digest = None
+            # Number of seconds before the same status of a slave or option
+                is emailed again (-t option).  A new status is emailed right
+                away.  None emails every status.  Requires a private
+                state_dir.
+            mail_rate = None
+            # Spool directory for the emails (-t option).  The emails are
+                written to the directory and sent by the -F option or the
+                daemon mode.  None sends the emails right away.
+            mail_spool = None
+            # Number of times a spooled email is tried before it is renamed
+                to .failed.
+            mail_retries = 5
+            # Number of seconds between time lag samples for the -T option.
+            lag_interval = 0.5
+            # Number of seconds before time lag sampling is stopped.
+            lag_deadline = 5
+            # Number of bytes a slave's read position can be behind the
+                master's position before it is reported as lagging (-C).
+            pos_tolerance = 0
+            # Number of seconds of slave time lag allowed before a slave
+                with a different position is reported as lagging (-C).  None
+                turns the time tolerance off.
+            time_tolerance = None
+            # Number of seconds a run is allowed to take, in daemon mode
+                each cycle.  None turns the run deadline off.
+            run_deadline = None
+            # Number of seconds each option is allowed to take.  None turns
+                the option budget off.
+            chk_budget = None
+            # Number of seconds each slave's checks are allowed to take (-j
+                option).  None turns the slave budget off.
+            slv_budget = None
+            # Maximum number of slaves checked at the same time (-j option).
+            chk_workers = 10
+            # Number of cycles before daemon mode exits (-l option).  None
+                will run until the program is stopped.
+            daemon_cycles = None
+
+        NOTE 1:  All entries are optional, any entry not set will use the
+            default value shown above.
+        NOTE 2:  An option which misses its budget or the run deadline is
+            reported with a TIMEOUT status and the rest of the results are
+            still sent out.  A slave which misses its budget is added to the
+            option's Timeouts list.  The connections used by work which
+            misses its budget are not used again and are closed once the
+            work finishes, a slave whose -C status update misses the budget
+            is reported as down.
+        NOTE 3:  A slave which is skipped by the circuit breaker is reported
+            as DOWN with a "skipped: backing off" note.  Once the backoff is
+            over the slave is connected to again and a good connection closes
+            the breaker.  The state is kept in the
+            mysql_rep_admin_breaker[_flavor_id].json file in state_dir.  The
+            circuit breaker is only used if state_dir is set to a directory
+            owned by the user which no one else can access.
 
     Example:
-        mysql_rep_admin.py -c mysql_cfg -d config -s slave.txt -T -x
+        mysql_rep_admin.py -c mysql_cfg -d config -s slave.txt -A -x
 
 """
 
 # Libraries and Global Variables
 
 # Standard
+import os
 import sys
+import stat
 import time
+import tempfile
 import socket
-
-try:
-    import simplejson as json
-except ImportError:
-    import json
+import collections
+import queue
+import threading
+import functools
+import bisect
+import itertools
+import zlib
+import importlib
 
 # Local
 try:
     from .lib import gen_libs
     from .lib import gen_class
-    from .lib import machine
-    from .mysql_lib import mysql_class
-    from .mysql_lib import mysql_libs
     from . import version
 
 except (ValueError, ImportError) as err:
     import lib.gen_libs as gen_libs                     # pylint:disable=R0402
     import lib.gen_class as gen_class                   # pylint:disable=R0402
-    import lib.machine as machine                       # pylint:disable=R0402
-    import mysql_lib.mysql_class as mysql_class         # pylint:disable=R0402
-    import mysql_lib.mysql_libs as mysql_libs           # pylint:disable=R0402
     import version
 
 __version__ = version.__version__
 
 
+class LazyModule():                                     # pylint:disable=R0903
+
+    """Class:  LazyModule
+
+    Description:  Stand-in for a module which is only imported the first
+        time one of its attributes is used.  The module names are tried in
+        order and the first one which imports is used.
+
+    Methods:
+        __init__
+        __getattr__
+        _load
+
+    """
+
+    def __init__(self, *names, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) names -> Module names to try in order
+            (input) kwargs:
+                package -> Package for relative module names
+
+        """
+
+        self._names = names
+        self._package = kwargs.get("package", None)
+        self._module = None
+
+    def __getattr__(self, attr):
+
+        """Method:  __getattr__
+
+        Description:  Returns the attribute from the imported module.
+
+        Arguments:
+            (input) attr -> Attribute name
+
+        """
+
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+
+        return getattr(self._load(), attr)
+
+    def _load(self):
+
+        """Method:  _load
+
+        Description:  Imports the module if not already imported.  Is
+            private so it cannot hide an attribute of the module.
+
+        Arguments:
+            (output) Module
+
+        """
+
+        if self._module is None:
+            for name in self._names:
+                try:
+                    self._module = importlib.import_module(
+                        name, package=self._package)
+                    break
+
+                except (ImportError, TypeError, ValueError):
+                    if name == self._names[-1]:
+                        raise
+
+        return self._module
+
+
+# Imported when first used, only the runs with options which use them pay
+#   for the import
+json = LazyModule("simplejson", "json")
+asyncio = LazyModule("asyncio")
+futures = LazyModule("concurrent.futures")
+machine = LazyModule(
+    ".lib.machine", "lib.machine", package=__package__)
+mysql_class = LazyModule(
+    ".mysql_lib.mysql_class", "mysql_lib.mysql_class", package=__package__)
+mysql_libs = LazyModule(
+    ".mysql_lib.mysql_libs", "mysql_lib.mysql_libs", package=__package__)
+
+# Default program settings, can be overridden in the -k settings file.
+SETTINGS = {"conn_workers": 10, "conn_timeout": 10, "lag_interval": 0.5,
+            "lag_deadline": 5, "chk_workers": 10, "daemon_cycles": None,
+            "pos_tolerance": 0, "time_tolerance": None, "run_deadline": None,
+            "chk_budget": None, "slv_budget": None, "state_dir": None,
+            "backoff_base": 60, "backoff_max": 3600, "discovery_ttl": 3600,
+            "cfg_cache": True, "json_backend": None, "mail_digest": None,
+            "mail_rate": None, "mail_spool": None, "mail_retries": 5}
+
+# Master configuration entries used to create the master instance.
+MST_KEYS = ["name", "sid", "user", "japd", "serv_os", "host", "port",
+            "cfg_file"]
+
+# Connection message of a slave skipped by the circuit breaker.
+SKIP_MSG = "skipped: backing off"
+
+# Connection message of a slave not connected to before the run deadline.
+DEADLINE_MSG = "skipped: run deadline reached"
+
+# Connection messages of slaves which were not tried, these are not failures
+#   for the circuit breaker.
+NOT_TRIED = (SKIP_MSG, DEADLINE_MSG)
+
+# Connection messages of an instance whose connection was taken away because
+#   its queries missed their budget, while the queries are still running and
+#   once they have finished and the connection is closed.
+ABANDON_MSG = "abandoned: queries timed out"
+CLOSED_MSG = "closed: queries timed out"
+
+# Value of a result record field which is left out of the JSON output.
+UNSET = object()
+
+# Guards the -q Timings block and the query latency histograms, the slaves
+#   are timed from several threads.
+TIMING_LOCK = threading.Lock()
+
+# Query latency histograms:  upper bound in seconds of each bucket, the
+#   mysql_class.Server methods which make a round trip to the server and the
+#   thread state which keeps a nested query call from being counted twice.
+LAT_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1,
+               2.5, 5]
+LAT_METHODS = ["sql", "col_sql", "vert_sql", "cmd_sql"]
+LAT_STATE = threading.local()
+
+# JSON backends in order of preference, the first one installed is used.
+JSON_BACKENDS = ["orjson", "simplejson", "json"]
+
+# Prometheus metrics written by the -P option:  type and help text.  The
+#   metric names are prefixed with PROM_PREFIX and the label values are
+#   escaped with PROM_ESCAPE.
+PROM_PREFIX = "mysql_rep_admin_"
+PROM_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+PROM_METRICS = {
+    "last_run_timestamp_seconds": ("gauge", "Time of the last run."),
+    "check_timeout": (
+        "gauge", "Option missed its budget or the run deadline."),
+    "master_position": ("gauge", "Master binary log position."),
+    "slave_read_position": (
+        "gauge", "Slave read position in the master binary log."),
+    "slave_exec_position": (
+        "gauge", "Slave executed position in the master binary log."),
+    "slave_connection_up": ("gauge", "Slave is connected."),
+    "slave_io_thread_up": ("gauge", "Slave IO thread is running."),
+    "slave_sql_thread_up": ("gauge", "Slave SQL thread is running."),
+    "slave_io_error": ("gauge", "Slave IO thread error number, 0 if none."),
+    "slave_sql_error": ("gauge", "Slave SQL thread error number, 0 if none."),
+    "slave_lag_seconds": ("gauge", "Slave time lag in seconds."),
+    "slave_skip_count": ("gauge", "Slave skip counter."),
+    "slave_temp_tables": ("gauge", "Slave open temporary tables."),
+    "slave_retried_transactions": ("gauge", "Slave retried transactions."),
+    "query_latency_seconds": (
+        "histogram", "SQL round trip latency of each server.")}
+
+
+class SlaveSnapshot(collections.namedtuple("SlaveSnapshot", [
+        "slave", "name", "connected", "conn", "log_info", "thr_stat",
+        "err_stat", "others", "time_lag", "slave_uuid", "gtid_mode",
+        "retrieved_gtid", "exe_gtid", "version", "snap_time",
+        "pos_time", "conn_msg"])):
+
+    """Class:  SlaveSnapshot
+
+    Description:  Immutable snapshot of a slave's replication status taken at
+        a single point in time.  Has the same read methods as the
+        mysql_class.SlaveRep class so the option functions all read the same
+        status.  The slave attribute is the live slave instance and the
+        pos_time attribute is the time the slave's log position was captured.
+
+    Methods:
+        get_name
+        is_connected
+        get_log_info
+        get_thr_stat
+        get_err_stat
+        get_others
+        get_time
+
+    """
+
+    __slots__ = ()
+
+    def get_name(self):
+
+        """Method:  get_name
+
+        Description:  Returns the slave's name.
+
+        Arguments:
+
+        """
+
+        return self.name
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Returns if the slave was connected at snapshot time.
+
+        Arguments:
+
+        """
+
+        return self.connected
+
+    def get_log_info(self):
+
+        """Method:  get_log_info
+
+        Description:  Returns the master log file, relay log file, read
+            position and executed position.
+
+        Arguments:
+
+        """
+
+        return self.log_info
+
+    def get_thr_stat(self):
+
+        """Method:  get_thr_stat
+
+        Description:  Returns the thread, IO thread, SQL thread and running
+            status.
+
+        Arguments:
+
+        """
+
+        return self.thr_stat
+
+    def get_err_stat(self):
+
+        """Method:  get_err_stat
+
+        Description:  Returns the IO and SQL errors, messages and timestamps.
+
+        Arguments:
+
+        """
+
+        return self.err_stat
+
+    def get_others(self):
+
+        """Method:  get_others
+
+        Description:  Returns the skip count, temp table count and retry
+            count.
+
+        Arguments:
+
+        """
+
+        return self.others
+
+    def get_time(self):
+
+        """Method:  get_time
+
+        Description:  Returns the time lag between the master and slave.
+
+        Arguments:
+
+        """
+
+        return self.time_lag
+
+
+class ResultRecord():
+
+    """Class:  ResultRecord
+
+    Description:  Base class for the per slave result records of the checks.
+        The records use __slots__ so a large fleet report does not build a
+        dictionary for every slave.  The fields are listed in __slots__ and
+        their JSON keys in JSON_KEYS.  A field which is UNSET is left out of
+        the JSON output.  The records are only converted to the JSON shape
+        at the output boundary by to_json.  The fields in STATE_FIELDS are
+        the status compared by the delta mode (-Q), None compares all of the
+        fields.  GOOD_STATE holds the healthy value of the fields which
+        determine whether the record reports a problem.
+
+    Methods:
+        __init__
+        to_dict
+        get_state
+        is_problem
+
+    """
+
+    __slots__ = ()
+    JSON_KEYS = ()
+    STATE_FIELDS = None
+    GOOD_STATE = {}
+
+    def __init__(self, *args, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+            (input) args -> Field values in __slots__ order
+            (input) kwargs -> Field values by field name
+
+        """
+
+        for cnt, field in enumerate(self.__slots__):
+            setattr(self, field,
+                    args[cnt] if cnt < len(args) else kwargs.get(field, UNSET))
+
+    def to_dict(self):
+
+        """Method:  to_dict
+
+        Description:  Returns the record in the JSON output shape.
+
+        Arguments:
+            (output) data -> Record in dictionary format
+
+        """
+
+        data = {}
+
+        for field, key in zip(self.__slots__, self.JSON_KEYS):
+            val = getattr(self, field)
+
+            if val is not UNSET:
+                data[key] = to_json(val)
+
+        return data
+
+    def get_state(self):
+
+        """Method:  get_state
+
+        Description:  Returns the record's status for the delta mode.
+
+        Arguments:
+            (output) state -> List of the status field values
+
+        """
+
+        state = []
+
+        for field in self.STATE_FIELDS or self.__slots__:
+            val = getattr(self, field)
+
+            if isinstance(val, ResultRecord):
+                val = val.get_state()
+
+            state.append(None if val is UNSET else to_json(val))
+
+        return state
+
+    def is_problem(self):
+
+        """Method:  is_problem
+
+        Description:  Checks to see if the record reports a problem.  A field
+            which is a record reports a problem if that record does, any
+            other field in GOOD_STATE if it is not the healthy value.
+
+        Arguments:
+            (output) True|False - Record reports a problem
+
+        """
+
+        for field, good in self.GOOD_STATE.items():
+            val = getattr(self, field)
+
+            if isinstance(val, ResultRecord):
+                if val.is_problem():
+                    return True
+
+            elif val != good:
+                return True
+
+        return False
+
+
+class SlaveLog(ResultRecord):                           # pylint:disable=R0903
+
+    """Class:  SlaveLog
+
+    Description:  Slave log positions result record for the -D option.
+
+    Methods:
+        None
+
+    """
+
+    __slots__ = ("name", "master_file", "master_pos", "relay_file",
+                 "exec_pos", "retrieved_gtid")
+    JSON_KEYS = ("Slave", "MasterFile", "MasterPosition", "RelayFile",
+                 "ExecPosition", "RetrievedGTID")
+
+
+class SlaveStatus(ResultRecord):                        # pylint:disable=R0903
+
+    """Class:  SlaveStatus
+
+    Description:  Slave log status result record for the -C option.
+
+    Methods:
+        None
+
+    """
+
+    __slots__ = ("name", "status", "info", "note")
+    JSON_KEYS = ("Name", "Status", "Info", "Note")
+    STATE_FIELDS = ("status", "note")
+    GOOD_STATE = {"status": "OK"}
+
+
+class SlaveThread(ResultRecord):                        # pylint:disable=R0903
+
+    """Class:  SlaveThread
+
+    Description:  Slave thread status result record for the -S option.
+
+    Methods:
+        None
+
+    """
+
+    __slots__ = ("name", "io_thread", "sql_thread")
+    JSON_KEYS = ("Name", "IOThread", "SQLThread")
+    GOOD_STATE = {"io_thread": "Up", "sql_thread": "Up"}
+
+
+class ThreadError(ResultRecord):                        # pylint:disable=R0903
+
+    """Class:  ThreadError
+
+    Description:  Slave IO or SQL thread error record for the -E option.
+
+    Methods:
+        None
+
+    """
+
+    __slots__ = ("status", "error", "message", "timestamp")
+    JSON_KEYS = ("Status", "Error", "Message", "Timestamp")
+    STATE_FIELDS = ("status", "error")
+    GOOD_STATE = {"status": "Good"}
+
+
+class SlaveError(ResultRecord):                         # pylint:disable=R0903
+
+    """Class:  SlaveError
+
+    Description:  Slave error result record for the -E option.  The io and
+        sql fields are ThreadError records.
+
+    Methods:
+        None
+
+    """
+
+    __slots__ = ("name", "connection", "io", "sql", "note")
+    JSON_KEYS = ("Name", "Connection", "IO", "SQL", "Note")
+    STATE_FIELDS = ("connection", "io", "sql", "note")
+    GOOD_STATE = {"connection": "Up", "io": "Good", "sql": "Good"}
+
+
+class SlaveTime(ResultRecord):
+
+    """Class:  SlaveTime
+
+    Description:  Slave time lag result record for the -T option.
+
+    Methods:
+        get_state
+
+    """
+
+    __slots__ = ("name", "slave_uuid", "lag_time", "samples",
+                 "converge_time", "note")
+    JSON_KEYS = ("Name", "Slave_UUID", "LagTime", "Samples", "ConvergeTime",
+                 "Note")
+    GOOD_STATE = {"lag_time": 0}
+
+    def get_state(self):
+
+        """Method:  get_state
+
+        Description:  Returns the record's status for the delta mode.  Any
+            time lag over zero is the same status, so a slave only changes
+            status when it starts or stops lagging.
+
+        Arguments:
+            (output) state -> List of the status field values
+
+        """
+
+        lag_time = self.lag_time
+
+        if isinstance(lag_time, (int, float)) and lag_time > 0:
+            lag_time = "Lagging"
+
+        return [None if val is UNSET else val
+                for val in (lag_time, self.note)]
+
+
+class SlaveOther(ResultRecord):                         # pylint:disable=R0903
+
+    """Class:  SlaveOther
+
+    Description:  Slave other status variables result record for the -O
+        option.
+
+    Methods:
+        None
+
+    """
+
+    __slots__ = ("name", "status", "skip_count", "tmp_tbl_count",
+                 "retry_count", "note")
+    JSON_KEYS = ("Name", "Status", "SkipCount", "TempTableCount",
+                 "RetryTransactionCount", "Note")
+    STATE_FIELDS = ("status", "note")
+    GOOD_STATE = {"status": "Good"}
+
+
+def to_json(data):
+
+    """Function:  to_json
+
+    Description:  Converts results to the JSON output shape.  Result records
+        are converted to dictionaries and lists and dictionaries are
+        converted in a single pass.
+
+    Arguments:
+        (input) data -> Results
+        (output) Results in the JSON output shape
+
+    """
+
+    if isinstance(data, ResultRecord):
+        return data.to_dict()
+
+    if isinstance(data, dict):
+        return {key: to_json(val) for key, val in data.items()}
+
+    if isinstance(data, (list, tuple)):
+        return [to_json(val) for val in data]
+
+    return data
+
+
+def dumps_json(module, data, indent=None):
+
+    """Function:  dumps_json
+
+    Description:  Serializes the data with a backend which has the same
+        dumps interface as the json module.
+
+    Arguments:
+        (input) module -> JSON backend module
+        (input) data -> Data in the JSON output shape
+        (input) indent -> Number of spaces to indent or None for compact
+        (output) JSON text
+
+    """
+
+    return module.dumps(data, indent=indent)
+
+
+def dumps_orjson(module, data, indent=None):
+
+    """Function:  dumps_orjson
+
+    Description:  Serializes the data with the orjson backend.  The orjson
+        module returns bytes and only supports an indent of 2 spaces, any
+        other indent is serialized by the json module so the -e output keeps
+        its format.
+
+    Arguments:
+        (input) module -> orjson module
+        (input) data -> Data in the JSON output shape
+        (input) indent -> Number of spaces to indent or None for compact
+        (output) JSON text
+
+    """
+
+    if indent and indent != 2:
+        return json.dumps(data, indent=indent)
+
+    return module.dumps(
+        data, option=module.OPT_INDENT_2 if indent else 0).decode("UTF-8")
+
+
+def get_serializer(backend=None):
+
+    """Function:  get_serializer
+
+    Description:  Returns the serializer for the JSON backend.  The named
+        backend is used if it is installed, otherwise the first installed
+        backend in JSON_BACKENDS is used.
+
+    Arguments:
+        (input) backend -> Name of the JSON backend or None
+        (output) Serializer function:  dumps(data, indent=None)
+
+    """
+
+    for name in ([backend] if backend else []) + JSON_BACKENDS:
+        try:
+            module = importlib.import_module(name)
+
+        except ImportError:
+            continue
+
+        return functools.partial(
+            dumps_orjson if name == "orjson" else dumps_json, module)
+
+    raise ImportError("No JSON backend is installed")
+
+
 def help_message():
 
     """Function:  help_message
@@ -364,7 +1220,7 @@ def rpt_mst_log(**kwargs):
     Arguments:
         (input) kwargs:
             master -> Master instance
-            slaves -> Slave instances
+            slaves -> SlaveSnapshot instances
         (output) data -> Results of the command in dictionary format
 
     """
@@ -397,7 +1253,7 @@ def rpt_slv_log(**kwargs):
     Arguments:
         (input) kwargs:
             master -> Master instance
-            slaves -> Slave instances
+            slaves -> SlaveSnapshot instances
         (output) data -> Results of the command in dictionary format
 
     """
@@ -409,529 +1265,3286 @@ def rpt_slv_log(**kwargs):
         for slv in slaves:
             if slv.is_connected():
                 mst_file, relay_file, read_pos, exec_pos = slv.get_log_info()
-                tdata = {"Slave": slv.get_name(), "MasterFile": mst_file,
-                         "MasterPosition": read_pos, "RelayFile": relay_file,
-                         "ExecPosition": exec_pos}
+                tdata = SlaveLog(
+                    slv.get_name(), mst_file, read_pos, relay_file, exec_pos)
 
                 if slv.gtid_mode:
-                    tdata["RetrievedGTID"] = slv.retrieved_gtid
+                    tdata.retrieved_gtid = slv.retrieved_gtid
 
             else:
-                tdata = {"Slave": slv.get_name(), "MasterFile": "Unknown",
-                         "MasterPosition": "Unknown", "RelayFile": "Unknown",
-                         "ExecPosition": "Unknown"}
+                tdata = SlaveLog(slv.get_name(), "Unknown", "Unknown",
+                                 "Unknown", "Unknown")
+
+            data["SlaveLogs"].append(tdata)
+
+    else:
+        print("rpt_slv_log:  Error:  No Slave instances detected.")
+
+    return data
+
+
+def add_skip_note(slave, data):
+
+    """Function:  add_skip_note
+
+    Description:  Adds a note to a down slave's results if the slave was
+        skipped by the circuit breaker or the run deadline instead of being
+        connected to.
+
+    Arguments:
+        (input) slave -> SlaveSnapshot instance
+        (input) data -> Slave result record
+        (output) data -> Slave result record
+
+    """
+
+    if getattr(slave, "conn_msg", None) in NOT_TRIED:
+        data.note = slave.conn_msg
+
+    return data
+
+
+def chk_slv(slave):
+
+    """Function:  chk_slv
+
+    Description:  Returns the Slave's read file and postition with the
+        executed file and position.  Will also print GTID info, in pre-MySQL
+        5.6 this will be NULL.  Include a status on whether the slave might
+        be lagging behind the master database.
+
+    Arguments:
+        (input) slave -> SlaveSnapshot instance
+        (output) data -> SlaveStatus record of the slave log information
+
+    """
+
+    mst_file, relay_file, read_pos, exec_pos = slave.get_log_info()
+
+    if slave.is_connected():
+        data = SlaveStatus(slave.get_name(), "OK")
+
+        # Slave's master info doesn't match slave's relay info
+        if mst_file != relay_file or read_pos != exec_pos:
+            data.status = \
+                "Warning:  Slave might be lagging in execution of log"
+            data.info = {"ReadLog": mst_file, "ReadPosition": read_pos,
+                         "ExecLog": relay_file, "ExecPosition": exec_pos}
+
+            if slave.gtid_mode:
+                data.info["RetrievedGTID"] = slave.retrieved_gtid
+                data.info["ExecutedGTID"] = slave.exe_gtid
+
+    else:
+        data = add_skip_note(slave, SlaveStatus(slave.get_name(), "DOWN"))
+
+    return data
+
+
+def chk_mst_log(**kwargs):
+
+    """Function:  chk_mst_log
+
+    Description:  Returns the binary log and position between the master and
+        slave(s) and the read and execute positions of the log on the slave.
+        Includes a status of whether the master and slaves are in sync.
+
+    Arguments:
+        (input) kwargs:
+            master -> Master instance
+            slaves -> SlaveSnapshot instances
+            settings -> Dictionary of program settings
+            mst_time -> Time the master's log position was captured
+        (output) data -> Results of the command in dictionary format
+
+    """
+
+    master = kwargs.get("master", None)
+    slaves = list(kwargs.get("slaves", []))
+    settings = kwargs.get("settings", SETTINGS)
+    mst_time = kwargs.get("mst_time", None)
+    data = {"CheckMasterLog": {"MasterLog": {}, "SlaveLogs": []}}
+
+    if not master and not slaves:
+        print("chk_mst_log:  Warning:  Missing Master and Slave instances.")
+        return data
+
+    if not master and slaves:
+        print("chk_mst_log: Warning:  Missing Master instance.")
+
+        for slv in slaves:
+            data["CheckMasterLog"]["SlaveLogs"].append(chk_slv(slv))
+
+        return data
+
+    fname, log_pos = master.get_log_info()
+    data["CheckMasterLog"]["MasterLog"]["Master"] = {
+        "Name": master.name, "Log": fname, "Position": log_pos}
+    data["CheckMasterLog"]["MasterLog"]["Slaves"] = []
+
+    for slv in slaves:
+        if slv.is_connected():
+            mst_file, _, read_pos, _ = slv.get_log_info()
+            tdata = SlaveStatus(slv.get_name(), "OK")
+
+            # Master's log file or position doesn't match slave's log info
+            if is_log_lagging(
+                    (fname, log_pos), (mst_file, read_pos),
+                    time_lag=slv.get_time(), settings=settings):
+                tdata.status = \
+                    "Warning:  Slave lagging in reading master log"
+                tdata.info = {"Log": mst_file, "Position": read_pos}
+                pos_time = getattr(slv, "pos_time", None)
+
+                if mst_time is not None and pos_time is not None:
+                    tdata.info["Skew"] = round(abs(pos_time - mst_time), 3)
+
+        else:
+            tdata = add_skip_note(slv, SlaveStatus(slv.get_name(), "DOWN"))
+
+        data["CheckMasterLog"]["MasterLog"]["Slaves"].append(tdata)
+        data["CheckMasterLog"]["SlaveLogs"].append(chk_slv(slv))
+
+    return data
+
+
+def is_log_lagging(mst_log, slv_log, **kwargs):
+
+    """Function:  is_log_lagging
+
+    Description:  Determines if the slave is lagging in reading the master
+        log.  A slave in the same log file as the master and within the
+        pos_tolerance number of bytes of the master's position, or ahead of
+        it as the master's position was read first, is not lagging.  If
+        time_tolerance is set, a slave with a time lag within the
+        time_tolerance number of seconds is not lagging.
+
+    Arguments:
+        (input) mst_log -> Master's log file and position
+        (input) slv_log -> Slave's master log file and read position
+        (input) kwargs:
+            time_lag -> Slave's time lag
+            settings -> Dictionary of program settings
+        (output) True|False -> Slave is lagging in reading the master log
+
+    """
+
+    fname, log_pos = mst_log
+    mst_file, read_pos = slv_log
+    settings = kwargs.get("settings", SETTINGS)
+    time_lag = kwargs.get("time_lag", None)
+    time_tol = settings.get("time_tolerance", None)
+
+    if fname == mst_file and log_pos == read_pos:
+        return False
+
+    if fname == mst_file and \
+       int(log_pos) - int(read_pos) <= int(
+           settings.get("pos_tolerance", 0)):
+        return False
+
+    if time_tol is not None and time_lag not in (None, "null") and \
+       time_lag <= time_tol:
+        return False
+
+    return True
+
+
+def chk_slv_thr(**kwargs):
+
+    """Function:  chk_slv_thr
+
+    Description:  Checks the status of the Slave(s) IO and SQL threads.
+
+    Arguments:
+        (input) kwargs:
+            master -> Master instance
+            slaves -> SlaveSnapshot instances
+        (output) data -> Results of the command in dictionary format
+
+    """
+
+    slaves = list(kwargs.get("slaves", []))
+    data = {"CheckSlaveThread": {"Slaves": []}}
+
+    if slaves:
+        for slv in slaves:
+            tdata = SlaveThread(slv.get_name(), "Up", "Up")
+            thr, io_thr, sql_thr, run = slv.get_thr_stat()
+
+            # Slave IO and run state
+            if not thr or not gen_libs.is_true(run):
+                tdata.io_thread = "Down"
+                tdata.sql_thread = "Down"
+
+            # Slave IO thread
+            elif not gen_libs.is_true(io_thr):
+                tdata.io_thread = "Down"
+
+            # Slave SQL thread
+            elif not gen_libs.is_true(sql_thr):
+                tdata.sql_thread = "Down"
+
+            data["CheckSlaveThread"]["Slaves"].append(tdata)
+
+    else:
+        print("chk_slv_thr:  Warning:  No Slave instance detected.")
+
+    return data
+
+
+def chk_slv_err(**kwargs):
+
+    """Function:  chk_slv_err
+
+    Description:  Check the Slave's IO and SQL threads for errors.
+
+    Arguments:
+        (input) kwargs:
+            master -> Master instance
+            slaves -> SlaveSnapshot instances
+        (output) data -> Results of the command in dictionary format
+
+    """
+
+    slaves = list(kwargs.get("slaves", []))
+    data = {"CheckSlaveError": {"Slaves": []}}
+
+    if not slaves:
+        print("chk_slv_err:  Warning:  No Slave instance detected.")
+        return data
+
+    for slv in slaves:
+        if slv.is_connected():
+            tdata = SlaveError(slv.get_name(), "Up", ThreadError("Good"),
+                               ThreadError("Good"))
+
+            # Pre-MySQL 5.6 versions, will be NULL for these two entries
+            iost, sql, io_msg, sql_msg, io_time, sql_time = \
+                slv.get_err_stat()
+
+            # IO error
+            if iost:
+                tdata.io = ThreadError("Bad", iost, io_msg, io_time)
+
+            # SQL error
+            if sql:
+                tdata.sql = ThreadError("Bad", sql, sql_msg, sql_time)
+
+        else:
+            tdata = add_skip_note(
+                slv, SlaveError(slv.get_name(), "DOWN", ThreadError("Unknown"),
+                                ThreadError("Unknown")))
+
+        data["CheckSlaveError"]["Slaves"].append(tdata)
+
+    return data
+
+
+def get_sid(sid):
+
+    """Function:  get_sid
+
+    Description:  Returns a server id as an integer.
+
+    Arguments:
+        (input) sid -> Server id
+        (output) Server id as an integer or None if not a server id
+
+    """
+
+    try:
+        return int(sid)
+
+    except (TypeError, ValueError):
+        return None
+
+
+def reconcile_slaves(master, slaves):
+
+    """Function:  reconcile_slaves
+
+    Description:  Reconciles the master's slave list against the slaves being
+        checked.  The master's slave list is indexed by UUID and server id,
+        so each slave is matched in a single lookup.  A slave is matched by
+        its UUID or, if down, by the server id from its configuration.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) slaves -> SlaveSnapshot instances
+        (output) recon -> Dictionary of reconciliation results
+            {"Missing": [master slave list entries not being checked],
+             "Unexpected": [slaves not in the master's slave list],
+             "Mismatched": [slaves whose name is not the master's host]}
+
+    """
+
+    recon = {"Missing": [], "Unexpected": [], "Mismatched": []}
+
+    if not master:
+        return recon
+
+    by_uuid = {}
+    by_sid = {}
+
+    for cnt, row in enumerate(master.slaves):
+        uuid = row.get("Replica_UUID", row.get("Slave_UUID"))
+        sid = get_sid(row.get("Server_Id", row.get("Server_id")))
+
+        if uuid:
+            by_uuid[uuid] = cnt
+
+        if sid is not None:
+            by_sid[sid] = cnt
+
+    matched = set()
+
+    for slv in slaves:
+        cnt = by_uuid.get(slv.slave_uuid) if slv.slave_uuid else None
+
+        if cnt is None:
+            cnt = by_sid.get(get_sid(getattr(slv.slave, "sid", None)))
+
+        if cnt is None:
+            recon["Unexpected"].append(
+                {"Name": slv.name, "Slave_UUID": slv.slave_uuid or "Unknown"})
+            continue
+
+        matched.add(cnt)
+        row = master.slaves[cnt]
+
+        if row.get("Host") and row["Host"].lower() != slv.name.lower():
+            recon["Mismatched"].append(
+                {"Name": slv.name, "Host": row["Host"],
+                 "Slave_UUID": row.get("Replica_UUID",
+                                       row.get("Slave_UUID"))})
+
+    recon["Missing"] = [row for cnt, row in enumerate(master.slaves)
+                        if cnt not in matched]
+
+    return recon
+
+
+def add_miss_slaves(master, data, slaves):
+
+    """Function:  add_miss_slaves
+
+    Description:  Adds the reconciliation of the master's slave list against
+        the checked slaves to the Check Slave Time results.  Slaves in the
+        master's slave list which are not being checked are added to the
+        slaves list with an UNK time lag.  Slaves not in the master's slave
+        list and slaves whose name does not match the master's host name are
+        listed under Unexpected and Mismatched.
+
+    Arguments:
+        (input) master -> Master instance
+        (input) data -> JSON document of Check Slave Time output
+        (input) slaves -> SlaveSnapshot instances
+        (output) data -> JSON document with the reconciliation added
+
+    """
+
+    recon = reconcile_slaves(master, slaves)
+
+    data["CheckSlaveTime"]["Slaves"] = data["CheckSlaveTime"]["Slaves"] + [
+        SlaveTime(slave_uuid=row.get("Replica_UUID", row.get("Slave_UUID")),
+                  lag_time="UNK") for row in recon["Missing"]]
+
+    for key in ["Unexpected", "Mismatched"]:
+        if recon[key]:
+            data["CheckSlaveTime"][key] = recon[key]
+
+    return data
+
+
+def chk_slv_time(**kwargs):
+
+    """Function:  chk_slv_time
+
+    Description:  Checks for time delays on the slave(s).
+
+    Arguments:
+        (input) kwargs:
+            master -> Master instance
+            slaves -> SlaveSnapshot instances
+            settings -> Dictionary of program settings
+            miss_slaves -> True|False - Add the missing, unexpected and
+                mismatched slaves to the results
+            deadline -> Time the run must be finished by
+            timings -> Dictionary of timings or None
+        (output) data -> Results of the command in dictionary format
+
+    """
+
+    master = kwargs.get("master", None)
+    slaves = list(kwargs.get("slaves", []))
+    settings = kwargs.get("settings", SETTINGS)
+    data = {"CheckSlaveTime": {"Slaves": []}}
+    start = time.time()
+
+    # Time lag sampling is stopped early if the run deadline is reached
+    lag_deadline = max(get_budget(
+        settings["lag_deadline"], kwargs.get("deadline", None)), 0)
+
+    if slaves:
+        conn_list = [slv.is_connected() for slv in slaves]
+
+        # Lagging slaves are re-checked together on a shared schedule
+        lag_list = iter(process_time_lag(
+            [[slv.slave, slv.get_time()] for slv, is_conn in
+             zip(slaves, conn_list) if is_conn],
+            lag_interval=settings["lag_interval"],
+            lag_deadline=lag_deadline))
+
+        for slv, is_conn in zip(slaves, conn_list):
+            if is_conn:
+                lag = next(lag_list)
+                data["CheckSlaveTime"]["Slaves"].append(SlaveTime(
+                    slv.get_name(), slv.slave_uuid, lag.get("LagTime"),
+                    lag.get("Samples", UNSET), lag.get("ConvergeTime", UNSET)))
+
+            else:
+                data["CheckSlaveTime"]["Slaves"].append(add_skip_note(
+                    slv, SlaveTime(slv.get_name(), "Unknown", "DOWN")))
+
+        add_timing(kwargs.get("timings", None), ["LagWait"], start)
+
+    if kwargs.get("miss_slaves", True):
+        data = add_miss_slaves(master, data, slaves)
+
+    return data
+
+
+def is_lagging(time_lag):
+
+    """Function:  is_lagging
+
+    Description:  Checks to see if a time lag value is a time lag.
+
+    Arguments:
+        (input) time_lag -> Time lag between master and slave
+        (output) True|False - If the value is a time lag
+
+    """
+
+    return time_lag == "null" or time_lag > 0
+
+
+def process_time_lag(slv_lags, **kwargs):
+
+    """Function:  process_time_lag
+
+    Description:  Check to see if the time lag still exists.  The lagging
+        slaves are re-sampled together every interval and stop being sampled
+        as soon as their time lag reaches zero or the deadline is reached.
+
+    Arguments:
+        (input) slv_lags -> List of slave instances and their time lags
+            [[slave, time_lag], ...]
+        (input) kwargs:
+            lag_interval -> Number of seconds between time lag samples
+            lag_deadline -> Number of seconds before sampling is stopped
+        (output) lag_list -> List of time lag results in the same order as
+            slv_lags: {"LagTime": time_lag, "Samples": [time_lag, ...],
+            "ConvergeTime": seconds to reach zero or None}
+
+    """
+
+    interval = kwargs.get("lag_interval", SETTINGS["lag_interval"])
+    deadline = kwargs.get("lag_deadline", SETTINGS["lag_deadline"])
+    start = time.time()
+    lag_list = []
+    lagging = []
+
+    for slv, time_lag in slv_lags:
+        tdata = {"LagTime": time_lag, "Samples": [time_lag],
+                 "ConvergeTime": 0.0}
+
+        if is_lagging(time_lag):
+            tdata["ConvergeTime"] = None
+
+            if slv.conn:
+                lagging.append([slv, tdata])
+
+        lag_list.append(tdata)
+
+    while lagging and time.time() - start < deadline:
+        time.sleep(min(interval, max(deadline - (time.time() - start), 0)))
+
+        for slv, tdata in lagging:
+            slv.upd_slv_time()
+            tdata["LagTime"] = slv.get_time()
+            tdata["Samples"].append(tdata["LagTime"])
+
+            if not is_lagging(tdata["LagTime"]):
+                tdata["ConvergeTime"] = round(time.time() - start, 3)
+
+        lagging = [item for item in lagging if is_lagging(item[1]["LagTime"])]
+
+    return lag_list
+
+
+def chk_slv_other(**kwargs):
+
+    """Function:  chk_slv_other
+
+    Description:  Returns a number of other status variables that might
+        indicate a problem on the slaves.
+
+    Arguments:
+        (input) kwargs:
+            master -> Master instance
+            slaves -> SlaveSnapshot instances
+        (output) data -> Results of the command in dictionary format
+
+    """
+
+    slaves = list(kwargs.get("slaves", []))
+    data = {"CheckSlaveOther": {"Slaves": []}}
+
+    if slaves:
+        for slv in slaves:
+            if slv.is_connected():
+                skip, tmp_tbl, retry = slv.get_others()
+                data["CheckSlaveOther"]["Slaves"].append(
+                    chk_other(
+                        skip, tmp_tbl, retry, slv.get_name(), slv.version))
+
+            else:
+                data["CheckSlaveOther"]["Slaves"].append(add_skip_note(
+                    slv, SlaveOther(slv.get_name(), "DOWN")))
+
+    else:
+        print("chk_slv_other:  Warning:  No Slave instance detected.")
+
+    return data
+
+
+def chk_other(skip, tmp_tbl, retry, name, sql_ver):
+
+    """Function:  chk_other
+
+    Description:  Print any possible problems found.
+
+    Arguments:
+        (input) skip -> Skip count
+        (input) tmp_tbl -> Temp tables create count
+        (input) retry -> Retry count
+        (input) name -> Name of Mysql server
+        (input) sql_ver -> Slave's MySQL version
+        (output) data -> SlaveOther record of problems detected in slave
+
+    """
+
+    data = SlaveOther(name, "Good")
+
+    if skip is None or skip > 0:
+        data.skip_count = skip
+        data.status = "Bad"
+
+    if not tmp_tbl or int(tmp_tbl) > 5:
+        data.tmp_tbl_count = tmp_tbl
+        data.status = "Bad"
+
+    if (sql_ver[0] < 8 and (not retry or int(retry) > 0)) \
+       or (sql_ver[0] >= 8 and retry > 0):
+        data.retry_count = retry
+        data.status = "Bad"
+
+    return data
+
+
+def create_filename(args, dtg=None):
+
+    """Function:  create_filename
+
+    Description:  Creates a filename for the attachment to an email.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) dtg -> TimeFormat instance
+        (output) -> File name for the email attachment
+
+    """
+
+    join_list = [args.get_val("-f")]
+
+    if args.arg_exist("-n"):
+        join_list.append(socket.gethostname())
+
+    if args.arg_exist("-g"):
+        join_list.append(dtg.get_time("dtg"))
+
+    if args.arg_exist("-m"):
+        join_list.append(dtg.msecs)
+
+    join_list.append("json")
+
+    if args.arg_exist("-Z"):
+        join_list.append("gz")
+
+    return ".".join(join_list)
+
+
+def gzip_text(text, chunk=65536):
+
+    """Function:  gzip_text
+
+    Description:  Returns the text compressed in the gzip format.  The text
+        is encoded and compressed a chunk at a time so only the compressed
+        copy of the whole text is kept.
+
+    Arguments:
+        (input) text -> Text
+        (input) chunk -> Number of characters compressed at a time
+        (output) Gzip compressed bytes
+
+    """
+
+    comp = zlib.compressobj(9, zlib.DEFLATED, 31)
+    parts = [comp.compress(text[pos:pos + chunk].encode("UTF-8"))
+             for pos in range(0, len(text), chunk)]
+    parts.append(comp.flush())
+
+    return b"".join(parts)
+
+
+def text_out(text, args, mode="w"):
+
+    """Function:  text_out
+
+    Description:  Writes the JSON text to the -o file and standard out.
+
+    Arguments:
+        (input) text -> JSON text
+        (input) args -> ArgParser class instance
+        (input) mode -> File mode for the -o file: a|w
+        (output) status -> Tuple of error flag and error message
+
+    """
+
+    ofile = args.get_val("-o", def_val=None)
+
+    if ofile:
+        try:
+            with open(ofile, mode, encoding="UTF-8") as fhdr:
+                fhdr.write(text + "\n")
+
+        except OSError as err:
+            return True, str(err)
+
+    if not args.arg_exist("-z"):
+        print(text, flush=True)
+
+    return False, None
+
+
+def send_msg(msg):
+
+    """Function:  send_msg
+
+    Description:  Sends an email message in the body or as an attachment.
+        The attachment is gzipped when the message is sent so a spooled
+        message keeps the JSON text.  The text is attached as it is, as it
+        is already serialized in the -e format by the json_backend setting.
+
+    Arguments:
+        (input) msg -> Dictionary of the email message
+
+    """
+
+    if msg["Attachment"] and msg.get("Gzip", False):
+        mail = gen_class.Mail2(msg["Subject"], msg["To"])
+        mail.add_attachment(msg["Attachment"], "gzip", gzip_text(msg["Text"]))
+        mail.send_email()
+
+    # Mail2 would serialize a json attachment again
+    elif msg["Attachment"]:
+        mail = gen_class.Mail2(msg["Subject"], msg["To"])
+        mail.add_attachment(msg["Attachment"], "text", msg["Text"])
+        mail.send_email()
+
+    else:
+        mail = gen_class.setup_mail(msg["To"], subj=msg["Subject"])
+        mail.add_2_msg(msg["Text"])
+        mail.send_mail(use_mailx=msg["Mailx"])
+
+
+def spool_mail(msg, spool):
+
+    """Function:  spool_mail
+
+    Description:  Writes an email message to the spool directory to be sent
+        later by flush_spool.  The file name starts with the time so the
+        emails are sent in the order they were spooled.
+
+    Arguments:
+        (input) msg -> Dictionary of the email message
+        (input) spool -> Spool directory
+        (output) True|False - Email message was spooled
+
+    """
+
+    return save_state(
+        os.path.join(spool, f"{time.time_ns()}_{os.getpid()}.json"), msg)
+
+
+def flush_spool(spool, **kwargs):
+
+    """Function:  flush_spool
+
+    Description:  Sends the email messages in the spool directory in the
+        order they were spooled.  Each message is claimed by renaming it so
+        two flushes never send the same message.  A message which fails to
+        send is left for the next flush and is renamed to .failed after the
+        number of retries.  The stale claims of a flush which did not finish
+        are sent again.
+
+    Arguments:
+        (input) spool -> Spool directory
+        (input) kwargs:
+            retries -> Number of times a message is tried
+            claim_age -> Number of seconds before a claim is stale
+        (output) sent -> Number of messages sent
+
+    """
+
+    retries = kwargs.get("retries", 5)
+    sent = 0
+    recover_claims(spool, claim_age=kwargs.get("claim_age", 3600))
+
+    try:
+        fnames = sorted(
+            name for name in os.listdir(spool) if name.endswith(".json"))
+
+    except OSError as err:
+        print(f"flush_spool 1:  Error detected: {err}")
+        fnames = []
+
+    for name in fnames:
+        fname = os.path.join(spool, name)
+        claim = f"{fname}.{os.getpid()}"
+
+        try:
+            os.rename(fname, claim)
+
+        except OSError:
+            # Already claimed by another flush
+            continue
+
+        msg = load_state(claim)
+
+        try:
+            send_msg(msg)
+
+        except (OSError, KeyError) as err:
+            msg["Attempts"] = msg.get("Attempts", 0) + 1
+            save_state(claim, msg)
+
+            if msg["Attempts"] >= retries:
+                print(f"flush_spool 2:  Error detected: {err}, moved to"
+                      f" {fname[:-5]}.failed")
+                os.replace(claim, fname[:-5] + ".failed")
+
+            else:
+                os.replace(claim, fname)
+
+        else:
+            os.remove(claim)
+            sent += 1
+
+    return sent
+
+
+def recover_claims(spool, **kwargs):
+
+    """Function:  recover_claims
+
+    Description:  Puts the messages claimed by a flush which did not finish
+        back in the spool directory.  A claim is stale if the process which
+        made it is no longer running, or is this process as flushes are not
+        run at the same time within a process, or the claim is older than
+        the claim_age number of seconds in case the process id was reused.
+
+    Arguments:
+        (input) spool -> Spool directory
+        (input) kwargs:
+            claim_age -> Number of seconds before a claim is stale
+        (output) recovered -> Number of messages put back
+
+    """
+
+    claim_age = kwargs.get("claim_age", 3600)
+    now = time.time()
+    recovered = 0
+
+    try:
+        names = os.listdir(spool)
+
+    except OSError:
+        # The spool directory error is reported by flush_spool
+        names = []
+
+    for name in names:
+        fname, _, pid = name.rpartition(".")
+
+        if not fname.endswith(".json") or not pid.isdigit():
+            continue
+
+        claim = os.path.join(spool, name)
+
+        try:
+            if int(pid) != os.getpid() and is_running(int(pid)) and \
+               now - os.path.getmtime(claim) < claim_age:
+                continue
+
+            os.rename(claim, os.path.join(spool, fname))
+            recovered += 1
+
+        except OSError:
+            # Already recovered by another flush
+            continue
+
+    return recovered
+
+
+def is_running(pid):
+
+    """Function:  is_running
+
+    Description:  Checks to see if a process is running.
+
+    Arguments:
+        (input) pid -> Process id
+        (output) True|False - Process is running
+
+    """
+
+    try:
+        os.kill(pid, 0)
+
+    except ProcessLookupError:
+        return False
+
+    except PermissionError:
+        # Running as another user
+        return True
+
+    return True
+
+
+def mail_out(text, args, **kwargs):
+
+    """Function:  mail_out
+
+    Description:  Emails the JSON text in the body or as an attachment.  If
+        a spool directory is given, the email is written to the spool
+        directory and sent later by flush_spool.  The email is sent right
+        away if it cannot be spooled.
+
+    Arguments:
+        (input) text -> JSON text
+        (input) args -> ArgParser class instance
+        (input) kwargs:
+            def_subj -> Default subject line for email
+            dtg -> TimeFormat instance
+            spool -> Spool directory or None
+
+    """
+
+    def_subj = kwargs.get("def_subj", "MySQLRepAdminCheck")
+    spool = kwargs.get("spool", None)
+    msg = {"Subject": args.get_val("-u", def_val=def_subj),
+           "To": args.get_val("-t"), "Text": text, "Attachment": None,
+           "Gzip": args.arg_exist("-Z"), "Mailx": args.arg_exist("-w")}
+
+    if args.arg_exist("-r"):
+        msg["Attachment"] = create_filename(args, dtg=kwargs.get("dtg", None))
+
+    if not spool or not spool_mail(msg, spool):
+        send_msg(msg)
+
+
+def data_out(data, args, **kwargs):
+
+    """Function:  data_out
+
+    Description:  Outputs the data in a variety of formats and media.  The
+        data is serialized once and the same JSON text is used for the -o
+        file, standard out and the email.  Only the email is sent if there
+        is no data, which sends a mail digest which is due.
+
+    Arguments:
+        (input) data -> Data output results or None
+        (input) args -> ArgParser class instance
+        (input) kwargs:
+            def_subj -> Default subject line for email
+            dtg -> TimeFormat instance
+            streamed -> True|False - Results were already written out as
+                JSON lines, only the email is sent
+            dumps -> Serializer function from get_serializer
+            settings -> Dictionary of program settings
+            timings -> Dictionary of timings or None, the Output and Mail
+                times are added to it
+
+    """
+
+    dumps = kwargs.get("dumps", None) or get_serializer()
+    timings = kwargs.get("timings", None)
+    indent = 4 if args.arg_exist("-e") else None
+    start = time.time()
+    text = None if data is None else dumps(to_json(data), indent=indent)
+    status = (False, None)
+
+    if data is not None and not kwargs.get("streamed", False):
+        status = text_out(
+            text, args, mode="a" if args.arg_exist("-a") else "w")
+        add_timing(timings, ["Output"], start)
+
+    if status[0]:
+        print(f"data_out 1:  Error detected: {status[1]}")
+
+    if args.arg_exist("-t") and not status[0]:
+        settings = kwargs.get("settings", SETTINGS)
+        start = time.time()
+        mail_data = get_mail_data(data, args, settings=settings)
+
+        if mail_data is not None:
+            if mail_data is not data:
+                text = dumps(to_json(mail_data), indent=indent)
+
+            mail_out(
+                text, args, dtg=kwargs.get("dtg", None),
+                def_subj=kwargs.get("def_subj", "MySQLRepAdminCheck"),
+                spool=settings["mail_spool"])
+            add_timing(timings, ["Mail"], start)
+
+
+def line_out(data, check, args, **kwargs):
+
+    """Function:  line_out
+
+    Description:  Writes an option's results as a single JSON line to the -o
+        file and standard out as soon as the option finishes.  Each line
+        holds the application, master and time of the run, so a line can be
+        read on its own.  With the -x option, an option with no problem is
+        not written and None is returned.
+
+    Arguments:
+        (input) data -> Data output results for the run
+        (input) check -> Results of the option
+        (input) args -> ArgParser class instance
+        (input) kwargs:
+            mode -> File mode for the -o file: a|w
+            dumps -> Serializer function from get_serializer
+            key -> Key the results are written under: Check|Timings
+        (output) status -> Tuple of error flag and error message or None if
+            nothing was written
+
+    """
+
+    key = kwargs.get("key", "Check")
+
+    if key == "Check" and args.arg_exist("-x") and not has_problem(check):
+        return None
+
+    dumps = kwargs.get("dumps", None) or get_serializer()
+    status = text_out(dumps(
+        {"Application": data["Application"], "Master": data["Master"],
+         "AsOf": data["AsOf"], key: to_json(check)}),
+        args, mode=kwargs.get("mode", "a"))
+
+    if status[0]:
+        print(f"line_out 1:  Error detected: {status[1]}")
+
+    return status
+
+
+def iter_records(data):
+
+    """Function:  iter_records
+
+    Description:  Returns the result records in the results.
+
+    Arguments:
+        (input) data -> Results
+        (output) Generator of the result records
+
+    """
+
+    if isinstance(data, ResultRecord):
+        yield data
+
+    elif isinstance(data, dict):
+        for val in data.values():
+            yield from iter_records(val)
+
+    elif isinstance(data, list):
+        for val in data:
+            yield from iter_records(val)
+
+
+def get_rec_metrics(rec, slv):
+
+    """Function:  get_rec_metrics
+
+    Description:  Returns the Prometheus metrics of a result record.  The
+        counters and log positions of the -O and -C options are only in the
+        results when there is a problem, so they are read from the slave's
+        status snapshot the option checked.
+
+    Arguments:
+        (input) rec -> Result record
+        (input) slv -> SlaveSnapshot instance of the record's slave or None
+        (output) metrics -> List of metric name, extra labels and value
+
+    """
+
+    metrics = []
+    connected = slv is not None and slv.is_connected()
+
+    if isinstance(rec, SlaveTime):
+        metrics.append(("slave_lag_seconds", {}, rec.lag_time))
+
+    elif isinstance(rec, SlaveThread):
+        metrics.append(("slave_io_thread_up", {}, int(rec.io_thread == "Up")))
+        metrics.append(
+            ("slave_sql_thread_up", {}, int(rec.sql_thread == "Up")))
+
+    elif isinstance(rec, SlaveError):
+        metrics.append(
+            ("slave_connection_up", {}, int(rec.connection == "Up")))
+
+        for thr, err in (("io", rec.io), ("sql", rec.sql)):
+            if isinstance(err, ThreadError) and err.status == "Good":
+                metrics.append((f"slave_{thr}_error", {}, 0))
+
+            elif isinstance(err, ThreadError) and err.status == "Bad":
+                metrics.append((f"slave_{thr}_error", {}, err.error))
+
+    elif isinstance(rec, SlaveOther) and connected:
+        skip, tmp_tbl, retry = slv.get_others()
+        metrics.append(("slave_skip_count", {}, skip))
+        metrics.append(("slave_temp_tables", {}, tmp_tbl))
+        metrics.append(("slave_retried_transactions", {}, retry))
+
+    elif isinstance(rec, SlaveLog):
+        metrics.append(("slave_read_position", {"log": rec.master_file},
+                        rec.master_pos))
+        metrics.append(
+            ("slave_exec_position", {"log": rec.relay_file}, rec.exec_pos))
+
+    elif isinstance(rec, SlaveStatus) and connected:
+        mst_file, relay_file, read_pos, exec_pos = slv.get_log_info()
+        metrics.append(("slave_read_position", {"log": mst_file}, read_pos))
+        metrics.append(("slave_exec_position", {"log": relay_file}, exec_pos))
+
+    return metrics
+
+
+def get_metrics(checks, slaves, now, latency=None):
+
+    """Function:  get_metrics
+
+    Description:  Returns the Prometheus metrics of the options' results.
+        The slave metrics are labeled with the slave's name and UUID.  A
+        slave reported by more than one option only has one of each metric.
+        The query latency histograms are labeled with the server's name.
+
+    Arguments:
+        (input) checks -> List of options and their results
+        (input) slaves -> List of SlaveSnapshot instances
+        (input) now -> Time of the run
+        (input) latency -> Dictionary of latency histograms or None
+        (output) metrics -> Dictionary of metric name and labels to value
+
+    """
+
+    snaps = {slv.get_name(): slv for slv in slaves}
+    metrics = {("last_run_timestamp_seconds", ()): now}
+
+    for opt, check in checks:
+        metrics[("check_timeout", (("option", opt),))] = \
+            int(check.get("Status") == "TIMEOUT")
+        mst_log = check.get("MasterLog") or \
+            check.get("CheckMasterLog", {}).get("MasterLog", {}).get("Master")
+
+        if mst_log:
+            metrics[("master_position", (
+                ("master", mst_log.get("Master", mst_log.get("Name"))),
+                ("log", mst_log.get("MasterLog", mst_log.get("Log")))))] = \
+                mst_log.get("LogPosition", mst_log.get("Position"))
+
+        for rec in iter_records(check):
+            name = getattr(rec, "name", UNSET)
+            slv = snaps.get(name)
+            uuid = getattr(slv, "slave_uuid", None) or \
+                getattr(rec, "slave_uuid", None)
+            labels = (("slave", name),
+                      ("uuid", uuid if isinstance(uuid, str) else ""))
+
+            for metric, extra, val in get_rec_metrics(rec, slv):
+                metrics[(metric, labels + tuple(extra.items()))] = val
+
+    for name, hist in get_latency(latency or {}).items():
+        for bound, cnt in hist["Buckets"].items():
+            metrics[("query_latency_seconds_bucket",
+                     (("server", name), ("le", bound)))] = cnt
+
+        metrics[("query_latency_seconds_sum", (("server", name),))] = \
+            hist["Sum"]
+        metrics[("query_latency_seconds_count", (("server", name),))] = \
+            hist["Count"]
+
+    return metrics
+
+
+def prom_value(val):
+
+    """Function:  prom_value
+
+    Description:  Returns a metric value in the Prometheus text format or None
+        if the value is not a number, such as Unknown or DOWN.
+
+    Arguments:
+        (input) val -> Metric value
+        (output) Metric value as text or None
+
+    """
+
+    if isinstance(val, bool) or not isinstance(val, (int, float, str)):
+        return None
+
+    try:
+        num = float(val)
+
+    except ValueError:
+        return None
+
+    return str(int(num)) if num.is_integer() else repr(num)
+
+
+def format_metrics(metrics):
+
+    """Function:  format_metrics
+
+    Description:  Returns the metrics in the Prometheus text format.  The
+        metrics are in PROM_METRICS order with their help and type lines.  A
+        histogram's samples are its _bucket, _sum and _count metrics.
+
+    Arguments:
+        (input) metrics -> Dictionary of metric name and labels to value
+        (output) Metrics in the Prometheus text format
+
+    """
+
+    lines = []
+
+    for metric, (mtype, mhelp) in PROM_METRICS.items():
+        samples = []
+        names = [metric + suffix for suffix in ("_bucket", "_sum", "_count")] \
+            if mtype == "histogram" else [metric]
+
+        for (name, labels), val in metrics.items():
+            val = prom_value(val) if name in names else None
+
+            if val is not None:
+                label_txt = ",".join(
+                    f'{key}="{str(lval).translate(PROM_ESCAPE)}"'
+                    for key, lval in labels)
+                samples.append(
+                    f"{PROM_PREFIX}{name}"
+                    f"{'{' + label_txt + '}' if label_txt else ''} {val}")
+
+        if samples:
+            lines.append(f"# HELP {PROM_PREFIX}{metric} {mhelp}")
+            lines.append(f"# TYPE {PROM_PREFIX}{metric} {mtype}")
+            lines.extend(samples)
+
+    return "\n".join(lines) + "\n"
+
+
+def prom_out(checks, slaves, fname, **kwargs):
+
+    """Function:  prom_out
+
+    Description:  Writes the options' results as Prometheus metrics to the -P
+        file for the node_exporter textfile collector.  The file is written
+        to a temporary file first and then moved into place so the collector
+        never reads a partial file.
+
+    Arguments:
+        (input) checks -> List of options and their results
+        (input) slaves -> List of SlaveSnapshot instances
+        (input) fname -> Path to the metrics file
+        (input) kwargs:
+            now -> Time of the run
+            latency -> Dictionary of latency histograms or None
+        (output) status -> Tuple of error flag and error message
+
+    """
+
+    text = format_metrics(get_metrics(
+        checks, slaves, kwargs.get("now", None) or time.time(),
+        kwargs.get("latency", None)))
+    tmp_file = fname + ".tmp"
+
+    try:
+        with open(tmp_file, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write(text)
+
+        os.replace(tmp_file, fname)
+
+    except (IOError, OSError) as err:
+        print(f"prom_out 1:  Error detected: {err}")
+        return True, str(err)
+
+    return False, None
+
+
+def has_problem(data):
+
+    """Function:  has_problem
+
+    Description:  Checks to see if the results report a problem for the
+        problem-only mode (-x).  A result record which reports a problem, an
+        option or slave which missed its budget and slaves listed under
+        Unexpected or Mismatched are a problem.
+
+    Arguments:
+        (input) data -> Results
+        (output) True|False - If a problem is detected
+
+    """
+
+    if isinstance(data, ResultRecord):
+        return data.is_problem()
+
+    if isinstance(data, dict):
+        if data.get("Status") == "TIMEOUT" or data.get("Unexpected") \
+           or data.get("Mismatched"):
+            return True
+
+        return any(has_problem(val) for val in data.values())
+
+    if isinstance(data, list):
+        return any(has_problem(val) for val in data)
+
+    return False
+
+
+def get_rec_key(path, rec):
+
+    """Function:  get_rec_key
+
+    Description:  Returns the delta state key of a result record.  The
+        record is identified by its name or, for a missing slave, its UUID.
+
+    Arguments:
+        (input) path -> Path to the list holding the record
+        (input) rec -> Result record
+        (output) Delta state key
+
+    """
+
+    name = getattr(rec, "name", UNSET)
+
+    if name is UNSET:
+        name = getattr(rec, "slave_uuid", UNSET)
+
+    return f"{path}/{None if name is UNSET else name}"
+
+
+def filter_records(data, path, keep):
+
+    """Function:  filter_records
+
+    Description:  Returns a copy of the results with only the result records
+        the keep function keeps.  The keep function is called with each
+        record's key and status.
+
+    Arguments:
+        (input) data -> Results
+        (input) path -> Path to the results
+        (input) keep -> Function:  keep(key, state) -> True|False
+        (output) data -> Results with only the kept records
+        (output) found -> Number of records found
+        (output) kept -> Number of records kept
+
+    """
+
+    found = kept = 0
+
+    if isinstance(data, dict):
+        tdata = {}
+
+        for key, val in data.items():
+            tdata[key], tfound, tkept = filter_records(
+                val, f"{path}/{key}", keep)
+            found += tfound
+            kept += tkept
+
+        return tdata, found, kept
+
+    if isinstance(data, list):
+        tdata = []
+
+        for val in data:
+            if isinstance(val, ResultRecord):
+                found += 1
+
+                if keep(get_rec_key(path, val), val.get_state()):
+                    tdata.append(val)
+                    kept += 1
+
+            else:
+                tdata.append(val)
+
+        return tdata, found, kept
+
+    return data, found, kept
+
+
+def is_changed(state, new_state, key, rec_state):
+
+    """Function:  is_changed
+
+    Description:  Adds the status to the delta state of this run and checks
+        to see if it changed since the last run.
+
+    Arguments:
+        (input) state -> Delta state of the last run
+        (input) new_state -> Delta state of this run
+        (input) key -> Delta state key
+        (input) rec_state -> Status of this run
+        (output) True|False - Status changed since the last run
+
+    """
+
+    new_state[key] = rec_state
+
+    return state.get(key) != rec_state
+
+
+def get_delta(opt, check, state, new_state):
+
+    """Function:  get_delta
+
+    Description:  Returns the option's results with only the slaves whose
+        status changed since the last run for the delta mode (-Q).  An
+        option with no slave records, such as -B or an option which timed
+        out, is compared as a whole.  Returns None if nothing changed.
+
+    Arguments:
+        (input) opt -> Option
+        (input) check -> Results of the option
+        (input) state -> Delta state of the last run
+        (input) new_state -> Delta state of this run
+        (output) data -> Changed results of the option or None
+
+    """
+
+    data, found, changed = filter_records(
+        check, opt, functools.partial(is_changed, state, new_state))
+
+    if not found:
+        changed = is_changed(state, new_state, opt, to_json(check))
+
+    return data if changed else None
+
+
+def is_mail_due(sent, rate, now, key, rec_state):
+
+    """Function:  is_mail_due
+
+    Description:  Checks to see if a slave's or option's status is due to be
+        emailed.  The same status is only emailed once every rate number of
+        seconds, a new status is emailed right away.
+
+    Arguments:
+        (input) sent -> Dictionary of the status and time last emailed
+        (input) rate -> Number of seconds between emails of the same status
+        (input) now -> Current time
+        (input) key -> Slave or option key
+        (input) rec_state -> Status of this run
+        (output) True|False - Status is due to be emailed
+
+    """
+
+    last = sent.get(key)
+
+    if last and last[0] == rec_state and now - last[1] < rate:
+        return False
+
+    sent[key] = [rec_state, now]
+
+    return True
+
+
+def limit_mail(data, sent, rate, now):
+
+    """Function:  limit_mail
+
+    Description:  Returns the results with only the slaves and options which
+        are due to be emailed under the mail_rate setting.  Returns None if
+        nothing is due.
+
+    Arguments:
+        (input) data -> Data output results
+        (input) sent -> Dictionary of the status and time last emailed
+        (input) rate -> Number of seconds between emails of the same status
+        (input) now -> Current time
+        (output) data -> Data output results due to be emailed or None
+
+    """
+
+    keep = functools.partial(is_mail_due, sent, rate, now)
+    checks = []
+
+    # Entries past the rate no longer hold back an email
+    for key in [key for key, val in sent.items() if now - val[1] >= rate]:
+        del sent[key]
+
+    for check in data["Checks"]:
+        key = check.get("Option", next(iter(check), None))
+        tdata, found, kept = filter_records(check, key, keep)
+
+        if kept or (not found and keep(key, to_json(check))):
+            checks.append(tdata)
+
+    return dict(data, Checks=checks) if checks else None
+
+
+def add_digest(data, state, window, now):
+
+    """Function:  add_digest
+
+    Description:  Adds the results to the mail digest.  The first results
+        are emailed right away and open a digest window of the mail_digest
+        setting number of seconds.  Results during the window are held and
+        emailed together by the first run after the window is over.
+
+    Arguments:
+        (input) data -> Data output results or None
+        (input) state -> Mail state
+        (input) window -> Number of seconds in a digest window
+        (input) now -> Current time
+        (output) data -> Results or digest to be emailed or None
+
+    """
+
+    if "start" in state and now - state["start"] < window:
+        if data is not None:
+            state.setdefault("pending", []).append(to_json(data))
+
+        return None
+
+    docs = state.pop("pending", [])
+
+    if data is not None:
+        docs.append(to_json(data))
+
+    if not docs:
+        state.pop("start", None)
+        return None
+
+    state["start"] = now
+
+    return docs[0] if len(docs) == 1 else \
+        {"Application": "MySQLReplication", "Digest": docs}
+
+
+def get_mail_data(data, args, **kwargs):
+
+    """Function:  get_mail_data
+
+    Description:  Returns the results to be emailed after the mail_rate and
+        mail_digest settings are applied.  The mail state is kept in the
+        mysql_rep_admin_mail[_flavor_id].json state file, which decides
+        what is emailed, so the settings are only applied with a private
+        state_dir.  Otherwise every result is emailed.
+
+    Arguments:
+        (input) data -> Data output results or None
+        (input) args -> ArgParser class instance
+        (input) kwargs:
+            settings -> Dictionary of program settings
+        (output) data -> Results to be emailed or None
+
+    """
+
+    settings = kwargs.get("settings", SETTINGS)
+
+    if settings["mail_rate"] is None and settings["mail_digest"] is None:
+        return data
+
+    fname = get_private_file(args, settings, "mail")
+
+    if not fname:
+        if not settings["state_dir"]:
+            print("get_mail_data:  Warning:  The mail_rate and mail_digest"
+                  " settings require the state_dir setting, all results are"
+                  " emailed.")
+
+        return data
+
+    now = time.time()
+    state = load_state(fname)
+
+    if data is not None and settings["mail_rate"] is not None:
+        data = limit_mail(
+            data, state.setdefault("sent", {}), settings["mail_rate"], now)
+
+    if settings["mail_digest"] is not None:
+        data = add_digest(data, state, settings["mail_digest"], now)
+
+    save_state(fname, state)
+
+    return data
+
+
+def create_snapshot(slv, pos_time=None):
+
+    """Function:  create_snapshot
+
+    Description:  Takes a snapshot of the slave's replication status.  The
+        status is read from the slave's last status update, so every option
+        uses the same status without further queries to the slave.  A slave
+        whose connection was abandoned has no status in its snapshot.
+
+    Arguments:
+        (input) slv -> Slave instance
+        (input) pos_time -> Time the slave's status was captured
+        (output) SlaveSnapshot instance
+
+    """
+
+    snap_time = time.time()
+
+    # A status update which missed its budget may have been cut off part way
+    if getattr(slv, "conn_msg", None) in (ABANDON_MSG, CLOSED_MSG):
+        return SlaveSnapshot(
+            slave=slv, name=slv.get_name(), connected=False, conn=None,
+            log_info=(None,) * 4, thr_stat=(None,) * 4, err_stat=(None,) * 6,
+            others=(None,) * 3, time_lag=None, slave_uuid=None,
+            gtid_mode=None, retrieved_gtid=None, exe_gtid=None, version=None,
+            snap_time=snap_time, pos_time=snap_time, conn_msg=slv.conn_msg)
+
+    return SlaveSnapshot(
+        slave=slv, name=slv.get_name(), connected=slv.is_connected(),
+        conn=slv.conn, log_info=tuple(slv.get_log_info()),
+        thr_stat=tuple(slv.get_thr_stat()),
+        err_stat=tuple(slv.get_err_stat()), others=tuple(slv.get_others()),
+        time_lag=slv.get_time(), slave_uuid=getattr(slv, "slave_uuid", None),
+        gtid_mode=getattr(slv, "gtid_mode", None),
+        retrieved_gtid=getattr(slv, "retrieved_gtid", None),
+        exe_gtid=getattr(slv, "exe_gtid", None),
+        version=getattr(slv, "version", None), snap_time=snap_time,
+        pos_time=snap_time if pos_time is None else pos_time,
+        conn_msg=getattr(slv, "conn_msg", None))
+
+
+def add_timing(timings, keys, start, end=None):
+
+    """Function:  add_timing
+
+    Description:  Adds the number of seconds since the start time to the
+        Timings block (-q option) under the keys.  The longest time is kept
+        if the same keys are timed more than once, such as the time lag
+        wait of slaves checked concurrently.  Nothing is done if timings is
+        None.
+
+    Arguments:
+        (input) timings -> Dictionary of timings or None
+        (input) keys -> List of keys, the last key holds the time
+        (input) start -> Start time
+        (input) end -> End time or None for the current time
+
+    """
+
+    if timings is None:
+        return
+
+    secs = round((time.time() if end is None else end) - start, 3)
+
+    with TIMING_LOCK:
+        for key in keys[:-1]:
+            timings = timings.setdefault(key, {})
+
+        timings[keys[-1]] = max(timings.get(keys[-1], 0), secs)
+
+
+def add_latency(latency, name, secs):
+
+    """Function:  add_latency
+
+    Description:  Adds a query's round trip time to the server's latency
+        histogram.
+
+    Arguments:
+        (input) latency -> Dictionary of latency histograms by server name
+        (input) name -> Server name
+        (input) secs -> Number of seconds the round trip took
+
+    """
+
+    with TIMING_LOCK:
+        hist = latency.setdefault(
+            name, {"Buckets": [0] * (len(LAT_BUCKETS) + 1), "Count": 0,
+                   "Sum": 0.0, "Max": 0.0})
+        hist["Buckets"][bisect.bisect_left(LAT_BUCKETS, secs)] += 1
+        hist["Count"] += 1
+        hist["Sum"] += secs
+        hist["Max"] = max(hist["Max"], secs)
+
+
+def timed_query(func, latency, name, *args, **kwargs):
+
+    """Function:  timed_query
+
+    Description:  Calls a server query method and adds the round trip time to
+        the server's latency histogram.  A query method called from within
+        another query method is not counted again.
+
+    Arguments:
+        (input) func -> Query method to be called
+        (input) latency -> Dictionary of latency histograms by server name
+        (input) name -> Server name
+        (input) *args -> Arguments of the query method
+        (input) **kwargs -> Keyword arguments of the query method
+        (output) Results of the query method
+
+    """
+
+    if getattr(LAT_STATE, "busy", False):
+        return func(*args, **kwargs)
+
+    LAT_STATE.busy = True
+    start = time.perf_counter()
+
+    try:
+        return func(*args, **kwargs)
+
+    finally:
+        LAT_STATE.busy = False
+        add_latency(latency, name, time.perf_counter() - start)
+
+
+def track_latency(server, latency):
+
+    """Function:  track_latency
+
+    Description:  Times every query the server instance makes, such as the
+        status, variable and GTID reads, by replacing the instance's query
+        methods with timed ones.  Nothing is done if latency is None.
+
+    Arguments:
+        (input) server -> Master or slave instance
+        (input) latency -> Dictionary of latency histograms or None
+
+    """
+
+    if latency is None:
+        return
+
+    for method in LAT_METHODS:
+        func = getattr(server, method, None)
+
+        if callable(func):
+            setattr(server, method, functools.partial(
+                timed_query, func, latency, server.name))
+
+
+def get_latency(latency):
+
+    """Function:  get_latency
+
+    Description:  Returns the latency histograms in the output format.  The
+        bucket counts are cumulative, the same as a Prometheus histogram.
+
+    Arguments:
+        (input) latency -> Dictionary of latency histograms by server name
+        (output) data -> Dictionary of latency histograms by server name
+
+    """
+
+    data = {}
+
+    with TIMING_LOCK:
+        for name, hist in latency.items():
+            cnts = itertools.accumulate(hist["Buckets"])
+            data[name] = {
+                "Count": hist["Count"], "Sum": round(hist["Sum"], 6),
+                "Max": round(hist["Max"], 6),
+                "Buckets": dict(zip(
+                    [str(bound) for bound in LAT_BUCKETS] + ["+Inf"],
+                    cnts))}
+
+    return data
+
+
+def timed_call(func):
+
+    """Function:  timed_call
+
+    Description:  Calls the function and returns the time at the midpoint of
+        the call, which is the best estimate of when a status query was
+        answered by the server.
+
+    Arguments:
+        (input) func -> Function to be called
+        (output) Midpoint time of the call
+
+    """
+
+    start = time.time()
+    func()
+
+    return (start + time.time()) / 2
+
+
+def sample_status(master, slaves, **kwargs):
+
+    """Function:  sample_status
+
+    Description:  Updates the master and slaves status at the same time, so
+        the master and slave log positions are captured as close together
+        as possible.  Each status update is stamped with the time it was
+        captured.  Instances which are not connected are not updated.  The
+        connection of an instance whose status update misses the budget is
+        abandoned with drop_conn and has no capture time.  An instance whose
+        status update fails has its connection closed, so it is seen as
+        down and is connected again by refresh_status.
+
+    Arguments:
+        (input) master -> Master instance or None
+        (input) slaves -> List of slave instances
+        (input) kwargs:
+            workers -> Maximum number of status updates run at the same time
+            budget -> Number of seconds or None for no budget
+        (output) mst_time -> Time the master's status was captured
+        (output) slv_times -> List of times the slaves' status was captured
+
+    """
+
+    slaves = list(slaves)
+    workers = kwargs.get("workers", len(slaves) + 1)
+    budget = kwargs.get("budget", None)
+    times = [None] * (len(slaves) + 1)
+
+    if budget is not None and budget <= 0:
+        return times[0], times[1:]
+
+    servers = [master] + slaves
+    executor = futures.ThreadPoolExecutor(
+        max_workers=max(min(int(workers), len(slaves) + 1), 1))
+
+    try:
+        jobs = {}
+
+        if master and master.is_connected():
+            jobs[executor.submit(timed_call, master.upd_mst_status)] = 0
+
+        for idx, slv in enumerate(slaves, 1):
+            if slv.is_connected():
+                jobs[executor.submit(timed_call, slv.upd_slv_status)] = idx
+
+        done, not_done = futures.wait(jobs, timeout=budget)
+
+        # The connection is closed once the status update finishes
+        for future in not_done:
+            dropped = drop_conn([servers[jobs[future]]])
+            future.add_done_callback(
+                lambda _, dropped=dropped: close_conn(dropped))
+
+        for future in done:
+            try:
+                times[jobs[future]] = future.result()
+
+            except Exception as err:                    # pylint:disable=W0718
+                srv = servers[jobs[future]]
+                print(f"sample_status 1:  Error detected on server"
+                      f" {srv.name}: {err}")
+                close_conn(drop_conn([srv]))
+
+    finally:
+        executor.shutdown(wait=False)
+
+    return times[0], times[1:]
+
+
+def drop_conn(servers):
+
+    """Function:  drop_conn
+
+    Description:  Takes the connections away from the instances used by work
+        which missed its budget.  The work may still be running queries on
+        the connections, so they are not used again by the program.  The
+        instances are seen as not connected and their status is not used.
+
+    Arguments:
+        (input) servers -> List of Master or Slave instances
+        (output) dropped -> List of instances and their connections
+
+    """
+
+    dropped = []
+
+    for srv in servers:
+        if getattr(srv, "conn", None):
+            dropped.append((srv, srv.conn))
+            srv.conn = None
+            srv.conn_msg = ABANDON_MSG
+
+    return dropped
+
+
+def close_conn(dropped):
+
+    """Function:  close_conn
+
+    Description:  Closes the connections taken by drop_conn, once the work
+        using them has finished.  The instances can then be connected again.
+
+    Arguments:
+        (input) dropped -> List of instances and their connections
+
+    """
+
+    for srv, conn in dropped:
+        if srv.conn_msg == ABANDON_MSG:
+            srv.conn_msg = CLOSED_MSG
+
+        try:
+            conn.close()
+
+        except Exception:                               # pylint:disable=W0718
+            pass
+
+
+def get_budget(budget, deadline):
+
+    """Function:  get_budget
+
+    Description:  Returns the number of seconds a piece of work is allowed to
+        run.  This is the lesser of the work's budget and the time left
+        before the deadline.
+
+    Arguments:
+        (input) budget -> Number of seconds or None for no budget
+        (input) deadline -> Time the run must be finished by or None
+        (output) budget -> Number of seconds or None for no limit
+
+    """
+
+    if deadline is not None:
+        time_left = deadline - time.time()
+        budget = time_left if budget is None else min(budget, time_left)
+
+    return budget
+
+
+def budget_worker(func, outcome):
+
+    """Function:  budget_worker
+
+    Description:  Thread worker for run_with_budget.  Stores the result or
+        the exception raised by the function in the outcome dictionary.  The
+        connections dropped while the function was running are closed.
+
+    Arguments:
+        (input) func -> Function to be called
+        (input) outcome -> Dictionary for the result or exception, and the
+            lock shared with run_with_budget
+
+    """
+
+    try:
+        outcome["result"] = func()
+
+    except Exception as err:                            # pylint:disable=W0718
+        outcome["error"] = err
+
+    finally:
+        with outcome["lock"]:
+            outcome["finished"] = True
+            dropped = outcome.get("dropped", [])
+
+        close_conn(dropped)
+
+
+def run_with_budget(func, budget, **kwargs):
+
+    """Function:  run_with_budget
+
+    Description:  Runs the function and waits up to the budget number of
+        seconds for it to finish.  A function which misses its budget is
+        left to finish in a background thread, so a hung server cannot block
+        the program.  The connections of the servers it uses are abandoned
+        with drop_conn, so they are not used by two threads at once, and are
+        closed when the function finishes.  With no budget and no deadline
+        the function is called directly.
+
+    Arguments:
+        (input) func -> Function to be called
+        (input) budget -> Number of seconds or None for no budget
+        (input) kwargs:
+            deadline -> Time the run must be finished by
+            servers -> List of Master or Slave instances used by the function
+        (output) finished -> True|False - Function finished within budget
+        (output) result -> Results of the function or None
+
+    """
+
+    budget = get_budget(budget, kwargs.get("deadline", None))
+
+    if budget is None:
+        return True, func()
+
+    if budget <= 0:
+        return False, None
+
+    outcome = {"lock": threading.Lock()}
+    thr = threading.Thread(target=budget_worker, args=(func, outcome),
+                           daemon=True)
+    thr.start()
+    thr.join(budget)
+
+    with outcome["lock"]:
+        if not outcome.get("finished", False):
+            outcome["dropped"] = drop_conn(kwargs.get("servers", []))
+            return False, None
+
+    if "error" in outcome:
+        raise outcome["error"]
+
+    return True, outcome.get("result")
+
+
+def run_chk_slaves(opt, func_dict, **kwargs):
+
+    """Function:  run_chk_slaves
+
+    Description:  Runs a -A option for each slave one after another with
+        run_slv_chk, so each slave's time is added to the timings, and merges
+        the slave results into a single result for the option.
+
+    Arguments:
+        (input) opt -> Option to be run
+        (input) func_dict -> Dictionary list of functions and options
+        (input) kwargs:
+            master -> Master instance
+            slaves -> SlaveSnapshot instances
+            settings -> Dictionary of program settings
+            mst_time -> Time the master's log position was captured
+            deadline -> Time the run must be finished by
+            timings -> Dictionary of timings
+        (output) data -> Results of the option in dictionary format
+
+    """
+
+    master = kwargs.get("master", None)
+    slaves = list(kwargs.get("slaves", []))
+    data = merge_data([run_slv_chk(
+        [opt], func_dict, master, slv,
+        settings=kwargs.get("settings", SETTINGS),
+        mst_time=kwargs.get("mst_time", None),
+        deadline=kwargs.get("deadline", None),
+        timings=kwargs.get("timings", None))[0] for slv in slaves])
+
+    if "CheckSlaveTime" in data:
+        data = add_miss_slaves(master, data, slaves)
+
+    return data
+
+
+def run_chk(opt, func_dict, **kwargs):
+
+    """Function:  run_chk
+
+    Description:  Runs the option's function within the chk_budget setting
+        number of seconds.  An option which misses its budget or the run
+        deadline is reported with a TIMEOUT status.  With timings, a -A
+        option is run for each slave with run_chk_slaves so each slave is
+        timed.
+
+    Arguments:
+        (input) opt -> Option to be run
+        (input) func_dict -> Dictionary list of functions and options
+        (input) kwargs:
+            master -> Master instance
+            slaves -> SlaveSnapshot instances
+            settings -> Dictionary of program settings
+            mst_time -> Time the master's log position was captured
+            deadline -> Time the run must be finished by
+            timings -> Dictionary of timings or None
+        (output) data -> Results of the option in dictionary format
+
+    """
+
+    settings = kwargs.get("settings", SETTINGS)
+    func = functools.partial(func_dict[opt], **kwargs)
+
+    if kwargs.get("timings", None) is not None and kwargs.get("slaves") and \
+       opt in func_dict.get("-A", []):
+        func = functools.partial(run_chk_slaves, opt, func_dict, **kwargs)
+
+    start = time.time()
+    finished, data = run_with_budget(
+        func, settings["chk_budget"],
+        deadline=kwargs.get("deadline", None),
+        servers=[getattr(slv, "slave", slv)
+                 for slv in kwargs.get("slaves", [])])
+
+    if not finished:
+        data = {"Option": opt, "Status": "TIMEOUT"}
+
+    add_timing(kwargs.get("timings", None), ["Checks", opt], start)
+
+    return data
+
+
+def get_inst_need(args, func_dict, inst_dict=None):
+
+    """Function:  get_inst_need
+
+    Description:  Returns the instances used by the selected options, so
+        only the instances which are used are connected to.  An option not
+        in the instance dictionary is taken to use all instances.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) func_dict -> Dictionary list of functions and options
+        (input) inst_dict -> Dictionary of options and the instances they use
+        (output) inst_need -> Set of instances used: master, slaves
+
+    """
+
+    if inst_dict is None:
+        return {"master", "slaves"}
+
+    inst_need = set()
+
+    for opt in get_opt_list(args, func_dict):
+        inst_need.update(inst_dict.get(opt, ["master", "slaves"]))
+
+    return inst_need
+
+
+def get_opt_list(args, func_dict):
+
+    """Function:  get_opt_list
+
+    Description:  Returns the list of options to be run in the order the
+        results are to be reported.  For the -A option, the options under -A
+        are first followed by any other selected options.  Otherwise, the
+        options are in the order they were selected.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) func_dict -> Dictionary list of functions and options
+        (output) opt_list -> List of options
+
+    """
+
+    func_dict = dict(func_dict)
+
+    if args.arg_exist("-A"):
+        opt_list = list(func_dict["-A"])
+
+        # The option is in func_dict but not under the ALL option and is not
+        #   the ALL option itself
+        opt_list.extend(
+            opt for opt in args.get_args() if opt in func_dict and
+            opt not in func_dict["-A"] and opt != "-A")
+
+    else:
+        opt_list = [opt for opt in args.get_args_keys() if opt in func_dict]
+
+    return opt_list
+
+
+def merge_data(data_list):
+
+    """Function:  merge_data
+
+    Description:  Merges a list of results from the same option into a single
+        result.  Lists are joined in order, dictionaries are merged and the
+        first value is kept for any other entries.
+
+    Arguments:
+        (input) data_list -> List of results in dictionary format
+        (output) data -> Merged results in dictionary format
+
+    """
+
+    data_list = list(data_list)
+    data = dict(data_list[0]) if data_list else {}
+
+    for tdata in data_list[1:]:
+        for key, val in tdata.items():
+            if key not in data:
+                data[key] = val
+
+            elif isinstance(val, dict):
+                data[key] = merge_data([data[key], val])
+
+            elif isinstance(val, list):
+                data[key] = data[key] + val
+
+    return data
+
+
+def run_slv_chk(opt_list, func_dict, master, slv, **kwargs):
+
+    """Function:  run_slv_chk
+
+    Description:  Runs the options one after another for a single slave.
+
+    Arguments:
+        (input) opt_list -> List of options
+        (input) func_dict -> Dictionary list of functions and options
+        (input) master -> Master instance
+        (input) slv -> SlaveSnapshot instance
+        (input) kwargs:
+            settings -> Dictionary of program settings
+            mst_time -> Time the master's log position was captured
+            deadline -> Time the run must be finished by
+            timings -> Dictionary of timings or None
+        (output) results -> List of results in opt_list order
+
+    """
+
+    timings = kwargs.get("timings", None)
+    results = []
+
+    for opt in opt_list:
+        start = time.time()
+        results.append(func_dict[opt](
+            master=master, slaves=[slv],
+            settings=kwargs.get("settings", SETTINGS),
+            mst_time=kwargs.get("mst_time", None),
+            deadline=kwargs.get("deadline", None), miss_slaves=False,
+            timings=timings))
+
+        if timings is not None:
+            add_timing(timings, ["Slaves", slv.get_name(), opt], start)
+
+    return results
+
+
+async def gather_slv_chk(loop, executor, opt_list, func_dict, master,
+                         slaves, **kwargs):
+
+    """Function:  gather_slv_chk
+
+    Description:  Runs the options for each slave concurrently in the
+        executor and waits for all of them to finish.  The options for each
+        slave are given the slv_budget setting number of seconds to run.
+
+    Arguments:
+        (input) loop -> Event loop
+        (input) executor -> Executor to run the blocking checks in
+        (input) opt_list -> List of options
+        (input) func_dict -> Dictionary list of functions and options
+        (input) master -> Master instance
+        (input) slaves -> List of slave instances
+        (input) kwargs:
+            settings -> Dictionary of program settings
+            mst_time -> Time the master's log position was captured
+            deadline -> Time the run must be finished by
+            timings -> Dictionary of timings or None
+        (output) List of finished flags and results for each slave in slave
+            order
+
+    """
+
+    settings = kwargs.get("settings", SETTINGS)
+    deadline = kwargs.get("deadline", None)
+
+    return await asyncio.gather(*[loop.run_in_executor(
+        executor, functools.partial(
+            run_with_budget, functools.partial(
+                run_slv_chk, opt_list, func_dict, master, slv,
+                settings=settings, mst_time=kwargs.get("mst_time", None),
+                deadline=deadline, timings=kwargs.get("timings", None)),
+            settings["slv_budget"], deadline=deadline,
+            servers=[getattr(slv, "slave", slv)])) for slv in slaves])
+
+
+def run_chk_async(opt_list, func_dict, master, slaves, **kwargs):
+
+    """Function:  run_chk_async
+
+    Description:  Asyncio check engine.  The -A options are run for all of
+        the slaves concurrently, the options for a single slave are run one
+        after another so a connection is only used by one check at a time.
+        The slave results are merged back into a single result for each
+        option.  A slave which misses its budget is added to the Timeouts
+        list of each option.  Any other options are then run as normal.
+
+    Arguments:
+        (input) opt_list -> List of options
+        (input) func_dict -> Dictionary list of functions and options
+        (input) master -> Master instance
+        (input) slaves -> List of slave instances
+        (input) kwargs:
+            settings -> Dictionary of program settings
+            mst_time -> Time the master's log position was captured
+            deadline -> Time the run must be finished by
+            timings -> Dictionary of timings or None
+        (output) checks -> List of results in opt_list order
+
+    """
+
+    func_dict = dict(func_dict)
+    slaves = list(slaves)
+    settings = kwargs.get("settings", SETTINGS)
+    mst_time = kwargs.get("mst_time", None)
+    deadline = kwargs.get("deadline", None)
+    timings = kwargs.get("timings", None)
+    slv_opts = [opt for opt in opt_list if opt in func_dict.get("-A", [])]
+    results = {}
+
+    if slaves and slv_opts:
+        loop = asyncio.new_event_loop()
+        executor = futures.ThreadPoolExecutor(
+            max_workers=max(int(settings["chk_workers"]), 1))
+        start = time.time()
+
+        try:
+            slv_results = loop.run_until_complete(gather_slv_chk(
+                loop, executor, slv_opts, func_dict, master, slaves,
+                settings=settings, mst_time=mst_time, deadline=deadline,
+                timings=timings))
+
+        finally:
+            executor.shutdown(wait=True)
+            loop.close()
+            add_timing(timings, ["Checks", "-j"], start)
+
+        timeouts = [SlaveStatus(slv.get_name(), "TIMEOUT")
+                    for slv, (finished, _) in zip(slaves, slv_results)
+                    if not finished]
+        slv_results = [item for finished, item in slv_results if finished]
+
+        for cnt, opt in enumerate(slv_opts):
+            results[opt] = merge_data([item[cnt] for item in slv_results])
+
+            if not results[opt]:
+                results[opt] = {"Option": opt, "Status": "TIMEOUT"}
+
+            if timeouts:
+                results[opt]["Timeouts"] = list(timeouts)
+
+            if "CheckSlaveTime" in results[opt]:
+                results[opt] = add_miss_slaves(master, results[opt], slaves)
+
+    for opt in (opt for opt in opt_list if opt not in results):
+        results[opt] = run_chk(
+            opt, func_dict, master=master, slaves=slaves, settings=settings,
+            mst_time=mst_time, deadline=deadline, timings=timings)
+
+    return [results[opt] for opt in opt_list]
+
+
+def call_run_chk(args, func_dict, master, slaves, **kwargs):
+
+    """Function:  call_run_chk
+
+    Description:  Calls the specified option function calls based on what
+        instances are available.  Both the master and slaves
+        instances are passed to the functions, the functions will
+        determine what instances to be used.  The data results will be
+        consolidated and then processed.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) func_dict -> Dictionary list of functions and options
+        (input) master -> Master instance
+        (input) slaves -> List of slave instances
+        (input) kwargs:
+            settings -> Dictionary of program settings
+            deadline -> Time the run must be finished by
+            mst_name -> Master name to use if not connected to the master
+            timings -> Dictionary of timings of the connect phase or None
+            latency -> Dictionary of query latency histograms or None
+
+    """
+
+    func_dict = dict(func_dict)
+    settings = kwargs.get("settings", SETTINGS)
+    deadline = kwargs.get("deadline", None)
+    slaves = list(slaves)
+    opt_list = get_opt_list(args, func_dict)
+    mst_time = None
+    slv_times = [None] * len(slaves)
+    timings = kwargs.get("timings", None)
+
+    if timings is None and args.arg_exist("-q"):
+        timings = {}
+
+    if deadline is None and settings["run_deadline"] is not None:
+        deadline = time.time() + settings["run_deadline"]
+
+    # Capture the master and slave log positions together for the -C option
+    if "-C" in opt_list and master and master.is_connected():
+        start = time.time()
+        mst_time, slv_times = sample_status(
+            master, slaves, workers=settings["chk_workers"],
+            budget=get_budget(settings["chk_budget"], deadline))
+        add_timing(timings, ["Sample"], start)
+
+    # The status of an abandoned master may have been cut off part way
+    mst_msg = getattr(master, "conn_msg", None)
+
+    if master and mst_msg in (ABANDON_MSG, CLOSED_MSG):
+        kwargs["mst_name"] = master.name
+        master = None
+
+    # All options read the same status snapshot of each slave
+    slaves = [create_snapshot(slv, pos_time=pos_time)
+              for slv, pos_time in zip(slaves, slv_times)]
+    dtg = gen_class.TimeFormat()
+    dtg.create_time()
+    data = {"Application": "MySQLReplication",
+            "Master": master.name if master else kwargs.get("mst_name", None),
+            "AsOf": dtg.get_time("zulu"),
+            "Checks": []}
+
+    # Each option is written out as a JSON line as soon as it finishes
+    lines = args.arg_exist("-b")
+    mode = "a" if args.arg_exist("-a") else "w"
+    dumps = get_serializer(settings["json_backend"])
+
+    # Only the slaves whose status changed since the last run are output,
+    #   the delta state decides what is reported so it must be private
+    delta_file = get_private_file(args, settings, "delta") \
+        if args.arg_exist("-Q") else None
+    delta = load_state(delta_file) if delta_file else None
+    new_delta = {}
+
+    if args.arg_exist("-Q") and not settings["state_dir"]:
+        print("call_run_chk:  Warning:  The -Q option requires the state_dir"
+              " setting, all results are output.")
+
+    # The output and email times of a run are shown by the next run
+    timings_file = get_state_file(args, settings, "timings")
+    last_run = {}
+
+    if timings is not None:
+        timings["LastRun"] = load_state(timings_file)
+
+    if args.arg_exist("-j"):
+        checks = run_chk_async(
+            opt_list, func_dict, master, slaves, settings=settings,
+            mst_time=mst_time, deadline=deadline, timings=timings)
+
+    else:
+        checks = (run_chk(
+            opt, func_dict, master=master, slaves=slaves, settings=settings,
+            mst_time=mst_time, deadline=deadline, timings=timings)
+            for opt in opt_list)
+
+    results = []
+
+    for opt, tdata in zip(opt_list, checks):
+        results.append((opt, tdata))
+
+        if delta is not None:
+            tdata = get_delta(opt, tdata, delta, new_delta)
+
+        if tdata is not None:
+            data["Checks"].append(tdata)
+
+            # The -o file is only appended to once this run has written it
+            if lines and line_out(
+                    data, tdata, args, mode=mode, dumps=dumps) is not None:
+                mode = "a"
+
+    # The metrics have every option and slave, not only the output ones
+    if args.arg_exist("-P"):
+        prom_out(results, slaves, args.get_val("-P"),
+                 latency=kwargs.get("latency", None))
+
+    if delta is not None:
+        save_state(delta_file, new_delta)
+
+        if not data["Checks"]:
+            data = None
+
+    if data and args.arg_exist("-x") and not has_problem(data):
+        data = None
+
+    if data and timings is not None:
+        data["Timings"] = timings
+
+        if kwargs.get("latency", None) is not None:
+            timings["Queries"] = get_latency(kwargs["latency"])
+
+        if lines:
+            line_out(data, timings, args, mode=mode, dumps=dumps,
+                     key="Timings")
+            mode = "a"
+
+    # A run with no lines written still replaces the last run's -o file
+    if lines and mode == "w" and args.get_val("-o", def_val=None):
+        try:
+            with open(args.get_val("-o"), mode, encoding="UTF-8"):
+                pass
+
+        except OSError as err:
+            print(f"call_run_chk 1:  Error detected: {err}")
+
+    if data and (not lines or args.arg_exist("-t")):
+        data_out(data, args, dtg=dtg, streamed=lines, dumps=dumps,
+                 settings=settings, timings=last_run)
+
+    # A mail digest which is due is sent even if this run has no output
+    elif args.arg_exist("-t") and settings["mail_digest"] is not None:
+        data_out(None, args, dtg=dtg, streamed=True, dumps=dumps,
+                 settings=settings, timings=last_run)
+
+    if timings is not None:
+        save_state(timings_file, last_run)
+
+
+def load_settings(args):
+
+    """Function:  load_settings
+
+    Description:  Returns the program settings.  Any setting not found in the
+        -k settings file will use the default value from SETTINGS.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (output) settings -> Dictionary of program settings
+
+    """
+
+    settings = dict(SETTINGS)
+
+    if args.arg_exist("-k"):
+        cfg = gen_libs.load_module(args.get_val("-k"), args.get_val("-d"))
+
+        for key in settings:
+            settings[key] = getattr(cfg, key, settings[key])
+
+    return settings
+
+
+def create_down_slv(slv_cfg, msg):
+
+    """Function:  create_down_slv
+
+    Description:  Returns an unconnected slave instance for a slave that
+        could not be connected to.
+
+    Arguments:
+        (input) slv_cfg -> Slave configuration dictionary
+        (input) msg -> Connection error message
+        (output) slv -> Slave instance
+
+    """
+
+    slv = mysql_class.SlaveRep(
+        slv_cfg["name"], slv_cfg["sid"], slv_cfg["user"], slv_cfg["japd"],
+        os_type=getattr(machine, slv_cfg["serv_os"])(), host=slv_cfg["host"],
+        port=slv_cfg["port"], defaults_file=slv_cfg["cfg_file"])
+    slv.conn_msg = msg
+
+    return slv
+
+
+def connect_worker(task_queue, lock):
+
+    """Function:  connect_worker
+
+    Description:  Thread worker for connect_slaves.  Creates and connects the
+        slave instances for each task in the queue until the queue is empty.
+        A task abandoned before it was started is skipped.  If the task was
+        abandoned because of a timeout, the late connection will be
+        disconnected.  A slave whose instance cannot be created is returned
+        as an unconnected instance.
+
+    Arguments:
+        (input) task_queue -> Queue of slave connection tasks
+        (input) lock -> Condition shared with connect_slaves
+
+    """
+
+    while True:
+        try:
+            task = task_queue.get_nowait()
+
+        except queue.Empty:
+            break
+
+        with lock:
+            if task["abandoned"]:
+                continue
+
+            task["start"] = time.time()
+            lock.notify_all()
+
+        slaves = []
+
+        try:
+            slaves = mysql_libs.create_slv_array([task["cfg"]])
+
+        except Exception as err:                        # pylint:disable=W0718
+            slaves = [create_down_slv(task["cfg"], f"Connect error: {err}")]
+
+        finally:
+            with lock:
+                task["slaves"] = slaves
+                task["end"] = time.time()
+                task["done"].set()
+                abandoned = task["abandoned"]
+                lock.notify_all()
+
+        if abandoned:
+            mysql_libs.disconnect([slv for slv in slaves if slv.conn])
+
+
+def start_workers(task_queue, lock, workers):
+
+    """Function:  start_workers
+
+    Description:  Starts the connect_worker threads.  They are daemon threads
+        so a hung connection will not hold up the program exit.
+
+    Arguments:
+        (input) task_queue -> Queue of slave connection tasks
+        (input) lock -> Condition shared with connect_slaves
+        (input) workers -> Number of threads to start
+
+    """
+
+    for _ in range(workers):
+        thr = threading.Thread(target=connect_worker, args=(task_queue, lock))
+        thr.daemon = True
+        thr.start()
+
+
+def get_task_limit(task, timeout, deadline):
+
+    """Function:  get_task_limit
+
+    Description:  Returns the time a slave connection task is given up at.
+        The connect timeout of a slave starts when a worker starts the
+        connection, the run deadline is the limit for every slave.
+
+    Arguments:
+        (input) task -> Slave connection task
+        (input) timeout -> Number of seconds to wait on a connection or None
+        (input) deadline -> Time the run must be finished by or None
+        (output) limit -> Time the task is given up at or None for no limit
+
+    """
+
+    limits = [] if deadline is None else [deadline]
+
+    if timeout is not None and "start" in task:
+        limits.append(task["start"] + timeout)
+
+    return min(limits) if limits else None
+
+
+def connect_slaves(slv_cfg, **kwargs):
+
+    """Function:  connect_slaves
+
+    Description:  Creates and connects the slave instances using a bounded
+        pool of threads.  Each slave's connect timeout starts when a worker
+        starts its connection.  A worker held by a slave which timed out is
+        replaced, so hung slaves cannot hold up the slaves behind them.  A
+        slave which is not connected in time is returned as an unconnected
+        instance, as is a slave not started before the run deadline which
+        has the DEADLINE_MSG message.  The slave list is returned in the
+        same order as the slave configuration list.
+
+    Arguments:
+        (input) slv_cfg -> List of slave configuration dictionaries
+        (input) kwargs:
+            conn_workers -> Maximum number of concurrent slave connections
+            conn_timeout -> Number of seconds to wait on each slave
+                connection or None to wait indefinitely
+            deadline -> Time the run must be finished by or None
+            breaker -> Circuit breaker state, slaves backing off are not
+                connected to
+            timings -> Dictionary of timings or None
+        (output) slaves -> List of slave instances
+
+    """
+
+    slv_cfg = list(slv_cfg)
+    timeout = kwargs.get("conn_timeout", SETTINGS["conn_timeout"])
+    deadline = kwargs.get("deadline", None)
+    breaker = kwargs.get("breaker", None)
+    submitted = time.time()
+    task_queue = queue.Queue()
+    lock = threading.Condition()
+    tasks = []
+    slaves = []
+
+    for cfg in slv_cfg:
+        task = {"cfg": cfg, "done": threading.Event(), "abandoned": False,
+                "slaves": []}
+
+        if is_backing_off(breaker, cfg["name"]):
+            task["skipped"] = True
+
+        else:
+            task_queue.put(task)
+
+        tasks.append(task)
+
+    start_workers(task_queue, lock, min(
+        max(int(kwargs.get("conn_workers", SETTINGS["conn_workers"])), 1),
+        task_queue.qsize()))
+
+    for task in tasks:
+        if task.get("skipped"):
+            slaves.append(create_down_slv(task["cfg"], SKIP_MSG))
+            continue
+
+        with lock:
+            while not task["done"].is_set():
+                limit = get_task_limit(task, timeout, deadline)
+
+                if limit is not None and limit <= time.time():
+                    task["abandoned"] = True
+                    break
+
+                lock.wait(None if limit is None else limit - time.time())
+
+            start = task.get("start", submitted)
+            end = task.get("end")
+
+        # A slave given its full timeout failed, its worker is replaced
+        if task["abandoned"] and timeout is not None and \
+           start + timeout <= time.time() and "start" in task:
+            start_workers(task_queue, lock, 1)
+            slaves.append(create_down_slv(
+                task["cfg"], f"Connection timed out after {timeout} seconds"))
+
+        elif task["abandoned"]:
+            slaves.append(create_down_slv(task["cfg"], DEADLINE_MSG))
+
+        else:
+            slaves.extend(task["slaves"] or [create_down_slv(
+                task["cfg"], "Connect error: no slave instance created")])
+
+        # A slave which timed out is timed up to when it was given up on
+        add_timing(kwargs.get("timings", None),
+                   ["Slaves", task["cfg"]["name"], "Connect"], start, end)
+
+    return slaves
+
+
+def get_state_file(args, settings, name):
+
+    """Function:  get_state_file
+
+    Description:  Returns the path to a program state file.  The file is in
+        the state_dir setting directory or the temporary directory and
+        includes the -y flavor id.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) settings -> Dictionary of program settings
+        (input) name -> Name of the state
+        (output) Path to the state file
+
+    """
+
+    flavor = f"_{args.get_val('-y')}" if args.arg_exist("-y") else ""
+
+    return os.path.join(
+        settings["state_dir"] or tempfile.gettempdir(),
+        f"mysql_rep_admin_{name}{flavor}.json")
+
+
+def get_private_file(args, settings, name):
+
+    """Function:  get_private_file
+
+    Description:  Returns the path to a program state file which the program
+        trusts, such as the configuration cache.  The file is only kept in a
+        state_dir setting directory owned by the user and private to them,
+        otherwise None is returned and the state is not used.
+
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) settings -> Dictionary of program settings
+        (input) name -> Name of the state
+        (output) Path to the state file or None
+
+    """
+
+    if not settings["state_dir"]:
+        return None
+
+    if not is_private_dir(settings["state_dir"]):
+        print(f"get_private_file:  Warning:  state_dir"
+              f" {settings['state_dir']} is not a private directory owned"
+              f" by the user, the {name} state is not used.")
+        return None
+
+    return get_state_file(args, settings, name)
+
+
+def is_private_dir(path):
+
+    """Function:  is_private_dir
+
+    Description:  Returns True if the directory is owned by the user and no
+        one else has any access to it.
+
+    Arguments:
+        (input) path -> Path to the directory
+        (output) True|False - Directory is private
+
+    """
 
-            data["SlaveLogs"].append(tdata)
+    try:
+        st_info = os.stat(path)
 
-    else:
-        print("rpt_slv_log:  Error:  No Slave instances detected.")
+    except OSError:
+        return False
 
-    return data
+    return stat.S_ISDIR(st_info.st_mode) and \
+        st_info.st_uid == os.getuid() and not st_info.st_mode & 0o077
 
 
-def chk_slv(slave):
+def load_state(fname):
 
-    """Function:  chk_slv
+    """Function:  load_state
 
-    Description:  Returns the Slave's read file and postition with the
-        executed file and position.  Will also print GTID info, in pre-MySQL
-        5.6 this will be NULL.  Include a status on whether the slave might
-        be lagging behind the master database.
+    Description:  Returns the program state from a state file.  A missing or
+        unreadable state file is an empty state.
 
     Arguments:
-        (input) slave -> Slave instance
-        (output) data -> Slave log information and status in dictionary format
+        (input) fname -> Path to the state file
+        (output) state -> Dictionary of the program state
 
     """
 
-    mst_file, relay_file, read_pos, exec_pos = slave.get_log_info()
+    try:
+        with open(fname, mode="r", encoding="UTF-8") as f_hdlr:
+            state = json.load(f_hdlr)
 
-    if slave.is_connected():
-        data = {"Name": slave.get_name(), "Status": "OK"}
+    except (IOError, OSError, ValueError):
+        state = {}
 
-        # Slave's master info doesn't match slave's relay info
-        if mst_file != relay_file or read_pos != exec_pos:
-            data["Status"] = \
-                "Warning:  Slave might be lagging in execution of log"
-            data["Info"] = {"ReadLog": mst_file, "ReadPosition": read_pos,
-                            "ExecLog": relay_file, "ExecPosition": exec_pos}
+    return state if isinstance(state, dict) else {}
 
-            if slave.gtid_mode:
-                data["Info"]["RetrievedGTID"] = slave.retrieved_gtid
-                data["Info"]["ExecutedGTID"] = slave.exe_gtid
 
-    else:
-        data = {"Name": slave.get_name(), "Status": "DOWN"}
+def save_state(fname, state):
 
-    return data
+    """Function:  save_state
 
+    Description:  Writes the program state to a state file.  The state is
+        written to a temporary file first and then moved into place so a
+        reader never sees a partial file.  The file is only readable by the
+        owner.
 
-def chk_mst_log(**kwargs):
+    Arguments:
+        (input) fname -> Path to the state file
+        (input) state -> Dictionary of the program state
+        (output) True|False - State file was saved
 
-    """Function:  chk_mst_log
+    """
 
-    Description:  Returns the binary log and position between the master and
-        slave(s) and the read and execute positions of the log on the slave.
-        Includes a status of whether the master and slaves are in sync.
+    tmp_file = None
 
-    Arguments:
-        (input) kwargs:
-            master -> Master instance
-            slaves -> Slave instances
-        (output) data -> Results of the command in dictionary format
+    try:
+        # A new temporary file only readable by the owner, so an existing
+        #   file or link in the directory is never written through
+        fdesc, tmp_file = tempfile.mkstemp(
+            suffix=".tmp", prefix=os.path.basename(fname) + ".",
+            dir=os.path.dirname(fname) or os.curdir)
 
-    """
+        with os.fdopen(fdesc, mode="w", encoding="UTF-8") as f_hdlr:
+            json.dump(state, f_hdlr)
 
-    master = kwargs.get("master", None)
-    slaves = list(kwargs.get("slaves", []))
-    data = {"CheckMasterLog": {"MasterLog": {}, "SlaveLogs": []}}
+        os.replace(tmp_file, fname)
 
-    if not master and not slaves:
-        print("chk_mst_log:  Warning:  Missing Master and Slave instances.")
-        return data
+    except (IOError, OSError) as err:
+        print(f"save_state:  Warning:  Unable to save state file {fname}:"
+              f" {err}")
 
-    if not master and slaves:
-        print("chk_mst_log: Warning:  Missing Master instance.")
+        if tmp_file and os.path.exists(tmp_file):
+            os.remove(tmp_file)
 
-        for slv in slaves:
-            data["CheckMasterLog"]["SlaveLogs"].append(chk_slv(slv))
+        return False
 
-        return data
+    return True
 
-    fname, log_pos = master.get_log_info()
-    data["CheckMasterLog"]["MasterLog"]["Master"] = {
-        "Name": master.name, "Log": fname, "Position": log_pos}
-    data["CheckMasterLog"]["MasterLog"]["Slaves"] = []
 
-    for slv in slaves:
-        if slv.is_connected():
-            mst_file, _, read_pos, _ = slv.get_log_info()
-            tdata = {"Name": slv.get_name(), "Status": "OK"}
+def get_cfg_key(fname):
 
-            # Master's log file or position doesn't match slave's log info
-            if fname != mst_file or log_pos != read_pos:
-                tdata["Status"] = \
-                    "Warning:  Slave lagging in reading master log"
-                tdata["Info"] = {"Log": mst_file, "Position": read_pos}
+    """Function:  get_cfg_key
 
-        else:
-            tdata = {"Name": slv.get_name(), "Status": "DOWN"}
+    Description:  Returns the modification time and size of a configuration
+        file, used to tell if a cached configuration is still current.
 
-        data["CheckMasterLog"]["MasterLog"]["Slaves"].append(tdata)
-        data["CheckMasterLog"]["SlaveLogs"].append(chk_slv(slv))
+    Arguments:
+        (input) fname -> Path to the configuration file
+        (output) List of modification time (ns) and size or None if the file
+            cannot be read
 
-    return data
+    """
 
+    try:
+        st_info = os.stat(fname)
 
-def chk_slv_thr(**kwargs):
+    except OSError:
+        return None
 
-    """Function:  chk_slv_thr
+    return [st_info.st_mtime_ns, st_info.st_size]
 
-    Description:  Checks the status of the Slave(s) IO and SQL threads.
 
-    Arguments:
-        (input) kwargs:
-            master -> Master instance
-            slaves -> Slave instances
-        (output) data -> Results of the command in dictionary format
+def get_cached_cfg(cache, fname, loader):
 
-    """
+    """Function:  get_cached_cfg
 
-    slaves = list(kwargs.get("slaves", []))
-    data = {"CheckSlaveThread": {"Slaves": []}}
+    Description:  Returns the parsed configuration for a configuration file
+        from the configuration cache.  The file is only parsed by the loader
+        if it is not in the cache or its modification time or size has
+        changed, in which case the cache is updated.
 
-    if slaves:
-        for slv in slaves:
-            tdata = {"Name": slv.get_name(), "IOThread": "Up",
-                     "SQLThread": "Up"}
-            thr, io_thr, sql_thr, run = slv.get_thr_stat()
+    Arguments:
+        (input) cache -> Dictionary of cached configurations
+        (input) fname -> Path to the configuration file
+        (input) loader -> Function which parses the configuration file
+        (output) data -> Parsed configuration
+        (output) True|False -> Cache was updated
 
-            # Slave IO and run state
-            if not thr or not gen_libs.is_true(run):
-                tdata["IOThread"] = "Down"
-                tdata["SQLThread"] = "Down"
+    """
 
-            # Slave IO thread
-            elif not gen_libs.is_true(io_thr):
-                tdata["IOThread"] = "Down"
+    key = get_cfg_key(fname)
+    entry = cache.get(fname, {})
 
-            # Slave SQL thread
-            elif not gen_libs.is_true(sql_thr):
-                tdata["SQLThread"] = "Down"
+    if key is not None and entry.get("Key") == key:
+        return entry["Data"], False
 
-            data["CheckSlaveThread"]["Slaves"].append(tdata)
+    data = loader()
 
-    else:
-        print("chk_slv_thr:  Warning:  No Slave instance detected.")
+    if key is None:
+        return data, False
 
-    return data
+    cache[fname] = {"Key": key, "Data": data}
 
+    return data, True
 
-def chk_slv_err(**kwargs):
 
-    """Function:  chk_slv_err
+def load_mst_cfg(args):
 
-    Description:  Check the Slave's IO and SQL threads for errors.
+    """Function:  load_mst_cfg
+
+    Description:  Returns the master configuration entries from the -c
+        master configuration file.
 
     Arguments:
-        (input) kwargs:
-            master -> Master instance
-            slaves -> Slave instances
-        (output) data -> Results of the command in dictionary format
+        (input) args -> ArgParser class instance
+        (output) Dictionary of the master configuration entries
 
     """
 
-    slaves = list(kwargs.get("slaves", []))
-    data = {"CheckSlaveError": {"Slaves": []}}
+    mst_cfg = gen_libs.load_module(args.get_val("-c"), args.get_val("-d"))
 
-    if not slaves:
-        print("chk_slv_err:  Warning:  No Slave instance detected.")
-        return data
+    return {key: getattr(mst_cfg, key) for key in MST_KEYS}
 
-    for slv in slaves:
-        if slv.is_connected():
-            tdata = {"Name": slv.get_name(), "Connection": "Up",
-                     "IO": {"Status": "Good"}, "SQL": {"Status": "Good"}}
 
-            # Pre-MySQL 5.6 versions, will be NULL for these two entries
-            iost, sql, io_msg, sql_msg, io_time, sql_time = \
-                slv.get_err_stat()
+def load_slv_cfg(args, slv_key):
 
-            # IO error
-            if iost:
-                tdata["IO"]["Error"] = iost
-                tdata["IO"]["Message"] = io_msg
-                tdata["IO"]["Timestamp"] = io_time
-                tdata["IO"]["Status"] = "Bad"
+    """Function:  load_slv_cfg
 
-            # SQL error
-            if sql:
-                tdata["SQL"]["Error"] = sql
-                tdata["SQL"]["Message"] = sql_msg
-                tdata["SQL"]["Timestamp"] = sql_time
-                tdata["SQL"]["Status"] = "Bad"
+    Description:  Returns the slave configurations from the -s slave file
+        with the entries converted to their data types.
 
-        else:
-            tdata = {"Name": slv.get_name(), "Connection": "DOWN",
-                     "IO": {"Status": "Unknown"},
-                     "SQL": {"Status": "Unknown"}}
+    Arguments:
+        (input) args -> ArgParser class instance
+        (input) slv_key -> Dictionary of keys and data types
+        (output) List of slave configuration dictionaries
 
-        data["CheckSlaveError"]["Slaves"].append(tdata)
+    """
 
-    return data
+    slv_cfg = gen_libs.create_cfg_array(
+        args.get_val("-s"), cfg_path=args.get_val("-d"))
 
+    return gen_libs.transpose_dict(slv_cfg, slv_key)
 
-def add_miss_slaves(master, data):
 
-    """Function:  add_miss_slaves
+def get_replicas(master):
 
-    Description:  Returns a list of missing slaves.
+    """Function:  get_replicas
+
+    Description:  Returns the replicas registered with the master from the
+        master's show slave hosts list.  A replica without a report-host
+        cannot be connected to and is skipped.
 
     Arguments:
         (input) master -> Master instance
-        (input) data -> JSON document of Check Slave Time output
-        (output) miss_slv -> List of missing slaves
+        (output) replicas -> List of replica dictionaries in server id order
 
     """
 
-    data = dict(data)
-    all_list = []
-    slv_list = []
-    miss_slv = []
+    replicas = []
 
     for slv in master.slaves:
-        all_list.append(slv["Replica_UUID"])
+        sid = slv.get("Server_Id", slv.get("Server_id"))
 
-    for slv in data["CheckSlaveTime"]["Slaves"]:
-        slv_list.append(slv["Slave_UUID"])
+        if not slv.get("Host"):
+            print(f"get_replicas:  Warning:  Replica with server id {sid}"
+                  f" has no report-host and is skipped.")
+            continue
 
-    # Add slaves from the master slave list that are not in the slave list
-    for uuid in [val for val in all_list if val not in slv_list]:
-        miss_slv.append({"Slave_UUID": uuid, "LagTime": "UNK"})
+        replicas.append(
+            {"name": slv["Host"], "host": slv["Host"],
+             "port": int(slv["Port"]), "sid": int(sid),
+             "uuid": slv.get("Replica_UUID", slv.get("Slave_UUID"))})
 
-    return miss_slv
+    return sorted(replicas, key=lambda item: item["sid"])
 
 
-def chk_slv_time(**kwargs):
+def is_topology_stale(topology, settings, now=None):
 
-    """Function:  chk_slv_time
+    """Function:  is_topology_stale
 
-    Description:  Checks for time delays on the slave(s).
+    Description:  Checks to see if the cached topology has to be checked
+        against the master.  A missing cache or a cache not checked within
+        the discovery_ttl setting is stale.
+
+    Arguments:
+        (input) topology -> Cached topology dictionary
+        (input) settings -> Dictionary of program settings
+        (input) now -> Current time
+        (output) True|False -> Cached topology is stale
+
+    """
+
+    if "Slaves" not in topology:
+        return True
+
+    return topology.get("Checked", 0) + settings["discovery_ttl"] < (
+        time.time() if now is None else now)
+
+
+def discover_slaves(master, template, topology, **kwargs):
+
+    """Function:  discover_slaves
+
+    Description:  Returns the slave configurations for the replicas of the
+        master.  The replica list is read from the master if connected and
+        the cached topology is saved if the topology has changed or the
+        cache is stale, otherwise the cached topology is used.  Each slave
+        uses the shared credentials and settings in the slave template.
 
     Arguments:
+        (input) master -> Master instance or None
+        (input) template -> Slave template module
+        (input) topology -> Cached topology dictionary
         (input) kwargs:
-            master -> Master instance
-            slaves -> Slave instances
-        (output) data -> Results of the command in dictionary format
+            settings -> Dictionary of program settings
+            fname -> Path to the topology state file or None to not cache
+        (output) slv_cfg -> List of slave configuration dictionaries
 
     """
 
-    master = kwargs.get("master", None)
-    slaves = list(kwargs.get("slaves", []))
-    data = {"CheckSlaveTime": {"Slaves": []}}
+    settings = kwargs.get("settings", SETTINGS)
+    replicas = topology.get("Slaves", [])
 
-    if slaves:
-        for slv in slaves:
-            if slv.is_connected():
-                data["CheckSlaveTime"]["Slaves"].append(
-                    {"Name": slv.get_name(),
-                     "Slave_UUID": slv.slave_uuid,
-                     "LagTime": process_time_lag(slv, slv.get_time())})
-            else:
-                data["CheckSlaveTime"]["Slaves"].append(
-                    {"Name": slv.get_name(),
-                     "Slave_UUID": "Unknown",
-                     "LagTime": "DOWN"})
+    if master and master.is_connected():
+        current = get_replicas(master)
 
-    data["CheckSlaveTime"]["Slaves"] = \
-        data["CheckSlaveTime"]["Slaves"] + add_miss_slaves(master, data)
+        # Cache is only written when the topology changes or is stale
+        if kwargs.get("fname", None) and (
+                current != replicas or is_topology_stale(topology, settings)):
+            save_state(kwargs.get("fname"),
+                       {"Slaves": current, "Checked": time.time()})
 
-    return data
+        replicas = current
 
+    return [create_discover_cfg(template, replica) for replica in replicas]
 
-def process_time_lag(slv, time_lag):
 
-    """Function:  process_time_lag
+def create_discover_cfg(template, replica):
 
-    Description:  Check to see if the time lag still exists.
+    """Function:  create_discover_cfg
+
+    Description:  Returns a slave configuration dictionary for a discovered
+        replica using the shared credentials in the slave template.
 
     Arguments:
-        (input) slv -> Slave instance
-        (input) time_lag -> Current time lag between master and slave
-        (output) time_lag -> Updated time lag between master and slave
+        (input) template -> Slave template module
+        (input) replica -> Replica dictionary
+        (output) cfg -> Slave configuration dictionary
 
     """
 
-    if time_lag == "null" or time_lag > 0:
-        time.sleep(5)
+    cfg = {"name": replica["name"], "host": replica["host"],
+           "port": replica["port"], "sid": replica["sid"],
+           "user": template.user, "japd": template.japd,
+           "serv_os": getattr(template, "serv_os", "Linux"),
+           "cfg_file": getattr(template, "cfg_file", None),
+           "extra_def_file": getattr(template, "extra_def_file", None)}
 
-        if slv.conn:
-            slv.upd_slv_time()
-            time_lag = slv.get_time()
+    for key in ["ssl_client_ca", "ssl_ca_path", "ssl_client_key",
+                "ssl_client_cert", "ssl_mode", "ssl_client_flag",
+                "ssl_disabled", "ssl_verify_id", "ssl_verify_cert",
+                "tls_versions"]:
+        if hasattr(template, key):
+            cfg[key] = getattr(template, key)
 
-    return time_lag
+    return cfg
 
 
-def chk_slv_other(**kwargs):
+def is_backing_off(state, name, now=None):
 
-    """Function:  chk_slv_other
+    """Function:  is_backing_off
 
-    Description:  Returns a number of other status variables that might
-        indicate a problem on the slaves.
+    Description:  Checks to see if the slave's circuit breaker is open and
+        the slave is not due to be retried yet.
 
     Arguments:
-        (input) kwargs:
-            master -> Master instance
-            slaves -> Slave instances
-        (output) data -> Results of the command in dictionary format
+        (input) state -> Circuit breaker state or None
+        (input) name -> Slave name
+        (input) now -> Current time
+        (output) True|False -> Slave is backing off
 
     """
 
-    slaves = list(kwargs.get("slaves", []))
-    data = {"CheckSlaveOther": {"Slaves": []}}
-
-    if slaves:
-        for slv in slaves:
-            if slv.is_connected():
-                skip, tmp_tbl, retry = slv.get_others()
-                data["CheckSlaveOther"]["Slaves"].append(
-                    chk_other(
-                        skip, tmp_tbl, retry, slv.get_name(), slv.version))
-
-            else:
-                data["CheckSlaveOther"]["Slaves"].append(
-                    {"Name": slv.get_name(), "Status": "DOWN"})
+    entry = (state or {}).get(name)
 
-    else:
-        print("chk_slv_other:  Warning:  No Slave instance detected.")
+    if not entry:
+        return False
 
-    return data
+    return entry["retry_at"] > (time.time() if now is None else now)
 
 
-def chk_other(skip, tmp_tbl, retry, name, sql_ver):
+def update_breaker(state, slaves, **kwargs):
 
-    """Function:  chk_other
+    """Function:  update_breaker
 
-    Description:  Print any possible problems found.
+    Description:  Updates the circuit breaker state with the connection
+        results of the slaves that were connected to.  A connected slave
+        closes its breaker.  A slave that failed to connect is backed off for
+        backoff_base seconds, doubled for each failure in a row up to
+        backoff_max seconds.  When the backoff is over the next connection
+        acts as the probe which closes the breaker again.
 
     Arguments:
-        (input) skip -> Skip count
-        (input) tmp_tbl -> Temp tables create count
-        (input) retry -> Retry count
-        (input) name -> Name of Mysql server
-        (input) sql_ver -> Slave's MySQL version
-        (output) data -> Dictionary of problems detected in slave
+        (input) state -> Circuit breaker state
+        (input) slaves -> List of slave instances that were connected to
+        (input) kwargs:
+            settings -> Dictionary of program settings
+            now -> Current time
+        (output) state -> Circuit breaker state
 
     """
 
-    data = {"Name": name, "Status": "Good"}
-
-    if skip is None or skip > 0:
-        data["SkipCount"] = skip
-        data["Status"] = "Bad"
+    settings = kwargs.get("settings", SETTINGS)
+    now = kwargs.get("now", time.time())
 
-    if not tmp_tbl or int(tmp_tbl) > 5:
-        data["TempTableCount"] = tmp_tbl
-        data["Status"] = "Bad"
+    for slv in slaves:
+        if slv.is_connected():
+            state.pop(slv.name, None)
 
-    if (sql_ver[0] < 8 and (not retry or int(retry) > 0)) \
-       or (sql_ver[0] >= 8 and retry > 0):
-        data["RetryTransactionCount"] = retry
-        data["Status"] = "Bad"
+        else:
+            failures = state.get(slv.name, {}).get("failures", 0) + 1
+            backoff = min(
+                settings["backoff_base"] * 2 ** (failures - 1),
+                settings["backoff_max"])
+            state[slv.name] = {"failures": failures, "last_fail": now,
+                               "retry_at": now + backoff}
 
-    return data
+    return state
 
 
-def create_filename(args, dtg=None):
+def refresh_status(master, slaves, **kwargs):
 
-    """Function:  create_filename
+    """Function:  refresh_status
 
-    Description:  Creates a filename for the attachment to an email.
+    Description:  Reconnects the master and any slaves which have dropped
+        their connection and updates the replication status of the connected
+        instances.  The dropped slaves are connected again with
+        connect_slaves, so the reconnects are bounded by the conn_timeout
+        setting and the run deadline, and are replaced in the slave list by
+        the new instances.  Slaves backing off in the circuit breaker are not
+        reconnected, nor is a master whose abandoned queries are still
+        running.  The status is updated with sample_status within the
+        chk_budget setting, so an instance which fails or hangs is dropped
+        and is reconnected on the next refresh.
 
     Arguments:
-        (input) args -> ArgParser class instance
-        (input) dtg -> TimeFormat instance
-        (output) -> File name for the email attachment
+        (input) master -> Master instance
+        (input) slaves -> List of slave instances, updated in place
+        (input) kwargs:
+            settings -> Dictionary of program settings
+            breaker -> Circuit breaker state
+            slv_cfg -> List of slave configuration dictionaries
+            latency -> Dictionary of query latency histograms or None
+            deadline -> Time the refresh must be finished by
+        (output) attempted -> List of slaves a reconnect was tried on
 
     """
 
-    join_list = [args.get_val("-f")]
+    settings = kwargs.get("settings", SETTINGS)
+    deadline = kwargs.get("deadline", None)
+    cfgs = {cfg["name"]: cfg for cfg in kwargs.get("slv_cfg", None) or []}
+    dropped = [idx for idx, slv in enumerate(slaves)
+               if not slv.is_connected() and slv.name in cfgs]
+    attempted = []
 
-    if args.arg_exist("-n"):
-        join_list.append(socket.gethostname())
+    if deadline is None and settings["run_deadline"] is not None:
+        deadline = time.time() + settings["run_deadline"]
 
-    if args.arg_exist("-g"):
-        join_list.append(dtg.get_time("dtg"))
+    # An abandoned master is reconnected once its queries have finished
+    if master and getattr(master, "conn_msg", None) != ABANDON_MSG:
+        if getattr(master, "conn_msg", None) == CLOSED_MSG:
+            master.conn_msg = None
 
-    if args.arg_exist("-m"):
-        join_list.append(dtg.msecs)
+        if not master.is_connected():
+            master.connect(silent=True)
 
-    join_list.append("json")
+    if dropped:
+        new_slvs = connect_slaves(
+            [cfgs[slaves[idx].name] for idx in dropped],
+            conn_workers=settings["conn_workers"],
+            conn_timeout=settings["conn_timeout"], deadline=deadline,
+            breaker=kwargs.get("breaker", None))
 
-    return ".".join(join_list)
+        for idx, slv in zip(dropped, new_slvs):
+            track_latency(slv, kwargs.get("latency", None))
+            slaves[idx] = slv
 
+            if slv.conn_msg not in NOT_TRIED:
+                attempted.append(slv)
 
-def data_out(data, args, **kwargs):
+    sample_status(master, slaves, workers=settings["chk_workers"],
+                  budget=get_budget(settings["chk_budget"], deadline))
+
+    return attempted
 
-    """Function:  data_out
 
-    Description:  Outputs the data in a variety of formats and media.
+def run_daemon(args, func_dict, master, slaves, **kwargs):
+
+    """Function:  run_daemon
+
+    Description:  Daemon mode.  Re-runs the selected options every interval
+        using the existing connections and outputs the results of each
+        cycle.  An error in a cycle is printed and the next cycle is still
+        run.  Runs until interrupted or the daemon_cycles setting is
+        reached.
 
     Arguments:
-        (input) data -> Data output results
         (input) args -> ArgParser class instance
+        (input) func_dict -> Dictionary list of functions and options
+        (input) master -> Master instance
+        (input) slaves -> List of slave instances
         (input) kwargs:
-            def_subj -> Default subject line for email
-            dtg -> TimeFormat instance
+            settings -> Dictionary of program settings
+            interval -> Number of seconds between the start of each cycle
+            breaker -> Circuit breaker state
+            breaker_file -> Path to the circuit breaker state file
+            mst_name -> Master name to use if not connected to the master
+            timings -> Dictionary of timings of the connect phase or None
+            latency -> Dictionary of query latency histograms or None
+            slv_cfg -> List of slave configuration dictionaries
+        (output) slaves -> List of slave instances, with the reconnected
+            slaves replaced
 
     """
 
-    data = dict(data)
-    def_subj = kwargs.get("def_subj", "MySQLRepAdminCheck")
-
-    status = gen_libs.dict_out(
-        data, ofile=args.get_val("-o", def_val=None),
-        mode="a" if args.arg_exist("-a") else "w",
-        expand=args.arg_exist("-e"), no_std=args.arg_exist("-z"))
+    slaves = list(slaves)
+    settings = kwargs.get("settings", SETTINGS)
+    interval = kwargs.get("interval", 60)
+    breaker = kwargs.get("breaker", None)
+    timings = kwargs.get("timings", None)
+    latency = kwargs.get("latency", None)
+    cycles = settings["daemon_cycles"]
+    cnt = 0
 
-    if status[0]:
-        print(f"data_out 1:  Error detected: {status[1]}")
+    try:
+        while True:
+            start = time.time()
 
-    if args.arg_exist("-t") and args.arg_exist("-r") and not status[0]:
-        mail = gen_class.Mail2(
-            args.get_val("-u", def_val=def_subj), args.get_val("-t"))
-        fname = create_filename(args, dtg=kwargs.get("dtg", None))
-        mail.add_attachment(fname, "json", data)
-        mail.send_email()
+            try:
+                call_run_chk(
+                    args, func_dict, master, slaves, settings=settings,
+                    mst_name=kwargs.get("mst_name", None), timings=timings,
+                    latency=latency)
 
-    elif args.arg_exist("-t") and not status[0]:
-        mail = gen_class.setup_mail(
-            args.get_val("-t"), subj=args.get_val("-u", def_val=def_subj))
-        indent = 4 if args.arg_exist("-e") else None
-        mail.add_2_msg(json.dumps(data, indent=indent))
-        mail.send_mail(use_mailx=args.arg_exist("-w"))
+                # Spooled emails are sent after the cycle's checks are output
+                if settings["mail_spool"]:
+                    flush_spool(settings["mail_spool"],
+                                retries=settings["mail_retries"])
 
+            except Exception as err:                    # pylint:disable=W0718
+                print(f"run_daemon 1:  Error detected: {err}")
 
-def is_time_lag(data):
+            cnt += 1
 
-    """Function:  is_time_lag
+            # The latency histograms cover the queries of one cycle
+            if latency is not None:
+                latency.clear()
 
-    Description:  Checks to see if there is a time lag.
+            if cycles and cnt >= cycles:
+                break
 
-    Note:  This should only be called when only the -T option is selected and
-        no other options as the list should only contain one item in the list.
+            time.sleep(max(interval - (time.time() - start), 0))
 
-    Arguments:
-        (input) data -> Data output results
-        (output) status -> True|False - If there is a time lag detected
+            # Each cycle's Connect time is the time to refresh the status
+            timings = None if timings is None else {}
+            start = time.time()
 
-    """
+            try:
+                attempted = refresh_status(
+                    master, slaves, settings=settings, breaker=breaker,
+                    slv_cfg=kwargs.get("slv_cfg", None), latency=latency)
+                add_timing(timings, ["Connect"], start)
 
-    status = False
-    data = dict(data)
+                if breaker is not None:
+                    update_breaker(breaker, attempted, settings=settings)
+                    save_state(kwargs.get("breaker_file"), breaker)
 
-    # The first list should only contain the -T option results
-    for slv in data["Checks"][0]["CheckSlaveTime"]["Slaves"]:
+            except Exception as err:                    # pylint:disable=W0718
+                print(f"run_daemon 2:  Error detected: {err}")
 
-        if slv["LagTime"] != 0:
-            status = True
-            break
+    except KeyboardInterrupt:
+        print("run_daemon:  Interrupted, daemon mode stopped.")
 
-    return status
+    return slaves
 
 
-def call_run_chk(args, func_dict, master, slaves):
+def chk_slv_src(args, func_dict, inst_dict):
 
-    """Function:  call_run_chk
+    """Function:  chk_slv_src
 
-    Description:  Calls the specified option function calls based on what
-        instances are available.  Both the master and slaves
-        instances are passed to the functions, the functions will
-        determine what instances to be used.  The data results will be
-        consolidated and then processed.
+    Description:  Checks that a source of slaves is given when a selected
+        option uses the slaves.  The slaves either come from the -s slave
+        file or are discovered from the master with the -i option.
 
     Arguments:
         (input) args -> ArgParser class instance
         (input) func_dict -> Dictionary list of functions and options
-        (input) master -> Master instance
-        (input) slaves -> List of slave instances
+        (input) inst_dict -> Dictionary of options and the instances they use
+        (output) status -> True|False - A source of slaves is given
 
     """
 
-    func_dict = dict(func_dict)
-    slaves = list(slaves)
-    dtg = gen_class.TimeFormat()
-    dtg.create_time()
-    data = {"Application": "MySQLReplication",
-            "Master": master.name,
-            "AsOf": dtg.get_time("zulu"),
-            "Checks": []}
-
-    if args.arg_exist("-A"):
-        for opt in func_dict["-A"]:
-            tdata = func_dict[opt](master=master, slaves=slaves)
-            data["Checks"].append(tdata)
-
-        # The option is in func_dict but not under the ALL option and is not
-        #   the ALL option itself
-        for item in (opt for opt in args.get_args() if opt in func_dict and
-                     opt not in func_dict["-A"] and opt != "-A"):
-
-            tdata = func_dict[item](master=master, slaves=slaves)
-            data["Checks"].append(tdata)
-
-    else:
-
-        # Intersect args & func_dict to find which functions to call.
-        for opt in set(args.get_args_keys()) & set(func_dict.keys()):
-            tdata = func_dict[opt](master=master, slaves=slaves)
-            data["Checks"].append(tdata)
+    status = True
 
-    if args.arg_exist("-x") and not is_time_lag(data):
-        data = None
+    if "slaves" in get_inst_need(args, func_dict, inst_dict) and \
+       not args.arg_exist("-s") and not args.arg_exist("-i"):
+        print("chk_slv_src:  Error:  The selected options require the -s or"
+              " -i option.")
+        status = False
 
-    if data:
-        data_out(data, args, dtg=dtg)
+    return status
 
 
 def run_program(args, func_dict, **kwargs):
@@ -945,20 +4558,76 @@ def run_program(args, func_dict, **kwargs):
         (input) func_dict -> Dictionary list of functions and options
         (input) kwargs:
             slv_key -> Dictionary of keys and data types
+            inst_dict -> Dictionary of options and the instances they use
 
     """
 
     func_dict = dict(func_dict)
+    settings = load_settings(args)
+    inst_need = get_inst_need(args, func_dict, kwargs.get("inst_dict", None))
+    deadline = None
+    breaker = None
+    breaker_file = None
     master = None
+    mst_name = None
+    topology = {}
+    topology_file = None
+    cfg_cache = {}
+    cache_file = None
+    cache_upd = False
+    timings = {} if args.arg_exist("-q") else None
+    latency = {} if args.arg_exist("-q") or args.arg_exist("-P") else None
+    start = time.time()
+
+    if settings["run_deadline"] is not None and not args.arg_exist("-l"):
+        deadline = time.time() + settings["run_deadline"]
+
+    if args.arg_exist("-F"):
+        if settings["mail_spool"]:
+            flush_spool(
+                settings["mail_spool"], retries=settings["mail_retries"])
 
-    if args.arg_exist("-c"):
-        mst_cfg = gen_libs.load_module(args.get_val("-c"), args.get_val("-d"))
+        else:
+            print("run_program:  Warning:  -F option requires the mail_spool"
+                  " setting.")
+
+        # Only the mail spool is flushed if no option is selected
+        if not get_opt_list(args, func_dict):
+            return
+
+    # Discovery reads the replica list from the master if the cache is stale
+    #   or is not in a private state_dir, as the cache decides the hosts the
+    #   slave credentials are sent to
+    if args.arg_exist("-i") and "slaves" in inst_need:
+        topology_file = get_private_file(args, settings, "topology")
+        topology = load_state(topology_file) if topology_file else {}
 
-        master = mysql_class.MasterRep(
-            mst_cfg.name, mst_cfg.sid, mst_cfg.user, mst_cfg.japd,
-            os_type=getattr(machine, mst_cfg.serv_os)(), host=mst_cfg.host,
-            port=mst_cfg.port, defaults_file=mst_cfg.cfg_file)
-        master.connect(silent=True)
+        if is_topology_stale(topology, settings):
+            inst_need.add("master")
+
+    # Parsed configurations are reused until the files change
+    if settings["cfg_cache"]:
+        cache_file = get_private_file(args, settings, "config")
+        cfg_cache = load_state(cache_file) if cache_file else {}
+
+    if args.arg_exist("-c"):
+        mst_cfg, updated = get_cached_cfg(
+            cfg_cache, os.path.abspath(os.path.join(
+                args.get_val("-d"), args.get_val("-c") + ".py")),
+            lambda: load_mst_cfg(args))
+        cache_upd = cache_upd or updated
+        mst_name = mst_cfg["name"]
+
+        # Only connect to the master if a selected option uses it
+        if "master" in inst_need:
+            master = mysql_class.MasterRep(
+                mst_cfg["name"], mst_cfg["sid"], mst_cfg["user"],
+                mst_cfg["japd"],
+                os_type=getattr(machine, mst_cfg["serv_os"])(),
+                host=mst_cfg["host"], port=mst_cfg["port"],
+                defaults_file=mst_cfg["cfg_file"])
+            track_latency(master, latency)
+            master.connect(silent=True)
 
     if master and master.conn_msg:
         print(f"run_program:  Error encountered on server {master.name}:"
@@ -966,15 +4635,61 @@ def run_program(args, func_dict, **kwargs):
 
     else:
         slaves = []
+        slv_cfg = None
+
+        if args.arg_exist("-s") and "slaves" in inst_need:
+            slv_cfg, updated = get_cached_cfg(
+                cfg_cache, os.path.abspath(os.path.join(
+                    args.get_val("-d"), args.get_val("-s"))),
+                lambda: load_slv_cfg(args, kwargs.get("slv_key", {})))
+            cache_upd = cache_upd or updated
+
+        elif args.arg_exist("-i") and "slaves" in inst_need:
+            slv_cfg = discover_slaves(
+                master, gen_libs.load_module(
+                    args.get_val("-i"), args.get_val("-d")),
+                topology, settings=settings, fname=topology_file)
+
+        if cache_file and cache_upd:
+            save_state(cache_file, cfg_cache)
+
+        if slv_cfg is not None:
+            # Slaves which keep failing to connect are backed off, the
+            #   breaker state decides which slaves are checked
+            if settings["backoff_base"]:
+                breaker_file = get_private_file(args, settings, "breaker")
+                breaker = load_state(breaker_file) if breaker_file else None
+
+            slaves = connect_slaves(
+                slv_cfg, conn_workers=settings["conn_workers"],
+                conn_timeout=settings["conn_timeout"], deadline=deadline,
+                breaker=breaker, timings=timings)
+
+            for slv in slaves:
+                track_latency(slv, latency)
+
+            if breaker is not None:
+                update_breaker(
+                    breaker, [slv for slv in slaves
+                              if slv.conn_msg not in NOT_TRIED],
+                    settings=settings)
+                save_state(breaker_file, breaker)
+
+        add_timing(timings, ["Connect"], start)
+
+        if args.arg_exist("-l"):
+            slaves = run_daemon(
+                args, func_dict, master, slaves, settings=settings,
+                interval=float(args.get_val("-l")), breaker=breaker,
+                breaker_file=breaker_file, mst_name=mst_name,
+                timings=timings, latency=latency, slv_cfg=slv_cfg)
 
-        if args.arg_exist("-s"):
-            slv_cfg = gen_libs.create_cfg_array(
-                args.get_val("-s"), cfg_path=args.get_val("-d"))
-            slv_cfg = gen_libs.transpose_dict(
-                slv_cfg, kwargs.get("slv_key", {}))
-            slaves = mysql_libs.create_slv_array(slv_cfg)
+        else:
+            call_run_chk(
+                args, func_dict, master, slaves, settings=settings,
+                deadline=deadline, mst_name=mst_name, timings=timings,
+                latency=latency)
 
-        call_run_chk(args, func_dict, master, slaves)
         conn_list = [slv for slv in slaves if slv.conn]
 
         if master and master.conn:
@@ -996,6 +4711,7 @@ def main():
         file_crt_list -> contains options which require files to be created
         file_perm -> file check options with their perms in octal
         func_dict -> dictionary list for the function calls or other options
+        inst_dict -> dictionary of options and the instances they use
         opt_con_req_list -> contains the options that require other options
         opt_multi_list -> list of options that will have multiple values
         opt_or_dict_list -> contains list of options that are OR and required
@@ -1016,16 +4732,21 @@ def main():
         "-A": ["-C", "-S", "-E", "-T", "-O"], "-B": rpt_mst_log,
         "-D": rpt_slv_log, "-C": chk_mst_log, "-S": chk_slv_thr,
         "-E": chk_slv_err, "-T": chk_slv_time, "-O": chk_slv_other}
+    inst_dict = {
+        "-B": ["master"], "-C": ["master", "slaves"], "-D": ["slaves"],
+        "-E": ["slaves"], "-O": ["slaves"], "-S": ["slaves"],
+        "-T": ["master", "slaves"]}
     opt_con_req_list = {
-        "-u": ["-t"], "-w": ["-t"], "-A": ["-s"], "-B": ["-c"],
-        "-C": ["-c", "-s"], "-D": ["-s"], "-E": ["-s"], "-O": ["-s"],
-        "-T": ["-c", "-s"], "-x": ["-T"], "-r": ["-f"], "-n": ["-r"],
-        "-g": ["-r"], "-m": ["-r"]}
+        "-u": ["-t"], "-w": ["-t"], "-B": ["-c"], "-C": ["-c"], "-T": ["-c"],
+        "-i": ["-c"], "-r": ["-f"], "-n": ["-r"], "-g": ["-r"],
+        "-m": ["-r"], "-Z": ["-r"]}
     opt_multi_list = ["-u", "-t"]
     opt_or_dict_list = {"-c": ["-s"]}
     opt_req_list = ["-c", "-d"]
-    opt_val_list = ["-d", "-c", "-p", "-s", "-o", "-u", "-t", "-y", "-f"]
-    opt_xor_val = {"-x": ["-A", "-B", "-C", "-S", "-E", "-D", "-O"]}
+    opt_val_list = [
+        "-d", "-c", "-p", "-s", "-o", "-u", "-t", "-y", "-f", "-k", "-l",
+        "-i", "-P"]
+    opt_xor_val = {"-x": ["-B", "-D"], "-s": ["-i"]}
     slv_key = {"sid": "int", "port": "int", "cfg_file": "None",
                "ssl_client_ca": "None", "ssl_ca_path": "None",
                "ssl_client_key": "None", "ssl_client_cert": "None",
@@ -1043,12 +4764,14 @@ def main():
        and args.arg_cond_req(opt_con_req=opt_con_req_list)                    \
        and args.arg_dir_chk(dir_perms_chk=dir_perms_chk)                      \
        and args.arg_file_chk(file_perm_chk=file_perm, file_crt=file_crt_list) \
-       and args.arg_xor_dict(opt_xor_val=opt_xor_val):
+       and args.arg_xor_dict(opt_xor_val=opt_xor_val)                         \
+       and chk_slv_src(args, func_dict, inst_dict):
 
         try:
             proglock = gen_class.ProgramLock(
                 sys.argv, args.get_val("-y", def_val=""))
-            run_program(args, func_dict, slv_key=slv_key)
+            run_program(
+                args, func_dict, slv_key=slv_key, inst_dict=inst_dict)
             del proglock
 
         except gen_class.SingleInstanceException:
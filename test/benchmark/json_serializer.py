@@ -0,0 +1,144 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  json_serializer.py
+
+    Description:  Benchmark of the JSON backends used to serialize the
+        mysql_rep_admin.py output.  Builds a synthetic -A document for a
+        fleet of slaves and times each installed backend for the compact
+        and expanded (-e) output.  Each measurement is the median of a
+        number of runs.
+
+    Usage:
+        test/benchmark/json_serializer.py [-n runs] [-s slaves]
+
+    Arguments:
+        -n runs => Number of runs for each measurement.  Default is 20.
+        -s slaves => Number of slaves in the document.  Default is 1000.
+
+        NOTE:  Run from the project directory.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import os
+import sys
+import time
+import argparse
+import importlib
+import statistics
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+
+
+def create_doc(slv_cnt):
+
+    """Function:  create_doc
+
+    Description:  Returns a synthetic -A document with the results of the -C,
+        -S, -E, -T and -O options for a number of slaves.
+
+    Arguments:
+        (input) slv_cnt -> Number of slaves
+        (output) Document in the JSON output shape
+
+    """
+
+    names = [f"slave{cnt:04d}" for cnt in range(slv_cnt)]
+    err = mysql_rep_admin.ThreadError(
+        "No", 1236, "Got fatal error from master", "2026-10-18 00:00:00")
+
+    return mysql_rep_admin.to_json({
+        "Application": "MySQLReplication", "Master": "master",
+        "AsOf": "2026-10-18T00:00:00Z", "Checks": [
+            {"CheckMasterLog": {
+                "MasterLog": {"Master": "master", "Log": "mysql-bin.000042",
+                              "Pos": 123456789},
+                "SlaveLogs": [mysql_rep_admin.SlaveLog(
+                    name, "mysql-bin.000042", 123456789, "relay-bin.000007",
+                    123456789, "uuid:1-100000") for name in names]}},
+            {"CheckSlaveThread": {"Slaves": [mysql_rep_admin.SlaveThread(
+                name, "Yes", err if cnt % 100 == 0 else "Yes")
+                for cnt, name in enumerate(names)]}},
+            {"CheckSlaveError": {"Slaves": [mysql_rep_admin.SlaveError(
+                name, "Up", "No", "No") for name in names]}},
+            {"CheckSlaveTime": {"Slaves": [mysql_rep_admin.SlaveTime(
+                name, f"uuid-{cnt}", cnt % 3, [cnt % 3] * 3, 0.5)
+                for cnt, name in enumerate(names)]}},
+            {"CheckSlaveOther": {"Slaves": [mysql_rep_admin.SlaveOther(
+                name, "Up", 0, 0, 0) for name in names]}}]})
+
+
+def time_dumps(dumps, doc, runs, indent=None):
+
+    """Function:  time_dumps
+
+    Description:  Returns the median time to serialize the document and the
+        size of the JSON text.
+
+    Arguments:
+        (input) dumps -> Serializer function from get_serializer
+        (input) doc -> Document in the JSON output shape
+        (input) runs -> Number of runs
+        (input) indent -> Number of spaces to indent or None for compact
+        (output) Median number of seconds to serialize the document
+        (output) Number of characters in the JSON text
+
+    """
+
+    times = []
+    text = ""
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        text = dumps(doc, indent=indent)
+        times.append(time.perf_counter() - start)
+
+    return statistics.median(times), len(text)
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Runs the serializer benchmarks and prints the results.
+
+    Arguments:
+
+    """
+
+    parser = argparse.ArgumentParser(description="mysql_rep_admin JSON")
+    parser.add_argument("-n", type=int, default=20, dest="runs")
+    parser.add_argument("-s", type=int, default=1000, dest="slaves")
+    args = parser.parse_args()
+
+    doc = create_doc(args.slaves)
+
+    print(f"Document: {args.slaves} slaves, median of {args.runs} runs")
+    print(f"{'Backend':<12}{'Compact':>12}{'Expanded':>12}{'Size':>12}")
+
+    for name in mysql_rep_admin.JSON_BACKENDS:
+        try:
+            importlib.import_module(name)
+
+        except ImportError:
+            print(f"{name:<12}{'not installed':>12}")
+            continue
+
+        dumps = mysql_rep_admin.get_serializer(name)
+        cmp_time, size = time_dumps(dumps, doc, args.runs)
+        exp_time, _ = time_dumps(dumps, doc, args.runs, indent=4)
+        print(f"{name:<12}{cmp_time * 1000:9.2f} ms{exp_time * 1000:9.2f} ms"
+              f"{size / 1024:9.1f} KB")
+
+    print(f"Selected:   {mysql_rep_admin.get_serializer().args[0].__name__}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
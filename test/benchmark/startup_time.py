@@ -0,0 +1,138 @@
+#!/usr/bin/python
+# Classification (U)
+
+"""Program:  startup_time.py
+
+    Description:  Benchmark of the mysql_rep_admin.py startup time.  Measures
+        the time to import the program, the time for a -v run and, if a
+        master configuration file is given, the time to the first query
+        with a -B run.  Each measurement is the median of a number of runs
+        in new processes so the results are reproducible.
+
+    Usage:
+        test/benchmark/startup_time.py [-n runs] [-b budget_ms]
+            [-c mysql_cfg -d path]
+
+    Arguments:
+        -n runs => Number of runs for each measurement.  Default is 10.
+        -b budget_ms => Import time budget in milliseconds.  Exits with a
+            status of 1 if the median import time is over the budget.
+        -c mysql_cfg => Master config file for the time to first query.
+        -d path => Directory path to the config file.
+
+        NOTE:  Run from the project directory.
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+# Modules which are only imported when an option uses them.
+LAZY_MODULES = ["asyncio", "concurrent.futures", "mysql_lib.mysql_class",
+                "mysql_lib.mysql_libs", "lib.machine"]
+
+IMPORT_CODE = """
+import sys
+import time
+start = time.perf_counter()
+import mysql_rep_admin
+print(time.perf_counter() - start)
+print(",".join(mod for mod in {0} if mod in sys.modules))
+"""
+
+
+def time_cmd(cmd):
+
+    """Function:  time_cmd
+
+    Description:  Runs a command in a new process and returns the wall time.
+
+    Arguments:
+        (input) cmd -> Command line list
+        (output) Number of seconds the command took
+
+    """
+
+    start = time.perf_counter()
+    subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                   check=False)
+
+    return time.perf_counter() - start
+
+
+def time_import(runs):
+
+    """Function:  time_import
+
+    Description:  Returns the median import time of the program and the
+        lazy modules which were imported at load time.
+
+    Arguments:
+        (input) runs -> Number of runs
+        (output) Median number of seconds to import the program
+        (output) List of lazy modules imported at load time
+
+    """
+
+    times = []
+    loaded = []
+
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", IMPORT_CODE.format(LAZY_MODULES)],
+            capture_output=True, text=True, check=True).stdout.splitlines()
+        times.append(float(out[0]))
+        loaded = [mod for mod in out[1].split(",") if mod]
+
+    return statistics.median(times), loaded
+
+
+def main():
+
+    """Function:  main
+
+    Description:  Runs the startup benchmarks and prints the results.
+
+    Arguments:
+
+    """
+
+    parser = argparse.ArgumentParser(description="mysql_rep_admin startup")
+    parser.add_argument("-n", type=int, default=10, dest="runs")
+    parser.add_argument("-b", type=float, default=None, dest="budget")
+    parser.add_argument("-c", default=None, dest="mst_cfg")
+    parser.add_argument("-d", default="config", dest="cfg_dir")
+    args = parser.parse_args()
+
+    imp_time, loaded = time_import(args.runs)
+    ver_time = statistics.median(
+        time_cmd([sys.executable, "mysql_rep_admin.py", "-v"])
+        for _ in range(args.runs))
+
+    print(f"Import time:          {imp_time * 1000:8.1f} ms")
+    print(f"Version run (-v):     {ver_time * 1000:8.1f} ms")
+
+    if args.mst_cfg:
+        qry_time = statistics.median(
+            time_cmd([sys.executable, "mysql_rep_admin.py", "-B", "-z",
+                      "-c", args.mst_cfg, "-d", args.cfg_dir])
+            for _ in range(args.runs))
+        print(f"First query run (-B): {qry_time * 1000:8.1f} ms")
+
+    print(f"Lazy modules loaded:  {', '.join(loaded) or 'None'}")
+
+    if args.budget is not None and imp_time * 1000 > args.budget:
+        print(f"Import time is over the {args.budget} ms budget.")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+# Classification (U)
+
+"""Program:  LazyModule.py
+
+    Description:  Unit testing of LazyModule in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/LazyModule.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):                      # pylint:disable=W0212
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_dunder_attr
+        test_no_module
+        test_fallback_module
+        test_not_imported
+        test_imported
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lazy = mysql_rep_admin.LazyModule("textwrap")
+
+    def test_dunder_attr(self):
+
+        """Function:  test_dunder_attr
+
+        Description:  Test special attributes do not import the module.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (hasattr(self.lazy, "__wrapped__"), self.lazy._module),
+            (False, None))
+
+    def test_no_module(self):
+
+        """Function:  test_no_module
+
+        Description:  Test with none of the modules importable.
+
+        Arguments:
+
+        """
+
+        lazy = mysql_rep_admin.LazyModule("missing_mod1", "missing_mod2")
+
+        with self.assertRaises(ImportError):
+            lazy.dedent("text")
+
+    def test_fallback_module(self):
+
+        """Function:  test_fallback_module
+
+        Description:  Test first importable module is used.
+
+        Arguments:
+
+        """
+
+        lazy = mysql_rep_admin.LazyModule(
+            ".missing_mod", "missing_mod", "textwrap", package=None)
+
+        self.assertEqual(lazy.dedent("  text"), "text")
+
+    def test_not_imported(self):
+
+        """Function:  test_not_imported
+
+        Description:  Test module is not imported until used.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(self.lazy._module)
+
+    def test_imported(self):
+
+        """Function:  test_imported
+
+        Description:  Test module is imported when an attribute is used.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (self.lazy.dedent("  text"), self.lazy._module.__name__),
+            ("text", "textwrap"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,240 @@
+# Classification (U)
+
+"""Program:  ResultRecord.py
+
+    Description:  Unit testing of ResultRecord in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/ResultRecord.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_is_problem_report
+        test_is_problem_nested
+        test_is_problem
+        test_no_problem
+        test_get_state_nested
+        test_get_state_fields
+        test_get_state_all
+        test_nested_record
+        test_unset_field
+        test_keyword_fields
+        test_positional_fields
+        test_no_dict
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.record = mysql_rep_admin.SlaveThread("slave1", "Yes", "No")
+        self.results = {"Name": "slave1", "IOThread": "Yes", "SQLThread": "No"}
+
+    def test_is_problem_report(self):
+
+        """Function:  test_is_problem_report
+
+        Description:  Test is_problem with a report record.
+
+        Arguments:
+
+        """
+
+        record = mysql_rep_admin.SlaveLog("slave1", "Unknown", "Unknown")
+
+        self.assertFalse(record.is_problem())
+
+    def test_is_problem_nested(self):
+
+        """Function:  test_is_problem_nested
+
+        Description:  Test is_problem with a problem in a record field.
+
+        Arguments:
+
+        """
+
+        record = mysql_rep_admin.SlaveError(
+            "slave1", "Up", mysql_rep_admin.ThreadError("Bad", 1236),
+            mysql_rep_admin.ThreadError("Good"))
+
+        self.assertTrue(record.is_problem())
+
+    def test_is_problem(self):
+
+        """Function:  test_is_problem
+
+        Description:  Test is_problem with a field not the healthy value.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(self.record.is_problem())
+
+    def test_no_problem(self):
+
+        """Function:  test_no_problem
+
+        Description:  Test is_problem with all fields the healthy value.
+
+        Arguments:
+
+        """
+
+        record = mysql_rep_admin.SlaveThread("slave1", "Up", "Up")
+
+        self.assertFalse(record.is_problem())
+
+    def test_get_state_nested(self):
+
+        """Function:  test_get_state_nested
+
+        Description:  Test get_state with a record as a field value.
+
+        Arguments:
+
+        """
+
+        record = mysql_rep_admin.SlaveError(
+            "slave1", "Up", mysql_rep_admin.ThreadError(
+                "Bad", 1236, "Error message", "2026-10-18 00:00:00"),
+            mysql_rep_admin.ThreadError("Good"))
+
+        self.assertEqual(
+            record.get_state(), ["Up", ["Bad", 1236], ["Good", None], None])
+
+    def test_get_state_fields(self):
+
+        """Function:  test_get_state_fields
+
+        Description:  Test get_state only uses the status fields.
+
+        Arguments:
+
+        """
+
+        record = mysql_rep_admin.SlaveStatus(
+            "slave1", "OK", {"Log": "mysql-bin.000001", "Position": 10})
+
+        self.assertEqual(record.get_state(), ["OK", None])
+
+    def test_get_state_all(self):
+
+        """Function:  test_get_state_all
+
+        Description:  Test get_state with all fields as the status.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.record.get_state(), ["slave1", "Yes", "No"])
+
+    def test_nested_record(self):
+
+        """Function:  test_nested_record
+
+        Description:  Test with a record as a field value.
+
+        Arguments:
+
+        """
+
+        record = mysql_rep_admin.SlaveThread(
+            "slave1", mysql_rep_admin.ThreadError("No", 1236), "Yes")
+
+        self.assertEqual(
+            record.to_dict(),
+            {"Name": "slave1", "IOThread": {"Status": "No", "Error": 1236},
+             "SQLThread": "Yes"})
+
+    def test_unset_field(self):
+
+        """Function:  test_unset_field
+
+        Description:  Test unset fields are left out of the output.
+
+        Arguments:
+
+        """
+
+        record = mysql_rep_admin.SlaveStatus("slave1", "DOWN")
+
+        self.assertEqual(
+            record.to_dict(), {"Name": "slave1", "Status": "DOWN"})
+
+    def test_keyword_fields(self):
+
+        """Function:  test_keyword_fields
+
+        Description:  Test with fields passed by name.
+
+        Arguments:
+
+        """
+
+        record = mysql_rep_admin.SlaveThread(
+            sql_thread="No", io_thread="Yes", name="slave1")
+
+        self.assertEqual(record.to_dict(), self.results)
+
+    def test_positional_fields(self):
+
+        """Function:  test_positional_fields
+
+        Description:  Test with fields passed in order.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.record.to_dict(), self.results)
+
+    def test_no_dict(self):
+
+        """Function:  test_no_dict
+
+        Description:  Test the record does not have an instance dictionary.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(hasattr(self.record, "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# Classification (U)
+
+"""Program:  SlaveTime.py
+
+    Description:  Unit testing of SlaveTime in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/SlaveTime.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_get_state_note
+        test_get_state_down
+        test_get_state_lagging
+        test_get_state_no_lag
+
+    """
+
+    def test_get_state_note(self):
+
+        """Function:  test_get_state_note
+
+        Description:  Test get_state with a skipped slave's note.
+
+        Arguments:
+
+        """
+
+        record = mysql_rep_admin.SlaveTime(
+            "slave1", "Unknown", "DOWN", note=mysql_rep_admin.SKIP_MSG)
+
+        self.assertEqual(
+            record.get_state(), ["DOWN", mysql_rep_admin.SKIP_MSG])
+
+    def test_get_state_down(self):
+
+        """Function:  test_get_state_down
+
+        Description:  Test get_state with a down slave.
+
+        Arguments:
+
+        """
+
+        record = mysql_rep_admin.SlaveTime("slave1", "Unknown", "DOWN")
+
+        self.assertEqual(record.get_state(), ["DOWN", None])
+
+    def test_get_state_lagging(self):
+
+        """Function:  test_get_state_lagging
+
+        Description:  Test get_state with any time lag is the same status.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.SlaveTime("slave1", "UUID1", 5).get_state(),
+            mysql_rep_admin.SlaveTime("slave1", "UUID1", 50).get_state())
+
+    def test_get_state_no_lag(self):
+
+        """Function:  test_get_state_no_lag
+
+        Description:  Test get_state with no time lag.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.SlaveTime("slave1", "UUID1", 0).get_state(),
+            [0, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
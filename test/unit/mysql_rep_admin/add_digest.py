@@ -0,0 +1,181 @@
+# Classification (U)
+
+"""Program:  add_digest.py
+
+    Description:  Unit testing of add_digest in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/add_digest.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_data_no_pending
+        test_no_data_pending
+        test_window_over_digest
+        test_window_over_single
+        test_window_open_no_data
+        test_window_open
+        test_first_mail
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = {"Application": "MySQLReplication", "Checks": [
+            {"CheckSlaveThread": {"Slaves": [
+                mysql_rep_admin.SlaveThread("slave1", "Up", "Down")]}}]}
+        self.data_json = mysql_rep_admin.to_json(self.data)
+        self.pending = {"Application": "MySQLReplication", "Checks": []}
+        self.window = 600
+
+    def test_no_data_no_pending(self):
+
+        """Function:  test_no_data_no_pending
+
+        Description:  Test with no data and nothing held after the window.
+
+        Arguments:
+
+        """
+
+        state = {"start": 1000}
+
+        self.assertEqual(
+            (mysql_rep_admin.add_digest(None, state, self.window, 2000),
+             state), (None, {}))
+
+    def test_no_data_pending(self):
+
+        """Function:  test_no_data_pending
+
+        Description:  Test with no data and results held after the window.
+
+        Arguments:
+
+        """
+
+        state = {"start": 1000, "pending": [self.pending]}
+
+        self.assertEqual(
+            (mysql_rep_admin.add_digest(None, state, self.window, 2000),
+             state), (self.pending, {"start": 2000}))
+
+    def test_window_over_digest(self):
+
+        """Function:  test_window_over_digest
+
+        Description:  Test with the held results and the data emailed as a
+            digest after the window.
+
+        Arguments:
+
+        """
+
+        state = {"start": 1000, "pending": [self.pending]}
+
+        self.assertEqual(
+            mysql_rep_admin.add_digest(self.data, state, self.window, 2000),
+            {"Application": "MySQLReplication",
+             "Digest": [self.pending, self.data_json]})
+
+    def test_window_over_single(self):
+
+        """Function:  test_window_over_single
+
+        Description:  Test with only the data after the window.
+
+        Arguments:
+
+        """
+
+        state = {"start": 1000}
+
+        self.assertEqual(
+            (mysql_rep_admin.add_digest(self.data, state, self.window, 2000),
+             state), (self.data_json, {"start": 2000}))
+
+    def test_window_open_no_data(self):
+
+        """Function:  test_window_open_no_data
+
+        Description:  Test with no data during the window.
+
+        Arguments:
+
+        """
+
+        state = {"start": 1000, "pending": [self.pending]}
+
+        self.assertEqual(
+            (mysql_rep_admin.add_digest(None, state, self.window, 1100),
+             state), (None, {"start": 1000, "pending": [self.pending]}))
+
+    def test_window_open(self):
+
+        """Function:  test_window_open
+
+        Description:  Test the data is held during the window.
+
+        Arguments:
+
+        """
+
+        state = {"start": 1000}
+
+        self.assertEqual(
+            (mysql_rep_admin.add_digest(self.data, state, self.window, 1100),
+             state), (None, {"start": 1000, "pending": [self.data_json]}))
+
+    def test_first_mail(self):
+
+        """Function:  test_first_mail
+
+        Description:  Test the first data is emailed right away and opens the
+            window.
+
+        Arguments:
+
+        """
+
+        state = {}
+
+        self.assertEqual(
+            (mysql_rep_admin.add_digest(self.data, state, self.window, 1000),
+             state), (self.data_json, {"start": 1000}))
+
+
+if __name__ == "__main__":
+    unittest.main()
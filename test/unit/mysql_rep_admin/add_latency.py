@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  add_latency.py
+
+    Description:  Unit testing of add_latency in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/add_latency.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_bucket_bound
+        test_over_buckets
+        test_multiple_queries
+        test_new_server
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.latency = {}
+        self.name = "Slave1"
+
+    def test_bucket_bound(self):
+
+        """Function:  test_bucket_bound
+
+        Description:  Test a time equal to a bucket bound is in that bucket.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.add_latency(self.latency, self.name, 0.005)
+
+        self.assertEqual(self.latency[self.name]["Buckets"][2], 1)
+
+    def test_over_buckets(self):
+
+        """Function:  test_over_buckets
+
+        Description:  Test a time over the last bucket bound.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.add_latency(self.latency, self.name, 30)
+
+        self.assertEqual(self.latency[self.name]["Buckets"][-1], 1)
+
+    def test_multiple_queries(self):
+
+        """Function:  test_multiple_queries
+
+        Description:  Test the count, sum and maximum of several queries.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.add_latency(self.latency, self.name, 0.002)
+        mysql_rep_admin.add_latency(self.latency, self.name, 0.8)
+
+        self.assertEqual(
+            (self.latency[self.name]["Count"],
+             round(self.latency[self.name]["Sum"], 3),
+             self.latency[self.name]["Max"]), (2, 0.802, 0.8))
+
+    def test_new_server(self):
+
+        """Function:  test_new_server
+
+        Description:  Test the histogram is created for a new server.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.add_latency(self.latency, self.name, 0.0005)
+
+        self.assertEqual(
+            self.latency, {self.name: {
+                "Buckets": [1] + [0] * len(mysql_rep_admin.LAT_BUCKETS),
+                "Count": 1, "Sum": 0.0005, "Max": 0.0005}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -49,8 +49,36 @@ class MasterRep():                                      # pylint:disable=R0903
 
         self.name = "Master_Name"
         self.slaves = [
-            {"Replica_UUID": "1"}, {"Replica_UUID": "2"},
-            {"Replica_UUID": "3"}]
+            {"Server_id": 11, "Host": "Slave1", "Replica_UUID": "1"},
+            {"Server_id": 21, "Host": "Slave2", "Replica_UUID": "2"},
+            {"Server_id": 31, "Host": "Slave3", "Replica_UUID": "3"}]
+
+
+class SlaveSnapshot():                                  # pylint:disable=R0903
+
+    """Class:  SlaveSnapshot
+
+    Description:  Class stub holder for mysql_rep_admin.SlaveSnapshot class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, slave_uuid, sid):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.slave_uuid = slave_uuid
+        self.slave = self
+        self.sid = sid
 
 
 class UnitTest(unittest.TestCase):
@@ -61,6 +89,8 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_no_master
+        test_unexpected_slv
         test_no_slv_miss
         test_one_slv_miss
 
@@ -77,14 +107,48 @@ class UnitTest(unittest.TestCase):
         """
 
         self.master = MasterRep()
+        self.slaves = [SlaveSnapshot("Slave1", "1", 11),
+                       SlaveSnapshot("Slave2", "2", 21)]
         self.data = {
             "CheckSlaveTime": {
                 "Slaves": [{"Slave_UUID": "1"}, {"Slave_UUID": "2"}]}}
-        self.data2 = {
+        self.results = {
             "CheckSlaveTime": {
                 "Slaves": [{"Slave_UUID": "1"}, {"Slave_UUID": "2"},
-                           {"Slave_UUID": "3"}]}}
-        self.results = [{"Slave_UUID": "3", "LagTime": "UNK"}]
+                           {"Slave_UUID": "3", "LagTime": "UNK"}]}}
+
+    def test_no_master(self):
+
+        """Function:  test_no_master
+
+        Description:  Test with no master instance.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.add_miss_slaves(None, self.data, self.slaves)),
+            {"CheckSlaveTime": {
+                "Slaves": [{"Slave_UUID": "1"}, {"Slave_UUID": "2"}]}})
+
+    def test_unexpected_slv(self):
+
+        """Function:  test_unexpected_slv
+
+        Description:  Test with slave not in the master's slave list.
+
+        Arguments:
+
+        """
+
+        self.slaves.append(SlaveSnapshot("Slave4", "4", 41))
+
+        self.assertEqual(
+            mysql_rep_admin.to_json(mysql_rep_admin.add_miss_slaves(
+                self.master, self.data, self.slaves))["CheckSlaveTime"][
+                    "Unexpected"], [{"Name": "Slave4", "Slave_UUID": "4"}])
 
     def test_no_slv_miss(self):
 
@@ -96,8 +160,13 @@ class UnitTest(unittest.TestCase):
 
         """
 
+        self.slaves.append(SlaveSnapshot("Slave3", "3", 31))
+
         self.assertEqual(
-            mysql_rep_admin.add_miss_slaves(self.master, self.data2), [])
+            mysql_rep_admin.to_json(mysql_rep_admin.add_miss_slaves(
+                self.master, self.data, self.slaves)),
+            {"CheckSlaveTime": {
+                "Slaves": [{"Slave_UUID": "1"}, {"Slave_UUID": "2"}]}})
 
     def test_one_slv_miss(self):
 
@@ -110,8 +179,8 @@ class UnitTest(unittest.TestCase):
         """
 
         self.assertEqual(
-            mysql_rep_admin.add_miss_slaves(self.master, self.data),
-            self.results)
+            mysql_rep_admin.to_json(mysql_rep_admin.add_miss_slaves(
+                self.master, self.data, self.slaves)), self.results)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,104 @@
+# Classification (U)
+
+"""Program:  add_skip_note.py
+
+    Description:  Unit testing of add_skip_note in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/add_skip_note.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import collections
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_conn_msg
+        test_other_conn_msg
+        test_skipped
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = collections.namedtuple("Slave", ["conn_msg"])
+        self.data = mysql_rep_admin.SlaveStatus("Slave_Name", "DOWN")
+        self.results = {"Name": "Slave_Name", "Status": "DOWN"}
+
+    def test_no_conn_msg(self):
+
+        """Function:  test_no_conn_msg
+
+        Description:  Test with slave without a connection message.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.add_skip_note("Slave", self.data).to_dict(),
+            self.results)
+
+    def test_other_conn_msg(self):
+
+        """Function:  test_other_conn_msg
+
+        Description:  Test with slave down for another reason.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.add_skip_note(
+                self.slave("Connection refused"), self.data).to_dict(),
+            self.results)
+
+    def test_skipped(self):
+
+        """Function:  test_skipped
+
+        Description:  Test with slave skipped by the circuit breaker.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.add_skip_note(
+                self.slave(mysql_rep_admin.SKIP_MSG), self.data).note,
+            "skipped: backing off")
+
+
+if __name__ == "__main__":
+    unittest.main()
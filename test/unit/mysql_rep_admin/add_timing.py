@@ -0,0 +1,125 @@
+# Classification (U)
+
+"""Program:  add_timing.py
+
+    Description:  Unit testing of add_timing in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/add_timing.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_end_time
+        test_longest_kept
+        test_nested_keys
+        test_no_timings
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.timings = {}
+        self.start = time.time()
+
+    def test_end_time(self):
+
+        """Function:  test_end_time
+
+        Description:  Test with the end time given.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.add_timing(
+            self.timings, ["Connect"], self.start, self.start + 1.5)
+
+        self.assertEqual(self.timings, {"Connect": 1.5})
+
+    def test_longest_kept(self):
+
+        """Function:  test_longest_kept
+
+        Description:  Test the longest time is kept for the same keys.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.add_timing(
+            self.timings, ["LagWait"], self.start, self.start + 2)
+        mysql_rep_admin.add_timing(
+            self.timings, ["LagWait"], self.start, self.start + 1)
+
+        self.assertEqual(self.timings, {"LagWait": 2})
+
+    def test_nested_keys(self):
+
+        """Function:  test_nested_keys
+
+        Description:  Test the nested keys are created.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.add_timing(
+            self.timings, ["Slaves", "Slave1", "Connect"], self.start,
+            self.start + 1)
+        mysql_rep_admin.add_timing(
+            self.timings, ["Slaves", "Slave1", "-S"], self.start,
+            self.start + 2)
+
+        self.assertEqual(
+            self.timings, {"Slaves": {"Slave1": {"Connect": 1, "-S": 2}}})
+
+    def test_no_timings(self):
+
+        """Function:  test_no_timings
+
+        Description:  Test with timings turned off.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mysql_rep_admin.add_timing(None, ["Connect"], self.start))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+# Classification (U)
+
+"""Program:  budget_worker.py
+
+    Description:  Unit testing of budget_worker in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/budget_worker.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def raise_error():
+
+    """Function:  raise_error
+
+    Description:  Function stub which raises an exception.
+
+    Arguments:
+
+    """
+
+    raise ValueError("Error Message")
+
+
+class Conn():                                           # pylint:disable=R0903
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql connection.
+
+    Methods:
+        __init__
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.closed = False
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub method holder for close.
+
+        Arguments:
+
+        """
+
+        self.closed = True
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = None
+        self.conn_msg = mysql_rep_admin.ABANDON_MSG
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_dropped_conn
+        test_exception
+        test_result
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.outcome = {"lock": threading.Lock()}
+
+    def test_dropped_conn(self):
+
+        """Function:  test_dropped_conn
+
+        Description:  Test connections dropped while running are closed.
+
+        Arguments:
+
+        """
+
+        server = Server()
+        conn = Conn()
+        self.outcome["dropped"] = [(server, conn)]
+        mysql_rep_admin.budget_worker(lambda: "Result", self.outcome)
+
+        self.assertEqual(
+            (conn.closed, server.conn_msg, self.outcome["finished"]),
+            (True, mysql_rep_admin.CLOSED_MSG, True))
+
+    def test_exception(self):
+
+        """Function:  test_exception
+
+        Description:  Test with function raising an exception.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.budget_worker(raise_error, self.outcome)
+
+        self.assertIsInstance(self.outcome["error"], ValueError)
+
+    def test_result(self):
+
+        """Function:  test_result
+
+        Description:  Test with function returning a result.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.budget_worker(lambda: "Result", self.outcome)
+
+        self.assertEqual(
+            (self.outcome["result"], self.outcome["finished"]),
+            ("Result", True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,12 +17,16 @@
 import sys
 import os
 import unittest
+import shutil
+import tempfile
+import json
 
 import mock
 
 # Local
 sys.path.append(os.getcwd())
 import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
 import version                                  # pylint:disable=E0401,C0413
 
 __version__ = version.__version__
@@ -161,7 +165,7 @@ class ArgParser():
         return self.args_array.get(skey, def_val)
 
 
-class MasterRep():                                      # pylint:disable=R0903
+class MasterRep():
 
     """Class:  MasterRep
 
@@ -169,6 +173,7 @@ class MasterRep():                                      # pylint:disable=R0903
 
     Methods:
         __init__
+        is_connected
 
     """
 
@@ -183,6 +188,19 @@ class MasterRep():                                      # pylint:disable=R0903
         """
 
         self.name = "Master_Name"
+        self.connected = True
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub method holder for MasterRep.is_connected.
+
+        Arguments:
+
+        """
+
+        return self.connected
 
 
 class SlaveRep():                                       # pylint:disable=R0903
@@ -209,6 +227,30 @@ class SlaveRep():                                       # pylint:disable=R0903
         self.name = "Slave_Name"
 
 
+class SlaveSnapshot():                                  # pylint:disable=R0903
+
+    """Class:  SlaveSnapshot
+
+    Description:  Class stub holder for mysql_rep_admin.SlaveSnapshot class.
+
+    Methods:
+        get_name
+
+    """
+
+    def get_name(self):
+
+        """Method:  get_name
+
+        Description:  Stub method holder for SlaveSnapshot.get_name.
+
+        Arguments:
+
+        """
+
+        return "Slave_Name"
+
+
 class UnitTest(unittest.TestCase):
 
     """Class:  UnitTest
@@ -217,8 +259,28 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
-        test_x_option_time_lag
-        test_x_option_no_time_lag
+        tearDown
+        set_ofile
+        test_latency
+        test_timings_lines
+        test_timings
+        test_prometheus_delta
+        test_digest_no_change
+        test_delta_no_change
+        test_delta
+        test_delta_no_state_dir
+        test_json_lines_async
+        test_json_lines_mail
+        test_json_lines_x_none
+        test_json_lines_x_option
+        test_json_lines
+        test_no_master
+        test_master_down
+        test_master_abandoned
+        test_sample_status
+        test_async_engine
+        test_x_option_problem
+        test_x_option_no_problem
         test_single_func
         test_argsarray_all2
         test_argsarray_all
@@ -238,16 +300,569 @@ class UnitTest(unittest.TestCase):
         self.master = MasterRep()
         self.slave = SlaveRep()
         self.args = ArgParser()
+        self.tmp_dir = None
         self.func_list = {"-A": ["-C", "-S"], "-C": chk_mst_log,
                           "-S": chk_slv_thr, "-D": rpt_slv_log}
 
-    @mock.patch("mysql_rep_admin.is_time_lag", mock.Mock(return_value=True))
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        if self.tmp_dir:
+            shutil.rmtree(self.tmp_dir)
+
+    def set_ofile(self):
+
+        """Function:  set_ofile
+
+        Description:  Sets the -b, -x, -o and -z options with an -o file
+            holding the last run's output.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        ofile = os.path.join(self.tmp_dir, "output.json")
+
+        with open(ofile, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write('{"Check": {"Option": "last run"}}\n')
+
+        self.args.args_array.update(
+            {"-b": True, "-x": True, "-o": ofile, "-z": True})
+
+        return ofile
+
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value=SlaveSnapshot()))
+    @mock.patch("mysql_rep_admin.load_state", mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.prom_out")
+    @mock.patch("mysql_rep_admin.data_out")
+    def test_latency(self, mock_out, mock_prom):
+
+        """Function:  test_latency
+
+        Description:  Test with -q and -P options the query latency
+            histograms are in the Timings block and the metrics.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-q"] = True
+        self.args.args_array["-P"] = "/metrics/mysql_rep_admin.prom"
+        latency = {}
+        mysql_rep_admin.add_latency(latency, "master", 0.002)
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave],
+            latency=latency)
+
+        self.assertEqual(
+            (mock_out.call_args[0][0]["Timings"]["Queries"],
+             mock_prom.call_args[1]["latency"]),
+            (mysql_rep_admin.get_latency(latency), latency))
+
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value=SlaveSnapshot()))
+    @mock.patch("mysql_rep_admin.load_state", mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.data_out", mock.Mock())
+    @mock.patch("mysql_rep_admin.line_out")
+    def test_timings_lines(self, mock_line):
+
+        """Function:  test_timings_lines
+
+        Description:  Test with -q and -b options writes the Timings as the
+            last line.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-q"] = True
+        self.args.args_array["-b"] = True
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        self.assertEqual(
+            (len(mock_line.call_args_list), mock_line.call_args[1]["key"],
+             list(mock_line.call_args[0][1]["Checks"].keys())),
+            (4, "Timings", ["-C", "-S", "-D"]))
+
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value=SlaveSnapshot()))
+    @mock.patch("mysql_rep_admin.load_state",
+                mock.Mock(return_value={"Output": 0.25}))
+    @mock.patch("mysql_rep_admin.save_state")
+    @mock.patch("mysql_rep_admin.data_out")
+    def test_timings(self, mock_out, mock_save):
+
+        """Function:  test_timings
+
+        Description:  Test with -q option adds the Timings block and keeps
+            the output times for the next run.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-q"] = True
+        timings = {"Connect": 0.5}
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave],
+            timings=timings)
+        data = mock_out.call_args[0][0]
+
+        self.assertEqual(
+            (data["Timings"] is timings, sorted(timings.keys()),
+             list(timings["Checks"].keys()), timings["LastRun"],
+             mock_save.call_args[0][1] is mock_out.call_args[1]["timings"]),
+            (True, ["Checks", "Connect", "LastRun", "Sample", "Slaves"],
+             ["-C", "-S", "-D"], {"Output": 0.25}, True))
+
+    @mock.patch("mysql_rep_admin.get_private_file",
+                mock.Mock(return_value="/state/delta.json"))
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.data_out", mock.Mock())
+    @mock.patch("mysql_rep_admin.load_state")
+    @mock.patch("mysql_rep_admin.prom_out")
+    def test_prometheus_delta(self, mock_prom, mock_load):
+
+        """Function:  test_prometheus_delta
+
+        Description:  Test with -P and -Q options has the metrics of every
+            option even when no status changed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Q"] = True
+        self.args.args_array["-P"] = "/metrics/mysql_rep_admin.prom"
+
+        mock_load.return_value = {
+            "-C": {"master": True}, "-S": {"slave_thread": True},
+            "-D": {"slave_log": True}}
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        self.assertEqual(
+            (mock_prom.call_args[0][0], mock_prom.call_args[0][2]),
+            ([("-C", {"master": True}), ("-S", {"slave_thread": True}),
+              ("-D", {"slave_log": True})], "/metrics/mysql_rep_admin.prom"))
+
+    @mock.patch("mysql_rep_admin.get_private_file",
+                mock.Mock(return_value="/state/delta.json"))
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.load_state")
+    @mock.patch("mysql_rep_admin.data_out")
+    def test_digest_no_change(self, mock_out, mock_load):
+
+        """Function:  test_digest_no_change
+
+        Description:  Test with -Q option, no status changed and the
+            mail_digest setting still sends a mail digest which is due.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Q"] = True
+        self.args.args_array["-t"] = "toaddr"
+        settings = dict(mysql_rep_admin.SETTINGS, mail_digest=600)
+
+        mock_load.return_value = {
+            "-C": {"master": True}, "-S": {"slave_thread": True},
+            "-D": {"slave_log": True}}
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave],
+            settings=settings)
+
+        self.assertIsNone(mock_out.call_args[0][0])
+
+    @mock.patch("mysql_rep_admin.get_private_file",
+                mock.Mock(return_value="/state/delta.json"))
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.load_state")
+    @mock.patch("mysql_rep_admin.data_out")
+    def test_delta_no_change(self, mock_out, mock_load):
+
+        """Function:  test_delta_no_change
+
+        Description:  Test with -Q option and no status changed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Q"] = True
+
+        mock_load.return_value = {
+            "-C": {"master": True}, "-S": {"slave_thread": True},
+            "-D": {"slave_log": True}}
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        mock_out.assert_not_called()
+
+    @mock.patch("mysql_rep_admin.get_private_file",
+                mock.Mock(return_value="/state/delta.json"))
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.save_state")
+    @mock.patch("mysql_rep_admin.load_state")
+    @mock.patch("mysql_rep_admin.data_out")
+    def test_delta(self, mock_out, mock_load, mock_save):
+
+        """Function:  test_delta
+
+        Description:  Test with -Q option and one option changed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Q"] = True
+
+        mock_load.return_value = {
+            "-C": {"master": True}, "-S": {"slave_thread": False},
+            "-D": {"slave_log": True}}
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        self.assertEqual(
+            (mock_out.call_args[0][0]["Checks"], mock_save.call_args[0][1]),
+            ([{"slave_thread": True}],
+             {"-C": {"master": True}, "-S": {"slave_thread": True},
+              "-D": {"slave_log": True}}))
+
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.save_state")
+    @mock.patch("mysql_rep_admin.load_state")
+    @mock.patch("mysql_rep_admin.data_out")
+    def test_delta_no_state_dir(self, mock_out, mock_load, mock_save):
+
+        """Function:  test_delta_no_state_dir
+
+        Description:  Test with -Q option and no state_dir setting outputs
+            all results and the delta state is not used.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-Q"] = True
+
+        mock_load.return_value = {}
+
+        with gen_libs.no_std_out():
+            mysql_rep_admin.call_run_chk(
+                self.args, self.func_list, self.master, [self.slave])
+
+        self.assertEqual(
+            (len(mock_out.call_args[0][0]["Checks"]), mock_save.called),
+            (3, False))
+
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
     @mock.patch("mysql_rep_admin.data_out", mock.Mock(return_value=True))
-    def test_x_option_time_lag(self):
+    @mock.patch("mysql_rep_admin.run_chk_async")
+    @mock.patch("mysql_rep_admin.line_out")
+    def test_json_lines_async(self, mock_line, mock_async):
+
+        """Function:  test_json_lines_async
+
+        Description:  Test with -b option and the asyncio check engine.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-b"] = True
+        self.args.args_array["-j"] = True
+
+        mock_async.return_value = [{"master": True}, {"slave_thread": True}]
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        self.assertEqual(
+            [item[0][1] for item in mock_line.call_args_list],
+            mock_async.return_value)
 
-        """Function:  test_x_option_time_lag
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.line_out", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.data_out")
+    def test_json_lines_mail(self, mock_out):
 
-        Description:  Test with -x option and time lag detected.
+        """Function:  test_json_lines_mail
+
+        Description:  Test with -b option and the results emailed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-b"] = True
+        self.args.args_array["-t"] = "toaddr"
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        self.assertTrue(mock_out.call_args[1]["streamed"])
+
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.run_chk")
+    def test_json_lines_x_none(self, mock_chk):
+
+        """Function:  test_json_lines_x_none
+
+        Description:  Test with -b and -x options the last run's -o file is
+            emptied when no option has a problem.
+
+        Arguments:
+
+        """
+
+        mock_chk.side_effect = lambda opt, *args, **kwargs: {"Option": opt}
+        ofile = self.set_ofile()
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        with open(ofile, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(f_hdlr.read(), "")
+
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.run_chk")
+    def test_json_lines_x_option(self, mock_chk):
+
+        """Function:  test_json_lines_x_option
+
+        Description:  Test with -b and -x options the first line written
+            replaces the last run's -o file when earlier options are
+            skipped.
+
+        Arguments:
+
+        """
+
+        mock_chk.side_effect = lambda opt, *args, **kwargs: {
+            "Option": opt, "Status": "TIMEOUT" if opt != "-C" else "OK"}
+        ofile = self.set_ofile()
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        with open(ofile, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(
+                [json.loads(line)["Check"]["Option"] for line in f_hdlr],
+                ["-S", "-D"])
+
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.data_out")
+    @mock.patch("mysql_rep_admin.line_out")
+    def test_json_lines(self, mock_line, mock_out):
+
+        """Function:  test_json_lines
+
+        Description:  Test with -b option writes a line for each option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-b"] = True
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        self.assertEqual(
+            ([item[1]["mode"] for item in mock_line.call_args_list],
+             mock_out.called), (["w", "a", "a"], False))
+
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.data_out")
+    def test_no_master(self, mock_out):
+
+        """Function:  test_no_master
+
+        Description:  Test with no master instance.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-A"]
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, None, [self.slave],
+            mst_name="Master_Name")
+
+        self.assertEqual(mock_out.call_args[0][0]["Master"], "Master_Name")
+
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.data_out", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.sample_status")
+    def test_master_down(self, mock_sample):
+
+        """Function:  test_master_down
+
+        Description:  Test with -C option and master not connected.
+
+        Arguments:
+
+        """
+
+        self.master.connected = False
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        mock_sample.assert_not_called()
+
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.run_chk", mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_admin.data_out")
+    @mock.patch("mysql_rep_admin.sample_status")
+    def test_master_abandoned(self, mock_sample, mock_out):
+
+        """Function:  test_master_abandoned
+
+        Description:  Test with -C option and the master's status update
+            missing its budget, the master's status is not used.
+
+        Arguments:
+
+        """
+
+        def abandon(*args, **kwargs):           # pylint:disable=W0613
+            self.master.connected = False
+            self.master.conn_msg = mysql_rep_admin.ABANDON_MSG
+
+            return None, [2.0]
+
+        mock_sample.side_effect = abandon
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        self.assertEqual(
+            (mock_out.call_args[0][0]["Master"],
+             mysql_rep_admin.run_chk.call_args[1]["master"]),
+            ("Master_Name", None))
+
+    @mock.patch("mysql_rep_admin.create_snapshot")
+    @mock.patch("mysql_rep_admin.data_out", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.sample_status")
+    def test_sample_status(self, mock_sample, mock_snap):
+
+        """Function:  test_sample_status
+
+        Description:  Test with -C option capturing the log positions.
+
+        Arguments:
+
+        """
+
+        mock_sample.return_value = (1.0, [2.0])
+        mock_snap.return_value = "SlaveSnapshot"
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        mock_snap.assert_called_once_with(self.slave, pos_time=2.0)
+
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.data_out", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.run_chk_async")
+    def test_async_engine(self, mock_async):
+
+        """Function:  test_async_engine
+
+        Description:  Test with -j option to use the asyncio check engine.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-j"] = True
+
+        mock_async.return_value = [{"master": True}]
+
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        mock_async.assert_called_once()
+
+    @mock.patch("mysql_rep_admin.has_problem", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.data_out", mock.Mock(return_value=True))
+    def test_x_option_problem(self):
+
+        """Function:  test_x_option_problem
+
+        Description:  Test with -x option and a problem detected.
 
         Arguments:
 
@@ -258,12 +873,17 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(mysql_rep_admin.call_run_chk(
             self.args, self.func_list, self.master, [self.slave]))
 
-    @mock.patch("mysql_rep_admin.is_time_lag", mock.Mock(return_value=False))
-    def test_x_option_no_time_lag(self):
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
+    @mock.patch("mysql_rep_admin.has_problem", mock.Mock(return_value=False))
+    @mock.patch("mysql_rep_admin.data_out")
+    def test_x_option_no_problem(self, mock_out):
 
-        """Function:  test_x_option_no_time_lag
+        """Function:  test_x_option_no_problem
 
-        Description:  Test with -x option and no time lag detected.
+        Description:  Test with -x option and no problem detected.
 
         Arguments:
 
@@ -271,9 +891,15 @@ class UnitTest(unittest.TestCase):
 
         self.args.args_array["-x"] = True
 
-        self.assertFalse(mysql_rep_admin.call_run_chk(
-            self.args, self.func_list, self.master, [self.slave]))
+        mysql_rep_admin.call_run_chk(
+            self.args, self.func_list, self.master, [self.slave])
+
+        mock_out.assert_not_called()
 
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
     @mock.patch("mysql_rep_admin.data_out", mock.Mock(return_value=True))
     def test_single_func(self):
 
@@ -290,6 +916,10 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(mysql_rep_admin.call_run_chk(
             self.args, self.func_list, self.master, [self.slave]))
 
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
     @mock.patch("mysql_rep_admin.data_out", mock.Mock(return_value=True))
     def test_argsarray_all2(self):
 
@@ -306,6 +936,10 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(mysql_rep_admin.call_run_chk(
             self.args, self.func_list, self.master, [self.slave]))
 
+    @mock.patch("mysql_rep_admin.sample_status",
+                mock.Mock(return_value=(1.0, [1.0])))
+    @mock.patch("mysql_rep_admin.create_snapshot",
+                mock.Mock(return_value="SlaveSnapshot"))
     @mock.patch("mysql_rep_admin.data_out", mock.Mock(return_value=True))
     def test_argsarray_all(self):
 
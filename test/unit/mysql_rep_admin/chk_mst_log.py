@@ -80,6 +80,7 @@ class SlaveRep():
         get_log_info
         get_name
         is_connected
+        get_time
 
     """
 
@@ -104,6 +105,8 @@ class SlaveRep():
         self.retrieved_gtid = 12345678
         self.exe_gtid = 23456789
         self.connected = True
+        self.time_lag = 0
+        self.pos_time = 10.25
 
     def get_log_info(self):
 
@@ -141,6 +144,18 @@ class SlaveRep():
 
         return self.connected
 
+    def get_time(self):
+
+        """Method:  get_time
+
+        Description:  Stub method holder for SlaveRep.get_time.
+
+        Arguments:
+
+        """
+
+        return self.time_lag
+
 
 class UnitTest(unittest.TestCase):
 
@@ -150,6 +165,8 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_capture_skew
+        test_pos_tolerance
         test_slave_down
         test_no_present
         test_slv_present
@@ -207,6 +224,48 @@ master log"}]},
                     "Slaves": [{"Name": "Slave_Name", "Status": "DOWN"}]},
                 "SlaveLogs": [{"Name": "SlaveName", "Status": "DOWN"}]}}
 
+    @mock.patch("mysql_rep_admin.chk_slv")
+    def test_capture_skew(self, mock_chk):
+
+        """Function:  test_capture_skew
+
+        Description:  Test with master and slave capture times.
+
+        Arguments:
+
+        """
+
+        mock_chk.return_value = dict(self.chk_slv_data)
+
+        data = mysql_rep_admin.to_json(mysql_rep_admin.chk_mst_log(
+            master=self.master, slaves=[self.slave], mst_time=10.0))
+
+        self.assertEqual(
+            data["CheckMasterLog"]["MasterLog"]["Slaves"][0]["Info"]["Skew"],
+            0.25)
+
+    @mock.patch("mysql_rep_admin.chk_slv")
+    def test_pos_tolerance(self, mock_chk):
+
+        """Function:  test_pos_tolerance
+
+        Description:  Test with slave within the position tolerance.
+
+        Arguments:
+
+        """
+
+        self.slave2.read_pos = 5600
+        settings = dict(mysql_rep_admin.SETTINGS)
+        settings["pos_tolerance"] = 100
+
+        mock_chk.return_value = dict(self.chk_slv_data)
+
+        self.assertEqual(
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_mst_log(
+                master=self.master, slaves=[self.slave2], settings=settings)),
+            self.results4)
+
     @mock.patch("mysql_rep_admin.chk_slv")
     def test_slave_down(self, mock_chk):
 
@@ -223,8 +282,8 @@ master log"}]},
         mock_chk.return_value = dict(self.chk_slv_data2)
 
         self.assertEqual(
-            mysql_rep_admin.chk_mst_log(
-                master=self.master, slaves=[self.slave]), self.results5)
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_mst_log(
+                master=self.master, slaves=[self.slave])), self.results5)
 
     def test_no_present(self):
 
@@ -238,8 +297,8 @@ master log"}]},
 
         with gen_libs.no_std_out():
             self.assertEqual(
-                mysql_rep_admin.chk_mst_log(
-                    master=None, slaves=[]), self.results)
+                mysql_rep_admin.to_json(mysql_rep_admin.chk_mst_log(
+                    master=None, slaves=[])), self.results)
 
     @mock.patch("mysql_rep_admin.chk_slv")
     def test_slv_present(self, mock_chk):
@@ -256,8 +315,8 @@ master log"}]},
 
         with gen_libs.no_std_out():
             self.assertEqual(
-                mysql_rep_admin.chk_mst_log(
-                    master=None, slaves=[self.slave]), self.results2)
+                mysql_rep_admin.to_json(mysql_rep_admin.chk_mst_log(
+                    master=None, slaves=[self.slave])), self.results2)
 
     @mock.patch("mysql_rep_admin.chk_slv")
     def test_mst_slv_present_lag(self, mock_chk):
@@ -273,8 +332,8 @@ master log"}]},
         mock_chk.return_value = dict(self.chk_slv_data)
 
         self.assertEqual(
-            mysql_rep_admin.chk_mst_log(
-                master=self.master, slaves=[self.slave]), self.results3)
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_mst_log(
+                master=self.master, slaves=[self.slave])), self.results3)
 
     @mock.patch("mysql_rep_admin.chk_slv")
     def test_mst_slv_present_ok(self, mock_chk):
@@ -290,8 +349,8 @@ master log"}]},
         mock_chk.return_value = dict(self.chk_slv_data)
 
         self.assertEqual(
-            mysql_rep_admin.chk_mst_log(
-                master=self.master, slaves=[self.slave2]), self.results4)
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_mst_log(
+                master=self.master, slaves=[self.slave2])), self.results4)
 
 
 if __name__ == "__main__":
@@ -96,9 +96,9 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_admin.chk_other(
+        self.assertEqual(mysql_rep_admin.to_json(mysql_rep_admin.chk_other(
             self.skip0, self.tmp_tbl0, self.retry3, self.name,
-            self.version2), self.results4a)
+            self.version2)), self.results4a)
 
     def test_retry_pre80(self):
 
@@ -110,9 +110,9 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_admin.chk_other(
+        self.assertEqual(mysql_rep_admin.to_json(mysql_rep_admin.chk_other(
             self.skip0, self.tmp_tbl0, self.retry1, self.name,
-            self.version), self.results4)
+            self.version)), self.results4)
 
     def test_tmp_tbl_down(self):
 
@@ -124,9 +124,9 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_admin.chk_other(
+        self.assertEqual(mysql_rep_admin.to_json(mysql_rep_admin.chk_other(
             self.skip0, self.tmp_tbl2, self.retry0, self.name,
-            self.version), self.results6)
+            self.version)), self.results6)
 
     def test_skip_down(self):
 
@@ -138,9 +138,9 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_admin.chk_other(
+        self.assertEqual(mysql_rep_admin.to_json(mysql_rep_admin.chk_other(
             self.skip2, self.tmp_tbl0, self.retry0, self.name,
-            self.version), self.results5)
+            self.version)), self.results5)
 
     def test_retry_error(self):
 
@@ -152,9 +152,9 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_admin.chk_other(
+        self.assertEqual(mysql_rep_admin.to_json(mysql_rep_admin.chk_other(
             self.skip0, self.tmp_tbl0, self.retry1, self.name,
-            self.version), self.results4)
+            self.version)), self.results4)
 
     def test_tmp_tbl_error(self):
 
@@ -166,9 +166,9 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_admin.chk_other(
+        self.assertEqual(mysql_rep_admin.to_json(mysql_rep_admin.chk_other(
             self.skip0, self.tmp_tbl6, self.retry0, self.name,
-            self.version), self.results3)
+            self.version)), self.results3)
 
     def test_skip_error(self):
 
@@ -181,9 +181,9 @@ class UnitTest(unittest.TestCase):
         """
 
         self.assertEqual(
-            mysql_rep_admin.chk_other(
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_other(
                 self.skip1, self.tmp_tbl0, self.retry0, self.name,
-                self.version), self.results2)
+                self.version)), self.results2)
 
     def test_no_errors(self):
 
@@ -196,9 +196,9 @@ class UnitTest(unittest.TestCase):
         """
 
         self.assertEqual(
-            mysql_rep_admin.chk_other(
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_other(
                 self.skip0, self.tmp_tbl0, self.retry0, self.name,
-                self.version), self.results)
+                self.version)), self.results)
 
 
 if __name__ == "__main__":
@@ -155,7 +155,9 @@ class UnitTest(unittest.TestCase):
         slave = SlaveRep(read_pos=4567)
         slave.connected = False
 
-        self.assertEqual(mysql_rep_admin.chk_slv(slave), self.results4)
+        self.assertEqual(
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.chk_slv(slave)), self.results4)
 
     def test_chk_slv_lag_gtid(self):
 
@@ -169,7 +171,9 @@ class UnitTest(unittest.TestCase):
 
         slave = SlaveRep()
 
-        self.assertEqual(mysql_rep_admin.chk_slv(slave), self.results3)
+        self.assertEqual(
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.chk_slv(slave)), self.results3)
 
     def test_chk_slv_lag(self):
 
@@ -184,7 +188,9 @@ class UnitTest(unittest.TestCase):
         slave = SlaveRep()
         slave.gtid_mode = None
 
-        self.assertEqual(mysql_rep_admin.chk_slv(slave), self.results2)
+        self.assertEqual(
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.chk_slv(slave)), self.results2)
 
     def test_chk_slv_ok(self):
 
@@ -198,7 +204,9 @@ class UnitTest(unittest.TestCase):
 
         slave = SlaveRep(read_pos=4567)
 
-        self.assertEqual(mysql_rep_admin.chk_slv(slave), self.results)
+        self.assertEqual(
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.chk_slv(slave)), self.results)
 
 
 if __name__ == "__main__":
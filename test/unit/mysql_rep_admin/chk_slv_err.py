@@ -202,8 +202,10 @@ class UnitTest(unittest.TestCase):
 
         self.slave5.connected = False
 
-        self.assertEqual(mysql_rep_admin.chk_slv_err(slaves=[self.slave5]),
-                         self.results)
+        self.assertEqual(
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.chk_slv_err(slaves=[self.slave5])),
+            self.results)
 
     def test_sql_error(self):
 
@@ -215,8 +217,10 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_admin.chk_slv_err(slaves=[self.slave4]),
-                         self.results2)
+        self.assertEqual(
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.chk_slv_err(slaves=[self.slave4])),
+            self.results2)
 
     def test_io_error(self):
 
@@ -228,8 +232,10 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_admin.chk_slv_err(slaves=[self.slave3]),
-                         self.results3)
+        self.assertEqual(
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.chk_slv_err(slaves=[self.slave3])),
+            self.results3)
 
     def test_no_slv_present(self):
 
@@ -243,7 +249,8 @@ class UnitTest(unittest.TestCase):
 
         with gen_libs.no_std_out():
             self.assertEqual(
-                mysql_rep_admin.chk_slv_err(slaves=[]), self.results4)
+                mysql_rep_admin.to_json(
+                    mysql_rep_admin.chk_slv_err(slaves=[])), self.results4)
 
     def test_no_error(self):
 
@@ -255,8 +262,10 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_admin.chk_slv_err(slaves=[self.slave2]),
-                         self.results5)
+        self.assertEqual(
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.chk_slv_err(slaves=[self.slave2])),
+            self.results5)
 
     def test_iosql_error(self):
 
@@ -268,8 +277,10 @@ class UnitTest(unittest.TestCase):
 
         """
 
-        self.assertEqual(mysql_rep_admin.chk_slv_err(slaves=[self.slave]),
-                         self.results6)
+        self.assertEqual(
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.chk_slv_err(slaves=[self.slave])),
+            self.results6)
 
 
 if __name__ == "__main__":
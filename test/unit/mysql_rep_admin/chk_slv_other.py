@@ -171,8 +171,8 @@ class UnitTest(unittest.TestCase):
         self.slave.connected = False
 
         self.assertEqual(
-            mysql_rep_admin.chk_slv_other(
-                master=self.master, slaves=[self.slave]), self.results4)
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_slv_other(
+                master=self.master, slaves=[self.slave])), self.results4)
 
     def test_chk_slv_other2(self):
 
@@ -185,8 +185,8 @@ class UnitTest(unittest.TestCase):
         """
 
         self.assertEqual(
-            mysql_rep_admin.chk_slv_other(
-                master=self.master, slaves=[self.slave2]), self.results)
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_slv_other(
+                master=self.master, slaves=[self.slave2])), self.results)
 
     def test_no_slv(self):
 
@@ -200,7 +200,9 @@ class UnitTest(unittest.TestCase):
 
         with gen_libs.no_std_out():
             self.assertEqual(
-                mysql_rep_admin.chk_slv_other(master=self.master, slaves=[]),
+                mysql_rep_admin.to_json(
+                    mysql_rep_admin.chk_slv_other(
+                        master=self.master, slaves=[])),
                 self.results2)
 
     def test_chk_slv_other(self):
@@ -214,8 +216,8 @@ class UnitTest(unittest.TestCase):
         """
 
         self.assertEqual(
-            mysql_rep_admin.chk_slv_other(
-                master=self.master, slaves=[self.slave]), self.results3)
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_slv_other(
+                master=self.master, slaves=[self.slave])), self.results3)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,187 @@
+# Classification (U)
+
+"""Program:  chk_slv_src.py
+
+    Description:  Unit testing of chk_slv_src in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/chk_slv_src.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_args
+        get_args_keys
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-S": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_args(self):
+
+        """Method:  get_args
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args.
+
+        Arguments:
+
+        """
+
+        return self.args_array
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_master_only
+        test_no_slave_source
+        test_slave_template
+        test_slave_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.func_dict = {"-B": "rpt_mst_log", "-S": "chk_slv_thr"}
+        self.inst_dict = {"-B": ["master"], "-S": ["slaves"]}
+
+    def test_master_only(self):
+
+        """Function:  test_master_only
+
+        Description:  Test with no slave source for a master only option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "mysql_cfg", "-B": True}
+
+        self.assertTrue(
+            mysql_rep_admin.chk_slv_src(
+                self.args, self.func_dict, self.inst_dict))
+
+    def test_no_slave_source(self):
+
+        """Function:  test_no_slave_source
+
+        Description:  Test with no slave source for a slave option.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_admin.chk_slv_src(
+                    self.args, self.func_dict, self.inst_dict))
+
+    def test_slave_template(self):
+
+        """Function:  test_slave_template
+
+        Description:  Test with the -i option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-i"] = "slave_template"
+
+        self.assertTrue(
+            mysql_rep_admin.chk_slv_src(
+                self.args, self.func_dict, self.inst_dict))
+
+    def test_slave_file(self):
+
+        """Function:  test_slave_file
+
+        Description:  Test with the -s option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-s"] = "slave.txt"
+
+        self.assertTrue(
+            mysql_rep_admin.chk_slv_src(
+                self.args, self.func_dict, self.inst_dict))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -136,7 +136,8 @@ class UnitTest(unittest.TestCase):
 
         with gen_libs.no_std_out():
             self.assertEqual(
-                mysql_rep_admin.chk_slv_thr(slaves=[]), self.results)
+                mysql_rep_admin.to_json(
+                    mysql_rep_admin.chk_slv_thr(slaves=[])), self.results)
 
     def test_sqlthr_down(self):
 
@@ -151,7 +152,9 @@ class UnitTest(unittest.TestCase):
         self.slave = SlaveRep(thr="ON", run="ON", io_thr="ON")
 
         self.assertEqual(
-            mysql_rep_admin.chk_slv_thr(slaves=[self.slave]), self.results2)
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.chk_slv_thr(slaves=[self.slave])),
+            self.results2)
 
     def test_iothr_down(self):
 
@@ -166,7 +169,9 @@ class UnitTest(unittest.TestCase):
         self.slave = SlaveRep(thr="ON", run="ON")
 
         self.assertEqual(
-            mysql_rep_admin.chk_slv_thr(slaves=[self.slave]), self.results3)
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.chk_slv_thr(slaves=[self.slave])),
+            self.results3)
 
     def test_thr_run_down(self):
 
@@ -181,7 +186,9 @@ class UnitTest(unittest.TestCase):
         self.slave = SlaveRep()
 
         self.assertEqual(
-            mysql_rep_admin.chk_slv_thr(slaves=[self.slave]), self.results4)
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.chk_slv_thr(slaves=[self.slave])),
+            self.results4)
 
 
 if __name__ == "__main__":
@@ -17,6 +17,7 @@
 import sys
 import os
 import unittest
+import time
 import mock
 
 # Local
@@ -49,6 +50,7 @@ class MasterRep():                                      # pylint:disable=R0903
         """
 
         self.name = "Master_Name"
+        self.slaves = []
 
 
 class SlaveRep():
@@ -79,8 +81,10 @@ class SlaveRep():
         self.lag_time = lag_time
         self.name = "Slave_Name"
         self.slave_uuid = "1"
+        self.sid = 11
         self.conn = conn
         self.connected = True
+        self.slave = self
 
     def get_time(self):
 
@@ -139,6 +143,11 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_lag_wait
+        test_run_deadline
+        test_no_miss_slaves
+        test_down_slv_registered
+        test_mixed_slv
         test_down_slv
         test_no_slv
         test_json
@@ -162,18 +171,132 @@ class UnitTest(unittest.TestCase):
         self.results2 = {
             "CheckSlaveTime": {
                 "Slaves": [
-                    {'LagTime': 0, 'Slave_UUID': '1', 'Name': 'Slave_Name'}]}}
+                    {'LagTime': 0, 'Slave_UUID': '1', 'Name': 'Slave_Name',
+                     'Samples': [0], 'ConvergeTime': 0.0}]}}
         self.results3 = {
             "CheckSlaveTime": {
                 "Slaves": [
-                    {'LagTime': 1, 'Slave_UUID': '1', 'Name': 'Slave_Name'}]}}
+                    {'LagTime': 1, 'Slave_UUID': '1', 'Name': 'Slave_Name',
+                     'Samples': [1, 1], 'ConvergeTime': None}]}}
         self.results4 = {
             "CheckSlaveTime": {
                 "Slaves": [
                     {'LagTime': 'DOWN', 'Slave_UUID': 'Unknown',
                      'Name': 'Slave_Name'}]}}
+        self.settings = {"lag_interval": 0.05, "lag_deadline": 0.05}
 
-    @mock.patch("mysql_rep_admin.add_miss_slaves", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_admin.add_miss_slaves",
+                mock.Mock(side_effect=lambda master, data, slaves: data))
+    @mock.patch("mysql_rep_admin.process_time_lag",
+                mock.Mock(return_value=[{"LagTime": 1}]))
+    def test_lag_wait(self):
+
+        """Function:  test_lag_wait
+
+        Description:  Test the time lag wait is timed.
+
+        Arguments:
+
+        """
+
+        timings = {}
+
+        mysql_rep_admin.chk_slv_time(
+            master=self.master, slaves=[self.slave], settings=self.settings,
+            timings=timings)
+
+        self.assertEqual(list(timings.keys()), ["LagWait"])
+
+    @mock.patch("mysql_rep_admin.add_miss_slaves",
+                mock.Mock(side_effect=lambda master, data, slaves: data))
+    @mock.patch("mysql_rep_admin.process_time_lag")
+    def test_run_deadline(self, mock_lag):
+
+        """Function:  test_run_deadline
+
+        Description:  Test time lag sampling stops at the run deadline.
+
+        Arguments:
+
+        """
+
+        self.settings["lag_deadline"] = 5
+
+        mock_lag.return_value = [{"LagTime": 1}]
+
+        mysql_rep_admin.chk_slv_time(
+            master=self.master, slaves=[self.slave], settings=self.settings,
+            deadline=time.time() - 1)
+
+        mock_lag.assert_called_once_with(
+            [[self.slave, 1]], lag_interval=0.05, lag_deadline=0)
+
+    @mock.patch("mysql_rep_admin.add_miss_slaves")
+    def test_no_miss_slaves(self, mock_miss):
+
+        """Function:  test_no_miss_slaves
+
+        Description:  Test with missing slaves turned off.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep(lag_time=0)
+
+        mysql_rep_admin.chk_slv_time(
+            master=self.master, slaves=[self.slave], settings=self.settings,
+            miss_slaves=False)
+
+        mock_miss.assert_not_called()
+
+    def test_down_slv_registered(self):
+
+        """Function:  test_down_slv_registered
+
+        Description:  Test down slave in the master's slave list is not also
+            reported as missing.
+
+        Arguments:
+
+        """
+
+        self.slave.connected = False
+        self.master.slaves = [
+            {"Server_id": 11, "Host": "Slave_Name", "Replica_UUID": "9"}]
+
+        self.assertEqual(
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_slv_time(
+                master=self.master, slaves=[self.slave],
+                settings=self.settings)), self.results4)
+
+    @mock.patch("mysql_rep_admin.add_miss_slaves",
+                mock.Mock(side_effect=lambda master, data, slaves: data))
+    def test_mixed_slv(self):
+
+        """Function:  test_mixed_slv
+
+        Description:  Test with down slave between lagging slaves.
+
+        Arguments:
+
+        """
+
+        slave2 = SlaveRep()
+        slave2.connected = False
+        slave3 = SlaveRep(lag_time=0)
+
+        self.assertEqual(
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_slv_time(
+                master=self.master, slaves=[self.slave, slave2, slave3],
+                settings=self.settings)),
+            {"CheckSlaveTime": {"Slaves": [
+                self.results3["CheckSlaveTime"]["Slaves"][0],
+                self.results4["CheckSlaveTime"]["Slaves"][0],
+                self.results2["CheckSlaveTime"]["Slaves"][0]]}})
+
+    @mock.patch("mysql_rep_admin.add_miss_slaves",
+                mock.Mock(side_effect=lambda master, data, slaves: data))
     def test_down_slv(self):
 
         """Function:  test_down_slv
@@ -187,10 +310,12 @@ class UnitTest(unittest.TestCase):
         self.slave.connected = False
 
         self.assertEqual(
-            mysql_rep_admin.chk_slv_time(
-                master=self.master, slaves=[self.slave]), self.results4)
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_slv_time(
+                master=self.master, slaves=[self.slave],
+                settings=self.settings)), self.results4)
 
-    @mock.patch("mysql_rep_admin.add_miss_slaves", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_admin.add_miss_slaves",
+                mock.Mock(side_effect=lambda master, data, slaves: data))
     def test_no_slv(self):
 
         """Function:  test_no_slv
@@ -202,11 +327,12 @@ class UnitTest(unittest.TestCase):
         """
 
         self.assertEqual(
-            mysql_rep_admin.chk_slv_time(
-                master=self.master, slaves=[]), self.results)
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_slv_time(
+                master=self.master, slaves=[],
+                settings=self.settings)), self.results)
 
-    @mock.patch("mysql_rep_admin.time.sleep", mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_admin.add_miss_slaves", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_admin.add_miss_slaves",
+                mock.Mock(side_effect=lambda master, data, slaves: data))
     def test_lag(self):
 
         """Function:  test_lag
@@ -218,11 +344,12 @@ class UnitTest(unittest.TestCase):
         """
 
         self.assertEqual(
-            mysql_rep_admin.chk_slv_time(
-                master=self.master, slaves=[self.slave]), self.results3)
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_slv_time(
+                master=self.master, slaves=[self.slave],
+                settings=self.settings)), self.results3)
 
-    @mock.patch("mysql_rep_admin.time.sleep", mock.Mock(return_value=True))
-    @mock.patch("mysql_rep_admin.add_miss_slaves", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_admin.add_miss_slaves",
+                mock.Mock(side_effect=lambda master, data, slaves: data))
     def test_no_lag(self):
 
         """Function:  test_std_no_lag
@@ -236,8 +363,9 @@ class UnitTest(unittest.TestCase):
         self.slave = SlaveRep(lag_time=0)
 
         self.assertEqual(
-            mysql_rep_admin.chk_slv_time(
-                master=self.master, slaves=[self.slave]), self.results2)
+            mysql_rep_admin.to_json(mysql_rep_admin.chk_slv_time(
+                master=self.master, slaves=[self.slave],
+                settings=self.settings)), self.results2)
 
 
 if __name__ == "__main__":
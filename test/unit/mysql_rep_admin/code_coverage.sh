@@ -8,24 +8,100 @@ coverage erase
 
 echo ""
 echo "Running unit test modules in conjunction with coverage"
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/LazyModule.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/ResultRecord.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/SlaveTime.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/add_digest.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/add_latency.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/add_miss_slaves.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/add_skip_note.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/add_timing.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/budget_worker.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/call_run_chk.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/chk_mst_log.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/chk_other.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/chk_slv.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/chk_slv_err.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/chk_slv_other.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/chk_slv_src.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/chk_slv_thr.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/chk_slv_time.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/connect_slaves.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/connect_worker.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/create_discover_cfg.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/create_down_slv.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/create_filename.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/create_snapshot.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/data_out.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/discover_slaves.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/dumps_json.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/dumps_orjson.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/filter_records.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/flush_spool.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/format_metrics.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/gather_slv_chk.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_budget.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_cached_cfg.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_cfg_key.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_delta.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_inst_need.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_latency.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_mail_data.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_metrics.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_opt_list.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_private_file.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_rec_key.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_rec_metrics.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_replicas.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_serializer.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_sid.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/get_state_file.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/gzip_text.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/has_problem.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/help_message.py
-coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/is_time_lag.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/is_backing_off.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/is_changed.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/is_lagging.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/is_log_lagging.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/is_mail_due.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/is_private_dir.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/is_running.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/is_topology_stale.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/iter_records.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/limit_mail.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/line_out.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/load_mst_cfg.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/load_settings.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/load_slv_cfg.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/load_state.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/mail_out.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/main.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/merge_data.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/process_time_lag.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/prom_out.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/prom_value.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/reconcile_slaves.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/recover_claims.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/refresh_status.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/rpt_mst_log.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/rpt_slv_log.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/run_chk.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/run_chk_async.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/run_chk_slaves.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/run_daemon.py
 coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/run_program.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/run_slv_chk.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/run_with_budget.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/sample_status.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/save_state.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/send_msg.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/spool_mail.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/text_out.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/timed_call.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/timed_query.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/to_json.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/track_latency.py
+coverage run -a --source=mysql_rep_admin test/unit/mysql_rep_admin/update_breaker.py
 
 echo ""
 echo "Producing code coverage report"
@@ -0,0 +1,338 @@
+# Classification (U)
+
+"""Program:  connect_slaves.py
+
+    Description:  Unit testing of connect_slaves in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/connect_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name="Slave_Name", conn="Connection Handler"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.conn = conn
+
+
+def create_slv_array(cfg_array):
+
+    """Function:  create_slv_array
+
+    Description:  Function stub holder for mysql_libs.create_slv_array.
+
+    Arguments:
+
+    """
+
+    cfg = cfg_array[0]
+
+    if cfg.get("delay"):
+        time.sleep(cfg["delay"])
+
+    return [SlaveRep(name=cfg["name"])]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timings
+        test_breaker_skipped
+        test_hung_slaves
+        test_queued_slaves
+        test_run_deadline
+        test_zero_timeout
+        test_timeout
+        test_single_worker
+        test_slave_order
+        test_no_slaves
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg_array = [{"name": "Slave1", "delay": 0.2},
+                          {"name": "Slave2"}, {"name": "Slave3"}]
+        self.results = ["Slave1", "Slave2", "Slave3"]
+        self.down_slv = SlaveRep(name="Slave1", conn=None)
+
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array",
+                create_slv_array)
+    def test_timings(self):
+
+        """Function:  test_timings
+
+        Description:  Test the connect time of each slave.
+
+        Arguments:
+
+        """
+
+        timings = {}
+
+        mysql_rep_admin.connect_slaves(
+            self.cfg_array, conn_workers=3, conn_timeout=5, timings=timings)
+
+        self.assertEqual(
+            (list(timings["Slaves"].keys()),
+             timings["Slaves"]["Slave1"]["Connect"] >= 0.2,
+             timings["Slaves"]["Slave2"]["Connect"] < 0.2),
+            (self.results, True, True))
+
+    @mock.patch("mysql_rep_admin.create_down_slv")
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    def test_breaker_skipped(self, mock_slv, mock_down):
+
+        """Function:  test_breaker_skipped
+
+        Description:  Test slave backing off is not connected to.
+
+        Arguments:
+
+        """
+
+        breaker = {"Slave1": {"failures": 1, "retry_at": time.time() + 60}}
+
+        mock_slv.side_effect = create_slv_array
+        mock_down.return_value = self.down_slv
+
+        slaves = mysql_rep_admin.connect_slaves(
+            self.cfg_array, conn_workers=3, conn_timeout=5, breaker=breaker)
+
+        self.assertEqual(
+            ([slv.name for slv in slaves], mock_slv.call_count,
+             mock_down.call_args[0][1]),
+            (self.results, 2, mysql_rep_admin.SKIP_MSG))
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.create_down_slv")
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array",
+                create_slv_array)
+    def test_hung_slaves(self, mock_down):
+
+        """Function:  test_hung_slaves
+
+        Description:  Test with more hung slaves than workers does not wait
+            on the hung slaves.
+
+        Arguments:
+
+        """
+
+        cfg_array = [{"name": f"Slave{cnt}", "delay": 2} for cnt in range(4)]
+
+        mock_down.side_effect = lambda cfg, msg: SlaveRep(cfg["name"], None)
+
+        start = time.time()
+        slaves = mysql_rep_admin.connect_slaves(
+            cfg_array, conn_workers=2, conn_timeout=0.2)
+
+        self.assertEqual(
+            ([slv.conn for slv in slaves], time.time() - start < 1),
+            ([None] * 4, True))
+
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array",
+                create_slv_array)
+    def test_queued_slaves(self):
+
+        """Function:  test_queued_slaves
+
+        Description:  Test slaves waiting on a worker are each given the
+            full connect timeout.
+
+        Arguments:
+
+        """
+
+        cfg_array = [{"name": f"Slave{cnt}", "delay": 0.2}
+                     for cnt in range(4)]
+
+        slaves = mysql_rep_admin.connect_slaves(
+            cfg_array, conn_workers=1, conn_timeout=0.5)
+
+        self.assertEqual(
+            [slv.conn for slv in slaves], ["Connection Handler"] * 4)
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.create_down_slv")
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array",
+                create_slv_array)
+    def test_run_deadline(self, mock_down):
+
+        """Function:  test_run_deadline
+
+        Description:  Test slaves not started before the run deadline are
+            not connected to and are marked as not tried.
+
+        Arguments:
+
+        """
+
+        cfg_array = [{"name": f"Slave{cnt}", "delay": 0.2}
+                     for cnt in range(4)]
+
+        mock_down.side_effect = lambda cfg, msg: SlaveRep(cfg["name"], msg)
+
+        start = time.time()
+        slaves = mysql_rep_admin.connect_slaves(
+            cfg_array, conn_workers=1, conn_timeout=5,
+            deadline=time.time() + 0.3)
+
+        self.assertEqual(
+            ([slv.conn for slv in slaves], time.time() - start < 1),
+            (["Connection Handler", mysql_rep_admin.DEADLINE_MSG,
+              mysql_rep_admin.DEADLINE_MSG, mysql_rep_admin.DEADLINE_MSG],
+             True))
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.create_down_slv")
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array",
+                create_slv_array)
+    def test_zero_timeout(self, mock_down):
+
+        """Function:  test_zero_timeout
+
+        Description:  Test with zero connect timeout does not wait.
+
+        Arguments:
+
+        """
+
+        self.cfg_array[0]["delay"] = 1
+
+        mock_down.return_value = self.down_slv
+
+        slaves = mysql_rep_admin.connect_slaves(
+            self.cfg_array[:1], conn_workers=1, conn_timeout=0)
+
+        self.assertIsNone(slaves[0].conn)
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.create_down_slv")
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array",
+                create_slv_array)
+    def test_timeout(self, mock_down):
+
+        """Function:  test_timeout
+
+        Description:  Test with slave connection timing out.
+
+        Arguments:
+
+        """
+
+        self.cfg_array[0]["delay"] = 1
+
+        mock_down.return_value = self.down_slv
+
+        slaves = mysql_rep_admin.connect_slaves(
+            self.cfg_array, conn_workers=3, conn_timeout=0.1)
+
+        self.assertEqual(
+            [slv.name for slv in slaves], self.results)
+        self.assertIsNone(slaves[0].conn)
+
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array",
+                create_slv_array)
+    def test_single_worker(self):
+
+        """Function:  test_single_worker
+
+        Description:  Test with a single worker thread.
+
+        Arguments:
+
+        """
+
+        slaves = mysql_rep_admin.connect_slaves(
+            self.cfg_array, conn_workers=1, conn_timeout=None)
+
+        self.assertEqual([slv.name for slv in slaves], self.results)
+
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array",
+                create_slv_array)
+    def test_slave_order(self):
+
+        """Function:  test_slave_order
+
+        Description:  Test the slave order matches the configuration order.
+
+        Arguments:
+
+        """
+
+        slaves = mysql_rep_admin.connect_slaves(
+            self.cfg_array, conn_workers=3, conn_timeout=5)
+
+        self.assertEqual([slv.name for slv in slaves], self.results)
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slave configurations.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.connect_slaves([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,220 @@
+# Classification (U)
+
+"""Program:  connect_worker.py
+
+    Description:  Unit testing of connect_worker in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/connect_worker.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import queue
+import threading
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name="Slave_Name"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.conn = "Connection Handler"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        create_task
+        test_not_started
+        test_abandoned
+        test_create_error
+        test_multiple_tasks
+        test_empty_queue
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.lock = threading.Condition()
+        self.task_queue = queue.Queue()
+        self.slave = SlaveRep()
+        self.slave2 = SlaveRep(name="Slave_Name2")
+
+    def create_task(self, cfg):
+
+        """Function:  create_task
+
+        Description:  Create a slave connection task and add to the queue.
+
+        Arguments:
+
+        """
+
+        task = {"cfg": cfg, "done": threading.Event(), "abandoned": False,
+                "slaves": []}
+        self.task_queue.put(task)
+
+        return task
+
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    def test_not_started(self, mock_slv):
+
+        """Function:  test_not_started
+
+        Description:  Test with task abandoned before it was started.
+
+        Arguments:
+
+        """
+
+        task = self.create_task({"name": "Slave_Name"})
+        task["abandoned"] = True
+
+        mysql_rep_admin.connect_worker(self.task_queue, self.lock)
+
+        self.assertEqual(
+            (mock_slv.called, task["done"].is_set()), (False, False))
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect")
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    def test_abandoned(self, mock_slv, mock_dis):
+
+        """Function:  test_abandoned
+
+        Description:  Test with task abandoned before connection finished.
+
+        Arguments:
+
+        """
+
+        task = self.create_task({"name": "Slave_Name"})
+
+        def create_slv_array(cfg_array):            # pylint:disable=W0613
+
+            """Function:  create_slv_array
+
+            Description:  Abandons the task while the slave is connecting.
+
+            Arguments:
+
+            """
+
+            task["abandoned"] = True
+
+            return [self.slave]
+
+        mock_slv.side_effect = create_slv_array
+        mock_dis.return_value = True
+
+        mysql_rep_admin.connect_worker(self.task_queue, self.lock)
+
+        mock_dis.assert_called_once_with([self.slave])
+
+    @mock.patch("mysql_rep_admin.create_down_slv")
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    def test_create_error(self, mock_slv, mock_down):
+
+        """Function:  test_create_error
+
+        Description:  Test a slave whose instance cannot be created is
+            returned as an unconnected instance.
+
+        Arguments:
+
+        """
+
+        task = self.create_task({"name": "Slave_Name"})
+        mock_slv.side_effect = ValueError("Bad port")
+        mock_down.return_value = self.slave
+
+        mysql_rep_admin.connect_worker(self.task_queue, self.lock)
+
+        self.assertEqual(
+            (task["slaves"], task["done"].is_set(),
+             mock_down.call_args[0][1]),
+            ([self.slave], True, "Connect error: Bad port"))
+
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    def test_multiple_tasks(self, mock_slv):
+
+        """Function:  test_multiple_tasks
+
+        Description:  Test with multiple tasks in the queue.
+
+        Arguments:
+
+        """
+
+        task = self.create_task({"name": "Slave_Name"})
+        task2 = self.create_task({"name": "Slave_Name2"})
+
+        mock_slv.side_effect = [[self.slave], [self.slave2]]
+
+        mysql_rep_admin.connect_worker(self.task_queue, self.lock)
+
+        self.assertEqual(
+            (task["slaves"], task2["slaves"], task2["done"].is_set()),
+            ([self.slave], [self.slave2], True))
+
+    def test_empty_queue(self):
+
+        """Function:  test_empty_queue
+
+        Description:  Test with empty queue.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_rep_admin.connect_worker(self.task_queue, self.lock))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  create_discover_cfg.py
+
+    Description:  Unit testing of create_discover_cfg in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/create_discover_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveTemplate():                                  # pylint:disable=R0903
+
+    """Class:  SlaveTemplate
+
+    Description:  Class stub holder for the slave template module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.user = "root"
+        self.japd = "japd"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_ssl_settings
+        test_template_defaults
+        test_replica_settings
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.template = SlaveTemplate()
+        self.replica = {"name": "SLAVE1", "host": "SLAVE1", "port": 3307,
+                        "sid": 11, "uuid": "UUID1"}
+
+    def test_ssl_settings(self):
+
+        """Function:  test_ssl_settings
+
+        Description:  Test SSL settings are taken from the template.
+
+        Arguments:
+
+        """
+
+        self.template.ssl_mode = "REQUIRED"
+
+        cfg = mysql_rep_admin.create_discover_cfg(self.template, self.replica)
+
+        self.assertEqual(
+            (cfg["ssl_mode"], "ssl_client_ca" in cfg), ("REQUIRED", False))
+
+    def test_template_defaults(self):
+
+        """Function:  test_template_defaults
+
+        Description:  Test defaults for settings missing from the template.
+
+        Arguments:
+
+        """
+
+        cfg = mysql_rep_admin.create_discover_cfg(self.template, self.replica)
+
+        self.assertEqual(
+            (cfg["serv_os"], cfg["cfg_file"], cfg["user"]),
+            ("Linux", None, "root"))
+
+    def test_replica_settings(self):
+
+        """Function:  test_replica_settings
+
+        Description:  Test host settings are taken from the replica.
+
+        Arguments:
+
+        """
+
+        cfg = mysql_rep_admin.create_discover_cfg(self.template, self.replica)
+
+        self.assertEqual(
+            (cfg["name"], cfg["host"], cfg["port"], cfg["sid"]),
+            ("SLAVE1", "SLAVE1", 3307, 11))
+
+
+if __name__ == "__main__":
+    unittest.main()
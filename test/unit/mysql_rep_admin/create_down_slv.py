@@ -0,0 +1,120 @@
+# Classification (U)
+
+"""Program:  create_down_slv.py
+
+    Description:  Unit testing of create_down_slv in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/create_down_slv.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(                                       # pylint:disable=R0913
+            self, name=None, sid=None, user=None, japd=None, **kwargs):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.sid = sid
+        self.user = user
+        self.japd = japd
+        self.host = kwargs.get("host", None)
+        self.conn = None
+        self.conn_msg = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_conn_msg
+        test_no_conn
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.cfg = {"name": "HOST_NAME", "japd": "japd", "cfg_file": None,
+                    "host": "SERVER", "user": "root", "serv_os": "Linux",
+                    "sid": 11, "port": 3306}
+        self.msg = "Connection timed out after 10 seconds"
+
+    @mock.patch("mysql_rep_admin.mysql_class.SlaveRep", SlaveRep)
+    def test_conn_msg(self):
+
+        """Function:  test_conn_msg
+
+        Description:  Test with connection message set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.create_down_slv(self.cfg, self.msg).conn_msg,
+            self.msg)
+
+    @mock.patch("mysql_rep_admin.mysql_class.SlaveRep", SlaveRep)
+    def test_no_conn(self):
+
+        """Function:  test_no_conn
+
+        Description:  Test with slave instance not connected.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mysql_rep_admin.create_down_slv(self.cfg, self.msg).conn)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -86,6 +86,7 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_filename_gzip
         test_filename_all
         test_filename_host_msecs
         test_filename_host_dtg
@@ -141,6 +142,22 @@ class UnitTest(unittest.TestCase):
         self.results9 = fname_host + msecs + json
         self.results10 = fname_host + dtg + "." + msecs + json
 
+    def test_filename_gzip(self):
+
+        """Function:  test_filename_gzip
+
+        Description:  Test with the gzip option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-f": "FileName", "-Z": True}
+
+        self.assertEqual(
+            mysql_rep_admin.create_filename(self.args, dtg=self.dtg),
+            "FileName.json.gz")
+
     @mock.patch("mysql_rep_admin.socket.gethostname",
                 mock.Mock(return_value="Hostname"))
     def test_filename_all(self):
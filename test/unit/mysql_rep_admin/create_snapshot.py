@@ -0,0 +1,310 @@
+# Classification (U)
+
+"""Program:  create_snapshot.py
+
+    Description:  Unit testing of create_snapshot in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/create_snapshot.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        get_name
+        is_connected
+        get_log_info
+        get_thr_stat
+        get_err_stat
+        get_others
+        get_time
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave_Name"
+        self.conn = "Connection Handler"
+        self.slave_uuid = "UUID"
+        self.gtid_mode = True
+        self.retrieved_gtid = "RetrievedGTID"
+        self.exe_gtid = "ExecutedGTID"
+        self.version = (8, 0, 28)
+        self.time_lag = 0
+
+    def get_name(self):
+
+        """Method:  get_name
+
+        Description:  Stub method holder for SlaveRep.get_name.
+
+        Arguments:
+
+        """
+
+        return self.name
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub method holder for SlaveRep.is_connected.
+
+        Arguments:
+
+        """
+
+        return bool(self.conn)
+
+    def get_log_info(self):
+
+        """Method:  get_log_info
+
+        Description:  Stub method holder for SlaveRep.get_log_info.
+
+        Arguments:
+
+        """
+
+        return "binlog.0001", "binlog.0001", 10, 10
+
+    def get_thr_stat(self):
+
+        """Method:  get_thr_stat
+
+        Description:  Stub method holder for SlaveRep.get_thr_stat.
+
+        Arguments:
+
+        """
+
+        return "Yes", "Yes", "Yes", "ON"
+
+    def get_err_stat(self):
+
+        """Method:  get_err_stat
+
+        Description:  Stub method holder for SlaveRep.get_err_stat.
+
+        Arguments:
+
+        """
+
+        return 0, 0, None, None, None, None
+
+    def get_others(self):
+
+        """Method:  get_others
+
+        Description:  Stub method holder for SlaveRep.get_others.
+
+        Arguments:
+
+        """
+
+        return 0, 2, 0
+
+    def get_time(self):
+
+        """Method:  get_time
+
+        Description:  Stub method holder for SlaveRep.get_time.
+
+        Arguments:
+
+        """
+
+        return self.time_lag
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_pos_time
+        test_default_pos_time
+        test_immutable
+        test_status_not_changed
+        test_live_slave
+        test_read_methods
+        test_down_slave
+        test_abandoned_slave
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep()
+
+    def test_pos_time(self):
+
+        """Function:  test_pos_time
+
+        Description:  Test with the log position capture time.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.create_snapshot(
+                self.slave, pos_time=10.5).pos_time, 10.5)
+
+    def test_default_pos_time(self):
+
+        """Function:  test_default_pos_time
+
+        Description:  Test capture time defaults to the snapshot time.
+
+        Arguments:
+
+        """
+
+        snap = mysql_rep_admin.create_snapshot(self.slave)
+
+        self.assertEqual(snap.pos_time, snap.snap_time)
+
+    def test_immutable(self):
+
+        """Function:  test_immutable
+
+        Description:  Test the snapshot cannot be changed.
+
+        Arguments:
+
+        """
+
+        snap = mysql_rep_admin.create_snapshot(self.slave)
+
+        with self.assertRaises(AttributeError):
+            snap.time_lag = 10
+
+    def test_status_not_changed(self):
+
+        """Function:  test_status_not_changed
+
+        Description:  Test snapshot does not change with the slave status.
+
+        Arguments:
+
+        """
+
+        snap = mysql_rep_admin.create_snapshot(self.slave)
+        self.slave.time_lag = 10
+
+        self.assertEqual(snap.get_time(), 0)
+
+    def test_live_slave(self):
+
+        """Function:  test_live_slave
+
+        Description:  Test snapshot holds the live slave instance.
+
+        Arguments:
+
+        """
+
+        self.assertIs(
+            mysql_rep_admin.create_snapshot(self.slave).slave, self.slave)
+
+    def test_read_methods(self):
+
+        """Function:  test_read_methods
+
+        Description:  Test the snapshot read methods.
+
+        Arguments:
+
+        """
+
+        snap = mysql_rep_admin.create_snapshot(self.slave)
+
+        self.assertEqual(
+            (snap.get_name(), snap.get_log_info(), snap.get_thr_stat(),
+             snap.get_err_stat(), snap.get_others()),
+            ("Slave_Name", ("binlog.0001", "binlog.0001", 10, 10),
+             ("Yes", "Yes", "Yes", "ON"), (0, 0, None, None, None, None),
+             (0, 2, 0)))
+
+    def test_down_slave(self):
+
+        """Function:  test_down_slave
+
+        Description:  Test with slave not connected.
+
+        Arguments:
+
+        """
+
+        self.slave.conn = None
+
+        self.assertFalse(
+            mysql_rep_admin.create_snapshot(self.slave).is_connected())
+
+
+    def test_abandoned_slave(self):
+
+        """Function:  test_abandoned_slave
+
+        Description:  Test snapshot of a slave whose connection was
+            abandoned has no status.
+
+        Arguments:
+
+        """
+
+        self.slave.conn = None
+        self.slave.conn_msg = mysql_rep_admin.ABANDON_MSG
+        snap = mysql_rep_admin.create_snapshot(self.slave, pos_time=10.5)
+
+        self.assertEqual(
+            (snap.is_connected(), snap.get_log_info(), snap.get_thr_stat(),
+             snap.get_time(), snap.conn_msg),
+            (False, (None,) * 4, (None,) * 4, None,
+             mysql_rep_admin.ABANDON_MSG))
+
+if __name__ == "__main__":
+    unittest.main()
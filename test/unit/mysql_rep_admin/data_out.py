@@ -246,6 +246,14 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_timings
+        test_no_data
+        test_mail_held
+        test_mail_data
+        test_serialize_once
+        test_expand
+        test_streamed_mail
+        test_streamed
         test_mail2
         test_append
         test_mail_subj
@@ -278,7 +286,181 @@ class UnitTest(unittest.TestCase):
         self.args_array6 = {"-a": True}
         self.args_array7 = {"-t": "toaddr", "-w": True}
 
-    @mock.patch("mysql_rep_admin.gen_libs.dict_out",
+    @mock.patch("mysql_rep_admin.mail_out", mock.Mock())
+    @mock.patch("mysql_rep_admin.get_mail_data")
+    @mock.patch("mysql_rep_admin.text_out",
+                mock.Mock(return_value=(False, None)))
+    def test_timings(self, mock_data):
+
+        """Function:  test_timings
+
+        Description:  Test the output and email are timed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array1
+        timings = {}
+
+        mock_data.return_value = self.data
+
+        mysql_rep_admin.data_out(self.data, self.args, timings=timings)
+
+        self.assertEqual(sorted(timings.keys()), ["Mail", "Output"])
+
+    @mock.patch("mysql_rep_admin.mail_out")
+    @mock.patch("mysql_rep_admin.get_mail_data")
+    @mock.patch("mysql_rep_admin.text_out")
+    def test_no_data(self, mock_text, mock_data, mock_mail):
+
+        """Function:  test_no_data
+
+        Description:  Test with no data sends a mail digest which is due.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array1
+
+        mock_data.return_value = self.data
+
+        mysql_rep_admin.data_out(None, self.args, streamed=True)
+
+        self.assertEqual(
+            (mock_text.called, json.loads(mock_mail.call_args[0][0])),
+            (False, self.data))
+
+    @mock.patch("mysql_rep_admin.mail_out")
+    @mock.patch("mysql_rep_admin.get_mail_data",
+                mock.Mock(return_value=None))
+    @mock.patch("mysql_rep_admin.text_out",
+                mock.Mock(return_value=(False, None)))
+    def test_mail_held(self, mock_mail):
+
+        """Function:  test_mail_held
+
+        Description:  Test with the email held by the mail settings.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array1
+
+        mysql_rep_admin.data_out(self.data, self.args)
+
+        mock_mail.assert_not_called()
+
+    @mock.patch("mysql_rep_admin.mail_out")
+    @mock.patch("mysql_rep_admin.get_mail_data")
+    @mock.patch("mysql_rep_admin.text_out")
+    def test_mail_data(self, mock_text, mock_data, mock_mail):
+
+        """Function:  test_mail_data
+
+        Description:  Test the email has the results left by the mail
+            settings.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array1
+        mail_data = {"Status": "digest"}
+
+        mock_text.return_value = (False, None)
+        mock_data.return_value = mail_data
+
+        mysql_rep_admin.data_out(self.data, self.args)
+
+        self.assertEqual(
+            (json.loads(mock_text.call_args[0][0]),
+             json.loads(mock_mail.call_args[0][0])), (self.data, mail_data))
+
+    @mock.patch("mysql_rep_admin.text_out")
+    @mock.patch("mysql_rep_admin.gen_class.setup_mail")
+    def test_serialize_once(self, mock_mail, mock_text):
+
+        """Function:  test_serialize_once
+
+        Description:  Test the same JSON text is used for every output.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array1
+        dumps = mock.Mock(return_value='{"Status": "ok"}')
+
+        mock_mail.return_value = self.mail
+        mock_text.return_value = (False, None)
+
+        mysql_rep_admin.data_out(self.data, self.args, dumps=dumps)
+
+        self.assertEqual(
+            (dumps.call_count, mock_text.call_args[0][0], self.mail.msg),
+            (1, '{"Status": "ok"}', '{"Status": "ok"}'))
+
+    @mock.patch("mysql_rep_admin.text_out")
+    def test_expand(self, mock_text):
+
+        """Function:  test_expand
+
+        Description:  Test with expand option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-e": True}
+        dumps = mock.Mock(return_value='{"Status": "ok"}')
+
+        mock_text.return_value = (False, None)
+
+        mysql_rep_admin.data_out(self.data, self.args, dumps=dumps)
+
+        dumps.assert_called_once_with(self.data, indent=4)
+
+    @mock.patch("mysql_rep_admin.text_out")
+    @mock.patch("mysql_rep_admin.gen_class.setup_mail")
+    def test_streamed_mail(self, mock_mail, mock_text):
+
+        """Function:  test_streamed_mail
+
+        Description:  Test with results already written out as JSON lines are
+            still emailed.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = self.args_array1
+
+        mock_mail.return_value = self.mail
+
+        mysql_rep_admin.data_out(self.data, self.args, streamed=True)
+
+        self.assertEqual(
+            (mock_text.called, json.loads(self.mail.msg)), (False, self.data))
+
+    @mock.patch("mysql_rep_admin.text_out")
+    def test_streamed(self, mock_text):
+
+        """Function:  test_streamed
+
+        Description:  Test with results already written out as JSON lines.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.data_out(self.data, self.args, streamed=True)
+
+        mock_text.assert_not_called()
+
+    @mock.patch("mysql_rep_admin.text_out",
                 mock.Mock(return_value=(False, None)))
     @mock.patch("mysql_rep_admin.gen_class.Mail2")
     def test_mail2_subj(self, mock_mail):
@@ -297,7 +479,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_rep_admin.data_out(self.data, self.args))
 
-    @mock.patch("mysql_rep_admin.gen_libs.dict_out",
+    @mock.patch("mysql_rep_admin.text_out",
                 mock.Mock(return_value=(False, None)))
     @mock.patch("mysql_rep_admin.gen_class.Mail2")
     def test_mail2(self, mock_mail):
@@ -316,7 +498,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_rep_admin.data_out(self.data, self.args))
 
-    @mock.patch("mysql_rep_admin.gen_libs.dict_out",
+    @mock.patch("mysql_rep_admin.text_out",
                 mock.Mock(return_value=(False, None)))
     def test_append(self):
 
@@ -332,7 +514,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_rep_admin.data_out(self.data, self.args))
 
-    @mock.patch("mysql_rep_admin.gen_libs.dict_out",
+    @mock.patch("mysql_rep_admin.text_out",
                 mock.Mock(return_value=(False, None)))
     @mock.patch("mysql_rep_admin.gen_class.setup_mail")
     def test_mail_subj(self, mock_mail):
@@ -351,7 +533,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_rep_admin.data_out(self.data, self.args))
 
-    @mock.patch("mysql_rep_admin.gen_libs.dict_out",
+    @mock.patch("mysql_rep_admin.text_out",
                 mock.Mock(return_value=(False, None)))
     @mock.patch("mysql_rep_admin.gen_class.setup_mail")
     def test_mail_mailx(self, mock_mail):
@@ -370,7 +552,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_rep_admin.data_out(self.data, self.args))
 
-    @mock.patch("mysql_rep_admin.gen_libs.dict_out",
+    @mock.patch("mysql_rep_admin.text_out",
                 mock.Mock(return_value=(False, None)))
     @mock.patch("mysql_rep_admin.gen_class.setup_mail")
     def test_mail(self, mock_mail):
@@ -389,7 +571,7 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_rep_admin.data_out(self.data, self.args))
 
-    @mock.patch("mysql_rep_admin.gen_libs.dict_out",
+    @mock.patch("mysql_rep_admin.text_out",
                 mock.Mock(return_value=(True, "Error Message")))
     def test_std_out_errors(self):
 
@@ -404,7 +586,7 @@ class UnitTest(unittest.TestCase):
         with gen_libs.no_std_out():
             self.assertFalse(mysql_rep_admin.data_out(self.data, self.args))
 
-    @mock.patch("mysql_rep_admin.gen_libs.dict_out",
+    @mock.patch("mysql_rep_admin.text_out",
                 mock.Mock(return_value=(False, None)))
     def test_std_out(self):
 
@@ -0,0 +1,256 @@
+# Classification (U)
+
+"""Program:  discover_slaves.py
+
+    Description:  Unit testing of discover_slaves in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/discover_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        is_connected
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = "Connection Handler"
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Method stub holder for mysql_class.Server.is_connected.
+
+        Arguments:
+
+        """
+
+        return self.conn is not None
+
+
+class SlaveTemplate():                                  # pylint:disable=R0903
+
+    """Class:  SlaveTemplate
+
+    Description:  Class stub holder for the slave template module.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.user = "root"
+        self.japd = "japd"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_master_down
+        test_no_master
+        test_topology_stale
+        test_topology_changed
+        test_topology_same
+        test_no_cache_file
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = MasterRep()
+        self.template = SlaveTemplate()
+        self.replicas = [
+            {"name": "SLAVE1", "host": "SLAVE1", "port": 3306, "sid": 11,
+             "uuid": "UUID1"}]
+        self.topology = {"Slaves": self.replicas, "Checked": time.time()}
+        self.settings = {"discovery_ttl": 3600}
+
+    @mock.patch("mysql_rep_admin.save_state")
+    def test_master_down(self, mock_save):
+
+        """Function:  test_master_down
+
+        Description:  Test cached topology is used with master down.
+
+        Arguments:
+
+        """
+
+        self.master.conn = None
+
+        slv_cfg = mysql_rep_admin.discover_slaves(
+            self.master, self.template, self.topology, settings=self.settings)
+
+        self.assertEqual([cfg["name"] for cfg in slv_cfg], ["SLAVE1"])
+        mock_save.assert_not_called()
+
+    @mock.patch("mysql_rep_admin.save_state")
+    def test_no_master(self, mock_save):
+
+        """Function:  test_no_master
+
+        Description:  Test cached topology is used with no master.
+
+        Arguments:
+
+        """
+
+        slv_cfg = mysql_rep_admin.discover_slaves(
+            None, self.template, self.topology, settings=self.settings)
+
+        self.assertEqual([cfg["sid"] for cfg in slv_cfg], [11])
+        mock_save.assert_not_called()
+
+    @mock.patch("mysql_rep_admin.get_replicas")
+    @mock.patch("mysql_rep_admin.save_state")
+    def test_topology_stale(self, mock_save, mock_replicas):
+
+        """Function:  test_topology_stale
+
+        Description:  Test stale cached topology is saved when unchanged.
+
+        Arguments:
+
+        """
+
+        self.topology["Checked"] = 0
+
+        mock_replicas.return_value = list(self.replicas)
+
+        mysql_rep_admin.discover_slaves(
+            self.master, self.template, self.topology, settings=self.settings,
+            fname="topology.json")
+
+        mock_save.assert_called_once()
+
+    @mock.patch("mysql_rep_admin.get_replicas")
+    @mock.patch("mysql_rep_admin.save_state")
+    def test_topology_changed(self, mock_save, mock_replicas):
+
+        """Function:  test_topology_changed
+
+        Description:  Test changed topology is saved and used.
+
+        Arguments:
+
+        """
+
+        replicas = self.replicas + [
+            {"name": "SLAVE2", "host": "SLAVE2", "port": 3306, "sid": 21,
+             "uuid": "UUID2"}]
+
+        mock_replicas.return_value = replicas
+
+        slv_cfg = mysql_rep_admin.discover_slaves(
+            self.master, self.template, self.topology, settings=self.settings,
+            fname="topology.json")
+
+        self.assertEqual(
+            ([cfg["name"] for cfg in slv_cfg], mock_save.call_args[0][0],
+             mock_save.call_args[0][1]["Slaves"]),
+            (["SLAVE1", "SLAVE2"], "topology.json", replicas))
+
+    @mock.patch("mysql_rep_admin.get_replicas")
+    @mock.patch("mysql_rep_admin.save_state")
+    def test_topology_same(self, mock_save, mock_replicas):
+
+        """Function:  test_topology_same
+
+        Description:  Test current cached topology is not rewritten.
+
+        Arguments:
+
+        """
+
+        mock_replicas.return_value = list(self.replicas)
+
+        mysql_rep_admin.discover_slaves(
+            self.master, self.template, self.topology, settings=self.settings,
+            fname="topology.json")
+
+        mock_save.assert_not_called()
+
+
+    @mock.patch("mysql_rep_admin.get_replicas")
+    @mock.patch("mysql_rep_admin.save_state")
+    def test_no_cache_file(self, mock_save, mock_replicas):
+
+        """Function:  test_no_cache_file
+
+        Description:  Test master's replica list is used and not cached with
+            no topology state file.
+
+        Arguments:
+
+        """
+
+        mock_replicas.return_value = list(self.replicas)
+
+        slv_cfg = mysql_rep_admin.discover_slaves(
+            self.master, self.template, {}, settings=self.settings)
+
+        self.assertEqual([cfg["name"] for cfg in slv_cfg], ["SLAVE1"])
+        mock_save.assert_not_called()
+
+if __name__ == "__main__":
+    unittest.main()
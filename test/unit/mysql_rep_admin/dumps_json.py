@@ -0,0 +1,85 @@
+# Classification (U)
+
+"""Program:  dumps_json.py
+
+    Description:  Unit testing of dumps_json in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/dumps_json.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_indent
+        test_compact
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = {"Slaves": [{"Name": "slave1", "LagTime": 0}]}
+
+    def test_indent(self):
+
+        """Function:  test_indent
+
+        Description:  Test with an indent for the expanded output.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.dumps_json(json, self.data, indent=4),
+            json.dumps(self.data, indent=4))
+
+    def test_compact(self):
+
+        """Function:  test_compact
+
+        Description:  Test with the compact output.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.dumps_json(json, self.data),
+            '{"Slaves": [{"Name": "slave1", "LagTime": 0}]}')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+# Classification (U)
+
+"""Program:  dumps_orjson.py
+
+    Description:  Unit testing of dumps_orjson in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/dumps_orjson.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class OrJson():
+
+    """Class:  OrJson
+
+    Description:  Class stub holder for the orjson module.
+
+    Methods:
+        __init__
+        dumps
+
+    """
+
+    OPT_INDENT_2 = 1
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.option = None
+
+    def dumps(self, data, option=0):
+
+        """Method:  dumps
+
+        Description:  Method stub holder for orjson.dumps.
+
+        Arguments:
+
+        """
+
+        self.option = option
+
+        return json.dumps(data, separators=(",", ":")).encode("UTF-8")
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_indent
+        test_indent_4
+        test_compact
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.module = OrJson()
+        self.data = {"Slaves": [{"Name": "slave1", "LagTime": 0}]}
+
+    def test_indent(self):
+
+        """Function:  test_indent
+
+        Description:  Test with an indent uses the orjson indent option.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.dumps_orjson(self.module, self.data, indent=2)
+
+        self.assertEqual(self.module.option, OrJson.OPT_INDENT_2)
+
+    def test_indent_4(self):
+
+        """Function:  test_indent_4
+
+        Description:  Test an indent orjson does not support keeps the json
+            module's format.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mysql_rep_admin.dumps_orjson(self.module, self.data, indent=4),
+             self.module.option), (json.dumps(self.data, indent=4), None))
+
+    def test_compact(self):
+
+        """Function:  test_compact
+
+        Description:  Test with the compact output returned as a string.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mysql_rep_admin.dumps_orjson(self.module, self.data),
+             self.module.option),
+            ('{"Slaves":[{"Name":"slave1","LagTime":0}]}', 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+# Classification (U)
+
+"""Program:  filter_records.py
+
+    Description:  Unit testing of filter_records in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/filter_records.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import functools
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_new_state
+        test_other_entries
+        test_no_records
+        test_new_slave
+        test_changed
+        test_no_change
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave1 = mysql_rep_admin.SlaveThread("slave1", "Up", "Up")
+        self.slave2 = mysql_rep_admin.SlaveThread("slave2", "Up", "Down")
+        self.data = {"CheckSlaveThread": {
+            "Slaves": [self.slave1, self.slave2]}}
+        self.state = {
+            "-S/CheckSlaveThread/Slaves/slave1": ["slave1", "Up", "Up"],
+            "-S/CheckSlaveThread/Slaves/slave2": ["slave2", "Up", "Up"]}
+        self.new_state = {}
+        self.keep = functools.partial(
+            mysql_rep_admin.is_changed, self.state, self.new_state)
+
+    def test_new_state(self):
+
+        """Function:  test_new_state
+
+        Description:  Test the status of each record is added to the new
+            state.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.filter_records(
+            self.data, "-S", self.keep)
+
+        self.assertEqual(
+            self.new_state,
+            {"-S/CheckSlaveThread/Slaves/slave1": ["slave1", "Up", "Up"],
+             "-S/CheckSlaveThread/Slaves/slave2": ["slave2", "Up", "Down"]})
+
+    def test_other_entries(self):
+
+        """Function:  test_other_entries
+
+        Description:  Test entries which are not records are kept.
+
+        Arguments:
+
+        """
+
+        self.data["CheckSlaveThread"]["Unexpected"] = [{"Name": "slave9"}]
+
+        self.assertEqual(
+            mysql_rep_admin.filter_records(
+                self.data, "-S", self.keep)[0],
+            {"CheckSlaveThread": {"Slaves": [self.slave2],
+                                  "Unexpected": [{"Name": "slave9"}]}})
+
+    def test_no_records(self):
+
+        """Function:  test_no_records
+
+        Description:  Test with results with no records.
+
+        Arguments:
+
+        """
+
+        data = {"MasterLog": {"Master": "master", "LogPosition": 10}}
+
+        self.assertEqual(
+            mysql_rep_admin.filter_records(
+                data, "-B", self.keep), (data, 0, 0))
+
+    def test_new_slave(self):
+
+        """Function:  test_new_slave
+
+        Description:  Test with a slave not in the last run's state.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.filter_records(
+                self.data, "-S",
+                functools.partial(mysql_rep_admin.is_changed, {}, {})),
+            (self.data, 2, 2))
+
+    def test_changed(self):
+
+        """Function:  test_changed
+
+        Description:  Test with one slave's status changed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.filter_records(
+                self.data, "-S", self.keep),
+            ({"CheckSlaveThread": {"Slaves": [self.slave2]}}, 2, 1))
+
+    def test_no_change(self):
+
+        """Function:  test_no_change
+
+        Description:  Test with no slave status changed.
+
+        Arguments:
+
+        """
+
+        self.slave2.sql_thread = "Up"
+
+        self.assertEqual(
+            mysql_rep_admin.filter_records(
+                self.data, "-S", self.keep),
+            ({"CheckSlaveThread": {"Slaves": []}}, 2, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,231 @@
+# Classification (U)
+
+"""Program:  flush_spool.py
+
+    Description:  Unit testing of flush_spool in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/flush_spool.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        spool
+        test_no_directory
+        test_claimed
+        test_stale_claim
+        test_retries_over
+        test_retry
+        test_order
+        test_sent
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.msg = {"Subject": "SubjectLine", "To": ["toaddr"],
+                    "Text": '{"Status": "ok"}', "Attachment": None,
+                    "Mailx": False}
+
+    def spool(self, name, msg):
+
+        """Function:  spool
+
+        Description:  Writes a message to the spool directory.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.save_state(os.path.join(self.tmp_dir, name), msg)
+
+    @mock.patch("mysql_rep_admin.send_msg")
+    def test_no_directory(self, mock_send):
+
+        """Function:  test_no_directory
+
+        Description:  Test with a spool directory which does not exist.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_admin.flush_spool(
+                    os.path.join(self.tmp_dir, "missing")), 0)
+
+        mock_send.assert_not_called()
+
+    @mock.patch("mysql_rep_admin.send_msg")
+    def test_claimed(self, mock_send):
+
+        """Function:  test_claimed
+
+        Description:  Test a message claimed by another flush is skipped.
+
+        Arguments:
+
+        """
+
+        self.spool("1_1.json", self.msg)
+
+        with mock.patch("mysql_rep_admin.os.rename",
+                        mock.Mock(side_effect=FileNotFoundError)):
+            self.assertEqual(mysql_rep_admin.flush_spool(self.tmp_dir), 0)
+
+        mock_send.assert_not_called()
+
+    @mock.patch("mysql_rep_admin.is_running", mock.Mock(return_value=False))
+    @mock.patch("mysql_rep_admin.send_msg")
+    def test_stale_claim(self, mock_send):
+
+        """Function:  test_stale_claim
+
+        Description:  Test a message claimed by a flush which died is sent.
+
+        Arguments:
+
+        """
+
+        self.spool("1_1.json.99999", self.msg)
+
+        self.assertEqual(
+            (mysql_rep_admin.flush_spool(self.tmp_dir),
+             os.listdir(self.tmp_dir), mock_send.call_args[0][0]),
+            (1, [], self.msg))
+
+    @mock.patch("mysql_rep_admin.send_msg",
+                mock.Mock(side_effect=ConnectionRefusedError("refused")))
+    def test_retries_over(self):
+
+        """Function:  test_retries_over
+
+        Description:  Test a message is renamed to .failed after the last
+            retry.
+
+        Arguments:
+
+        """
+
+        self.spool("1_1.json", dict(self.msg, Attempts=1))
+
+        with gen_libs.no_std_out():
+            mysql_rep_admin.flush_spool(self.tmp_dir, retries=2)
+
+        self.assertEqual(
+            (os.listdir(self.tmp_dir), mysql_rep_admin.load_state(
+                os.path.join(self.tmp_dir, "1_1.failed"))["Attempts"]),
+            (["1_1.failed"], 2))
+
+    @mock.patch("mysql_rep_admin.send_msg",
+                mock.Mock(side_effect=ConnectionRefusedError("refused")))
+    def test_retry(self):
+
+        """Function:  test_retry
+
+        Description:  Test a message which fails is left for the next flush.
+
+        Arguments:
+
+        """
+
+        self.spool("1_1.json", self.msg)
+
+        self.assertEqual(
+            (mysql_rep_admin.flush_spool(self.tmp_dir, retries=2),
+             mysql_rep_admin.load_state(
+                 os.path.join(self.tmp_dir, "1_1.json"))),
+            (0, dict(self.msg, Attempts=1)))
+
+    @mock.patch("mysql_rep_admin.send_msg")
+    def test_order(self, mock_send):
+
+        """Function:  test_order
+
+        Description:  Test the messages are sent in the order spooled.
+
+        Arguments:
+
+        """
+
+        self.spool("2_1.json", dict(self.msg, Text="second"))
+        self.spool("1_1.json", dict(self.msg, Text="first"))
+
+        mysql_rep_admin.flush_spool(self.tmp_dir)
+
+        self.assertEqual(
+            [call[0][0]["Text"] for call in mock_send.call_args_list],
+            ["first", "second"])
+
+    @mock.patch("mysql_rep_admin.send_msg")
+    def test_sent(self, mock_send):
+
+        """Function:  test_sent
+
+        Description:  Test a message which is sent is removed.
+
+        Arguments:
+
+        """
+
+        self.spool("1_1.json", self.msg)
+
+        self.assertEqual(
+            (mysql_rep_admin.flush_spool(self.tmp_dir),
+             os.listdir(self.tmp_dir)), (1, []))
+        mock_send.assert_called_once_with(self.msg)
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+# Classification (U)
+
+"""Program:  format_metrics.py
+
+    Description:  Unit testing of format_metrics in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/format_metrics.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_histogram
+        test_escape
+        test_not_number
+        test_order
+        test_format_metrics
+
+    """
+
+    def test_histogram(self):
+
+        """Function:  test_histogram
+
+        Description:  Test a histogram's bucket, sum and count samples are
+            under one help and type line.
+
+        Arguments:
+
+        """
+
+        metrics = {
+            ("query_latency_seconds_bucket",
+             (("server", "slave1"), ("le", "+Inf"))): 2,
+            ("query_latency_seconds_sum", (("server", "slave1"),)): 0.25,
+            ("query_latency_seconds_count", (("server", "slave1"),)): 2}
+
+        self.assertEqual(
+            mysql_rep_admin.format_metrics(metrics),
+            "# HELP mysql_rep_admin_query_latency_seconds SQL round trip"
+            " latency of each server.\n"
+            "# TYPE mysql_rep_admin_query_latency_seconds histogram\n"
+            'mysql_rep_admin_query_latency_seconds_bucket{server="slave1",'
+            'le="+Inf"} 2\n'
+            'mysql_rep_admin_query_latency_seconds_sum{server="slave1"}'
+            " 0.25\n"
+            'mysql_rep_admin_query_latency_seconds_count{server="slave1"}'
+            " 2\n")
+
+    def test_escape(self):
+
+        """Function:  test_escape
+
+        Description:  Test the label values are escaped.
+
+        Arguments:
+
+        """
+
+        metrics = {("slave_lag_seconds", (("slave", 'a"b\\c\nd'),)): 1}
+
+        self.assertIn(
+            'mysql_rep_admin_slave_lag_seconds{slave="a\\"b\\\\c\\nd"} 1',
+            mysql_rep_admin.format_metrics(metrics))
+
+    def test_not_number(self):
+
+        """Function:  test_not_number
+
+        Description:  Test a metric with no number value is left out with
+            its help and type lines.
+
+        Arguments:
+
+        """
+
+        metrics = {("slave_lag_seconds", (("slave", "slave1"),)): "DOWN"}
+
+        self.assertEqual(mysql_rep_admin.format_metrics(metrics), "\n")
+
+    def test_order(self):
+
+        """Function:  test_order
+
+        Description:  Test the metrics are grouped in PROM_METRICS order.
+
+        Arguments:
+
+        """
+
+        metrics = {("slave_lag_seconds", (("slave", "slave1"),)): 1,
+                   ("slave_io_thread_up", (("slave", "slave1"),)): 1,
+                   ("slave_lag_seconds", (("slave", "slave2"),)): 2}
+
+        self.assertEqual(
+            [line.split("{")[0] for line in mysql_rep_admin.format_metrics(
+                metrics).splitlines() if not line.startswith("#")],
+            ["mysql_rep_admin_slave_io_thread_up",
+             "mysql_rep_admin_slave_lag_seconds",
+             "mysql_rep_admin_slave_lag_seconds"])
+
+    def test_format_metrics(self):
+
+        """Function:  test_format_metrics
+
+        Description:  Test the metrics in the Prometheus text format.
+
+        Arguments:
+
+        """
+
+        metrics = {("last_run_timestamp_seconds", ()): 1000.5,
+                   ("slave_lag_seconds",
+                    (("slave", "slave1"), ("uuid", "UUID1"))): 3}
+
+        self.assertEqual(
+            mysql_rep_admin.format_metrics(metrics),
+            "# HELP mysql_rep_admin_last_run_timestamp_seconds Time of the"
+            " last run.\n"
+            "# TYPE mysql_rep_admin_last_run_timestamp_seconds gauge\n"
+            "mysql_rep_admin_last_run_timestamp_seconds 1000.5\n"
+            "# HELP mysql_rep_admin_slave_lag_seconds Slave time lag in"
+            " seconds.\n"
+            "# TYPE mysql_rep_admin_slave_lag_seconds gauge\n"
+            'mysql_rep_admin_slave_lag_seconds{slave="slave1",uuid="UUID1"}'
+            " 3\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
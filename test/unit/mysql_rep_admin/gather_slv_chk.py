@@ -0,0 +1,179 @@
+# Classification (U)
+
+"""Program:  gather_slv_chk.py
+
+    Description:  Unit testing of gather_slv_chk in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/gather_slv_chk.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import asyncio
+import concurrent.futures
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def chk_slv_thr(**kwargs):
+
+    """Method:  chk_slv_thr
+
+    Description:  Function stub holder for mysql_rep_admin.chk_slv_thr.
+
+    Arguments:
+
+    """
+
+    slv = kwargs.get("slaves")[0]
+    time.sleep(slv.delay)
+
+    return {"CheckSlaveThread": {"Slaves": [slv.name]}}
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, delay=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.delay = delay
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        run_gather
+        test_slv_budget
+        test_slave_order
+        test_no_slaves
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.loop = asyncio.new_event_loop()
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        self.func_dict = {"-S": chk_slv_thr}
+        self.slaves = [SlaveRep("Slave1", delay=0.1), SlaveRep("Slave2")]
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        self.executor.shutdown(wait=True)
+        self.loop.close()
+
+    def run_gather(self, slaves, settings=None):
+
+        """Function:  run_gather
+
+        Description:  Run gather_slv_chk in the event loop.
+
+        Arguments:
+
+        """
+
+        return self.loop.run_until_complete(mysql_rep_admin.gather_slv_chk(
+            self.loop, self.executor, ["-S"], self.func_dict, None, slaves,
+            settings=settings or mysql_rep_admin.SETTINGS))
+
+    def test_slv_budget(self):
+
+        """Function:  test_slv_budget
+
+        Description:  Test with slave missing its budget.
+
+        Arguments:
+
+        """
+
+        settings = dict(mysql_rep_admin.SETTINGS)
+        settings["slv_budget"] = 0.05
+        self.slaves[0].delay = 0.5
+
+        self.assertEqual(
+            self.run_gather(self.slaves, settings=settings),
+            [(False, None),
+             (True, [{"CheckSlaveThread": {"Slaves": ["Slave2"]}}])])
+
+    def test_slave_order(self):
+
+        """Function:  test_slave_order
+
+        Description:  Test results are in slave order.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            self.run_gather(self.slaves),
+            [(True, [{"CheckSlaveThread": {"Slaves": ["Slave1"]}}]),
+             (True, [{"CheckSlaveThread": {"Slaves": ["Slave2"]}}])])
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(self.run_gather([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+# Classification (U)
+
+"""Program:  get_budget.py
+
+    Description:  Unit testing of get_budget in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_budget.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_deadline_passed
+        test_deadline_first
+        test_budget_first
+        test_deadline_only
+        test_budget_only
+        test_no_limits
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.now = time.time()
+
+    def test_deadline_passed(self):
+
+        """Function:  test_deadline_passed
+
+        Description:  Test with the deadline already passed.
+
+        Arguments:
+
+        """
+
+        self.assertLess(
+            mysql_rep_admin.get_budget(10, self.now - 1), 0)
+
+    def test_deadline_first(self):
+
+        """Function:  test_deadline_first
+
+        Description:  Test with the deadline before the end of the budget.
+
+        Arguments:
+
+        """
+
+        self.assertLessEqual(
+            mysql_rep_admin.get_budget(10, self.now + 5), 5)
+
+    def test_budget_first(self):
+
+        """Function:  test_budget_first
+
+        Description:  Test with the budget ending before the deadline.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.get_budget(5, self.now + 100), 5)
+
+    def test_deadline_only(self):
+
+        """Function:  test_deadline_only
+
+        Description:  Test with a deadline and no budget.
+
+        Arguments:
+
+        """
+
+        self.assertGreater(
+            mysql_rep_admin.get_budget(None, self.now + 100), 90)
+
+    def test_budget_only(self):
+
+        """Function:  test_budget_only
+
+        Description:  Test with a budget and no deadline.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.get_budget(5, None), 5)
+
+    def test_no_limits(self):
+
+        """Function:  test_no_limits
+
+        Description:  Test with no budget and no deadline.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_rep_admin.get_budget(None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+# Classification (U)
+
+"""Program:  get_cached_cfg.py
+
+    Description:  Unit testing of get_cached_cfg in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_cached_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_file
+        test_file_changed
+        test_not_cached
+        test_cached
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.fname = "/opt/config/slave.txt"
+        self.data = [{"name": "SLAVE1", "sid": 11}]
+        self.data2 = [{"name": "SLAVE2", "sid": 21, "japd": "pwd2"}]
+        self.cache = {self.fname: {"Key": [100, 20], "Data": self.data}}
+        self.loader = mock.Mock(return_value=self.data2)
+
+    @mock.patch("mysql_rep_admin.get_cfg_key", mock.Mock(return_value=None))
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test file which cannot be read is not cached.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mysql_rep_admin.get_cached_cfg({}, self.fname, self.loader),
+             self.loader.call_count), ((self.data2, False), 1))
+
+    @mock.patch("mysql_rep_admin.get_cfg_key",
+                mock.Mock(return_value=[200, 20]))
+    def test_file_changed(self):
+
+        """Function:  test_file_changed
+
+        Description:  Test changed file is parsed and the cache updated.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mysql_rep_admin.get_cached_cfg(
+                self.cache, self.fname, self.loader),
+             self.cache[self.fname]),
+            ((self.data2, True), {"Key": [200, 20], "Data": self.data2}))
+
+    @mock.patch("mysql_rep_admin.get_cfg_key",
+                mock.Mock(return_value=[100, 20]))
+    def test_not_cached(self):
+
+        """Function:  test_not_cached
+
+        Description:  Test file not in the cache is parsed and cached.
+
+        Arguments:
+
+        """
+
+        cache = {}
+
+        self.assertEqual(
+            (mysql_rep_admin.get_cached_cfg(cache, self.fname, self.loader),
+             list(cache)), ((self.data2, True), [self.fname]))
+
+    @mock.patch("mysql_rep_admin.get_cfg_key",
+                mock.Mock(return_value=[100, 20]))
+    def test_cached(self):
+
+        """Function:  test_cached
+
+        Description:  Test unchanged file is not parsed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mysql_rep_admin.get_cached_cfg(
+                self.cache, self.fname, self.loader),
+             self.loader.called), ((self.data, False), False))
+
+
+if __name__ == "__main__":
+    unittest.main()
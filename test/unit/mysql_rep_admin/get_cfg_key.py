@@ -0,0 +1,121 @@
+# Classification (U)
+
+"""Program:  get_cfg_key.py
+
+    Description:  Unit testing of get_cfg_key in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_cfg_key.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+import shutil
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_file_changed
+        test_no_file
+        test_cfg_key
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "slave.txt")
+
+        with open(self.fname, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("name = SLAVE1\n")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_file_changed(self):
+
+        """Function:  test_file_changed
+
+        Description:  Test key changes when the file changes.
+
+        Arguments:
+
+        """
+
+        key = mysql_rep_admin.get_cfg_key(self.fname)
+
+        with open(self.fname, mode="a", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("sid = 11\n")
+
+        self.assertNotEqual(mysql_rep_admin.get_cfg_key(self.fname), key)
+
+    def test_no_file(self):
+
+        """Function:  test_no_file
+
+        Description:  Test with configuration file missing.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(
+            mysql_rep_admin.get_cfg_key(
+                os.path.join(self.tmp_dir, "missing.txt")))
+
+    def test_cfg_key(self):
+
+        """Function:  test_cfg_key
+
+        Description:  Test key is the modification time and size.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_cfg_key(self.fname),
+            [os.stat(self.fname).st_mtime_ns, 14])
+
+
+if __name__ == "__main__":
+    unittest.main()
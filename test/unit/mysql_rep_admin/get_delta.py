@@ -0,0 +1,186 @@
+# Classification (U)
+
+"""Program:  get_delta.py
+
+    Description:  Unit testing of get_delta in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_delta.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        create_check
+        test_timeout_unchanged
+        test_no_records_changed
+        test_no_records_state
+        test_lag_cleared
+        test_lag_changed
+        test_first_run
+        test_no_change
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.new_state = {}
+        self.timeout = {"Option": "-T", "Status": "TIMEOUT"}
+        self.mst_log = {"MasterLog": {"Master": "master", "LogPosition": 10}}
+
+    def create_check(self, lag_time):
+
+        """Function:  create_check
+
+        Description:  Returns -T results for a slave with the time lag.
+
+        Arguments:
+
+        """
+
+        return {"CheckSlaveTime": {"Slaves": [
+            mysql_rep_admin.SlaveTime("slave1", "UUID1", lag_time)]}}
+
+    def test_timeout_unchanged(self):
+
+        """Function:  test_timeout_unchanged
+
+        Description:  Test with an option which timed out in the last run.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_rep_admin.get_delta(
+            "-T", self.timeout, {"-T": dict(self.timeout)}, self.new_state))
+
+    def test_no_records_changed(self):
+
+        """Function:  test_no_records_changed
+
+        Description:  Test with results with no records which changed.
+
+        Arguments:
+
+        """
+
+        state = {"-B": {"MasterLog": {"Master": "master", "LogPosition": 5}}}
+
+        self.assertEqual(
+            mysql_rep_admin.get_delta("-B", self.mst_log, state,
+                                      self.new_state), self.mst_log)
+
+    def test_no_records_state(self):
+
+        """Function:  test_no_records_state
+
+        Description:  Test results with no records are kept in the state as
+            a whole.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.get_delta("-B", self.mst_log, {}, self.new_state)
+
+        self.assertEqual(self.new_state, {"-B": self.mst_log})
+
+    def test_lag_cleared(self):
+
+        """Function:  test_lag_cleared
+
+        Description:  Test with a slave's time lag back to zero.
+
+        Arguments:
+
+        """
+
+        state = {}
+        mysql_rep_admin.get_delta("-T", self.create_check(30), {}, state)
+
+        self.assertEqual(
+            mysql_rep_admin.to_json(mysql_rep_admin.get_delta(
+                "-T", self.create_check(0), state, self.new_state)),
+            mysql_rep_admin.to_json(self.create_check(0)))
+
+    def test_lag_changed(self):
+
+        """Function:  test_lag_changed
+
+        Description:  Test with a lagging slave's time lag changing.
+
+        Arguments:
+
+        """
+
+        state = {}
+        mysql_rep_admin.get_delta("-T", self.create_check(30), {}, state)
+
+        self.assertIsNone(mysql_rep_admin.get_delta(
+            "-T", self.create_check(45), state, self.new_state))
+
+    def test_first_run(self):
+
+        """Function:  test_first_run
+
+        Description:  Test with no state from a last run.
+
+        Arguments:
+
+        """
+
+        check = self.create_check(0)
+
+        self.assertEqual(
+            mysql_rep_admin.get_delta("-T", check, {}, self.new_state), check)
+
+    def test_no_change(self):
+
+        """Function:  test_no_change
+
+        Description:  Test with no status changed.
+
+        Arguments:
+
+        """
+
+        state = {}
+        mysql_rep_admin.get_delta("-T", self.create_check(0), {}, state)
+
+        self.assertIsNone(mysql_rep_admin.get_delta(
+            "-T", self.create_check(0), state, self.new_state))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+# Classification (U)
+
+"""Program:  get_inst_need.py
+
+    Description:  Unit testing of get_inst_need in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_inst_need.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_args
+        get_args_keys
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-c": "mysql_cfg", "-s": "slave.txt"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_args(self):
+
+        """Method:  get_args
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args.
+
+        Arguments:
+
+        """
+
+        return self.args_array
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_all_option
+        test_not_in_inst_dict
+        test_multiple_options
+        test_slave_only
+        test_no_inst_dict
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.func_dict = {"-A": ["-C", "-S"], "-B": "rpt_mst_log",
+                          "-C": "chk_mst_log", "-S": "chk_slv_thr",
+                          "-D": "rpt_slv_log"}
+        self.inst_dict = {"-B": ["master"], "-C": ["master", "slaves"],
+                          "-S": ["slaves"]}
+
+    def test_all_option(self):
+
+        """Function:  test_all_option
+
+        Description:  Test with the all option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-A"] = True
+
+        self.assertEqual(
+            mysql_rep_admin.get_inst_need(
+                self.args, self.func_dict, self.inst_dict),
+            {"master", "slaves"})
+
+    def test_not_in_inst_dict(self):
+
+        """Function:  test_not_in_inst_dict
+
+        Description:  Test with option not in the instance dictionary.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-D"] = True
+
+        self.assertEqual(
+            mysql_rep_admin.get_inst_need(
+                self.args, self.func_dict, self.inst_dict),
+            {"master", "slaves"})
+
+    def test_multiple_options(self):
+
+        """Function:  test_multiple_options
+
+        Description:  Test with a master option and a slave option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-B"] = True
+        self.args.args_array["-S"] = True
+
+        self.assertEqual(
+            mysql_rep_admin.get_inst_need(
+                self.args, self.func_dict, self.inst_dict),
+            {"master", "slaves"})
+
+    def test_slave_only(self):
+
+        """Function:  test_slave_only
+
+        Description:  Test with a slave only option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-S"] = True
+
+        self.assertEqual(
+            mysql_rep_admin.get_inst_need(
+                self.args, self.func_dict, self.inst_dict), {"slaves"})
+
+    def test_no_inst_dict(self):
+
+        """Function:  test_no_inst_dict
+
+        Description:  Test with no instance dictionary.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-S"] = True
+
+        self.assertEqual(
+            mysql_rep_admin.get_inst_need(self.args, self.func_dict),
+            {"master", "slaves"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# Classification (U)
+
+"""Program:  get_latency.py
+
+    Description:  Unit testing of get_latency in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_latency.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_cumulative_buckets
+        test_no_servers
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.latency = {}
+
+    def test_cumulative_buckets(self):
+
+        """Function:  test_cumulative_buckets
+
+        Description:  Test the bucket counts are cumulative.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.add_latency(self.latency, "Slave1", 0.002)
+        mysql_rep_admin.add_latency(self.latency, "Slave1", 0.8)
+        data = mysql_rep_admin.get_latency(self.latency)["Slave1"]
+
+        self.assertEqual(
+            (data["Count"], data["Sum"], data["Max"], data["Buckets"]["0.001"],
+             data["Buckets"]["0.0025"], data["Buckets"]["0.5"],
+             data["Buckets"]["1"], data["Buckets"]["+Inf"]),
+            (2, 0.802, 0.8, 0, 1, 1, 2, 2))
+
+    def test_no_servers(self):
+
+        """Function:  test_no_servers
+
+        Description:  Test with no queries timed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.get_latency(self.latency), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
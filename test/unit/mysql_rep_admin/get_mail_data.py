@@ -0,0 +1,272 @@
+# Classification (U)
+
+"""Program:  get_mail_data.py
+
+    Description:  Unit testing of get_mail_data in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_mail_data.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-t": "toaddr"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_data_digest
+        test_rate_and_digest
+        test_digest
+        test_rate_state
+        test_rate
+        test_no_settings
+        test_no_state_dir
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.settings = dict(mysql_rep_admin.SETTINGS, state_dir=self.tmp_dir)
+        self.fname = os.path.join(self.tmp_dir, "mysql_rep_admin_mail.json")
+        self.data = {"Application": "MySQLReplication", "Checks": [
+            {"CheckSlaveThread": {"Slaves": [
+                mysql_rep_admin.SlaveThread("slave1", "Up", "Down")]}}]}
+
+    @mock.patch("mysql_rep_admin.time.time", mock.Mock(return_value=1000))
+    def test_no_data_digest(self):
+
+        """Function:  test_no_data_digest
+
+        Description:  Test with no data and nothing held.
+
+        Arguments:
+
+        """
+
+        self.settings["mail_digest"] = 600
+
+        self.assertIsNone(
+            mysql_rep_admin.get_mail_data(
+                None, self.args, settings=self.settings))
+
+    @mock.patch("mysql_rep_admin.time.time", mock.Mock(return_value=1000))
+    def test_rate_and_digest(self):
+
+        """Function:  test_rate_and_digest
+
+        Description:  Test the same status is not held for the digest when
+            it is within the rate.
+
+        Arguments:
+
+        """
+
+        self.settings["mail_rate"] = 300
+        self.settings["mail_digest"] = 600
+
+        mysql_rep_admin.get_mail_data(
+            self.data, self.args, settings=self.settings)
+        mysql_rep_admin.get_mail_data(
+            self.data, self.args, settings=self.settings)
+
+        self.assertNotIn(
+            "pending", mysql_rep_admin.load_state(self.fname))
+
+    @mock.patch("mysql_rep_admin.time.time", mock.Mock(return_value=1000))
+    def test_digest(self):
+
+        """Function:  test_digest
+
+        Description:  Test with the mail_digest setting.
+
+        Arguments:
+
+        """
+
+        self.settings["mail_digest"] = 600
+
+        self.assertEqual(
+            [mysql_rep_admin.get_mail_data(
+                self.data, self.args, settings=self.settings),
+             mysql_rep_admin.get_mail_data(
+                 self.data, self.args, settings=self.settings)],
+            [mysql_rep_admin.to_json(self.data), None])
+
+    @mock.patch("mysql_rep_admin.time.time", mock.Mock(return_value=1000))
+    def test_rate_state(self):
+
+        """Function:  test_rate_state
+
+        Description:  Test the emailed status is saved to the state file.
+
+        Arguments:
+
+        """
+
+        self.settings["mail_rate"] = 300
+
+        mysql_rep_admin.get_mail_data(
+            self.data, self.args, settings=self.settings)
+
+        self.assertEqual(
+            mysql_rep_admin.load_state(self.fname),
+            {"sent": {"CheckSlaveThread/CheckSlaveThread/Slaves/slave1":
+                      [["slave1", "Up", "Down"], 1000]}})
+
+    @mock.patch("mysql_rep_admin.time.time", mock.Mock(return_value=1000))
+    def test_rate(self):
+
+        """Function:  test_rate
+
+        Description:  Test with the mail_rate setting.
+
+        Arguments:
+
+        """
+
+        self.settings["mail_rate"] = 300
+
+        self.assertEqual(
+            [mysql_rep_admin.get_mail_data(
+                self.data, self.args, settings=self.settings),
+             mysql_rep_admin.get_mail_data(
+                 self.data, self.args, settings=self.settings)],
+            [self.data, None])
+
+    def test_no_settings(self):
+
+        """Function:  test_no_settings
+
+        Description:  Test with no mail settings set.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mysql_rep_admin.get_mail_data(
+                self.data, self.args, settings=self.settings),
+             os.path.exists(self.fname)), (self.data, False))
+
+    def test_no_state_dir(self):
+
+        """Function:  test_no_state_dir
+
+        Description:  Test the mail settings are not applied without a
+            state_dir setting.
+
+        Arguments:
+
+        """
+
+        self.settings["mail_rate"] = 3600
+        self.settings["state_dir"] = None
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                [mysql_rep_admin.get_mail_data(
+                    self.data, self.args, settings=self.settings),
+                 mysql_rep_admin.get_mail_data(
+                     self.data, self.args, settings=self.settings)],
+                [self.data, self.data])
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+# Classification (U)
+
+"""Program:  get_metrics.py
+
+    Description:  Unit testing of get_metrics in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_metrics.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_latency
+        test_record_uuid
+        test_one_per_slave
+        test_chk_mst_log
+        test_rpt_mst_log
+        test_timeout
+        test_no_checks
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = mysql_rep_admin.SlaveSnapshot(**dict(
+            dict.fromkeys(mysql_rep_admin.SlaveSnapshot._fields),
+            name="slave1", connected=True, slave_uuid="UUID1",
+            log_info=("bin.01", "bin.01", 20, 20)))
+        self.labels = (("slave", "slave1"), ("uuid", "UUID1"))
+        self.now = 1000.0
+
+    def test_latency(self):
+
+        """Function:  test_latency
+
+        Description:  Test the query latency histograms are labeled with the
+            server's name.
+
+        Arguments:
+
+        """
+
+        latency = {}
+        mysql_rep_admin.add_latency(latency, "master", 0.002)
+        metrics = mysql_rep_admin.get_metrics([], [], self.now, latency)
+
+        self.assertEqual(
+            (metrics[("query_latency_seconds_bucket",
+                      (("server", "master"), ("le", "0.001")))],
+             metrics[("query_latency_seconds_bucket",
+                      (("server", "master"), ("le", "+Inf")))],
+             metrics[("query_latency_seconds_count",
+                      (("server", "master"),))]),
+            (0, 1, 1))
+
+    def test_record_uuid(self):
+
+        """Function:  test_record_uuid
+
+        Description:  Test the UUID is taken from the record if the slave
+            has none.
+
+        Arguments:
+
+        """
+
+        checks = [("-T", {"CheckSlaveTime": {"Slaves": [
+            mysql_rep_admin.SlaveTime("slave1", "UUID1", 5)]}})]
+
+        self.assertEqual(
+            mysql_rep_admin.get_metrics(
+                checks, [self.slave._replace(slave_uuid=None)],
+                self.now)[("slave_lag_seconds", self.labels)], 5)
+
+    def test_one_per_slave(self):
+
+        """Function:  test_one_per_slave
+
+        Description:  Test a slave listed twice only has one of each metric.
+
+        Arguments:
+
+        """
+
+        checks = [("-C", {"CheckMasterLog": {
+            "MasterLog": {"Master": {"Name": "master", "Log": "bin.01",
+                                     "Position": 20},
+                          "Slaves": [mysql_rep_admin.SlaveStatus(
+                              "slave1", "OK")]},
+            "SlaveLogs": [mysql_rep_admin.SlaveStatus("slave1", "OK")]}})]
+
+        self.assertEqual(
+            sorted(name for name, _ in mysql_rep_admin.get_metrics(
+                checks, [self.slave], self.now)),
+            ["check_timeout", "last_run_timestamp_seconds",
+             "master_position", "slave_exec_position",
+             "slave_read_position"])
+
+    def test_chk_mst_log(self):
+
+        """Function:  test_chk_mst_log
+
+        Description:  Test with the -C option master position.
+
+        Arguments:
+
+        """
+
+        checks = [("-C", {"CheckMasterLog": {
+            "MasterLog": {"Master": {"Name": "master", "Log": "bin.01",
+                                     "Position": 20}, "Slaves": []},
+            "SlaveLogs": []}})]
+
+        self.assertEqual(
+            mysql_rep_admin.get_metrics(checks, [], self.now)[
+                ("master_position", (("master", "master"),
+                                     ("log", "bin.01")))], 20)
+
+    def test_rpt_mst_log(self):
+
+        """Function:  test_rpt_mst_log
+
+        Description:  Test with the -B option master position.
+
+        Arguments:
+
+        """
+
+        checks = [("-B", {"MasterLog": {
+            "Master": "master", "MasterLog": "bin.01", "LogPosition": 20}})]
+
+        self.assertEqual(
+            mysql_rep_admin.get_metrics(checks, [], self.now)[
+                ("master_position", (("master", "master"),
+                                     ("log", "bin.01")))], 20)
+
+    def test_timeout(self):
+
+        """Function:  test_timeout
+
+        Description:  Test with an option which timed out.
+
+        Arguments:
+
+        """
+
+        checks = [("-S", {"Option": "-S", "Status": "TIMEOUT"})]
+
+        self.assertEqual(
+            mysql_rep_admin.get_metrics(checks, [], self.now),
+            {("last_run_timestamp_seconds", ()): self.now,
+             ("check_timeout", (("option", "-S"),)): 1})
+
+    def test_no_checks(self):
+
+        """Function:  test_no_checks
+
+        Description:  Test with no options.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_metrics([], [], self.now),
+            {("last_run_timestamp_seconds", ()): self.now})
+
+
+if __name__ == "__main__":
+    unittest.main()
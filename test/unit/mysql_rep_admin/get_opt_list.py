@@ -0,0 +1,169 @@
+# Classification (U)
+
+"""Program:  get_opt_list.py
+
+    Description:  Unit testing of get_opt_list in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_opt_list.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_args
+        get_args_keys
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-A": True, "-D": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_args(self):
+
+        """Method:  get_args
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args.
+
+        Arguments:
+
+        """
+
+        return self.args_array
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_args_order
+        test_all_option_only
+        test_all_option
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.func_dict = {"-A": ["-C", "-S"], "-C": True, "-S": True,
+                          "-D": True, "-T": True}
+
+    def test_args_order(self):
+
+        """Function:  test_args_order
+
+        Description:  Test with options in command line order.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-d": "config", "-T": True, "-C": True,
+                                "-S": True}
+
+        self.assertEqual(
+            mysql_rep_admin.get_opt_list(self.args, self.func_dict),
+            ["-T", "-C", "-S"])
+
+    def test_all_option_only(self):
+
+        """Function:  test_all_option_only
+
+        Description:  Test with only the all option.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-D"]
+
+        self.assertEqual(
+            mysql_rep_admin.get_opt_list(self.args, self.func_dict),
+            ["-C", "-S"])
+
+    def test_all_option(self):
+
+        """Function:  test_all_option
+
+        Description:  Test with all option and an extra option.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_opt_list(self.args, self.func_dict),
+            ["-C", "-S", "-D"])
+
+
+if __name__ == "__main__":
+    unittest.main()
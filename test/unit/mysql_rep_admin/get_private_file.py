@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  get_private_file.py
+
+    Description:  Unit testing of get_private_file in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_private_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-d": "config"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_state_dir
+        test_not_private
+        test_private
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.settings = dict(mysql_rep_admin.SETTINGS)
+        self.settings["state_dir"] = "/var/lib/rep_admin"
+
+    def test_no_state_dir(self):
+
+        """Function:  test_no_state_dir
+
+        Description:  Test the temporary directory is not used.
+
+        Arguments:
+
+        """
+
+        self.settings["state_dir"] = None
+
+        self.assertIsNone(mysql_rep_admin.get_private_file(
+            self.args, self.settings, "config"))
+
+    @mock.patch("mysql_rep_admin.is_private_dir",
+                mock.Mock(return_value=False))
+    def test_not_private(self):
+
+        """Function:  test_not_private
+
+        Description:  Test with state directory others can access.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertIsNone(mysql_rep_admin.get_private_file(
+                self.args, self.settings, "config"))
+
+    @mock.patch("mysql_rep_admin.is_private_dir",
+                mock.Mock(return_value=True))
+    def test_private(self):
+
+        """Function:  test_private
+
+        Description:  Test with private state directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_private_file(
+                self.args, self.settings, "config"),
+            "/var/lib/rep_admin/mysql_rep_admin_config.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+# Classification (U)
+
+"""Program:  get_rec_key.py
+
+    Description:  Unit testing of get_rec_key in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_rec_key.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_no_name_no_uuid
+        test_missing_slave
+        test_name
+
+    """
+
+    def test_no_name_no_uuid(self):
+
+        """Function:  test_no_name_no_uuid
+
+        Description:  Test with a record with no name or UUID.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_rec_key(
+                "-E", mysql_rep_admin.ThreadError("Good")), "-E/None")
+
+    def test_missing_slave(self):
+
+        """Function:  test_missing_slave
+
+        Description:  Test with a missing slave identified by its UUID.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_rec_key(
+                "-T/CheckSlaveTime/Slaves",
+                mysql_rep_admin.SlaveTime(slave_uuid="UUID1", lag_time="UNK")),
+            "-T/CheckSlaveTime/Slaves/UUID1")
+
+    def test_name(self):
+
+        """Function:  test_name
+
+        Description:  Test with a record identified by its name.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_rec_key(
+                "-S/CheckSlaveThread/Slaves",
+                mysql_rep_admin.SlaveThread("slave1", "Up", "Up")),
+            "-S/CheckSlaveThread/Slaves/slave1")
+
+
+if __name__ == "__main__":
+    unittest.main()
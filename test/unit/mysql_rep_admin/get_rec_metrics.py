@@ -0,0 +1,198 @@
+# Classification (U)
+
+"""Program:  get_rec_metrics.py
+
+    Description:  Unit testing of get_rec_metrics in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_rec_metrics.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_slave_down
+        test_slave_status
+        test_slave_log
+        test_slave_other
+        test_slave_error_down
+        test_slave_error
+        test_slave_thread
+        test_slave_time
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = mysql_rep_admin.SlaveSnapshot(**dict(
+            dict.fromkeys(mysql_rep_admin.SlaveSnapshot._fields),
+            name="slave1", connected=True, others=(0, 2, 1),
+            log_info=("bin.01", "bin.00", 20, 10)))
+        self.down_slave = self.slave._replace(connected=False)
+
+    def test_slave_down(self):
+
+        """Function:  test_slave_down
+
+        Description:  Test with the counters of a slave which is down.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_rec_metrics(
+                mysql_rep_admin.SlaveOther("slave1", "DOWN"),
+                self.down_slave), [])
+
+    def test_slave_status(self):
+
+        """Function:  test_slave_status
+
+        Description:  Test with the -C option positions from the snapshot.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_rec_metrics(
+                mysql_rep_admin.SlaveStatus("slave1", "OK"), self.slave),
+            [("slave_read_position", {"log": "bin.01"}, 20),
+             ("slave_exec_position", {"log": "bin.00"}, 10)])
+
+    def test_slave_log(self):
+
+        """Function:  test_slave_log
+
+        Description:  Test with the -D option positions.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_rec_metrics(
+                mysql_rep_admin.SlaveLog(
+                    "slave1", "bin.02", 30, "bin.02", 25), None),
+            [("slave_read_position", {"log": "bin.02"}, 30),
+             ("slave_exec_position", {"log": "bin.02"}, 25)])
+
+    def test_slave_other(self):
+
+        """Function:  test_slave_other
+
+        Description:  Test with the -O option counters from the snapshot.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_rec_metrics(
+                mysql_rep_admin.SlaveOther("slave1", "Good"), self.slave),
+            [("slave_skip_count", {}, 0), ("slave_temp_tables", {}, 2),
+             ("slave_retried_transactions", {}, 1)])
+
+    def test_slave_error_down(self):
+
+        """Function:  test_slave_error_down
+
+        Description:  Test with the -E option for a slave which is down.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_rec_metrics(
+                mysql_rep_admin.SlaveError(
+                    "slave1", "DOWN", mysql_rep_admin.ThreadError("Unknown"),
+                    mysql_rep_admin.ThreadError("Unknown")),
+                self.down_slave), [("slave_connection_up", {}, 0)])
+
+    def test_slave_error(self):
+
+        """Function:  test_slave_error
+
+        Description:  Test with the -E option error numbers.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_rec_metrics(
+                mysql_rep_admin.SlaveError(
+                    "slave1", "Up", mysql_rep_admin.ThreadError("Good"),
+                    mysql_rep_admin.ThreadError(
+                        "Bad", 1062, "Duplicate entry", "2026-10-18")),
+                self.slave),
+            [("slave_connection_up", {}, 1), ("slave_io_error", {}, 0),
+             ("slave_sql_error", {}, 1062)])
+
+    def test_slave_thread(self):
+
+        """Function:  test_slave_thread
+
+        Description:  Test with the -S option thread status.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_rec_metrics(
+                mysql_rep_admin.SlaveThread("slave1", "Up", "Down"),
+                self.slave),
+            [("slave_io_thread_up", {}, 1), ("slave_sql_thread_up", {}, 0)])
+
+    def test_slave_time(self):
+
+        """Function:  test_slave_time
+
+        Description:  Test with the -T option time lag.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_rec_metrics(
+                mysql_rep_admin.SlaveTime("slave1", "UUID1", 5), self.slave),
+            [("slave_lag_seconds", {}, 5)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,135 @@
+# Classification (U)
+
+"""Program:  get_replicas.py
+
+    Description:  Unit testing of get_replicas in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_replicas.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.slaves = [
+            {"Server_Id": 21, "Host": "SLAVE2", "Port": 3306,
+             "Replica_UUID": "UUID2"},
+            {"Server_id": "11", "Host": "SLAVE1", "Port": "3307",
+             "Slave_UUID": "UUID1"}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_report_host
+        test_replica_order
+        test_no_replicas
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = MasterRep()
+        self.results = [
+            {"name": "SLAVE1", "host": "SLAVE1", "port": 3307, "sid": 11,
+             "uuid": "UUID1"},
+            {"name": "SLAVE2", "host": "SLAVE2", "port": 3306, "sid": 21,
+             "uuid": "UUID2"}]
+
+    def test_no_report_host(self):
+
+        """Function:  test_no_report_host
+
+        Description:  Test replica without a report-host is skipped.
+
+        Arguments:
+
+        """
+
+        self.master.slaves.append(
+            {"Server_Id": 31, "Host": "", "Port": 3306})
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_admin.get_replicas(self.master), self.results)
+
+    def test_replica_order(self):
+
+        """Function:  test_replica_order
+
+        Description:  Test replicas are returned in server id order.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_replicas(self.master), self.results)
+
+    def test_no_replicas(self):
+
+        """Function:  test_no_replicas
+
+        Description:  Test with no replicas registered with the master.
+
+        Arguments:
+
+        """
+
+        self.master.slaves = []
+
+        self.assertEqual(mysql_rep_admin.get_replicas(self.master), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+# Classification (U)
+
+"""Program:  get_serializer.py
+
+    Description:  Unit testing of get_serializer in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_serializer.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import json
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def import_module(name):
+
+    """Function:  import_module
+
+    Description:  Function stub holder for importlib.import_module, only the
+        json module is installed.
+
+    Arguments:
+
+    """
+
+    if name != "json":
+        raise ImportError(f"No module named '{name}'")
+
+    return json
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_backend
+        test_orjson
+        test_named_not_installed
+        test_named_backend
+        test_first_installed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = {"Status": "ok"}
+
+    @mock.patch("mysql_rep_admin.importlib.import_module")
+    def test_no_backend(self, mock_imp):
+
+        """Function:  test_no_backend
+
+        Description:  Test with no JSON backend installed.
+
+        Arguments:
+
+        """
+
+        mock_imp.side_effect = ImportError("No module")
+
+        with self.assertRaises(ImportError):
+            mysql_rep_admin.get_serializer()
+
+    @mock.patch("mysql_rep_admin.importlib.import_module")
+    def test_orjson(self, mock_imp):
+
+        """Function:  test_orjson
+
+        Description:  Test with the orjson backend.
+
+        Arguments:
+
+        """
+
+        mock_imp.return_value = "orjson"
+
+        self.assertEqual(
+            mysql_rep_admin.get_serializer("orjson").func,
+            mysql_rep_admin.dumps_orjson)
+
+    @mock.patch("mysql_rep_admin.importlib.import_module", import_module)
+    def test_named_not_installed(self):
+
+        """Function:  test_named_not_installed
+
+        Description:  Test with the named backend not installed uses the
+            first installed backend.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_serializer("ujson")(self.data),
+            '{"Status": "ok"}')
+
+    @mock.patch("mysql_rep_admin.importlib.import_module")
+    def test_named_backend(self, mock_imp):
+
+        """Function:  test_named_backend
+
+        Description:  Test with a named backend.
+
+        Arguments:
+
+        """
+
+        mock_imp.return_value = json
+
+        mysql_rep_admin.get_serializer("simplejson")
+
+        mock_imp.assert_called_once_with("simplejson")
+
+    @mock.patch("mysql_rep_admin.importlib.import_module", import_module)
+    def test_first_installed(self):
+
+        """Function:  test_first_installed
+
+        Description:  Test with the first installed backend.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_serializer()(self.data, indent=4),
+            json.dumps(self.data, indent=4))
+
+
+if __name__ == "__main__":
+    unittest.main()
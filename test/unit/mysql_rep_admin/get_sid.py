@@ -0,0 +1,93 @@
+# Classification (U)
+
+"""Program:  get_sid.py
+
+    Description:  Unit testing of get_sid in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_sid.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_not_sid
+        test_none
+        test_string
+        test_integer
+
+    """
+
+    def test_not_sid(self):
+
+        """Function:  test_not_sid
+
+        Description:  Test with value which is not a server id.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_rep_admin.get_sid("Unknown"))
+
+    def test_none(self):
+
+        """Function:  test_none
+
+        Description:  Test with no server id.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_rep_admin.get_sid(None))
+
+    def test_string(self):
+
+        """Function:  test_string
+
+        Description:  Test with server id as a string.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.get_sid("11"), 11)
+
+    def test_integer(self):
+
+        """Function:  test_integer
+
+        Description:  Test with server id as an integer.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.get_sid(11), 11)
+
+
+if __name__ == "__main__":
+    unittest.main()
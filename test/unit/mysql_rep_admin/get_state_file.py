@@ -0,0 +1,160 @@
+# Classification (U)
+
+"""Program:  get_state_file.py
+
+    Description:  Unit testing of get_state_file in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/get_state_file.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-d": "config"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_flavor_id
+        test_state_dir
+        test_default_dir
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.settings = dict(mysql_rep_admin.SETTINGS)
+
+    def test_flavor_id(self):
+
+        """Function:  test_flavor_id
+
+        Description:  Test with -y flavor id in the file name.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-y"] = "prod"
+        self.settings["state_dir"] = "/var/lib/rep_admin"
+
+        self.assertEqual(
+            mysql_rep_admin.get_state_file(
+                self.args, self.settings, "breaker"),
+            "/var/lib/rep_admin/mysql_rep_admin_breaker_prod.json")
+
+    def test_state_dir(self):
+
+        """Function:  test_state_dir
+
+        Description:  Test with state_dir setting.
+
+        Arguments:
+
+        """
+
+        self.settings["state_dir"] = "/var/lib/rep_admin"
+
+        self.assertEqual(
+            mysql_rep_admin.get_state_file(
+                self.args, self.settings, "breaker"),
+            "/var/lib/rep_admin/mysql_rep_admin_breaker.json")
+
+    def test_default_dir(self):
+
+        """Function:  test_default_dir
+
+        Description:  Test with the default temporary directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.get_state_file(
+                self.args, self.settings, "breaker"),
+            os.path.join(
+                tempfile.gettempdir(), "mysql_rep_admin_breaker.json"))
+
+
+if __name__ == "__main__":
+    unittest.main()
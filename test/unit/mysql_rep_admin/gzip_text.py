@@ -0,0 +1,122 @@
+# Classification (U)
+
+"""Program:  gzip_text.py
+
+    Description:  Unit testing of gzip_text in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/gzip_text.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import gzip
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_empty
+        test_multibyte_chunks
+        test_chunks
+        test_gzip_text
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.text = '{"Slaves": [' + ", ".join(
+            f'{{"Name": "slave{cnt}", "Status": "OK"}}'
+            for cnt in range(100)) + "]}"
+
+    def test_empty(self):
+
+        """Function:  test_empty
+
+        Description:  Test with empty text.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            gzip.decompress(mysql_rep_admin.gzip_text("")), b"")
+
+    def test_multibyte_chunks(self):
+
+        """Function:  test_multibyte_chunks
+
+        Description:  Test with multibyte characters across the chunks.
+
+        Arguments:
+
+        """
+
+        text = "Slave été ✓ " * 50
+
+        self.assertEqual(
+            gzip.decompress(
+                mysql_rep_admin.gzip_text(text, chunk=7)).decode("UTF-8"),
+            text)
+
+    def test_chunks(self):
+
+        """Function:  test_chunks
+
+        Description:  Test with the text compressed in a number of chunks.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            gzip.decompress(
+                mysql_rep_admin.gzip_text(self.text, chunk=100)),
+            self.text.encode("UTF-8"))
+
+    def test_gzip_text(self):
+
+        """Function:  test_gzip_text
+
+        Description:  Test the text is compressed in the gzip format.
+
+        Arguments:
+
+        """
+
+        data = mysql_rep_admin.gzip_text(self.text)
+
+        self.assertEqual(
+            (gzip.decompress(data), len(data) < len(self.text) / 10),
+            (self.text.encode("UTF-8"), True))
+
+
+if __name__ == "__main__":
+    unittest.main()
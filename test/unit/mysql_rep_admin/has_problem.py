@@ -0,0 +1,325 @@
+# Classification (U)
+
+"""Program:  has_problem.py
+
+    Description:  Unit testing of has_problem in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/has_problem.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_healthy_checks
+        test_later_check
+        test_unexpected_slave
+        test_log_warning
+        test_other_bad
+        test_thread_error
+        test_thread_down
+        test_slave_timeout
+        test_check_timeout
+        test_missing_slave
+        test_time_lag_multiple_slaves3
+        test_time_lag_multiple_slaves2
+        test_time_lag_multiple_slaves
+        test_time_lag_single_slave
+        test_no_time_lag_multiple_slaves
+        test_no_time_lag_single_slave
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        slv_time = mysql_rep_admin.SlaveTime
+        self.data = {
+            "Checks": [{
+                "CheckSlaveTime": {
+                    "Slaves": [slv_time("slave1", lag_time=0)]}}]}
+        self.data2 = {
+            "Checks": [{
+                "CheckSlaveTime": {
+                    "Slaves": [slv_time("slave1", lag_time=0),
+                               slv_time("slave2", lag_time=0)]}}]}
+        self.data3 = {
+            "Checks": [{
+                "CheckSlaveTime": {
+                    "Slaves": [slv_time("slave1", lag_time=1)]}}]}
+        self.data4 = {
+            "Checks": [{
+                "CheckSlaveTime": {
+                    "Slaves": [slv_time("slave1", lag_time=1),
+                               slv_time("slave2", lag_time=0)]}}]}
+        self.data5 = {
+            "Checks": [{
+                "CheckSlaveTime": {
+                    "Slaves": [slv_time("slave1", lag_time=0),
+                               slv_time("slave2", lag_time=1)]}}]}
+        self.data6 = {
+            "Checks": [{
+                "CheckSlaveTime": {
+                    "Slaves": [slv_time("slave1", lag_time=1),
+                               slv_time("slave2", lag_time=1)]}}]}
+        self.data7 = {
+            "Checks": [{
+                "CheckSlaveTime": {
+                    "Slaves": [slv_time("slave1", lag_time=0),
+                               slv_time("slave2", lag_time=None)]}}]}
+        self.thr = mysql_rep_admin.SlaveThread("slave1", "Up", "Up")
+        self.err = mysql_rep_admin.SlaveError(
+            "slave1", "Up", mysql_rep_admin.ThreadError("Good"),
+            mysql_rep_admin.ThreadError("Good"))
+        self.other = mysql_rep_admin.SlaveOther("slave1", "Good")
+        self.status = mysql_rep_admin.SlaveStatus("slave1", "OK")
+        self.checks = {"Checks": [
+            {"CheckMasterLog": {"MasterLog": {"Slaves": [self.status]},
+                                "SlaveLogs": [self.status]}},
+            {"CheckSlaveThread": {"Slaves": [self.thr]}},
+            {"CheckSlaveError": {"Slaves": [self.err]}},
+            self.data["Checks"][0],
+            {"CheckSlaveOther": {"Slaves": [self.other]}}]}
+
+    def test_healthy_checks(self):
+
+        """Function:  test_healthy_checks
+
+        Description:  Test with -A options and no problem detected.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_rep_admin.has_problem(self.checks))
+
+    def test_later_check(self):
+
+        """Function:  test_later_check
+
+        Description:  Test with a problem in an option after the first one.
+
+        Arguments:
+
+        """
+
+        self.checks["Checks"].append(self.data3["Checks"][0])
+
+        self.assertTrue(mysql_rep_admin.has_problem(self.checks))
+
+    def test_unexpected_slave(self):
+
+        """Function:  test_unexpected_slave
+
+        Description:  Test with a slave not in the master's slave list.
+
+        Arguments:
+
+        """
+
+        self.data["Checks"][0]["CheckSlaveTime"]["Unexpected"] = [
+            {"Name": "slave9"}]
+
+        self.assertTrue(mysql_rep_admin.has_problem(self.data))
+
+    def test_log_warning(self):
+
+        """Function:  test_log_warning
+
+        Description:  Test with a slave lagging in reading the master log.
+
+        Arguments:
+
+        """
+
+        self.status.status = "Warning:  Slave lagging in reading master log"
+
+        self.assertTrue(mysql_rep_admin.has_problem(self.checks))
+
+    def test_other_bad(self):
+
+        """Function:  test_other_bad
+
+        Description:  Test with a bad status variable on a slave.
+
+        Arguments:
+
+        """
+
+        self.other.status = "Bad"
+
+        self.assertTrue(mysql_rep_admin.has_problem(self.checks))
+
+    def test_thread_error(self):
+
+        """Function:  test_thread_error
+
+        Description:  Test with an error on a slave's SQL thread.
+
+        Arguments:
+
+        """
+
+        self.err.sql = mysql_rep_admin.ThreadError("Bad", 1062)
+
+        self.assertTrue(mysql_rep_admin.has_problem(self.checks))
+
+    def test_thread_down(self):
+
+        """Function:  test_thread_down
+
+        Description:  Test with a slave's IO thread down.
+
+        Arguments:
+
+        """
+
+        self.thr.io_thread = "Down"
+
+        self.assertTrue(mysql_rep_admin.has_problem(self.checks))
+
+    def test_slave_timeout(self):
+
+        """Function:  test_slave_timeout
+
+        Description:  Test with slave missing its budget.
+
+        Arguments:
+
+        """
+
+        self.data["Checks"][0]["Timeouts"] = [
+            {"Name": "slave2", "Status": "TIMEOUT"}]
+
+        self.assertTrue(mysql_rep_admin.has_problem(self.data))
+
+    def test_check_timeout(self):
+
+        """Function:  test_check_timeout
+
+        Description:  Test with -T option missing its budget.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_admin.has_problem(
+            {"Checks": [{"Option": "-T", "Status": "TIMEOUT"}]}))
+
+    def test_missing_slave(self):
+
+        """Function:  test_missing_slave
+
+        Description:  Test with missing slave.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_admin.has_problem(self.data7))
+
+    def test_time_lag_multiple_slaves3(self):
+
+        """Function:  test_time_lag_multiple_slaves3
+
+        Description:  Test with time lag with multiple slaves.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_admin.has_problem(self.data6))
+
+    def test_time_lag_multiple_slaves2(self):
+
+        """Function:  test_time_lag_multiple_slaves2
+
+        Description:  Test with time lag with multiple slaves.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_admin.has_problem(self.data5))
+
+    def test_time_lag_multiple_slaves(self):
+
+        """Function:  test_time_lag_multiple_slaves
+
+        Description:  Test with time lag with multiple slaves.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_admin.has_problem(self.data4))
+
+    def test_time_lag_single_slave(self):
+
+        """Function:  test_time_lag_single_slave
+
+        Description:  Test with time lag with single slave.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_admin.has_problem(self.data3))
+
+    def test_no_time_lag_multiple_slaves(self):
+
+        """Function:  test_no_time_lag_multiple_slaves
+
+        Description:  Test with no time lag with multiple slaves.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_rep_admin.has_problem(self.data2))
+
+    def test_no_time_lag_single_slave(self):
+
+        """Function:  test_no_time_lag_single_slave
+
+        Description:  Test with no time lag with single slave.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_rep_admin.has_problem(self.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
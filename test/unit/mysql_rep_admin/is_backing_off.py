@@ -0,0 +1,109 @@
+# Classification (U)
+
+"""Program:  is_backing_off.py
+
+    Description:  Unit testing of is_backing_off in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/is_backing_off.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_retry_due
+        test_backing_off
+        test_not_in_state
+        test_no_state
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.state = {"Slave1": {"failures": 1, "retry_at": 100.0}}
+
+    def test_retry_due(self):
+
+        """Function:  test_retry_due
+
+        Description:  Test with slave due to be retried.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_rep_admin.is_backing_off(self.state, "Slave1", now=100.0))
+
+    def test_backing_off(self):
+
+        """Function:  test_backing_off
+
+        Description:  Test with slave backing off.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_admin.is_backing_off(self.state, "Slave1", now=99.0))
+
+    def test_not_in_state(self):
+
+        """Function:  test_not_in_state
+
+        Description:  Test with slave not in the state.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_rep_admin.is_backing_off(self.state, "Slave2", now=99.0))
+
+    def test_no_state(self):
+
+        """Function:  test_no_state
+
+        Description:  Test with circuit breaker turned off.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_rep_admin.is_backing_off(None, "Slave1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+# Classification (U)
+
+"""Program:  is_changed.py
+
+    Description:  Unit testing of is_changed in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/is_changed.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_new_state
+        test_new_key
+        test_changed
+        test_no_change
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.key = "-S/CheckSlaveThread/Slaves/slave1"
+        self.state = {self.key: ["slave1", "Up", "Up"]}
+        self.new_state = {}
+
+    def test_new_state(self):
+
+        """Function:  test_new_state
+
+        Description:  Test the status is added to the new state.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.is_changed(
+            self.state, self.new_state, self.key, ["slave1", "Up", "Down"])
+
+        self.assertEqual(
+            self.new_state, {self.key: ["slave1", "Up", "Down"]})
+
+    def test_new_key(self):
+
+        """Function:  test_new_key
+
+        Description:  Test with a key not in the last run's state.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_admin.is_changed(
+                {}, self.new_state, self.key, ["slave1", "Up", "Up"]))
+
+    def test_changed(self):
+
+        """Function:  test_changed
+
+        Description:  Test with the status changed.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_admin.is_changed(
+                self.state, self.new_state, self.key,
+                ["slave1", "Up", "Down"]))
+
+    def test_no_change(self):
+
+        """Function:  test_no_change
+
+        Description:  Test with the status not changed.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_rep_admin.is_changed(
+                self.state, self.new_state, self.key,
+                ["slave1", "Up", "Up"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
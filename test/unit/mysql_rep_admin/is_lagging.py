@@ -0,0 +1,80 @@
+# Classification (U)
+
+"""Program:  is_lagging.py
+
+    Description:  Unit testing of is_lagging in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/is_lagging.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_null_lag
+        test_time_lag
+        test_no_lag
+
+    """
+
+    def test_null_lag(self):
+
+        """Function:  test_null_lag
+
+        Description:  Test with null time lag.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_admin.is_lagging("null"))
+
+    def test_time_lag(self):
+
+        """Function:  test_time_lag
+
+        Description:  Test with time lag.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_admin.is_lagging(10))
+
+    def test_no_lag(self):
+
+        """Function:  test_no_lag
+
+        Description:  Test with no time lag.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_rep_admin.is_lagging(0))
+
+
+if __name__ == "__main__":
+    unittest.main()
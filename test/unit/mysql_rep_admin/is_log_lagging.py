@@ -0,0 +1,211 @@
+# Classification (U)
+
+"""Program:  is_log_lagging.py
+
+    Description:  Unit testing of is_log_lagging in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/is_log_lagging.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_time_null
+        test_time_tolerance_exceeded
+        test_time_tolerance
+        test_diff_log_file
+        test_slave_ahead
+        test_pos_tolerance_exceeded
+        test_pos_tolerance
+        test_no_tolerance
+        test_same_position
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.mst_log = ("binlog.0002", 5000)
+        self.settings = dict(mysql_rep_admin.SETTINGS)
+
+    def test_time_null(self):
+
+        """Function:  test_time_null
+
+        Description:  Test with time tolerance and slave time lag of null.
+
+        Arguments:
+
+        """
+
+        self.settings["time_tolerance"] = 5
+
+        self.assertTrue(
+            mysql_rep_admin.is_log_lagging(
+                self.mst_log, ("binlog.0001", 100), time_lag="null",
+                settings=self.settings))
+
+    def test_time_tolerance_exceeded(self):
+
+        """Function:  test_time_tolerance_exceeded
+
+        Description:  Test with slave time lag outside the time tolerance.
+
+        Arguments:
+
+        """
+
+        self.settings["time_tolerance"] = 5
+
+        self.assertTrue(
+            mysql_rep_admin.is_log_lagging(
+                self.mst_log, ("binlog.0001", 100), time_lag=6,
+                settings=self.settings))
+
+    def test_time_tolerance(self):
+
+        """Function:  test_time_tolerance
+
+        Description:  Test with slave time lag within the time tolerance.
+
+        Arguments:
+
+        """
+
+        self.settings["time_tolerance"] = 5
+
+        self.assertFalse(
+            mysql_rep_admin.is_log_lagging(
+                self.mst_log, ("binlog.0001", 100), time_lag=5,
+                settings=self.settings))
+
+    def test_diff_log_file(self):
+
+        """Function:  test_diff_log_file
+
+        Description:  Test with slave in a different log file.
+
+        Arguments:
+
+        """
+
+        self.settings["pos_tolerance"] = 10000
+
+        self.assertTrue(
+            mysql_rep_admin.is_log_lagging(
+                self.mst_log, ("binlog.0001", 4990), time_lag=0,
+                settings=self.settings))
+
+    def test_slave_ahead(self):
+
+        """Function:  test_slave_ahead
+
+        Description:  Test with slave position ahead of the master.
+
+        Arguments:
+
+        """
+
+        self.settings["pos_tolerance"] = 5
+
+        self.assertFalse(
+            mysql_rep_admin.is_log_lagging(
+                self.mst_log, ("binlog.0002", 5010), time_lag=0,
+                settings=self.settings))
+
+    def test_pos_tolerance_exceeded(self):
+
+        """Function:  test_pos_tolerance_exceeded
+
+        Description:  Test with slave position outside the tolerance.
+
+        Arguments:
+
+        """
+
+        self.settings["pos_tolerance"] = 100
+
+        self.assertTrue(
+            mysql_rep_admin.is_log_lagging(
+                self.mst_log, ("binlog.0002", 4899), time_lag=0,
+                settings=self.settings))
+
+    def test_pos_tolerance(self):
+
+        """Function:  test_pos_tolerance
+
+        Description:  Test with slave position within the tolerance.
+
+        Arguments:
+
+        """
+
+        self.settings["pos_tolerance"] = 100
+
+        self.assertFalse(
+            mysql_rep_admin.is_log_lagging(
+                self.mst_log, ("binlog.0002", 4900), time_lag=0,
+                settings=self.settings))
+
+    def test_no_tolerance(self):
+
+        """Function:  test_no_tolerance
+
+        Description:  Test with default settings and a position difference.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_admin.is_log_lagging(
+                self.mst_log, ("binlog.0002", 4999), time_lag=0))
+
+    def test_same_position(self):
+
+        """Function:  test_same_position
+
+        Description:  Test with slave at the master's position.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_rep_admin.is_log_lagging(
+                self.mst_log, ("binlog.0002", 5000)))
+
+
+if __name__ == "__main__":
+    unittest.main()
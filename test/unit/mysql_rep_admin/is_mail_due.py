@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  is_mail_due.py
+
+    Description:  Unit testing of is_mail_due in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/is_mail_due.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_sent_updated
+        test_not_sent
+        test_rate_over
+        test_new_status
+        test_same_status
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.key = "-T/CheckSlaveTime/Slaves/slave1"
+        self.sent = {self.key: [["Lagging", None], 1000]}
+        self.rate = 300
+
+    def test_sent_updated(self):
+
+        """Function:  test_sent_updated
+
+        Description:  Test the status and time are saved when emailed.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.is_mail_due(
+            self.sent, self.rate, 1100, self.key, [None, None])
+
+        self.assertEqual(self.sent, {self.key: [[None, None], 1100]})
+
+    def test_not_sent(self):
+
+        """Function:  test_not_sent
+
+        Description:  Test with a key not emailed before.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_admin.is_mail_due(
+                {}, self.rate, 1100, self.key, ["Lagging", None]))
+
+    def test_rate_over(self):
+
+        """Function:  test_rate_over
+
+        Description:  Test with the same status emailed before the rate.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_admin.is_mail_due(
+                self.sent, self.rate, 1300, self.key, ["Lagging", None]))
+
+    def test_new_status(self):
+
+        """Function:  test_new_status
+
+        Description:  Test with a new status within the rate.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_admin.is_mail_due(
+                self.sent, self.rate, 1100, self.key, [None, None]))
+
+    def test_same_status(self):
+
+        """Function:  test_same_status
+
+        Description:  Test with the same status within the rate.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mysql_rep_admin.is_mail_due(
+                self.sent, self.rate, 1100, self.key, ["Lagging", None]),
+             self.sent[self.key][1]), (False, 1000))
+
+
+if __name__ == "__main__":
+    unittest.main()
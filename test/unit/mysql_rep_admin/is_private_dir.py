@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  is_private_dir.py
+
+    Description:  Unit testing of is_private_dir in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/is_private_dir.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_missing
+        test_not_directory
+        test_other_access
+        test_private
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test with directory missing.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_rep_admin.is_private_dir(
+            os.path.join(self.tmp_dir, "missing")))
+
+    def test_not_directory(self):
+
+        """Function:  test_not_directory
+
+        Description:  Test with a file in place of the directory.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.tmp_dir, "state")
+
+        with open(fname, mode="w", encoding="UTF-8"):
+            pass
+
+        os.chmod(fname, 0o600)
+
+        self.assertFalse(mysql_rep_admin.is_private_dir(fname))
+
+    def test_other_access(self):
+
+        """Function:  test_other_access
+
+        Description:  Test with directory others can write to.
+
+        Arguments:
+
+        """
+
+        os.chmod(self.tmp_dir, 0o1777)
+
+        self.assertFalse(mysql_rep_admin.is_private_dir(self.tmp_dir))
+
+    def test_private(self):
+
+        """Function:  test_private
+
+        Description:  Test with directory only the user can access.
+
+        Arguments:
+
+        """
+
+        os.chmod(self.tmp_dir, 0o700)
+
+        self.assertTrue(mysql_rep_admin.is_private_dir(self.tmp_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
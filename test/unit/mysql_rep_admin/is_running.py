@@ -0,0 +1,85 @@
+# Classification (U)
+
+"""Program:  is_running.py
+
+    Description:  Unit testing of is_running in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/is_running.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_running
+        test_other_user
+        test_not_running
+
+    """
+
+    def test_running(self):
+
+        """Function:  test_running
+
+        Description:  Test with a running process.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_admin.is_running(os.getpid()))
+
+    @mock.patch("mysql_rep_admin.os.kill",
+                mock.Mock(side_effect=PermissionError))
+    def test_other_user(self):
+
+        """Function:  test_other_user
+
+        Description:  Test with a process running as another user.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(mysql_rep_admin.is_running(1))
+
+    @mock.patch("mysql_rep_admin.os.kill",
+                mock.Mock(side_effect=ProcessLookupError))
+    def test_not_running(self):
+
+        """Function:  test_not_running
+
+        Description:  Test with a process which is not running.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(mysql_rep_admin.is_running(99999))
+
+
+if __name__ == "__main__":
+    unittest.main()
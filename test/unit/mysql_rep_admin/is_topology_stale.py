@@ -0,0 +1,99 @@
+# Classification (U)
+
+"""Program:  is_topology_stale.py
+
+    Description:  Unit testing of is_topology_stale in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/is_topology_stale.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_stale
+        test_current
+        test_no_cache
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.settings = {"discovery_ttl": 3600}
+        self.topology = {"Slaves": [], "Checked": 1000}
+
+    def test_stale(self):
+
+        """Function:  test_stale
+
+        Description:  Test with cache not checked within the time to live.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_admin.is_topology_stale(
+                self.topology, self.settings, now=5000))
+
+    def test_current(self):
+
+        """Function:  test_current
+
+        Description:  Test with cache checked within the time to live.
+
+        Arguments:
+
+        """
+
+        self.assertFalse(
+            mysql_rep_admin.is_topology_stale(
+                self.topology, self.settings, now=2000))
+
+    def test_no_cache(self):
+
+        """Function:  test_no_cache
+
+        Description:  Test with no cached topology.
+
+        Arguments:
+
+        """
+
+        self.assertTrue(
+            mysql_rep_admin.is_topology_stale({}, self.settings, now=2000))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+# Classification (U)
+
+"""Program:  iter_records.py
+
+    Description:  Unit testing of iter_records in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/iter_records.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_records
+        test_record
+        test_nested
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave1 = mysql_rep_admin.SlaveStatus("slave1", "OK")
+        self.slave2 = mysql_rep_admin.SlaveStatus("slave2", "OK")
+
+    def test_no_records(self):
+
+        """Function:  test_no_records
+
+        Description:  Test with results with no records.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_rep_admin.iter_records(
+                {"MasterLog": {"Master": "master", "LogPosition": 10}})), [])
+
+    def test_record(self):
+
+        """Function:  test_record
+
+        Description:  Test with a record.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            list(mysql_rep_admin.iter_records(self.slave1)), [self.slave1])
+
+    def test_nested(self):
+
+        """Function:  test_nested
+
+        Description:  Test with records nested in the results.
+
+        Arguments:
+
+        """
+
+        data = {"CheckMasterLog": {
+            "MasterLog": {"Master": {"Name": "master"},
+                          "Slaves": [self.slave1]},
+            "SlaveLogs": [self.slave2]}}
+
+        self.assertEqual(
+            list(mysql_rep_admin.iter_records(data)),
+            [self.slave1, self.slave2])
+
+
+if __name__ == "__main__":
+    unittest.main()
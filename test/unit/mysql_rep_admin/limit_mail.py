@@ -0,0 +1,184 @@
+# Classification (U)
+
+"""Program:  limit_mail.py
+
+    Description:  Unit testing of limit_mail in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/limit_mail.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        create_data
+        test_expired_removed
+        test_no_records_held
+        test_no_records_due
+        test_some_due
+        test_nothing_due
+        test_first_mail
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave1 = mysql_rep_admin.SlaveThread("slave1", "Up", "Down")
+        self.slave2 = mysql_rep_admin.SlaveThread("slave2", "Up", "Down")
+        self.key1 = "CheckSlaveThread/CheckSlaveThread/Slaves/slave1"
+        self.key2 = "CheckSlaveThread/CheckSlaveThread/Slaves/slave2"
+        self.timeout = {"Option": "-T", "Status": "TIMEOUT"}
+        self.sent = {self.key1: [["slave1", "Up", "Down"], 1000],
+                     self.key2: [["slave2", "Up", "Down"], 1000]}
+        self.rate = 300
+
+    def create_data(self, *checks):
+
+        """Function:  create_data
+
+        Description:  Returns data output results with the checks.
+
+        Arguments:
+
+        """
+
+        return {"Application": "MySQLReplication", "Master": "master",
+                "Checks": list(checks)}
+
+    def test_expired_removed(self):
+
+        """Function:  test_expired_removed
+
+        Description:  Test entries past the rate are removed.
+
+        Arguments:
+
+        """
+
+        self.sent["-B"] = [{"Status": "TIMEOUT"}, 500]
+
+        mysql_rep_admin.limit_mail(
+            self.create_data(), self.sent, self.rate, 1100)
+
+        self.assertEqual(list(self.sent), [self.key1, self.key2])
+
+    def test_no_records_held(self):
+
+        """Function:  test_no_records_held
+
+        Description:  Test with an option with no records emailed within the
+            rate.
+
+        Arguments:
+
+        """
+
+        self.sent["-T"] = [self.timeout, 1000]
+
+        self.assertIsNone(
+            mysql_rep_admin.limit_mail(
+                self.create_data(self.timeout), self.sent, self.rate, 1100))
+
+    def test_no_records_due(self):
+
+        """Function:  test_no_records_due
+
+        Description:  Test with an option with no records not emailed
+            before.
+
+        Arguments:
+
+        """
+
+        data = self.create_data(self.timeout)
+
+        self.assertEqual(
+            mysql_rep_admin.limit_mail(data, self.sent, self.rate, 1100),
+            data)
+
+    def test_some_due(self):
+
+        """Function:  test_some_due
+
+        Description:  Test with only some slaves due to be emailed.
+
+        Arguments:
+
+        """
+
+        self.slave2.sql_thread = "Up"
+        data = self.create_data(
+            {"CheckSlaveThread": {"Slaves": [self.slave1, self.slave2]}})
+
+        self.assertEqual(
+            mysql_rep_admin.limit_mail(
+                data, self.sent, self.rate, 1100)["Checks"],
+            [{"CheckSlaveThread": {"Slaves": [self.slave2]}}])
+
+    def test_nothing_due(self):
+
+        """Function:  test_nothing_due
+
+        Description:  Test with no slaves due to be emailed.
+
+        Arguments:
+
+        """
+
+        data = self.create_data(
+            {"CheckSlaveThread": {"Slaves": [self.slave1, self.slave2]}})
+
+        self.assertIsNone(
+            mysql_rep_admin.limit_mail(data, self.sent, self.rate, 1100))
+
+    def test_first_mail(self):
+
+        """Function:  test_first_mail
+
+        Description:  Test with nothing emailed before.
+
+        Arguments:
+
+        """
+
+        data = self.create_data(
+            {"CheckSlaveThread": {"Slaves": [self.slave1, self.slave2]}},
+            self.timeout)
+
+        self.assertEqual(
+            mysql_rep_admin.limit_mail(data, {}, self.rate, 1100), data)
+
+
+if __name__ == "__main__":
+    unittest.main()
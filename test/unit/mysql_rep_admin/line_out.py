@@ -0,0 +1,279 @@
+# Classification (U)
+
+"""Program:  line_out.py
+
+    Description:  Unit testing of line_out in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/line_out.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import json
+import tempfile
+import shutil
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-b": True, "-z": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        read_lines
+        test_timings_key
+        test_x_option_no_problem
+        test_file_error
+        test_std_out
+        test_write_mode
+        test_append
+        test_record
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.ofile = os.path.join(self.tmp_dir, "line_out.json")
+        self.data = {"Application": "MySQLReplication", "Master": "Master",
+                     "AsOf": "2026-10-18T00:00:00Z", "Checks": []}
+        self.check = {"CheckSlaveThread": {"Slaves": [
+            mysql_rep_admin.SlaveThread("slave1", "Yes", "Yes")]}}
+        self.results = {
+            "Application": "MySQLReplication", "Master": "Master",
+            "AsOf": "2026-10-18T00:00:00Z",
+            "Check": {"CheckSlaveThread": {"Slaves": [
+                {"Name": "slave1", "IOThread": "Yes", "SQLThread": "Yes"}]}}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def read_lines(self):
+
+        """Function:  read_lines
+
+        Description:  Returns the JSON lines in the output file.
+
+        Arguments:
+
+        """
+
+        with open(self.ofile, encoding="UTF-8") as fhdr:
+            return [json.loads(line) for line in fhdr]
+
+    def test_timings_key(self):
+
+        """Function:  test_timings_key
+
+        Description:  Test with the Timings written even with the -x option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-x"] = True
+        self.args.args_array["-o"] = self.ofile
+
+        mysql_rep_admin.line_out(
+            self.data, {"Connect": 0.5}, self.args, key="Timings")
+
+        self.assertEqual(self.read_lines()[0]["Timings"], {"Connect": 0.5})
+
+    def test_x_option_no_problem(self):
+
+        """Function:  test_x_option_no_problem
+
+        Description:  Test with -x option and no problem is not written.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-x"] = True
+        self.args.args_array["-o"] = self.ofile
+        check = {"CheckSlaveTime": {"Slaves": [
+            mysql_rep_admin.SlaveTime("slave1", lag_time=0)]}}
+
+        self.assertEqual(
+            (mysql_rep_admin.line_out(self.data, check, self.args),
+             os.path.isfile(self.ofile)), (None, False))
+
+    @mock.patch("mysql_rep_admin.open", create=True)
+    def test_file_error(self, mock_open):
+
+        """Function:  test_file_error
+
+        Description:  Test with the output file not writable.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-o"] = self.ofile
+
+        mock_open.side_effect = OSError("Permission denied")
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                mysql_rep_admin.line_out(self.data, self.check, self.args),
+                (True, "Permission denied"))
+
+    def test_std_out(self):
+
+        """Function:  test_std_out
+
+        Description:  Test with the JSON line written to standard out.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-z"]
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_std:
+            mysql_rep_admin.line_out(self.data, self.check, self.args)
+
+        self.assertEqual(json.loads(mock_std.getvalue()), self.results)
+
+    def test_write_mode(self):
+
+        """Function:  test_write_mode
+
+        Description:  Test with write mode replaces the output file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-o"] = self.ofile
+
+        mysql_rep_admin.line_out(self.data, self.check, self.args)
+        mysql_rep_admin.line_out(self.data, self.check, self.args, mode="w")
+
+        self.assertEqual(self.read_lines(), [self.results])
+
+    def test_append(self):
+
+        """Function:  test_append
+
+        Description:  Test with one JSON line added for each option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-o"] = self.ofile
+
+        mysql_rep_admin.line_out(self.data, self.check, self.args, mode="w")
+        mysql_rep_admin.line_out(self.data, self.check, self.args)
+
+        self.assertEqual(self.read_lines(), [self.results, self.results])
+
+    def test_record(self):
+
+        """Function:  test_record
+
+        Description:  Test with result records converted to JSON.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-o"] = self.ofile
+
+        mysql_rep_admin.line_out(self.data, self.check, self.args, mode="w")
+
+        self.assertEqual(self.read_lines(), [self.results])
+
+
+if __name__ == "__main__":
+    unittest.main()
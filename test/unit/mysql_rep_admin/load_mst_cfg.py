@@ -0,0 +1,145 @@
+# Classification (U)
+
+"""Program:  load_mst_cfg.py
+
+    Description:  Unit testing of load_mst_cfg in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/load_mst_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {
+            "-c": "mysql_cfg", "-d": "config", "-s": "slave.txt"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class MstCfg():                                         # pylint:disable=R0903
+
+    """Class:  MstCfg
+
+    Description:  Class stub holder for gen_libs.load_module class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "MasterName"
+        self.sid = 11
+        self.user = "UserName"
+        self.japd = None
+        self.serv_os = "Linux"
+        self.host = "HostName"
+        self.port = 3306
+        self.cfg_file = None
+        self.extra_def_file = "mysql.cfg"
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_mst_cfg
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.results = {"name": "MasterName", "sid": 11, "user": "UserName",
+                        "japd": None, "serv_os": "Linux", "host": "HostName",
+                        "port": 3306, "cfg_file": None}
+
+    @mock.patch("mysql_rep_admin.gen_libs.load_module")
+    def test_mst_cfg(self, mock_cfg):
+
+        """Function:  test_mst_cfg
+
+        Description:  Test master configuration entries are returned.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = MstCfg()
+
+        self.assertEqual(
+            mysql_rep_admin.load_mst_cfg(self.args), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
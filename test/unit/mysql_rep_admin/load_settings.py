@@ -0,0 +1,184 @@
+# Classification (U)
+
+"""Program:  load_settings.py
+
+    Description:  Unit testing of load_settings in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/load_settings.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-d": "config"}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class SettingsCfg():                                    # pylint:disable=R0903
+
+    """Class:  SettingsCfg
+
+    Description:  Class stub holder for gen_libs.load_module class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn_workers = 20
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_partial_settings
+        test_settings_file
+        test_default_settings
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.cfg = SettingsCfg()
+
+    @mock.patch("mysql_rep_admin.gen_libs.load_module")
+    def test_partial_settings(self, mock_cfg):
+
+        """Function:  test_partial_settings
+
+        Description:  Test with settings missing from the settings file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-k"] = "rep_admin_cfg"
+
+        mock_cfg.return_value = self.cfg
+
+        self.assertEqual(
+            mysql_rep_admin.load_settings(self.args)["conn_timeout"],
+            mysql_rep_admin.SETTINGS["conn_timeout"])
+
+    @mock.patch("mysql_rep_admin.gen_libs.load_module")
+    def test_settings_file(self, mock_cfg):
+
+        """Function:  test_settings_file
+
+        Description:  Test with settings file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-k"] = "rep_admin_cfg"
+
+        mock_cfg.return_value = self.cfg
+
+        self.assertEqual(
+            mysql_rep_admin.load_settings(self.args)["conn_workers"], 20)
+
+    def test_default_settings(self):
+
+        """Function:  test_default_settings
+
+        Description:  Test with no settings file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.load_settings(self.args),
+            mysql_rep_admin.SETTINGS)
+
+
+if __name__ == "__main__":
+    unittest.main()
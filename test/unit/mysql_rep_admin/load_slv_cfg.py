@@ -0,0 +1,118 @@
+# Classification (U)
+
+"""Program:  load_slv_cfg.py
+
+    Description:  Unit testing of load_slv_cfg in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/load_slv_cfg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():                                      # pylint:disable=R0903
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {
+            "-c": "mysql_cfg", "-d": "config", "-s": "slave.txt"}
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_slv_cfg
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.slv_key = {"sid": "int", "port": "int"}
+        self.cfg_array = [{"name": "SLAVE1", "sid": "11", "port": "3306"}]
+        self.results = [{"name": "SLAVE1", "sid": 11, "port": 3306}]
+
+    @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
+    @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
+    def test_slv_cfg(self, mock_array, mock_transpose):
+
+        """Function:  test_slv_cfg
+
+        Description:  Test slave configurations are returned typed.
+
+        Arguments:
+
+        """
+
+        mock_array.return_value = self.cfg_array
+        mock_transpose.return_value = self.results
+
+        self.assertEqual(
+            (mysql_rep_admin.load_slv_cfg(self.args, self.slv_key),
+             mock_array.call_args, mock_transpose.call_args[0][1]),
+            (self.results, mock.call("slave.txt", cfg_path="config"),
+             self.slv_key))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+# Classification (U)
+
+"""Program:  load_state.py
+
+    Description:  Unit testing of load_state in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/load_state.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        write_file
+        test_not_dict
+        test_bad_json
+        test_missing_file
+        test_load_state
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "breaker.json")
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def write_file(self, text):
+
+        """Function:  write_file
+
+        Description:  Write the text to the state file.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write(text)
+
+    def test_not_dict(self):
+
+        """Function:  test_not_dict
+
+        Description:  Test with state file not containing a dictionary.
+
+        Arguments:
+
+        """
+
+        self.write_file("[1, 2]")
+
+        self.assertEqual(mysql_rep_admin.load_state(self.fname), {})
+
+    def test_bad_json(self):
+
+        """Function:  test_bad_json
+
+        Description:  Test with a corrupt state file.
+
+        Arguments:
+
+        """
+
+        self.write_file("{\"Slave1\": ")
+
+        self.assertEqual(mysql_rep_admin.load_state(self.fname), {})
+
+    def test_missing_file(self):
+
+        """Function:  test_missing_file
+
+        Description:  Test with no state file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.load_state(self.fname), {})
+
+    def test_load_state(self):
+
+        """Function:  test_load_state
+
+        Description:  Test with state file.
+
+        Arguments:
+
+        """
+
+        self.write_file("{\"Slave1\": {\"failures\": 2}}")
+
+        self.assertEqual(
+            mysql_rep_admin.load_state(self.fname),
+            {"Slave1": {"failures": 2}})
+
+
+if __name__ == "__main__":
+    unittest.main()
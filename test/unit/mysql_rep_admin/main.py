@@ -36,12 +36,14 @@ class ArgParser():
 
     Methods:
         __init__
+        arg_exist
         arg_cond_req
         arg_dir_chk
         arg_file_chk
         arg_require
         arg_req_or_lst
         get_args
+        get_args_keys
         get_val
         arg_xor_dict
         arg_parse2
@@ -75,6 +77,18 @@ class ArgParser():
         self.opt_xor_val2 = True
         self.argparse2 = True
 
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
     def arg_cond_req(self, opt_con_req):
 
         """Method:  arg_cond_req
@@ -159,6 +173,18 @@ class ArgParser():
 
         return self.args_array
 
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
     def get_val(self, skey, def_val):
 
         """Method:  get_val
@@ -247,6 +273,7 @@ class UnitTest(unittest.TestCase):
         test_arg_file_true
         test_arg_xor_dict_false
         test_arg_xor_dict_true
+        test_slv_src_false
         test_run_program
         test_programlock_true
         test_programlock_false
@@ -566,6 +593,29 @@ class UnitTest(unittest.TestCase):
 
         self.assertFalse(mysql_rep_admin.main())
 
+    @mock.patch("mysql_rep_admin.run_program")
+    @mock.patch("mysql_rep_admin.gen_libs.help_func",
+                mock.Mock(return_value=False))
+    @mock.patch("mysql_rep_admin.gen_class.ArgParser")
+    def test_slv_src_false(self, mock_arg, mock_run):
+
+        """Function:  test_slv_src_false
+
+        Description:  Test with no source of slaves for a slave option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-c": "mysql_cfg", "-S": True}
+
+        mock_arg.return_value = self.args
+
+        with gen_libs.no_std_out():
+            self.assertFalse(mysql_rep_admin.main())
+
+        self.assertFalse(mock_run.called)
+
     @mock.patch("mysql_rep_admin.run_program", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.gen_libs.help_func",
                 mock.Mock(return_value=False))
@@ -0,0 +1,139 @@
+# Classification (U)
+
+"""Program:  merge_data.py
+
+    Description:  Unit testing of merge_data in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/merge_data.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_change_input
+        test_nested_dict
+        test_list_order
+        test_single_data
+        test_empty_list
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.data = {"CheckSlaveThread": {"Slaves": [{"Name": "Slave1"}]}}
+        self.data2 = {"CheckSlaveThread": {"Slaves": [{"Name": "Slave2"}]}}
+        self.data3 = {"CheckMasterLog": {
+            "MasterLog": {"Master": {"Name": "Master"},
+                          "Slaves": [{"Name": "Slave1"}]},
+            "SlaveLogs": [{"Name": "Slave1"}]}}
+        self.data4 = {"CheckMasterLog": {
+            "MasterLog": {"Master": {"Name": "Master"},
+                          "Slaves": [{"Name": "Slave2"}]},
+            "SlaveLogs": [{"Name": "Slave2"}]}}
+        self.results = {"CheckSlaveThread": {
+            "Slaves": [{"Name": "Slave1"}, {"Name": "Slave2"}]}}
+        self.results2 = {"CheckMasterLog": {
+            "MasterLog": {"Master": {"Name": "Master"},
+                          "Slaves": [{"Name": "Slave1"}, {"Name": "Slave2"}]},
+            "SlaveLogs": [{"Name": "Slave1"}, {"Name": "Slave2"}]}}
+
+    def test_no_change_input(self):
+
+        """Function:  test_no_change_input
+
+        Description:  Test the input data is not changed.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.merge_data([self.data, self.data2])
+
+        self.assertEqual(len(self.data["CheckSlaveThread"]["Slaves"]), 1)
+
+    def test_nested_dict(self):
+
+        """Function:  test_nested_dict
+
+        Description:  Test with nested dictionaries.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.merge_data([self.data3, self.data4]),
+            self.results2)
+
+    def test_list_order(self):
+
+        """Function:  test_list_order
+
+        Description:  Test lists are joined in order.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.merge_data([self.data, self.data2]), self.results)
+
+    def test_single_data(self):
+
+        """Function:  test_single_data
+
+        Description:  Test with a single result.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.merge_data([self.data]), self.data)
+
+    def test_empty_list(self):
+
+        """Function:  test_empty_list
+
+        Description:  Test with empty list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.merge_data([]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -40,7 +40,7 @@ class SlaveRep():
 
     """
 
-    def __init__(self, lag_time=1, conn="Connection Instance"):
+    def __init__(self, lag_time=1, conn="Connection Instance", lag_list=None):
 
         """Method:  __init__
 
@@ -52,6 +52,7 @@ class SlaveRep():
 
         self.lag_time = lag_time
         self.conn = conn
+        self.lag_list = list(lag_list) if lag_list else []
 
     def get_time(self):
 
@@ -75,6 +76,9 @@ class SlaveRep():
 
         """
 
+        if self.lag_list:
+            self.lag_time = self.lag_list.pop(0)
+
         return True
 
 
@@ -86,13 +90,15 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
-        test_mysql_down_std
-        test_mysql_down_json
-        test_lag_one2
+        test_mysql_down
+        test_lag_converge_time
+        test_lag_clears
         test_lag_one
-        test_lag_zero
-        test_lag_none
-        test_lag_json
+        test_lag_null
+        test_deadline
+        test_multiple_slaves
+        test_single_wait
+        test_no_wait
         test_no_lag
 
     """
@@ -109,46 +115,47 @@ class UnitTest(unittest.TestCase):
 
         self.slave = SlaveRep()
         self.slave2 = SlaveRep(lag_time="null")
-        self.slave3 = SlaveRep(lag_time=0)
+        self.slave3 = SlaveRep(lag_list=[3, 0])
         self.slave4 = SlaveRep(lag_time="null", conn=None)
         self.time_lag0 = 0
         self.time_lag1 = 1
         self.time_lag2 = "null"
+        self.poll = {"lag_interval": 0.01, "lag_deadline": 0.05}
 
-    @mock.patch("time.sleep", mock.Mock(return_value=True))
-    def test_mysql_down_std(self):
+    def test_mysql_down(self):
 
-        """Function:  test_mysql_down_std
+        """Function:  test_mysql_down
 
-        Description:  Test with MySQL is down in standard format.
+        Description:  Test with MySQL is down.
 
         Arguments:
 
         """
 
         self.assertEqual(
-            mysql_rep_admin.process_time_lag(self.slave4, self.time_lag2),
-            self.time_lag2)
+            mysql_rep_admin.process_time_lag(
+                [[self.slave4, self.time_lag2]], **self.poll),
+            [{"LagTime": self.time_lag2, "Samples": [self.time_lag2],
+              "ConvergeTime": None}])
 
-    @mock.patch("time.sleep", mock.Mock(return_value=True))
-    def test_mysql_down_json(self):
+    def test_lag_converge_time(self):
 
-        """Function:  test_mysql_down_json
+        """Function:  test_lag_converge_time
 
-        Description:  Test with MySQL is down in JSON format.
+        Description:  Test with time lag clearing records converge time.
 
         Arguments:
 
         """
 
-        self.assertEqual(
-            mysql_rep_admin.process_time_lag(self.slave4, self.time_lag2),
-            self.time_lag2)
+        results = mysql_rep_admin.process_time_lag(
+            [[self.slave3, self.time_lag1]], **self.poll)
 
-    @mock.patch("time.sleep", mock.Mock(return_value=True))
-    def test_lag_one2(self):
+        self.assertGreater(results[0]["ConvergeTime"], 0)
 
-        """Function:  test_lag_one2
+    def test_lag_clears(self):
+
+        """Function:  test_lag_clears
 
         Description:  Test with time lag set to one and then clears.
 
@@ -156,11 +163,13 @@ class UnitTest(unittest.TestCase):
 
         """
 
+        results = mysql_rep_admin.process_time_lag(
+            [[self.slave3, self.time_lag1]], **self.poll)
+
         self.assertEqual(
-            mysql_rep_admin.process_time_lag(self.slave3, self.time_lag1),
-            self.time_lag0)
+            (results[0]["LagTime"], results[0]["Samples"]),
+            (self.time_lag0, [self.time_lag1, 3, self.time_lag0]))
 
-    @mock.patch("time.sleep", mock.Mock(return_value=True))
     def test_lag_one(self):
 
         """Function:  test_lag_one
@@ -171,54 +180,97 @@ class UnitTest(unittest.TestCase):
 
         """
 
+        results = mysql_rep_admin.process_time_lag(
+            [[self.slave, self.time_lag1]], **self.poll)
+
         self.assertEqual(
-            mysql_rep_admin.process_time_lag(self.slave, self.time_lag1),
-            self.time_lag1)
+            (results[0]["LagTime"], results[0]["ConvergeTime"]),
+            (self.time_lag1, None))
 
-    @mock.patch("time.sleep", mock.Mock(return_value=True))
-    def test_lag_zero(self):
+    def test_lag_null(self):
 
-        """Function:  test_lag_zero
+        """Function:  test_lag_null
 
-        Description:  Test with time lag set to zero.
+        Description:  Test with time lag set to null.
 
         Arguments:
 
         """
 
-        self.assertEqual(
-            mysql_rep_admin.process_time_lag(self.slave, self.time_lag0),
-            self.time_lag0)
+        results = mysql_rep_admin.process_time_lag(
+            [[self.slave2, self.time_lag2]], **self.poll)
 
-    @mock.patch("time.sleep", mock.Mock(return_value=True))
-    def test_lag_none(self):
+        self.assertEqual(results[0]["LagTime"], self.time_lag2)
 
-        """Function:  test_lag_none
+    def test_deadline(self):
 
-        Description:  Test with time lag set to None.
+        """Function:  test_deadline
+
+        Description:  Test with sampling stopped at the deadline.
 
         Arguments:
 
         """
 
-        self.assertEqual(
-            mysql_rep_admin.process_time_lag(self.slave2, self.time_lag2),
-            self.time_lag2)
+        results = mysql_rep_admin.process_time_lag(
+            [[self.slave, self.time_lag1]], lag_interval=0.01,
+            lag_deadline=0.03)
 
-    @mock.patch("time.sleep", mock.Mock(return_value=True))
-    def test_lag_json(self):
+        self.assertLessEqual(len(results[0]["Samples"]), 5)
 
-        """Function:  test_lag_json
+    def test_multiple_slaves(self):
 
-        Description:  Test with time lag to JSON.
+        """Function:  test_multiple_slaves
+
+        Description:  Test with multiple slaves with and without time lag.
 
         Arguments:
 
         """
 
+        results = mysql_rep_admin.process_time_lag(
+            [[self.slave, self.time_lag0], [self.slave3, self.time_lag1],
+             [self.slave2, self.time_lag2]], **self.poll)
+
         self.assertEqual(
-            mysql_rep_admin.process_time_lag(self.slave, self.time_lag1),
-            self.time_lag1)
+            [item["LagTime"] for item in results],
+            [self.time_lag0, self.time_lag0, self.time_lag2])
+
+    @mock.patch("mysql_rep_admin.time.sleep")
+    def test_single_wait(self, mock_sleep):
+
+        """Function:  test_single_wait
+
+        Description:  Test with multiple slaves clearing share one wait.
+
+        Arguments:
+
+        """
+
+        mock_sleep.return_value = True
+        slave = SlaveRep(lag_list=[0])
+        slave2 = SlaveRep(lag_time="null", lag_list=[0])
+
+        mysql_rep_admin.process_time_lag(
+            [[slave, self.time_lag1], [slave2, self.time_lag2]], **self.poll)
+
+        mock_sleep.assert_called_once()
+
+    @mock.patch("mysql_rep_admin.time.sleep")
+    def test_no_wait(self, mock_sleep):
+
+        """Function:  test_no_wait
+
+        Description:  Test with no time lag does not wait.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.process_time_lag(
+            [[self.slave, self.time_lag0]], **self.poll)
+
+        mock_sleep.assert_not_called()
 
     def test_no_lag(self):
 
@@ -231,8 +283,10 @@ class UnitTest(unittest.TestCase):
         """
 
         self.assertEqual(
-            mysql_rep_admin.process_time_lag(self.slave, self.time_lag0),
-            self.time_lag0)
+            mysql_rep_admin.process_time_lag(
+                [[self.slave, self.time_lag0]], **self.poll),
+            [{"LagTime": self.time_lag0, "Samples": [self.time_lag0],
+              "ConvergeTime": 0.0}])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,133 @@
+# Classification (U)
+
+"""Program:  prom_out.py
+
+    Description:  Unit testing of prom_out in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/prom_out.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_directory
+        test_replaced
+        test_prom_out
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "mysql_rep_admin.prom")
+        self.checks = [("-S", {"CheckSlaveThread": {"Slaves": [
+            mysql_rep_admin.SlaveThread("slave1", "Up", "Up")]}})]
+
+    def test_no_directory(self):
+
+        """Function:  test_no_directory
+
+        Description:  Test with a metrics directory which does not exist.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.tmp_dir, "missing", "mysql_rep_admin.prom")
+
+        with gen_libs.no_std_out():
+            self.assertTrue(
+                mysql_rep_admin.prom_out(self.checks, [], fname)[0])
+
+    def test_replaced(self):
+
+        """Function:  test_replaced
+
+        Description:  Test the metrics file is replaced and no temporary
+            file is left.
+
+        Arguments:
+
+        """
+
+        with open(self.fname, mode="w", encoding="UTF-8") as f_hdlr:
+            f_hdlr.write("old\n")
+
+        mysql_rep_admin.prom_out(self.checks, [], self.fname, now=1000)
+
+        with open(self.fname, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(
+                (f_hdlr.readline(), os.listdir(self.tmp_dir)),
+                ("# HELP mysql_rep_admin_last_run_timestamp_seconds Time of"
+                 " the last run.\n", ["mysql_rep_admin.prom"]))
+
+    def test_prom_out(self):
+
+        """Function:  test_prom_out
+
+        Description:  Test the metrics are written to the file.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.prom_out(
+                self.checks, [], self.fname, now=1000), (False, None))
+
+        with open(self.fname, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertIn(
+                'mysql_rep_admin_slave_sql_thread_up{slave="slave1",uuid=""}'
+                " 1\n", f_hdlr.read())
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
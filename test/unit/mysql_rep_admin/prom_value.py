@@ -0,0 +1,134 @@
+# Classification (U)
+
+"""Program:  prom_value.py
+
+    Description:  Unit testing of prom_value in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/prom_value.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        test_unset
+        test_bool
+        test_not_number
+        test_number_text
+        test_float
+        test_whole_float
+        test_int
+
+    """
+
+    def test_unset(self):
+
+        """Function:  test_unset
+
+        Description:  Test with an unset value.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_rep_admin.prom_value(mysql_rep_admin.UNSET))
+
+    def test_bool(self):
+
+        """Function:  test_bool
+
+        Description:  Test with a boolean value.
+
+        Arguments:
+
+        """
+
+        self.assertIsNone(mysql_rep_admin.prom_value(True))
+
+    def test_not_number(self):
+
+        """Function:  test_not_number
+
+        Description:  Test with text which is not a number.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            [mysql_rep_admin.prom_value("DOWN"),
+             mysql_rep_admin.prom_value(None)], [None, None])
+
+    def test_number_text(self):
+
+        """Function:  test_number_text
+
+        Description:  Test with a number in text.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.prom_value("12"), "12")
+
+    def test_float(self):
+
+        """Function:  test_float
+
+        Description:  Test with a float value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.prom_value(0.25), "0.25")
+
+    def test_whole_float(self):
+
+        """Function:  test_whole_float
+
+        Description:  Test with a whole number float value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.prom_value(3.0), "3")
+
+    def test_int(self):
+
+        """Function:  test_int
+
+        Description:  Test with an integer value.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.prom_value(123456789), "123456789")
+
+
+if __name__ == "__main__":
+    unittest.main()
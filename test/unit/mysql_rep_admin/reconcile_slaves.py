@@ -0,0 +1,232 @@
+# Classification (U)
+
+"""Program:  reconcile_slaves.py
+
+    Description:  Unit testing of reconcile_slaves in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/reconcile_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class MasterRep():                                      # pylint:disable=R0903
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master_Name"
+        self.slaves = [
+            {"Server_id": 11, "Host": "Slave1", "Replica_UUID": "1"},
+            {"Server_id": 21, "Host": "Slave2", "Replica_UUID": "2"},
+            {"Server_id": 31, "Host": "Slave3", "Replica_UUID": "3"}]
+
+
+class SlaveSnapshot():                                  # pylint:disable=R0903
+
+    """Class:  SlaveSnapshot
+
+    Description:  Class stub holder for mysql_rep_admin.SlaveSnapshot class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self, name, slave_uuid, sid):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.slave_uuid = slave_uuid
+        self.slave = self
+        self.sid = sid
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_slave_file_uuid
+        test_name_mismatch
+        test_down_slv_sid
+        test_unexpected
+        test_missing
+        test_all_matched
+        test_no_master
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = MasterRep()
+        self.slaves = [SlaveSnapshot("Slave1", "1", 11),
+                       SlaveSnapshot("Slave2", "2", 21),
+                       SlaveSnapshot("Slave3", "3", 31)]
+        self.recon = {"Missing": [], "Unexpected": [], "Mismatched": []}
+
+    def test_slave_file_uuid(self):
+
+        """Function:  test_slave_file_uuid
+
+        Description:  Test with the older Slave_UUID and Server_Id keys.
+
+        Arguments:
+
+        """
+
+        self.master.slaves = [
+            {"Server_Id": "11", "Host": "Slave1", "Slave_UUID": "1"}]
+
+        self.assertEqual(
+            mysql_rep_admin.reconcile_slaves(self.master, self.slaves[:1]),
+            self.recon)
+
+    def test_name_mismatch(self):
+
+        """Function:  test_name_mismatch
+
+        Description:  Test with slave name not matching the master's host.
+
+        Arguments:
+
+        """
+
+        self.slaves[1] = SlaveSnapshot("slave2.domain", "2", 21)
+        self.recon["Mismatched"] = [
+            {"Name": "slave2.domain", "Host": "Slave2", "Slave_UUID": "2"}]
+
+        self.assertEqual(
+            mysql_rep_admin.reconcile_slaves(self.master, self.slaves),
+            self.recon)
+
+    def test_down_slv_sid(self):
+
+        """Function:  test_down_slv_sid
+
+        Description:  Test down slave is matched by its server id.
+
+        Arguments:
+
+        """
+
+        self.slaves[2] = SlaveSnapshot("Slave3", None, 31)
+
+        self.assertEqual(
+            mysql_rep_admin.reconcile_slaves(self.master, self.slaves),
+            self.recon)
+
+    def test_unexpected(self):
+
+        """Function:  test_unexpected
+
+        Description:  Test with slave not in the master's slave list.
+
+        Arguments:
+
+        """
+
+        self.slaves.append(SlaveSnapshot("Slave4", None, 41))
+        self.recon["Unexpected"] = [
+            {"Name": "Slave4", "Slave_UUID": "Unknown"}]
+
+        self.assertEqual(
+            mysql_rep_admin.reconcile_slaves(self.master, self.slaves),
+            self.recon)
+
+    def test_missing(self):
+
+        """Function:  test_missing
+
+        Description:  Test with slave in the master's slave list not checked.
+
+        Arguments:
+
+        """
+
+        self.recon["Missing"] = [self.master.slaves[0]]
+
+        self.assertEqual(
+            mysql_rep_admin.reconcile_slaves(self.master, self.slaves[1:]),
+            self.recon)
+
+    def test_all_matched(self):
+
+        """Function:  test_all_matched
+
+        Description:  Test with all slaves matched.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.reconcile_slaves(self.master, self.slaves),
+            self.recon)
+
+    def test_no_master(self):
+
+        """Function:  test_no_master
+
+        Description:  Test with no master instance.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.reconcile_slaves(None, self.slaves), self.recon)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+# Classification (U)
+
+"""Program:  recover_claims.py
+
+    Description:  Unit testing of recover_claims in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/recover_claims.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        touch
+        test_no_directory
+        test_not_claim
+        test_own_claim
+        test_old_claim
+        test_running
+        test_not_running
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def touch(self, name, age=0):
+
+        """Function:  touch
+
+        Description:  Creates a file in the spool directory.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.tmp_dir, name)
+
+        with open(fname, mode="w", encoding="UTF-8"):
+            pass
+
+        mtime = time.time() - age
+        os.utime(fname, (mtime, mtime))
+
+    def test_no_directory(self):
+
+        """Function:  test_no_directory
+
+        Description:  Test with a spool directory which does not exist.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.recover_claims(
+                os.path.join(self.tmp_dir, "missing")), 0)
+
+    @mock.patch("mysql_rep_admin.is_running", mock.Mock(return_value=False))
+    def test_not_claim(self):
+
+        """Function:  test_not_claim
+
+        Description:  Test other spool files are left alone.
+
+        Arguments:
+
+        """
+
+        self.touch("1_1.json")
+        self.touch("1_2.failed")
+        self.touch("1_3.json.abc.tmp")
+
+        self.assertEqual(
+            (mysql_rep_admin.recover_claims(self.tmp_dir),
+             sorted(os.listdir(self.tmp_dir))),
+            (0, ["1_1.json", "1_2.failed", "1_3.json.abc.tmp"]))
+
+    def test_own_claim(self):
+
+        """Function:  test_own_claim
+
+        Description:  Test a claim left by this process is put back.
+
+        Arguments:
+
+        """
+
+        self.touch(f"1_1.json.{os.getpid()}")
+
+        self.assertEqual(
+            (mysql_rep_admin.recover_claims(self.tmp_dir),
+             os.listdir(self.tmp_dir)), (1, ["1_1.json"]))
+
+    @mock.patch("mysql_rep_admin.is_running", mock.Mock(return_value=True))
+    def test_old_claim(self):
+
+        """Function:  test_old_claim
+
+        Description:  Test a claim older than the claim age is put back.
+
+        Arguments:
+
+        """
+
+        self.touch("1_1.json.99999", age=120)
+
+        self.assertEqual(
+            (mysql_rep_admin.recover_claims(self.tmp_dir, claim_age=60),
+             os.listdir(self.tmp_dir)), (1, ["1_1.json"]))
+
+    @mock.patch("mysql_rep_admin.is_running", mock.Mock(return_value=True))
+    def test_running(self):
+
+        """Function:  test_running
+
+        Description:  Test a claim of a running flush is left alone.
+
+        Arguments:
+
+        """
+
+        self.touch("1_1.json.99999")
+
+        self.assertEqual(
+            (mysql_rep_admin.recover_claims(self.tmp_dir),
+             os.listdir(self.tmp_dir)), (0, ["1_1.json.99999"]))
+
+    @mock.patch("mysql_rep_admin.is_running", mock.Mock(return_value=False))
+    def test_not_running(self):
+
+        """Function:  test_not_running
+
+        Description:  Test a claim of a flush which died is put back.
+
+        Arguments:
+
+        """
+
+        self.touch("1_1.json.99999")
+
+        self.assertEqual(
+            (mysql_rep_admin.recover_claims(self.tmp_dir),
+             os.listdir(self.tmp_dir)), (1, ["1_1.json"]))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,385 @@
+# Classification (U)
+
+"""Program:  refresh_status.py
+
+    Description:  Unit testing of refresh_status in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/refresh_status.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Conn():                                           # pylint:disable=R0903
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql connection.
+
+    Methods:
+        close
+
+    """
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub method holder for close.
+
+        Arguments:
+
+        """
+
+
+class Server():
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.MasterRep and
+        mysql_class.SlaveRep classes.
+
+    Methods:
+        __init__
+        is_connected
+        connect
+        upd_mst_status
+        upd_slv_status
+
+    """
+
+    def __init__(self, connected=True, reconnect=True, name="Server_Name"):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.connected = connected
+        self.reconnect = reconnect
+        self.conn = Conn()
+        self.conn_msg = None
+        self.error = None
+        self.conn_cnt = 0
+        self.upd_cnt = 0
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub method holder for Server.is_connected.
+
+        Arguments:
+
+        """
+
+        return self.connected and self.conn is not None
+
+    def connect(self, silent=False):
+
+        """Method:  connect
+
+        Description:  Stub method holder for Server.connect.
+
+        Arguments:
+
+        """
+
+        self.conn_cnt += 1
+        self.connected = self.reconnect
+
+        return silent
+
+    def upd_mst_status(self):
+
+        """Method:  upd_mst_status
+
+        Description:  Stub method holder for MasterRep.upd_mst_status.
+
+        Arguments:
+
+        """
+
+        self.upd_cnt += 1
+
+    def upd_slv_status(self):
+
+        """Method:  upd_slv_status
+
+        Description:  Stub method holder for SlaveRep.upd_slv_status.
+
+        Arguments:
+
+        """
+
+        if self.error:
+            raise self.error
+
+        self.upd_cnt += 1
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_slave_cfg
+        test_backing_off
+        test_reconnect_failed
+        test_reconnect_dropped
+        test_master_closed
+        test_master_abandoned
+        test_connected
+        test_no_master
+        test_update_error
+        test_run_deadline
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = Server()
+        self.slave = Server()
+        self.slave2 = Server(connected=False, name="Slave2")
+        self.new_slave = Server(name="Slave2")
+        self.slv_cfg = [{"name": "Slave2"}]
+
+    def test_no_slave_cfg(self):
+
+        """Function:  test_no_slave_cfg
+
+        Description:  Test a dropped slave with no configuration is left
+            down.
+
+        Arguments:
+
+        """
+
+        slaves = [self.slave2]
+
+        self.assertEqual(
+            (mysql_rep_admin.refresh_status(self.master, slaves), slaves),
+            ([], [self.slave2]))
+
+    @mock.patch("mysql_rep_admin.create_down_slv")
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    def test_backing_off(self, mock_slv, mock_down):
+
+        """Function:  test_backing_off
+
+        Description:  Test a slave backing off is not reconnected.
+
+        Arguments:
+
+        """
+
+        breaker = {"Slave2": {"failures": 1, "retry_at": time.time() + 60}}
+
+        self.slave2.conn_msg = mysql_rep_admin.SKIP_MSG
+
+        mock_down.return_value = self.slave2
+
+        self.assertEqual(
+            (mysql_rep_admin.refresh_status(
+                self.master, [self.slave2], breaker=breaker,
+                slv_cfg=self.slv_cfg), mock_slv.called,
+             mock_down.call_args[0][1]),
+            ([], False, mysql_rep_admin.SKIP_MSG))
+
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    def test_reconnect_failed(self, mock_slv):
+
+        """Function:  test_reconnect_failed
+
+        Description:  Test with a slave which fails to reconnect.
+
+        Arguments:
+
+        """
+
+        self.new_slave.connected = False
+
+        mock_slv.return_value = [self.new_slave]
+
+        self.assertEqual(
+            (mysql_rep_admin.refresh_status(
+                self.master, [self.slave2], slv_cfg=self.slv_cfg),
+             self.new_slave.upd_cnt), ([self.new_slave], 0))
+
+    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    def test_reconnect_dropped(self, mock_slv):
+
+        """Function:  test_reconnect_dropped
+
+        Description:  Test only the dropped slave is reconnected and replaced
+            in the slave list.
+
+        Arguments:
+
+        """
+
+        slaves = [self.slave, self.slave2]
+
+        mock_slv.return_value = [self.new_slave]
+
+        mysql_rep_admin.refresh_status(
+            self.master, slaves, slv_cfg=self.slv_cfg)
+
+        self.assertEqual(
+            (slaves, mock_slv.call_args[0][0], self.slave.upd_cnt,
+             self.new_slave.upd_cnt),
+            ([self.slave, self.new_slave], self.slv_cfg, 1, 1))
+
+    def test_master_closed(self):
+
+        """Function:  test_master_closed
+
+        Description:  Test master is reconnected once its abandoned queries
+            have finished.
+
+        Arguments:
+
+        """
+
+        self.master.connected = False
+        self.master.conn_msg = mysql_rep_admin.CLOSED_MSG
+
+        mysql_rep_admin.refresh_status(self.master, [self.slave])
+
+        self.assertEqual(
+            (self.master.conn_cnt, self.master.upd_cnt, self.master.conn_msg),
+            (1, 1, None))
+
+    def test_master_abandoned(self):
+
+        """Function:  test_master_abandoned
+
+        Description:  Test master is not reconnected while its abandoned
+            queries are still running.
+
+        Arguments:
+
+        """
+
+        self.master.connected = False
+        self.master.conn_msg = mysql_rep_admin.ABANDON_MSG
+
+        mysql_rep_admin.refresh_status(self.master, [self.slave])
+
+        self.assertEqual(
+            (self.master.conn_cnt, self.master.upd_cnt, self.slave.upd_cnt),
+            (0, 0, 1))
+
+    def test_connected(self):
+
+        """Function:  test_connected
+
+        Description:  Test with all instances connected.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.refresh_status(self.master, [self.slave])
+
+        self.assertEqual(
+            (self.master.conn_cnt, self.master.upd_cnt, self.slave.upd_cnt),
+            (0, 1, 1))
+
+    def test_no_master(self):
+
+        """Function:  test_no_master
+
+        Description:  Test with no master instance.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.refresh_status(None, [self.slave])
+
+        self.assertEqual(self.slave.upd_cnt, 1)
+
+    def test_update_error(self):
+
+        """Function:  test_update_error
+
+        Description:  Test a slave whose status update fails is dropped and
+            the other instances are still updated.
+
+        Arguments:
+
+        """
+
+        self.slave.error = ValueError("Lost connection")
+        slave2 = Server(name="Slave2")
+
+        with gen_libs.no_std_out():
+            mysql_rep_admin.refresh_status(self.master, [self.slave, slave2])
+
+        self.assertEqual(
+            (self.slave.is_connected(), self.slave.conn_msg,
+             self.master.upd_cnt, slave2.upd_cnt),
+            (False, mysql_rep_admin.CLOSED_MSG, 1, 1))
+
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    def test_run_deadline(self, mock_conn):
+
+        """Function:  test_run_deadline
+
+        Description:  Test the reconnects are bounded by the run deadline
+            and no status is updated once it has passed.
+
+        Arguments:
+
+        """
+
+        deadline = time.time() - 1
+
+        mock_conn.return_value = [self.new_slave]
+
+        mysql_rep_admin.refresh_status(
+            self.master, [self.slave2], slv_cfg=self.slv_cfg,
+            deadline=deadline)
+
+        self.assertEqual(
+            (mock_conn.call_args[1]["deadline"], self.master.upd_cnt,
+             self.new_slave.upd_cnt), (deadline, 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -154,7 +154,8 @@ class UnitTest(unittest.TestCase):
         slave.connected = False
 
         self.assertEqual(
-            mysql_rep_admin.rpt_slv_log(slaves=[slave]), self.results4)
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.rpt_slv_log(slaves=[slave])), self.results4)
 
     def test_no_slaves(self):
 
@@ -168,7 +169,8 @@ class UnitTest(unittest.TestCase):
 
         with gen_libs.no_std_out():
             self.assertEqual(
-                mysql_rep_admin.rpt_slv_log(slaves=[]), self.results)
+                mysql_rep_admin.to_json(
+                    mysql_rep_admin.rpt_slv_log(slaves=[])), self.results)
 
     def test_slave(self):
 
@@ -183,7 +185,8 @@ class UnitTest(unittest.TestCase):
         slave = SlaveRep()
 
         self.assertEqual(
-            mysql_rep_admin.rpt_slv_log(slaves=[slave]), self.results2)
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.rpt_slv_log(slaves=[slave])), self.results2)
 
     def test_gtid(self):
 
@@ -198,7 +201,8 @@ class UnitTest(unittest.TestCase):
         slave = SlaveRep(gtid_mode="ON")
 
         self.assertEqual(
-            mysql_rep_admin.rpt_slv_log(slaves=[slave]), self.results3)
+            mysql_rep_admin.to_json(
+                mysql_rep_admin.rpt_slv_log(slaves=[slave])), self.results3)
 
 
 if __name__ == "__main__":
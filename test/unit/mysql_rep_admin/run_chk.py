@@ -0,0 +1,207 @@
+# Classification (U)
+
+"""Program:  run_chk.py
+
+    Description:  Unit testing of run_chk in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/run_chk.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def chk_slv_thr(**kwargs):
+
+    """Method:  chk_slv_thr
+
+    Description:  Function stub holder for mysql_rep_admin.chk_slv_thr.
+
+    Arguments:
+
+    """
+
+    time.sleep(kwargs.get("delay", 0))
+
+    return {"CheckSlaveThread": {"Slaves": kwargs.get("slaves")}}
+
+
+class SlaveSnapshot():                                  # pylint:disable=R0903
+
+    """Class:  SlaveSnapshot
+
+    Description:  Class stub holder for mysql_rep_admin.SlaveSnapshot class.
+
+    Methods:
+        __init__
+        get_name
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+
+    def get_name(self):
+
+        """Method:  get_name
+
+        Description:  Stub method holder for SlaveSnapshot.get_name.
+
+        Arguments:
+
+        """
+
+        return self.name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timings
+        test_slave_timings
+        test_deadline_passed
+        test_timeout
+        test_within_budget
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.func_dict = {"-S": chk_slv_thr}
+        self.settings = dict(mysql_rep_admin.SETTINGS)
+        self.results = {"CheckSlaveThread": {"Slaves": ["Slave1"]}}
+        self.results2 = {"Option": "-S", "Status": "TIMEOUT"}
+
+    def test_timings(self):
+
+        """Function:  test_timings
+
+        Description:  Test the option is timed.
+
+        Arguments:
+
+        """
+
+        timings = {}
+
+        mysql_rep_admin.run_chk(
+            "-S", self.func_dict, slaves=["Slave1"], settings=self.settings,
+            delay=0.05, timings=timings)
+
+        self.assertGreaterEqual(timings["Checks"]["-S"], 0.05)
+
+    def test_slave_timings(self):
+
+        """Function:  test_slave_timings
+
+        Description:  Test a -A option is timed for each slave and the slave
+            results are merged.
+
+        Arguments:
+
+        """
+
+        timings = {}
+        slaves = [SlaveSnapshot("Slave1"), SlaveSnapshot("Slave2")]
+        self.func_dict["-A"] = ["-S"]
+
+        data = mysql_rep_admin.run_chk(
+            "-S", self.func_dict, slaves=slaves, settings=self.settings,
+            timings=timings)
+
+        self.assertEqual(
+            (data, sorted(timings["Slaves"]), list(timings["Checks"])),
+            ({"CheckSlaveThread": {"Slaves": slaves}}, ["Slave1", "Slave2"],
+             ["-S"]))
+
+    def test_deadline_passed(self):
+
+        """Function:  test_deadline_passed
+
+        Description:  Test with the run deadline already passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.run_chk(
+                "-S", self.func_dict, slaves=["Slave1"],
+                settings=self.settings, deadline=time.time() - 1),
+            self.results2)
+
+    def test_timeout(self):
+
+        """Function:  test_timeout
+
+        Description:  Test with option missing its budget.
+
+        Arguments:
+
+        """
+
+        self.settings["chk_budget"] = 0.05
+
+        self.assertEqual(
+            mysql_rep_admin.run_chk(
+                "-S", self.func_dict, slaves=["Slave1"],
+                settings=self.settings, delay=0.5), self.results2)
+
+    def test_within_budget(self):
+
+        """Function:  test_within_budget
+
+        Description:  Test with option finishing within its budget.
+
+        Arguments:
+
+        """
+
+        self.settings["chk_budget"] = 5
+
+        self.assertEqual(
+            mysql_rep_admin.run_chk(
+                "-S", self.func_dict, slaves=["Slave1"],
+                settings=self.settings), self.results)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,261 @@
+# Classification (U)
+
+"""Program:  run_chk_async.py
+
+    Description:  Unit testing of run_chk_async in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/run_chk_async.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def chk_slv_thr(**kwargs):
+
+    """Method:  chk_slv_thr
+
+    Description:  Function stub holder for mysql_rep_admin.chk_slv_thr.
+
+    Arguments:
+
+    """
+
+    for slv in kwargs.get("slaves"):
+        time.sleep(slv.delay)
+
+    return {"CheckSlaveThread": {
+        "Slaves": [slv.name for slv in kwargs.get("slaves")]}}
+
+
+def chk_slv_time(**kwargs):
+
+    """Method:  chk_slv_time
+
+    Description:  Function stub holder for mysql_rep_admin.chk_slv_time.
+
+    Arguments:
+
+    """
+
+    return {"CheckSlaveTime": {
+        "Slaves": [{"Name": slv.name} for slv in kwargs.get("slaves")]}}
+
+
+def rpt_slv_log(**kwargs):
+
+    """Method:  rpt_slv_log
+
+    Description:  Function stub holder for mysql_rep_admin.rpt_slv_log.
+
+    Arguments:
+
+    """
+
+    return {"SlaveLogs": [slv.name for slv in kwargs.get("slaves")]}
+
+
+class SlaveRep():
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        get_name
+
+    """
+
+    def __init__(self, name, delay=0):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.delay = delay
+
+    def get_name(self):
+
+        """Method:  get_name
+
+        Description:  Stub method holder for SlaveRep.get_name.
+
+        Arguments:
+
+        """
+
+        return self.name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_all_slaves_timeout
+        test_slave_timeout
+        test_miss_slaves
+        test_other_option
+        test_opt_order
+        test_no_slaves
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slaves = [SlaveRep("Slave1"), SlaveRep("Slave2")]
+        self.func_dict = {"-A": ["-S", "-T"], "-S": chk_slv_thr,
+                          "-T": chk_slv_time, "-D": rpt_slv_log}
+        self.miss_slv = [{"Slave_UUID": "3", "LagTime": "UNK"}]
+        self.settings = dict(mysql_rep_admin.SETTINGS)
+
+    def test_all_slaves_timeout(self):
+
+        """Function:  test_all_slaves_timeout
+
+        Description:  Test with all slaves missing their budget.
+
+        Arguments:
+
+        """
+
+        self.settings["slv_budget"] = 0.05
+        self.slaves[0].delay = 0.5
+        self.slaves[1].delay = 0.5
+
+        self.assertEqual(
+            mysql_rep_admin.to_json(mysql_rep_admin.run_chk_async(
+                ["-S"], self.func_dict, None, self.slaves,
+                settings=self.settings)),
+            [{"Option": "-S", "Status": "TIMEOUT", "Timeouts": [
+                {"Name": "Slave1", "Status": "TIMEOUT"},
+                {"Name": "Slave2", "Status": "TIMEOUT"}]}])
+
+    def test_slave_timeout(self):
+
+        """Function:  test_slave_timeout
+
+        Description:  Test with slave missing its budget.
+
+        Arguments:
+
+        """
+
+        self.settings["slv_budget"] = 0.05
+        self.slaves[0].delay = 0.5
+
+        self.assertEqual(
+            mysql_rep_admin.to_json(mysql_rep_admin.run_chk_async(
+                ["-S"], self.func_dict, None, self.slaves,
+                settings=self.settings)),
+            [{"CheckSlaveThread": {"Slaves": ["Slave2"]},
+              "Timeouts": [{"Name": "Slave1", "Status": "TIMEOUT"}]}])
+
+    @mock.patch("mysql_rep_admin.add_miss_slaves")
+    def test_miss_slaves(self, mock_miss):
+
+        """Function:  test_miss_slaves
+
+        Description:  Test missing slaves are added once after merging.
+
+        Arguments:
+
+        """
+
+        mock_miss.side_effect = lambda master, data, slaves: {
+            "CheckSlaveTime": {
+                "Slaves": data["CheckSlaveTime"]["Slaves"] + self.miss_slv}}
+
+        self.assertEqual(
+            (mysql_rep_admin.run_chk_async(
+                ["-T"], self.func_dict, None, self.slaves),
+             mock_miss.call_args[0][2]),
+            ([{"CheckSlaveTime": {"Slaves": [
+                {"Name": "Slave1"}, {"Name": "Slave2"}] + self.miss_slv}}],
+             self.slaves))
+
+    def test_other_option(self):
+
+        """Function:  test_other_option
+
+        Description:  Test with option not under the all option.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.run_chk_async(
+                ["-S", "-D"], self.func_dict, None, self.slaves),
+            [{"CheckSlaveThread": {"Slaves": ["Slave1", "Slave2"]}},
+             {"SlaveLogs": ["Slave1", "Slave2"]}])
+
+    def test_opt_order(self):
+
+        """Function:  test_opt_order
+
+        Description:  Test results are in option order.
+
+        Arguments:
+
+        """
+
+        results = mysql_rep_admin.run_chk_async(
+            ["-D", "-S"], self.func_dict, None, self.slaves)
+
+        self.assertEqual(
+            [list(item.keys())[0] for item in results],
+            ["SlaveLogs", "CheckSlaveThread"])
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.run_chk_async(
+                ["-S"], self.func_dict, None, []),
+            [{"CheckSlaveThread": {"Slaves": []}}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+# Classification (U)
+
+"""Program:  run_chk_slaves.py
+
+    Description:  Unit testing of run_chk_slaves in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/run_chk_slaves.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def chk_slv_time(**kwargs):
+
+    """Method:  chk_slv_time
+
+    Description:  Function stub holder for mysql_rep_admin.chk_slv_time.
+
+    Arguments:
+
+    """
+
+    return {"CheckSlaveTime": {"Slaves": [
+        slv.get_name() for slv in kwargs.get("slaves")]}}
+
+
+class SlaveSnapshot():                                  # pylint:disable=R0903
+
+    """Class:  SlaveSnapshot
+
+    Description:  Class stub holder for mysql_rep_admin.SlaveSnapshot class.
+
+    Methods:
+        __init__
+        get_name
+
+    """
+
+    def __init__(self, name):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+
+    def get_name(self):
+
+        """Method:  get_name
+
+        Description:  Stub method holder for SlaveSnapshot.get_name.
+
+        Arguments:
+
+        """
+
+        return self.name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_merged
+        test_miss_slaves
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.func_dict = {"-T": chk_slv_time}
+        self.slaves = [SlaveSnapshot("Slave1"), SlaveSnapshot("Slave2")]
+        self.timings = {}
+
+    @mock.patch("mysql_rep_admin.add_miss_slaves")
+    def test_merged(self, mock_miss):
+
+        """Function:  test_merged
+
+        Description:  Test each slave is timed and the results are merged.
+
+        Arguments:
+
+        """
+
+        mock_miss.side_effect = lambda master, data, slaves: data
+
+        self.assertEqual(
+            (mysql_rep_admin.run_chk_slaves(
+                "-T", self.func_dict, slaves=self.slaves,
+                timings=self.timings), sorted(self.timings["Slaves"])),
+            ({"CheckSlaveTime": {"Slaves": ["Slave1", "Slave2"]}},
+             ["Slave1", "Slave2"]))
+
+    @mock.patch("mysql_rep_admin.add_miss_slaves")
+    def test_miss_slaves(self, mock_miss):
+
+        """Function:  test_miss_slaves
+
+        Description:  Test the master's slave list is reconciled once for
+            the merged Check Slave Time results.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.run_chk_slaves(
+            "-T", self.func_dict, master="Master", slaves=self.slaves,
+            timings=self.timings)
+
+        mock_miss.assert_called_once_with(
+            "Master", {"CheckSlaveTime": {"Slaves": ["Slave1", "Slave2"]}},
+            self.slaves)
+
+
+if __name__ == "__main__":
+    unittest.main()
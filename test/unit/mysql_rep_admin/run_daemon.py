@@ -0,0 +1,236 @@
+# Classification (U)
+
+"""Program:  run_daemon.py
+
+    Description:  Unit testing of run_daemon in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/run_daemon.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_refresh_error
+        test_cycle_error
+        test_cycle_latency
+        test_flush_spool
+        test_interrupted
+        test_refresh_between_cycles
+        test_cycles
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = "ArgParser"
+        self.func_dict = {"-S": True}
+        self.settings = dict(mysql_rep_admin.SETTINGS)
+        self.settings["daemon_cycles"] = 3
+
+    @mock.patch("mysql_rep_admin.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.refresh_status")
+    def test_refresh_error(self, mock_refresh):
+
+        """Function:  test_refresh_error
+
+        Description:  Test an error refreshing the status does not stop the
+            daemon.
+
+        Arguments:
+
+        """
+
+        mock_refresh.side_effect = [OSError("Lost connection"), []]
+
+        with gen_libs.no_std_out():
+            mysql_rep_admin.run_daemon(
+                self.args, self.func_dict, None, [], settings=self.settings,
+                interval=1)
+
+        self.assertEqual(mock_refresh.call_count, 2)
+
+    @mock.patch("mysql_rep_admin.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.refresh_status", mock.Mock(return_value=[]))
+    @mock.patch("mysql_rep_admin.call_run_chk")
+    def test_cycle_error(self, mock_chk):
+
+        """Function:  test_cycle_error
+
+        Description:  Test an error in a cycle does not stop the daemon.
+
+        Arguments:
+
+        """
+
+        mock_chk.side_effect = [ValueError("Query failed"), True, True]
+
+        with gen_libs.no_std_out():
+            mysql_rep_admin.run_daemon(
+                self.args, self.func_dict, None, [], settings=self.settings,
+                interval=1)
+
+        self.assertEqual(mock_chk.call_count, 3)
+
+    @mock.patch("mysql_rep_admin.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.refresh_status", mock.Mock())
+    @mock.patch("mysql_rep_admin.call_run_chk")
+    def test_cycle_latency(self, mock_chk):
+
+        """Function:  test_cycle_latency
+
+        Description:  Test each cycle has its own query latency histograms.
+
+        Arguments:
+
+        """
+
+        latency = {}
+        seen = []
+
+        def run_chk(*args, **kwargs):               # pylint:disable=W0613
+
+            """Function:  run_chk
+
+            Description:  Stub holder for mysql_rep_admin.call_run_chk.
+
+            Arguments:
+
+            """
+
+            seen.append(dict(kwargs["latency"]))
+            mysql_rep_admin.add_latency(kwargs["latency"], "master", 0.002)
+
+        mock_chk.side_effect = run_chk
+
+        mysql_rep_admin.run_daemon(
+            self.args, self.func_dict, None, [], settings=self.settings,
+            interval=1, latency=latency)
+
+        self.assertEqual((seen, latency), ([{}, {}, {}], {}))
+
+    @mock.patch("mysql_rep_admin.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.refresh_status", mock.Mock())
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.flush_spool")
+    def test_flush_spool(self, mock_flush):
+
+        """Function:  test_flush_spool
+
+        Description:  Test the mail spool is flushed after each cycle.
+
+        Arguments:
+
+        """
+
+        self.settings["mail_spool"] = "/spool"
+
+        mysql_rep_admin.run_daemon(
+            self.args, self.func_dict, None, [], settings=self.settings,
+            interval=1)
+
+        self.assertEqual(
+            mock_flush.call_args_list, [mock.call("/spool", retries=5)] * 3)
+
+    @mock.patch("mysql_rep_admin.refresh_status", mock.Mock())
+    @mock.patch("mysql_rep_admin.time.sleep")
+    @mock.patch("mysql_rep_admin.call_run_chk")
+    def test_interrupted(self, mock_chk, mock_sleep):
+
+        """Function:  test_interrupted
+
+        Description:  Test with daemon mode interrupted.
+
+        Arguments:
+
+        """
+
+        self.settings["daemon_cycles"] = None
+
+        mock_chk.return_value = True
+        mock_sleep.side_effect = [True, KeyboardInterrupt]
+
+        with gen_libs.no_std_out():
+            mysql_rep_admin.run_daemon(
+                self.args, self.func_dict, None, [], settings=self.settings,
+                interval=1)
+
+        self.assertEqual(mock_chk.call_count, 2)
+
+    @mock.patch("mysql_rep_admin.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.refresh_status")
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    def test_refresh_between_cycles(self, mock_refresh):
+
+        """Function:  test_refresh_between_cycles
+
+        Description:  Test status is refreshed between each cycle.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.run_daemon(
+            self.args, self.func_dict, None, [], settings=self.settings,
+            interval=1)
+
+        self.assertEqual(mock_refresh.call_count, 2)
+
+    @mock.patch("mysql_rep_admin.time.sleep", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.refresh_status", mock.Mock())
+    @mock.patch("mysql_rep_admin.call_run_chk")
+    def test_cycles(self, mock_chk):
+
+        """Function:  test_cycles
+
+        Description:  Test daemon mode stops after the number of cycles.
+
+        Arguments:
+
+        """
+
+        mock_chk.return_value = True
+
+        mysql_rep_admin.run_daemon(
+            self.args, self.func_dict, None, [], settings=self.settings,
+            interval=1)
+
+        self.assertEqual(mock_chk.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
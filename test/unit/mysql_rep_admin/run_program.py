@@ -17,6 +17,7 @@
 import sys
 import os
 import unittest
+import time
 import mock
 
 # Local
@@ -59,6 +60,8 @@ class ArgParser():
     Methods:
         __init__
         arg_exist
+        get_args
+        get_args_keys
         get_val
 
     """
@@ -88,6 +91,30 @@ class ArgParser():
 
         return arg in self.args_array
 
+    def get_args(self):
+
+        """Method:  get_args
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args.
+
+        Arguments:
+
+        """
+
+        return self.args_array
+
+    def get_args_keys(self):
+
+        """Method:  get_args_keys
+
+        Description:  Method stub holder for gen_class.ArgParser.get_args_keys.
+
+        Arguments:
+
+        """
+
+        return list(self.args_array.keys())
+
     def get_val(self, skey, def_val=None):
 
         """Method:  get_val
@@ -101,7 +128,7 @@ class ArgParser():
         return self.args_array.get(skey, def_val)
 
 
-class SlaveRep():                                       # pylint:disable=R0903
+class SlaveRep():
 
     """Class:  SlaveRep
 
@@ -109,6 +136,7 @@ class SlaveRep():                                       # pylint:disable=R0903
 
     Methods:
         __init__
+        is_connected
 
     """
 
@@ -142,6 +170,19 @@ class SlaveRep():                                       # pylint:disable=R0903
         self.port = kwargs.get("port", None)
         self.cfg_file = kwargs.get("cfg_file", None)
         self.conn = "Connection Handler"
+        self.conn_msg = None
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub method holder for SlaveRep.is_connected.
+
+        Arguments:
+
+        """
+
+        return bool(self.conn)
 
 
 class MasterRep():                                      # pylint:disable=R0903
@@ -245,6 +286,8 @@ class UnitTest(unittest.TestCase):
 
     Methods:
         setUp
+        test_flush_no_spool
+        test_flush_only
         test_master_connect_fail
         test_master_connect_good
         test_master_down
@@ -253,6 +296,18 @@ class UnitTest(unittest.TestCase):
         test_no_master
         test_no_slaves
         test_single_func
+        test_daemon_mode
+        test_breaker_saved
+        test_breaker_off
+        test_breaker_not_tried
+        test_breaker_not_private
+        test_master_not_used
+        test_slaves_not_used
+        test_discover_cached
+        test_discover_not_private
+        test_discover_stale
+        test_cfg_cached
+        test_cfg_not_private
 
     """
 
@@ -272,6 +327,7 @@ class UnitTest(unittest.TestCase):
         self.slave2 = SlaveRep()
         self.slv_array = [self.slave1, self.slave2]
         self.func_list = {"-D": rpt_slv_log}
+        self.inst_dict = {"-B": ["master"], "-S": ["slaves"]}
         self.args = ArgParser()
         self.cfg_array = [{"name": "HOST_NAME", "japd": "japd",
                            "cfg_file": "None", "host": "SERVER",
@@ -290,6 +346,49 @@ class UnitTest(unittest.TestCase):
                             "user": "root", "serv_os": "Linux", "sid": 21,
                             "port": 3306}]
 
+    @mock.patch("mysql_rep_admin.call_run_chk")
+    @mock.patch("mysql_rep_admin.flush_spool")
+    def test_flush_no_spool(self, mock_flush, mock_chk):
+
+        """Function:  test_flush_no_spool
+
+        Description:  Test with -F option and no mail_spool setting.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-d": "config", "-F": True}
+
+        with gen_libs.no_std_out():
+            mysql_rep_admin.run_program(self.args, self.func_list)
+
+        self.assertEqual((mock_flush.called, mock_chk.called), (False, False))
+
+    @mock.patch("mysql_rep_admin.call_run_chk")
+    @mock.patch("mysql_rep_admin.flush_spool")
+    @mock.patch("mysql_rep_admin.load_settings")
+    def test_flush_only(self, mock_settings, mock_flush, mock_chk):
+
+        """Function:  test_flush_only
+
+        Description:  Test with -F option and no other option only flushes
+            the mail spool.
+
+        Arguments:
+
+        """
+
+        self.args.args_array = {"-d": "config", "-F": True}
+
+        mock_settings.return_value = dict(
+            mysql_rep_admin.SETTINGS, mail_spool="/spool")
+
+        mysql_rep_admin.run_program(self.args, self.func_list)
+
+        mock_flush.assert_called_once_with("/spool", retries=5)
+        mock_chk.assert_not_called()
+
     @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
     @mock.patch("mysql_rep_admin.gen_libs.load_module")
     def test_master_conn_fail(self, mock_cfg, mock_rep):
@@ -315,7 +414,9 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
-    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.load_state", mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_admin.connect_slaves")
     @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
     @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
     @mock.patch("mysql_rep_admin.gen_libs.load_module")
@@ -343,7 +444,9 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
-    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.load_state", mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_admin.connect_slaves")
     @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
     @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
     @mock.patch("mysql_rep_admin.gen_libs.load_module")
@@ -372,7 +475,9 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
-    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.load_state", mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_admin.connect_slaves")
     @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
     @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
     @mock.patch("mysql_rep_admin.gen_libs.load_module")
@@ -402,7 +507,9 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
-    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.load_state", mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_admin.connect_slaves")
     @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
     @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
     @mock.patch("mysql_rep_admin.gen_libs.load_module")
@@ -431,7 +538,9 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
-    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.load_state", mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_admin.connect_slaves")
     @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
     def test_no_master(self, mock_array, mock_slv, mock_transpose):
 
@@ -480,7 +589,9 @@ class UnitTest(unittest.TestCase):
                 mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
     @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
-    @mock.patch("mysql_rep_admin.mysql_libs.create_slv_array")
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.load_state", mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_admin.connect_slaves")
     @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
     @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
     @mock.patch("mysql_rep_admin.gen_libs.load_module")
@@ -504,6 +615,440 @@ class UnitTest(unittest.TestCase):
         self.assertFalse(
             mysql_rep_admin.run_program(self.args, self.func_list))
 
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.run_daemon")
+    @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.load_state", mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
+    @mock.patch("mysql_rep_admin.gen_libs.load_module")
+    def test_daemon_mode(                               # pylint:disable=R0913
+            self, mock_cfg, mock_array, mock_rep, mock_slv, mock_transpose,
+            mock_daemon):
+
+        """Function:  test_daemon_mode
+
+        Description:  Test with -l option for daemon mode.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-l"] = "60"
+
+        mock_transpose.return_value = self.cfg_array2
+        mock_cfg.return_value = self.mstcfg
+        mock_array.return_value = self.cfg_array
+        mock_rep.return_value = self.master
+        mock_slv.return_value = self.slv_array
+        mock_daemon.return_value = self.slv_array
+
+        mysql_rep_admin.run_program(self.args, self.func_list)
+
+        mock_daemon.assert_called_once()
+
+    @mock.patch("mysql_rep_admin.get_private_file",
+                mock.Mock(return_value="/state/state.json"))
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
+    @mock.patch("mysql_rep_admin.save_state")
+    @mock.patch("mysql_rep_admin.load_state")
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
+    def test_breaker_saved(                             # pylint:disable=R0913
+            self, mock_array, mock_slv, mock_load, mock_save,
+            mock_transpose):
+
+        """Function:  test_breaker_saved
+
+        Description:  Test circuit breaker is closed for connected slaves.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-c"]
+
+        mock_array.return_value = self.cfg_array
+        mock_transpose.return_value = self.cfg_array2
+        mock_slv.return_value = self.slv_array
+        mock_load.side_effect = [{}, {None: {"failures": 1, "retry_at": 0}}]
+
+        mysql_rep_admin.run_program(self.args, self.func_list)
+
+        self.assertEqual(mock_save.call_args[0][1], {})
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.load_settings")
+    @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
+    @mock.patch("mysql_rep_admin.save_state")
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
+    def test_breaker_off(                               # pylint:disable=R0913
+            self, mock_array, mock_slv, mock_save, mock_transpose,
+            mock_settings):
+
+        """Function:  test_breaker_off
+
+        Description:  Test with circuit breaker turned off.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-c"]
+        settings = dict(mysql_rep_admin.SETTINGS)
+        settings["backoff_base"] = 0
+
+        mock_array.return_value = self.cfg_array
+        mock_transpose.return_value = self.cfg_array2
+        mock_slv.return_value = self.slv_array
+        mock_settings.return_value = settings
+
+        mysql_rep_admin.run_program(self.args, self.func_list)
+
+        mock_save.assert_not_called()
+
+    @mock.patch("mysql_rep_admin.get_private_file",
+                mock.Mock(return_value="/state/state.json"))
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
+    @mock.patch("mysql_rep_admin.save_state")
+    @mock.patch("mysql_rep_admin.load_state")
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
+    def test_breaker_not_tried(                         # pylint:disable=R0913
+            self, mock_array, mock_slv, mock_load, mock_save,
+            mock_transpose):
+
+        """Function:  test_breaker_not_tried
+
+        Description:  Test slaves not started before the run deadline are
+            not counted as failures by the circuit breaker.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-c"]
+        self.slave1.conn = None
+        self.slave1.conn_msg = mysql_rep_admin.DEADLINE_MSG
+
+        mock_array.return_value = self.cfg_array
+        mock_transpose.return_value = self.cfg_array2
+        mock_slv.return_value = [self.slave1]
+        mock_load.side_effect = [{}, {}]
+
+        mysql_rep_admin.run_program(self.args, self.func_list)
+
+        self.assertEqual(mock_save.call_args[0][1], {})
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.get_private_file",
+                mock.Mock(return_value=None))
+    @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
+    @mock.patch("mysql_rep_admin.save_state")
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
+    def test_breaker_not_private(                       # pylint:disable=R0913
+            self, mock_array, mock_slv, mock_save, mock_transpose):
+
+        """Function:  test_breaker_not_private
+
+        Description:  Test circuit breaker is not used without a private
+            state directory.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-c"]
+
+        mock_array.return_value = self.cfg_array
+        mock_transpose.return_value = self.cfg_array2
+        mock_slv.return_value = self.slv_array
+
+        mysql_rep_admin.run_program(self.args, self.func_list)
+
+        self.assertEqual(
+            (mock_slv.call_args[1]["breaker"], mock_save.called),
+            (None, False))
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.call_run_chk")
+    @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.load_state", mock.Mock(return_value={}))
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
+    @mock.patch("mysql_rep_admin.gen_libs.load_module")
+    def test_master_not_used(                           # pylint:disable=R0913
+            self, mock_cfg, mock_array, mock_rep, mock_slv, mock_transpose,
+            mock_call):
+
+        """Function:  test_master_not_used
+
+        Description:  Test master is not connected to for a slave only
+            option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-S"] = True
+
+        mock_cfg.return_value = self.mstcfg
+        mock_array.return_value = self.cfg_array
+        mock_transpose.return_value = self.cfg_array2
+        mock_slv.return_value = self.slv_array
+
+        mysql_rep_admin.run_program(
+            self.args, {"-S": rpt_slv_log}, inst_dict=self.inst_dict)
+
+        mock_rep.assert_not_called()
+        self.assertEqual(
+            (mock_call.call_args[0][2], mock_call.call_args[1]["mst_name"]),
+            (None, "MasterName"))
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_admin.gen_libs.load_module")
+    def test_slaves_not_used(self, mock_cfg, mock_rep, mock_slv):
+
+        """Function:  test_slaves_not_used
+
+        Description:  Test slaves are not connected to for a master only
+            option.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-B"] = True
+
+        mock_cfg.return_value = self.mstcfg
+        mock_rep.return_value = self.master
+
+        mysql_rep_admin.run_program(
+            self.args, {"-B": rpt_slv_log}, inst_dict=self.inst_dict)
+
+        mock_slv.assert_not_called()
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.get_private_file",
+                mock.Mock(return_value="/state/topology.json"))
+    @mock.patch("mysql_rep_admin.discover_slaves")
+    @mock.patch("mysql_rep_admin.load_state")
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_admin.gen_libs.load_module")
+    def test_discover_cached(                           # pylint:disable=R0913
+            self, mock_cfg, mock_rep, mock_slv, mock_load, mock_discover):
+
+        """Function:  test_discover_cached
+
+        Description:  Test master is not connected to with a current cached
+            topology for a slave only option.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-s"]
+        self.args.args_array["-i"] = "slave_template"
+        self.args.args_array["-S"] = True
+
+        mock_cfg.return_value = self.mstcfg
+        mock_load.return_value = {"Slaves": [], "Checked": time.time()}
+        mock_discover.return_value = self.cfg_array2
+        mock_slv.return_value = self.slv_array
+
+        mysql_rep_admin.run_program(
+            self.args, {"-S": rpt_slv_log}, inst_dict=self.inst_dict)
+
+        mock_rep.assert_not_called()
+        self.assertEqual(
+            (mock_discover.call_args[0][0], mock_slv.call_args[0][0]),
+            (None, self.cfg_array2))
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.get_private_file",
+                mock.Mock(return_value=None))
+    @mock.patch("mysql_rep_admin.discover_slaves")
+    @mock.patch("mysql_rep_admin.load_state")
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_admin.gen_libs.load_module")
+    def test_discover_not_private(                      # pylint:disable=R0913
+            self, mock_cfg, mock_rep, mock_slv, mock_load, mock_discover):
+
+        """Function:  test_discover_not_private
+
+        Description:  Test master is connected to for a slave only option
+            when the topology cache is not in a private state directory.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-s"]
+        self.args.args_array["-i"] = "slave_template"
+        self.args.args_array["-S"] = True
+
+        mock_cfg.return_value = self.mstcfg
+        mock_rep.return_value = self.master
+        mock_load.return_value = {"Slaves": [], "Checked": time.time()}
+        mock_discover.return_value = self.cfg_array2
+        mock_slv.return_value = self.slv_array
+
+        mysql_rep_admin.run_program(
+            self.args, {"-S": rpt_slv_log}, inst_dict=self.inst_dict)
+
+        self.assertEqual(
+            (mock_discover.call_args[0][0], mock_discover.call_args[0][2],
+             mock_discover.call_args[1]["fname"]), (self.master, {}, None))
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.save_state", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.discover_slaves")
+    @mock.patch("mysql_rep_admin.load_state")
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_admin.gen_libs.load_module")
+    def test_discover_stale(                            # pylint:disable=R0913
+            self, mock_cfg, mock_rep, mock_slv, mock_load, mock_discover):
+
+        """Function:  test_discover_stale
+
+        Description:  Test master is connected to with a stale cached
+            topology for a slave only option.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-s"]
+        self.args.args_array["-i"] = "slave_template"
+        self.args.args_array["-S"] = True
+
+        mock_cfg.return_value = self.mstcfg
+        mock_rep.return_value = self.master
+        mock_load.return_value = {}
+        mock_discover.return_value = self.cfg_array2
+        mock_slv.return_value = self.slv_array
+
+        mysql_rep_admin.run_program(
+            self.args, {"-S": rpt_slv_log}, inst_dict=self.inst_dict)
+
+        self.assertEqual(mock_discover.call_args[0][0], self.master)
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.get_cfg_key", mock.Mock(return_value=[1, 2]))
+    @mock.patch("mysql_rep_admin.get_private_file",
+                mock.Mock(return_value="/state/config.json"))
+    @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
+    @mock.patch("mysql_rep_admin.save_state")
+    @mock.patch("mysql_rep_admin.load_state")
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_admin.gen_libs.create_cfg_array")
+    @mock.patch("mysql_rep_admin.gen_libs.load_module")
+    def test_cfg_cached(                                # pylint:disable=R0913
+            self, mock_cfg, mock_array, mock_rep, mock_slv, mock_load,
+            mock_save, mock_transpose):
+
+        """Function:  test_cfg_cached
+
+        Description:  Test unchanged configuration files are not parsed.
+
+        Arguments:
+
+        """
+
+        mst_file = os.path.abspath(os.path.join("config", "mysql_cfg.py"))
+        slv_file = os.path.abspath(os.path.join("config", "slaves.txt"))
+        self.mstcfg.japd = "mst_japd"
+        mst_data = {key: getattr(self.mstcfg, key)
+                    for key in mysql_rep_admin.MST_KEYS}
+        cache = {mst_file: {"Key": [1, 2], "Data": mst_data},
+                 slv_file: {"Key": [1, 2], "Data": self.cfg_array2}}
+
+        mock_load.side_effect = [cache, {}]
+        mock_rep.return_value = self.master
+        mock_slv.return_value = self.slv_array
+
+        mysql_rep_admin.run_program(self.args, self.func_list)
+
+        mock_cfg.assert_not_called()
+        mock_array.assert_not_called()
+        mock_transpose.assert_not_called()
+        self.assertEqual(
+            (mock_rep.call_args[0][3], mock_slv.call_args[0][0],
+             mock_save.call_count), ("mst_japd", self.cfg_array2, 1))
+
+    @mock.patch("mysql_rep_admin.mysql_libs.disconnect",
+                mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.call_run_chk", mock.Mock(return_value=True))
+    @mock.patch("mysql_rep_admin.connect_slaves")
+    @mock.patch("mysql_rep_admin.get_cfg_key", mock.Mock(return_value=[1, 2]))
+    @mock.patch("mysql_rep_admin.get_private_file",
+                mock.Mock(return_value=None))
+    @mock.patch("mysql_rep_admin.gen_libs.transpose_dict")
+    @mock.patch("mysql_rep_admin.save_state")
+    @mock.patch("mysql_rep_admin.load_state")
+    @mock.patch("mysql_rep_admin.mysql_class.MasterRep")
+    @mock.patch("mysql_rep_admin.gen_libs.load_module")
+    def test_cfg_not_private(                           # pylint:disable=R0913
+            self, mock_cfg, mock_rep, mock_load, mock_save, mock_transpose,
+            mock_slv):
+
+        """Function:  test_cfg_not_private
+
+        Description:  Test configuration cache is not used without a
+            private state directory.
+
+        Arguments:
+
+        """
+
+        mock_cfg.return_value = self.mstcfg
+        mock_load.return_value = {}
+        mock_rep.return_value = self.master
+        mock_transpose.return_value = self.cfg_array2
+        mock_slv.return_value = self.slv_array
+
+        mysql_rep_admin.run_program(self.args, self.func_list)
+
+        self.assertEqual(
+            [call[0][0] for call in mock_load.call_args_list +
+             mock_save.call_args_list if "config" in call[0][0]], [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,188 @@
+# Classification (U)
+
+"""Program:  run_slv_chk.py
+
+    Description:  Unit testing of run_slv_chk in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/run_slv_chk.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def chk_slv_thr(**kwargs):
+
+    """Method:  chk_slv_thr
+
+    Description:  Function stub holder for mysql_rep_admin.chk_slv_thr.
+
+    Arguments:
+
+    """
+
+    return {"CheckSlaveThread": {
+        "Slaves": [slv.name for slv in kwargs.get("slaves")]}}
+
+
+def chk_slv_time(**kwargs):
+
+    """Method:  chk_slv_time
+
+    Description:  Function stub holder for mysql_rep_admin.chk_slv_time.
+
+    Arguments:
+
+    """
+
+    return {"CheckSlaveTime": {"MissSlaves": kwargs.get("miss_slaves")}}
+
+
+class SlaveRep():                                       # pylint:disable=R0903
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        get_name
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave_Name"
+
+    def get_name(self):
+
+        """Method:  get_name
+
+        Description:  Stub holder for SlaveRep.get_name method.
+
+        Arguments:
+
+        """
+
+        return self.name
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_timings
+        test_no_miss_slaves
+        test_single_slave
+        test_opt_order
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep()
+        self.func_dict = {"-S": chk_slv_thr, "-T": chk_slv_time}
+
+    def test_timings(self):
+
+        """Function:  test_timings
+
+        Description:  Test each option is timed for the slave.
+
+        Arguments:
+
+        """
+
+        timings = {}
+
+        mysql_rep_admin.run_slv_chk(
+            ["-T", "-S"], self.func_dict, None, self.slave, timings=timings)
+
+        self.assertEqual(
+            list(timings["Slaves"]["Slave_Name"].keys()), ["-T", "-S"])
+
+    def test_no_miss_slaves(self):
+
+        """Function:  test_no_miss_slaves
+
+        Description:  Test missing slaves are not added for a single slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.run_slv_chk(
+                ["-T"], self.func_dict, None, self.slave),
+            [{"CheckSlaveTime": {"MissSlaves": False}}])
+
+    def test_single_slave(self):
+
+        """Function:  test_single_slave
+
+        Description:  Test options are only passed the single slave.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.run_slv_chk(
+                ["-S"], self.func_dict, None, self.slave),
+            [{"CheckSlaveThread": {"Slaves": ["Slave_Name"]}}])
+
+    def test_opt_order(self):
+
+        """Function:  test_opt_order
+
+        Description:  Test results are in option order.
+
+        Arguments:
+
+        """
+
+        results = mysql_rep_admin.run_slv_chk(
+            ["-T", "-S"], self.func_dict, None, self.slave)
+
+        self.assertEqual(
+            [list(item.keys())[0] for item in results],
+            ["CheckSlaveTime", "CheckSlaveThread"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,248 @@
+# Classification (U)
+
+"""Program:  run_with_budget.py
+
+    Description:  Unit testing of run_with_budget in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/run_with_budget.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import time
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def slow_func():
+
+    """Function:  slow_func
+
+    Description:  Function stub which takes longer than its budget.
+
+    Arguments:
+
+    """
+
+    time.sleep(0.5)
+
+    return "Result"
+
+
+def raise_error():
+
+    """Function:  raise_error
+
+    Description:  Function stub which raises an exception.
+
+    Arguments:
+
+    """
+
+    raise ValueError("Error Message")
+
+
+class Conn():                                           # pylint:disable=R0903
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql connection.
+
+    Methods:
+        __init__
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.closed = threading.Event()
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub method holder for close.
+
+        Arguments:
+
+        """
+
+        self.closed.set()
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.conn = Conn()
+        self.conn_msg = None
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_exception
+        test_deadline_passed
+        test_missed_budget
+        test_dropped_conn
+        test_within_budget
+        test_no_budget
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.thread = None
+
+    def test_exception(self):
+
+        """Function:  test_exception
+
+        Description:  Test exception is raised in the calling thread.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mysql_rep_admin.run_with_budget(raise_error, 1)
+
+    def test_deadline_passed(self):
+
+        """Function:  test_deadline_passed
+
+        Description:  Test with the run deadline already passed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.run_with_budget(
+                slow_func, None, deadline=time.time() - 1), (False, None))
+
+    def test_missed_budget(self):
+
+        """Function:  test_missed_budget
+
+        Description:  Test with function missing its budget.
+
+        Arguments:
+
+        """
+
+        start = time.time()
+
+        self.assertEqual(
+            (mysql_rep_admin.run_with_budget(slow_func, 0.05),
+             time.time() - start < 0.4), ((False, None), True))
+
+    def test_dropped_conn(self):
+
+        """Function:  test_dropped_conn
+
+        Description:  Test the connections of a function missing its budget
+            are dropped and closed once the function finishes.
+
+        Arguments:
+
+        """
+
+        server = Server()
+        conn = server.conn
+        release = threading.Event()
+        result = mysql_rep_admin.run_with_budget(
+            release.wait, 0.05, servers=[server])
+        dropped = (server.conn, server.conn_msg, conn.closed.is_set())
+        release.set()
+
+        self.assertEqual(
+            (result, dropped, conn.closed.wait(2), server.conn_msg),
+            ((False, None), (None, mysql_rep_admin.ABANDON_MSG, False), True,
+             mysql_rep_admin.CLOSED_MSG))
+
+    def test_within_budget(self):
+
+        """Function:  test_within_budget
+
+        Description:  Test with function finishing within its budget.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.run_with_budget(lambda: "Result", 5),
+            (True, "Result"))
+
+    def test_no_budget(self):
+
+        """Function:  test_no_budget
+
+        Description:  Test function is called directly with no budget.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.run_with_budget(
+                threading.current_thread, None),
+            (True, threading.current_thread()))
+
+
+if __name__ == "__main__":
+    unittest.main()
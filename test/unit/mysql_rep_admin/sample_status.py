@@ -0,0 +1,374 @@
+# Classification (U)
+
+"""Program:  sample_status.py
+
+    Description:  Unit testing of sample_status in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/sample_status.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import threading
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Conn():                                           # pylint:disable=R0903
+
+    """Class:  Conn
+
+    Description:  Class stub holder for a mysql connection.
+
+    Methods:
+        __init__
+        close
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.closed = threading.Event()
+
+    def close(self):
+
+        """Method:  close
+
+        Description:  Stub method holder for close.
+
+        Arguments:
+
+        """
+
+        self.closed.set()
+
+
+class MasterRep():
+
+    """Class:  MasterRep
+
+    Description:  Class stub holder for mysql_class.MasterRep class.
+
+    Methods:
+        __init__
+        is_connected
+        upd_mst_status
+
+    """
+
+    def __init__(self, barrier=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Master_Name"
+        self.barrier = barrier
+        self.updated = False
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub method holder for MasterRep.is_connected.
+
+        Arguments:
+
+        """
+
+        return True
+
+    def upd_mst_status(self):
+
+        """Method:  upd_mst_status
+
+        Description:  Stub method holder for MasterRep.upd_mst_status.
+
+        Arguments:
+
+        """
+
+        if self.barrier:
+            self.barrier.wait(timeout=5)
+
+        self.updated = True
+
+
+class SlaveRep():
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        is_connected
+        upd_slv_status
+
+    """
+
+    def __init__(self, barrier=None, connected=True, release=None,
+                 error=None):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave_Name"
+        self.barrier = barrier
+        self.connected = connected
+        self.release = release
+        self.error = error
+        self.updated = False
+        self.conn = Conn()
+        self.conn_msg = None
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub method holder for SlaveRep.is_connected.
+
+        Arguments:
+
+        """
+
+        return self.connected
+
+    def upd_slv_status(self):
+
+        """Method:  upd_slv_status
+
+        Description:  Stub method holder for SlaveRep.upd_slv_status.
+
+        Arguments:
+
+        """
+
+        if self.barrier:
+            self.barrier.wait(timeout=5)
+
+        if self.release:
+            self.release.wait(timeout=5)
+
+        if self.error:
+            raise self.error
+
+        self.updated = True
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_concurrent
+        test_slave_down
+        test_capture_times
+        test_missed_budget
+        test_no_budget_left
+        test_no_slaves
+        test_no_master
+        test_update_error
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.master = MasterRep()
+        self.slave = SlaveRep()
+        self.slave2 = SlaveRep(connected=False)
+
+    def test_concurrent(self):
+
+        """Function:  test_concurrent
+
+        Description:  Test the master and slaves are updated at the same
+            time.
+
+        Arguments:
+
+        """
+
+        barrier = threading.Barrier(3)
+        master = MasterRep(barrier=barrier)
+        slaves = [SlaveRep(barrier=barrier), SlaveRep(barrier=barrier)]
+
+        mysql_rep_admin.sample_status(master, slaves)
+
+        self.assertFalse(barrier.broken)
+
+    def test_slave_down(self):
+
+        """Function:  test_slave_down
+
+        Description:  Test with slave not connected.
+
+        Arguments:
+
+        """
+
+        _, slv_times = mysql_rep_admin.sample_status(
+            self.master, [self.slave, self.slave2], workers=1)
+
+        self.assertEqual(
+            (slv_times[1], self.slave2.updated, self.slave.updated),
+            (None, False, True))
+
+    def test_capture_times(self):
+
+        """Function:  test_capture_times
+
+        Description:  Test the capture times are returned.
+
+        Arguments:
+
+        """
+
+        mst_time, slv_times = mysql_rep_admin.sample_status(
+            self.master, [self.slave])
+
+        self.assertTrue(
+            isinstance(mst_time, float) and isinstance(slv_times[0], float))
+
+    def test_missed_budget(self):
+
+        """Function:  test_missed_budget
+
+        Description:  Test a slave missing the budget is abandoned and its
+            connection closed once its status update finishes.
+
+        Arguments:
+
+        """
+
+        release = threading.Event()
+        slave = SlaveRep(release=release)
+        conn = slave.conn
+        mst_time, slv_times = mysql_rep_admin.sample_status(
+            self.master, [self.slave, slave], budget=0.1)
+        dropped = (slave.conn, slave.conn_msg, conn.closed.is_set())
+        release.set()
+
+        self.assertEqual(
+            (isinstance(mst_time, float), isinstance(slv_times[0], float),
+             slv_times[1], dropped, conn.closed.wait(5), slave.conn_msg),
+            (True, True, None, (None, mysql_rep_admin.ABANDON_MSG, False),
+             True, mysql_rep_admin.CLOSED_MSG))
+
+    def test_no_budget_left(self):
+
+        """Function:  test_no_budget_left
+
+        Description:  Test no status is updated with no budget left.
+
+        Arguments:
+
+        """
+
+        mst_time, slv_times = mysql_rep_admin.sample_status(
+            self.master, [self.slave], budget=0)
+
+        self.assertEqual(
+            (mst_time, slv_times, self.master.updated, self.slave.updated),
+            (None, [None], False, False))
+
+    def test_no_slaves(self):
+
+        """Function:  test_no_slaves
+
+        Description:  Test with no slaves.
+
+        Arguments:
+
+        """
+
+        _, slv_times = mysql_rep_admin.sample_status(self.master, [])
+
+        self.assertEqual((slv_times, self.master.updated), ([], True))
+
+
+    def test_no_master(self):
+
+        """Function:  test_no_master
+
+        Description:  Test with no master instance.
+
+        Arguments:
+
+        """
+
+        mst_time, slv_times = mysql_rep_admin.sample_status(
+            None, [self.slave])
+
+        self.assertEqual(
+            (mst_time, isinstance(slv_times[0], float)), (None, True))
+
+    def test_update_error(self):
+
+        """Function:  test_update_error
+
+        Description:  Test a slave whose status update fails has its
+            connection closed and the other instances are still updated.
+
+        Arguments:
+
+        """
+
+        slave = SlaveRep(error=ValueError("Lost connection"))
+        conn = slave.conn
+
+        with gen_libs.no_std_out():
+            mst_time, slv_times = mysql_rep_admin.sample_status(
+                self.master, [slave, self.slave])
+
+        self.assertEqual(
+            (isinstance(mst_time, float), slv_times[0],
+             isinstance(slv_times[1], float), slave.conn,
+             slave.conn_msg, conn.closed.is_set()),
+            (True, None, True, None, mysql_rep_admin.CLOSED_MSG, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+# Classification (U)
+
+"""Program:  save_state.py
+
+    Description:  Unit testing of save_state in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/save_state.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+import json
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        test_no_directory
+        test_status
+        test_no_tmp_file
+        test_tmp_link
+        test_file_perms
+        test_save_state
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.fname = os.path.join(self.tmp_dir, "breaker.json")
+        self.state = {"Slave1": {"failures": 1, "retry_at": 100.0}}
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def test_no_directory(self):
+
+        """Function:  test_no_directory
+
+        Description:  Test with state directory missing.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.tmp_dir, "missing", "breaker.json")
+
+        with gen_libs.no_std_out():
+            mysql_rep_admin.save_state(fname, self.state)
+
+        self.assertFalse(os.path.exists(fname))
+
+    def test_status(self):
+
+        """Function:  test_status
+
+        Description:  Test the status of the save is returned.
+
+        Arguments:
+
+        """
+
+        fname = os.path.join(self.tmp_dir, "missing", "breaker.json")
+
+        with gen_libs.no_std_out():
+            self.assertEqual(
+                (mysql_rep_admin.save_state(self.fname, self.state),
+                 mysql_rep_admin.save_state(fname, self.state)),
+                (True, False))
+
+    def test_no_tmp_file(self):
+
+        """Function:  test_no_tmp_file
+
+        Description:  Test temporary file is moved into place.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.save_state(self.fname, self.state)
+
+        self.assertEqual(os.listdir(self.tmp_dir), ["breaker.json"])
+
+    def test_tmp_link(self):
+
+        """Function:  test_tmp_link
+
+        Description:  Test a link at the old temporary file name is not
+            written through.
+
+        Arguments:
+
+        """
+
+        target = os.path.join(self.tmp_dir, "target.json")
+        os.symlink(target, self.fname + ".tmp")
+        mysql_rep_admin.save_state(self.fname, self.state)
+
+        self.assertEqual(
+            (os.path.exists(target), os.path.islink(self.fname)),
+            (False, False))
+
+    def test_file_perms(self):
+
+        """Function:  test_file_perms
+
+        Description:  Test state file is only readable by the owner.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.save_state(self.fname, self.state)
+
+        self.assertEqual(os.stat(self.fname).st_mode & 0o777, 0o600)
+
+    def test_save_state(self):
+
+        """Function:  test_save_state
+
+        Description:  Test state is saved to the state file.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.save_state(self.fname, self.state)
+
+        with open(self.fname, mode="r", encoding="UTF-8") as f_hdlr:
+            self.assertEqual(json.load(f_hdlr), self.state)
+
+
+if __name__ == "__main__":
+    unittest.main()
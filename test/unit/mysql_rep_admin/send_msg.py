@@ -0,0 +1,215 @@
+# Classification (U)
+
+"""Program:  send_msg.py
+
+    Description:  Unit testing of send_msg in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/send_msg.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import gzip
+import json
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Mail2():
+
+    """Class:  Mail2
+
+    Description:  Class stub holder for gen_class.Mail2 class.
+
+    Methods:
+        __init__
+        add_attachment
+        send_email
+
+    """
+
+    sent = []
+
+    def __init__(self, subj, to_addr):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.subj = subj
+        self.to_addr = to_addr
+        self.attach = {}
+
+    def add_attachment(self, fname, ftype, data):
+
+        """Method:  add_attachment
+
+        Description:  Stub method holder for Mail2.add_attachment, a json
+            attachment is serialized as in the Mail2 class.
+
+        Arguments:
+
+        """
+
+        self.attach[fname] = json.dumps(data) if ftype == "json" else data
+
+    def send_email(self):
+
+        """Method:  send_email
+
+        Description:  Stub method holder for Mail2.send_email.
+
+        Arguments:
+
+        """
+
+        Mail2.sent.append(self)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_gzip_attachment
+        test_attachment
+        test_attachment_text
+        test_mailx
+        test_body
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.msg = {"Subject": "SubjectLine", "To": ["toaddr"],
+                    "Text": '{"Status": "ok"}', "Attachment": None,
+                    "Mailx": False}
+
+    @mock.patch("mysql_rep_admin.gen_class.Mail2")
+    def test_gzip_attachment(self, mock_mail):
+
+        """Function:  test_gzip_attachment
+
+        Description:  Test with the attachment gzipped.
+
+        Arguments:
+
+        """
+
+        self.msg["Attachment"] = "FileName.json.gz"
+        self.msg["Gzip"] = True
+
+        mysql_rep_admin.send_msg(self.msg)
+
+        args = mock_mail.return_value.add_attachment.call_args[0]
+
+        self.assertEqual(
+            (args[0], args[1], gzip.decompress(args[2])),
+            ("FileName.json.gz", "gzip", b'{"Status": "ok"}'))
+
+    @mock.patch("mysql_rep_admin.gen_class.Mail2")
+    def test_attachment(self, mock_mail):
+
+        """Function:  test_attachment
+
+        Description:  Test with the message as an attachment.
+
+        Arguments:
+
+        """
+
+        self.msg["Attachment"] = "FileName.json"
+
+        mysql_rep_admin.send_msg(self.msg)
+
+        mock_mail.return_value.add_attachment.assert_called_once_with(
+            "FileName.json", "text", '{"Status": "ok"}')
+
+    @mock.patch("mysql_rep_admin.gen_class.Mail2", Mail2)
+    def test_attachment_text(self):
+
+        """Function:  test_attachment_text
+
+        Description:  Test the attachment holds the JSON text as it was
+            serialized.
+
+        Arguments:
+
+        """
+
+        self.msg["Attachment"] = "FileName.json"
+        Mail2.sent = []
+
+        mysql_rep_admin.send_msg(self.msg)
+
+        self.assertEqual(
+            Mail2.sent[0].attach["FileName.json"], '{"Status": "ok"}')
+
+    @mock.patch("mysql_rep_admin.gen_class.setup_mail")
+    def test_mailx(self, mock_mail):
+
+        """Function:  test_mailx
+
+        Description:  Test with the mailx override.
+
+        Arguments:
+
+        """
+
+        self.msg["Mailx"] = True
+
+        mysql_rep_admin.send_msg(self.msg)
+
+        mock_mail.return_value.send_mail.assert_called_once_with(
+            use_mailx=True)
+
+    @mock.patch("mysql_rep_admin.gen_class.setup_mail")
+    def test_body(self, mock_mail):
+
+        """Function:  test_body
+
+        Description:  Test with the message in the body.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.send_msg(self.msg)
+
+        self.assertEqual(
+            (mock_mail.call_args, mock_mail.return_value.add_2_msg.call_args),
+            (mock.call(["toaddr"], subj="SubjectLine"),
+             mock.call('{"Status": "ok"}')))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+# Classification (U)
+
+"""Program:  spool_mail.py
+
+    Description:  Unit testing of spool_mail in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/spool_mail.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import shutil
+import tempfile
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import lib.gen_libs as gen_libs             # pylint:disable=E0401,C0413,R0402
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_directory
+        test_order
+        test_spool_mail
+        tearDown
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.tmp_dir = tempfile.mkdtemp()
+        self.msg = {"Subject": "SubjectLine", "To": ["toaddr"],
+                    "Text": '{"Status": "ok"}', "Attachment": None,
+                    "Mailx": False}
+
+    def test_no_directory(self):
+
+        """Function:  test_no_directory
+
+        Description:  Test with a spool directory which does not exist.
+
+        Arguments:
+
+        """
+
+        with gen_libs.no_std_out():
+            self.assertFalse(
+                mysql_rep_admin.spool_mail(
+                    self.msg, os.path.join(self.tmp_dir, "missing")))
+
+    def test_order(self):
+
+        """Function:  test_order
+
+        Description:  Test the file names sort in the order spooled.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.spool_mail(dict(self.msg, Text="first"), self.tmp_dir)
+        mysql_rep_admin.spool_mail(
+            dict(self.msg, Text="second"), self.tmp_dir)
+
+        self.assertEqual(
+            [mysql_rep_admin.load_state(
+                os.path.join(self.tmp_dir, name))["Text"]
+             for name in sorted(os.listdir(self.tmp_dir))],
+            ["first", "second"])
+
+    def test_spool_mail(self):
+
+        """Function:  test_spool_mail
+
+        Description:  Test the message is written to the spool directory.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mysql_rep_admin.spool_mail(self.msg, self.tmp_dir),
+             [mysql_rep_admin.load_state(os.path.join(self.tmp_dir, name))
+              for name in os.listdir(self.tmp_dir)]), (True, [self.msg]))
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+# Classification (U)
+
+"""Program:  text_out.py
+
+    Description:  Unit testing of text_out in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/text_out.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import io
+import tempfile
+import shutil
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class ArgParser():
+
+    """Class:  ArgParser
+
+    Description:  Class stub holder for gen_class.ArgParser class.
+
+    Methods:
+        __init__
+        arg_exist
+        get_val
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.args_array = {"-z": True}
+
+    def arg_exist(self, arg):
+
+        """Method:  arg_exist
+
+        Description:  Method stub holder for gen_class.ArgParser.arg_exist.
+
+        Arguments:
+
+        """
+
+        return arg in self.args_array
+
+    def get_val(self, skey, def_val=None):
+
+        """Method:  get_val
+
+        Description:  Method stub holder for gen_class.ArgParser.get_val.
+
+        Arguments:
+
+        """
+
+        return self.args_array.get(skey, def_val)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        tearDown
+        read_file
+        test_file_error
+        test_std_out
+        test_append
+        test_write
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.args = ArgParser()
+        self.tmp_dir = tempfile.mkdtemp()
+        self.ofile = os.path.join(self.tmp_dir, "text_out.json")
+        self.text = '{"Status": "ok"}'
+
+    def tearDown(self):
+
+        """Function:  tearDown
+
+        Description:  Clean up of unit testing.
+
+        Arguments:
+
+        """
+
+        shutil.rmtree(self.tmp_dir)
+
+    def read_file(self):
+
+        """Function:  read_file
+
+        Description:  Returns the contents of the output file.
+
+        Arguments:
+
+        """
+
+        with open(self.ofile, encoding="UTF-8") as fhdr:
+            return fhdr.read()
+
+    def test_file_error(self):
+
+        """Function:  test_file_error
+
+        Description:  Test with the output file directory missing.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-o"] = os.path.join(
+            self.tmp_dir, "missing", "text_out.json")
+
+        self.assertTrue(mysql_rep_admin.text_out(self.text, self.args)[0])
+
+    def test_std_out(self):
+
+        """Function:  test_std_out
+
+        Description:  Test with the text written to standard out.
+
+        Arguments:
+
+        """
+
+        del self.args.args_array["-z"]
+
+        with mock.patch("sys.stdout", new_callable=io.StringIO) as mock_std:
+            mysql_rep_admin.text_out(self.text, self.args)
+
+        self.assertEqual(mock_std.getvalue(), self.text + "\n")
+
+    def test_append(self):
+
+        """Function:  test_append
+
+        Description:  Test with the text appended to the output file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-o"] = self.ofile
+
+        mysql_rep_admin.text_out(self.text, self.args)
+        mysql_rep_admin.text_out(self.text, self.args, mode="a")
+
+        self.assertEqual(self.read_file(), (self.text + "\n") * 2)
+
+    def test_write(self):
+
+        """Function:  test_write
+
+        Description:  Test with the text written to the output file.
+
+        Arguments:
+
+        """
+
+        self.args.args_array["-o"] = self.ofile
+
+        self.assertEqual(
+            (mysql_rep_admin.text_out(self.text, self.args),
+             self.read_file()), ((False, None), self.text + "\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
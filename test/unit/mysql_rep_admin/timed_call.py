@@ -0,0 +1,86 @@
+# Classification (U)
+
+"""Program:  timed_call.py
+
+    Description:  Unit testing of timed_call in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/timed_call.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import mock
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_function_called
+        test_midpoint_time
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.func = mock.Mock(return_value=True)
+
+    def test_function_called(self):
+
+        """Function:  test_function_called
+
+        Description:  Test the function is called.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.timed_call(self.func)
+
+        self.func.assert_called_once_with()
+
+    @mock.patch("mysql_rep_admin.time.time")
+    def test_midpoint_time(self, mock_time):
+
+        """Function:  test_midpoint_time
+
+        Description:  Test the midpoint time of the call is returned.
+
+        Arguments:
+
+        """
+
+        mock_time.side_effect = [10.0, 11.0]
+
+        self.assertEqual(mysql_rep_admin.timed_call(self.func), 10.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+# Classification (U)
+
+"""Program:  timed_query.py
+
+    Description:  Unit testing of timed_query in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/timed_query.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+import functools
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+def query(cmd, nested=None):
+
+    """Function:  query
+
+    Description:  Stub holder for a server query method.
+
+    Arguments:
+
+    """
+
+    if nested:
+        nested(cmd)
+
+    return [cmd]
+
+
+def query_error(cmd):
+
+    """Function:  query_error
+
+    Description:  Stub holder for a server query method which fails.
+
+    Arguments:
+
+    """
+
+    raise ValueError(cmd)
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_nested_query
+        test_query_error
+        test_query
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.latency = {}
+        self.cmd = "show slave status"
+
+    def test_nested_query(self):
+
+        """Function:  test_nested_query
+
+        Description:  Test a query called by another query is counted once.
+
+        Arguments:
+
+        """
+
+        nested = functools.partial(
+            mysql_rep_admin.timed_query, query, self.latency, "Slave1")
+
+        mysql_rep_admin.timed_query(
+            query, self.latency, "Slave1", self.cmd, nested=nested)
+
+        self.assertEqual(self.latency["Slave1"]["Count"], 1)
+
+    def test_query_error(self):
+
+        """Function:  test_query_error
+
+        Description:  Test a failed query is still timed.
+
+        Arguments:
+
+        """
+
+        with self.assertRaises(ValueError):
+            mysql_rep_admin.timed_query(
+                query_error, self.latency, "Slave1", self.cmd)
+
+        self.assertEqual(
+            (self.latency["Slave1"]["Count"], mysql_rep_admin.LAT_STATE.busy),
+            (1, False))
+
+    def test_query(self):
+
+        """Function:  test_query
+
+        Description:  Test the query results are returned and timed.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            (mysql_rep_admin.timed_query(
+                query, self.latency, "Slave1", self.cmd),
+             self.latency["Slave1"]["Count"]), ([self.cmd], 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
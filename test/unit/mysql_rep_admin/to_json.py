@@ -0,0 +1,109 @@
+# Classification (U)
+
+"""Program:  to_json.py
+
+    Description:  Unit testing of to_json in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/to_json.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_record_in_list
+        test_record
+        test_tuple
+        test_scalar
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.record = mysql_rep_admin.SlaveStatus("slave1", "DOWN")
+        self.results = {"Name": "slave1", "Status": "DOWN"}
+
+    def test_record_in_list(self):
+
+        """Function:  test_record_in_list
+
+        Description:  Test with records nested in a dictionary and list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.to_json({"Slaves": [self.record]}),
+            {"Slaves": [self.results]})
+
+    def test_record(self):
+
+        """Function:  test_record
+
+        Description:  Test with a result record.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.to_json(self.record), self.results)
+
+    def test_tuple(self):
+
+        """Function:  test_tuple
+
+        Description:  Test with a tuple is converted to a list.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.to_json(("a", 1)), ["a", 1])
+
+    def test_scalar(self):
+
+        """Function:  test_scalar
+
+        Description:  Test with a value which is not converted.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(mysql_rep_admin.to_json("Yes"), "Yes")
+
+
+if __name__ == "__main__":
+    unittest.main()
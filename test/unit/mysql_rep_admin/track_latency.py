@@ -0,0 +1,141 @@
+# Classification (U)
+
+"""Program:  track_latency.py
+
+    Description:  Unit testing of track_latency in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/track_latency.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class Server():                                         # pylint:disable=R0903
+
+    """Class:  Server
+
+    Description:  Class stub holder for mysql_class.Server class.
+
+    Methods:
+        __init__
+        col_sql
+
+    """
+
+    def __init__(self):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = "Slave1"
+
+    def col_sql(self, cmd):
+
+        """Method:  col_sql
+
+        Description:  Stub holder for mysql_class.Server.col_sql method.
+
+        Arguments:
+
+        """
+
+        return [{"Name": self.name, "Cmd": cmd}]
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_no_latency
+        test_missing_method
+        test_query_timed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.server = Server()
+        self.latency = {}
+        self.cmd = "show slave status"
+
+    def test_no_latency(self):
+
+        """Function:  test_no_latency
+
+        Description:  Test with latency tracking turned off.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.track_latency(self.server, None)
+
+        self.assertNotIn("col_sql", vars(self.server))
+
+    def test_missing_method(self):
+
+        """Function:  test_missing_method
+
+        Description:  Test a query method the server does not have is
+            skipped.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.track_latency(self.server, self.latency)
+
+        self.assertFalse(hasattr(self.server, "vert_sql"))
+
+    def test_query_timed(self):
+
+        """Function:  test_query_timed
+
+        Description:  Test the server's queries are timed.
+
+        Arguments:
+
+        """
+
+        mysql_rep_admin.track_latency(self.server, self.latency)
+
+        self.assertEqual(
+            (self.server.col_sql(self.cmd), self.latency["Slave1"]["Count"]),
+            ([{"Name": "Slave1", "Cmd": self.cmd}], 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
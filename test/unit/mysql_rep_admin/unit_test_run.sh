@@ -6,21 +6,97 @@
 
 echo ""
 echo "Unit testing..."
+/usr/bin/python ./test/unit/mysql_rep_admin/LazyModule.py
+/usr/bin/python ./test/unit/mysql_rep_admin/ResultRecord.py
+/usr/bin/python ./test/unit/mysql_rep_admin/SlaveTime.py
+/usr/bin/python ./test/unit/mysql_rep_admin/add_digest.py
+/usr/bin/python ./test/unit/mysql_rep_admin/add_latency.py
 /usr/bin/python ./test/unit/mysql_rep_admin/add_miss_slaves.py
+/usr/bin/python ./test/unit/mysql_rep_admin/add_skip_note.py
+/usr/bin/python ./test/unit/mysql_rep_admin/add_timing.py
+/usr/bin/python ./test/unit/mysql_rep_admin/budget_worker.py
 /usr/bin/python ./test/unit/mysql_rep_admin/call_run_chk.py
 /usr/bin/python ./test/unit/mysql_rep_admin/chk_mst_log.py
 /usr/bin/python ./test/unit/mysql_rep_admin/chk_other.py
 /usr/bin/python ./test/unit/mysql_rep_admin/chk_slv.py
 /usr/bin/python ./test/unit/mysql_rep_admin/chk_slv_err.py
 /usr/bin/python ./test/unit/mysql_rep_admin/chk_slv_other.py
+/usr/bin/python ./test/unit/mysql_rep_admin/chk_slv_src.py
 /usr/bin/python ./test/unit/mysql_rep_admin/chk_slv_thr.py
 /usr/bin/python ./test/unit/mysql_rep_admin/chk_slv_time.py
+/usr/bin/python ./test/unit/mysql_rep_admin/connect_slaves.py
+/usr/bin/python ./test/unit/mysql_rep_admin/connect_worker.py
+/usr/bin/python ./test/unit/mysql_rep_admin/create_discover_cfg.py
+/usr/bin/python ./test/unit/mysql_rep_admin/create_down_slv.py
 /usr/bin/python ./test/unit/mysql_rep_admin/create_filename.py
+/usr/bin/python ./test/unit/mysql_rep_admin/create_snapshot.py
 /usr/bin/python ./test/unit/mysql_rep_admin/data_out.py
+/usr/bin/python ./test/unit/mysql_rep_admin/discover_slaves.py
+/usr/bin/python ./test/unit/mysql_rep_admin/dumps_json.py
+/usr/bin/python ./test/unit/mysql_rep_admin/dumps_orjson.py
+/usr/bin/python ./test/unit/mysql_rep_admin/filter_records.py
+/usr/bin/python ./test/unit/mysql_rep_admin/flush_spool.py
+/usr/bin/python ./test/unit/mysql_rep_admin/format_metrics.py
+/usr/bin/python ./test/unit/mysql_rep_admin/gather_slv_chk.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_budget.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_cached_cfg.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_cfg_key.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_delta.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_inst_need.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_latency.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_mail_data.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_metrics.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_opt_list.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_private_file.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_rec_key.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_rec_metrics.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_replicas.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_serializer.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_sid.py
+/usr/bin/python ./test/unit/mysql_rep_admin/get_state_file.py
+/usr/bin/python ./test/unit/mysql_rep_admin/gzip_text.py
+/usr/bin/python ./test/unit/mysql_rep_admin/has_problem.py
 /usr/bin/python ./test/unit/mysql_rep_admin/help_message.py
-/usr/bin/python ./test/unit/mysql_rep_admin/is_time_lag.py
+/usr/bin/python ./test/unit/mysql_rep_admin/is_backing_off.py
+/usr/bin/python ./test/unit/mysql_rep_admin/is_changed.py
+/usr/bin/python ./test/unit/mysql_rep_admin/is_lagging.py
+/usr/bin/python ./test/unit/mysql_rep_admin/is_log_lagging.py
+/usr/bin/python ./test/unit/mysql_rep_admin/is_mail_due.py
+/usr/bin/python ./test/unit/mysql_rep_admin/is_private_dir.py
+/usr/bin/python ./test/unit/mysql_rep_admin/is_running.py
+/usr/bin/python ./test/unit/mysql_rep_admin/is_topology_stale.py
+/usr/bin/python ./test/unit/mysql_rep_admin/iter_records.py
+/usr/bin/python ./test/unit/mysql_rep_admin/limit_mail.py
+/usr/bin/python ./test/unit/mysql_rep_admin/line_out.py
+/usr/bin/python ./test/unit/mysql_rep_admin/load_mst_cfg.py
+/usr/bin/python ./test/unit/mysql_rep_admin/load_settings.py
+/usr/bin/python ./test/unit/mysql_rep_admin/load_slv_cfg.py
+/usr/bin/python ./test/unit/mysql_rep_admin/load_state.py
+/usr/bin/python ./test/unit/mysql_rep_admin/mail_out.py
 /usr/bin/python ./test/unit/mysql_rep_admin/main.py
+/usr/bin/python ./test/unit/mysql_rep_admin/merge_data.py
 /usr/bin/python ./test/unit/mysql_rep_admin/process_time_lag.py
+/usr/bin/python ./test/unit/mysql_rep_admin/prom_out.py
+/usr/bin/python ./test/unit/mysql_rep_admin/prom_value.py
+/usr/bin/python ./test/unit/mysql_rep_admin/reconcile_slaves.py
+/usr/bin/python ./test/unit/mysql_rep_admin/recover_claims.py
+/usr/bin/python ./test/unit/mysql_rep_admin/refresh_status.py
 /usr/bin/python ./test/unit/mysql_rep_admin/rpt_mst_log.py
 /usr/bin/python ./test/unit/mysql_rep_admin/rpt_slv_log.py
+/usr/bin/python ./test/unit/mysql_rep_admin/run_chk.py
+/usr/bin/python ./test/unit/mysql_rep_admin/run_chk_async.py
+/usr/bin/python ./test/unit/mysql_rep_admin/run_chk_slaves.py
+/usr/bin/python ./test/unit/mysql_rep_admin/run_daemon.py
 /usr/bin/python ./test/unit/mysql_rep_admin/run_program.py
+/usr/bin/python ./test/unit/mysql_rep_admin/run_slv_chk.py
+/usr/bin/python ./test/unit/mysql_rep_admin/run_with_budget.py
+/usr/bin/python ./test/unit/mysql_rep_admin/sample_status.py
+/usr/bin/python ./test/unit/mysql_rep_admin/save_state.py
+/usr/bin/python ./test/unit/mysql_rep_admin/send_msg.py
+/usr/bin/python ./test/unit/mysql_rep_admin/spool_mail.py
+/usr/bin/python ./test/unit/mysql_rep_admin/text_out.py
+/usr/bin/python ./test/unit/mysql_rep_admin/timed_call.py
+/usr/bin/python ./test/unit/mysql_rep_admin/timed_query.py
+/usr/bin/python ./test/unit/mysql_rep_admin/to_json.py
+/usr/bin/python ./test/unit/mysql_rep_admin/track_latency.py
+/usr/bin/python ./test/unit/mysql_rep_admin/update_breaker.py
@@ -0,0 +1,165 @@
+# Classification (U)
+
+"""Program:  update_breaker.py
+
+    Description:  Unit testing of update_breaker in mysql_rep_admin.py.
+
+    Usage:
+        test/unit/mysql_rep_admin/update_breaker.py
+
+    Arguments:
+
+"""
+
+# Libraries and Global Variables
+
+# Standard
+import sys
+import os
+import unittest
+
+# Local
+sys.path.append(os.getcwd())
+import mysql_rep_admin                          # pylint:disable=E0401,C0413
+import version                                  # pylint:disable=E0401,C0413
+
+__version__ = version.__version__
+
+
+class SlaveRep():
+
+    """Class:  SlaveRep
+
+    Description:  Class stub holder for mysql_class.SlaveRep class.
+
+    Methods:
+        __init__
+        is_connected
+
+    """
+
+    def __init__(self, name, connected=True):
+
+        """Method:  __init__
+
+        Description:  Class initialization.
+
+        Arguments:
+
+        """
+
+        self.name = name
+        self.connected = connected
+
+    def is_connected(self):
+
+        """Method:  is_connected
+
+        Description:  Stub method holder for SlaveRep.is_connected.
+
+        Arguments:
+
+        """
+
+        return self.connected
+
+
+class UnitTest(unittest.TestCase):
+
+    """Class:  UnitTest
+
+    Description:  Class which is a representation of a unit testing.
+
+    Methods:
+        setUp
+        test_backoff_max
+        test_backoff_doubled
+        test_first_failure
+        test_breaker_closed
+
+    """
+
+    def setUp(self):
+
+        """Function:  setUp
+
+        Description:  Initialization for unit testing.
+
+        Arguments:
+
+        """
+
+        self.slave = SlaveRep("Slave1")
+        self.slave2 = SlaveRep("Slave2", connected=False)
+        self.settings = dict(mysql_rep_admin.SETTINGS)
+        self.settings["backoff_base"] = 60
+        self.settings["backoff_max"] = 200
+
+    def test_backoff_max(self):
+
+        """Function:  test_backoff_max
+
+        Description:  Test backoff is limited to backoff_max.
+
+        Arguments:
+
+        """
+
+        state = {"Slave2": {"failures": 3, "retry_at": 0}}
+
+        self.assertEqual(
+            mysql_rep_admin.update_breaker(
+                state, [self.slave2], settings=self.settings,
+                now=1000)["Slave2"]["retry_at"], 1200)
+
+    def test_backoff_doubled(self):
+
+        """Function:  test_backoff_doubled
+
+        Description:  Test backoff is doubled for each failure in a row.
+
+        Arguments:
+
+        """
+
+        state = {"Slave2": {"failures": 1, "retry_at": 0}}
+
+        self.assertEqual(
+            mysql_rep_admin.update_breaker(
+                state, [self.slave2], settings=self.settings, now=1000),
+            {"Slave2": {"failures": 2, "last_fail": 1000, "retry_at": 1120}})
+
+    def test_first_failure(self):
+
+        """Function:  test_first_failure
+
+        Description:  Test with slave failing to connect the first time.
+
+        Arguments:
+
+        """
+
+        self.assertEqual(
+            mysql_rep_admin.update_breaker(
+                {}, [self.slave2], settings=self.settings, now=1000),
+            {"Slave2": {"failures": 1, "last_fail": 1000, "retry_at": 1060}})
+
+    def test_breaker_closed(self):
+
+        """Function:  test_breaker_closed
+
+        Description:  Test breaker is closed when the probe connects.
+
+        Arguments:
+
+        """
+
+        state = {"Slave1": {"failures": 4, "retry_at": 0}}
+
+        self.assertEqual(
+            mysql_rep_admin.update_breaker(
+                state, [self.slave], settings=self.settings, now=1000), {})
+
+
+if __name__ == "__main__":
+    unittest.main()